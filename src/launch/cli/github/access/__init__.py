@@ -1,6 +1,12 @@
 import click
 
-from .commands import check_pr_organization, check_user_organization, set_default
+from .commands import (
+    audit,
+    check_pr_organization,
+    check_user_organization,
+    set_default,
+    set_default_many,
+)
 
 
 @click.group(name="access")
@@ -9,5 +15,7 @@ def access_group():
 
 
 access_group.add_command(set_default)
+access_group.add_command(set_default_many)
 access_group.add_command(check_user_organization)
 access_group.add_command(check_pr_organization)
+access_group.add_command(audit)
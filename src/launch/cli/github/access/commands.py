@@ -1,20 +1,26 @@
 import logging
+import sys
+from typing import IO, Any
 
 import click
 
+from launch.config.common import MAX_WORKERS
 from launch.config.github import (
     GITHUB_ORG_NAME,
     GITHUB_ORG_PLATFORM_TEAM,
     GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS,
+    GITHUB_REQUESTS_PER_SECOND,
 )
+from launch.lib.common.utilities import format_table
 from launch.lib.github.access import (
-    NoMatchingTeamException,
-    configure_default_branch_protection,
-    grant_admin,
-    grant_maintain,
-    select_administrative_team,
+    REPO_PREFIX_ADMIN_TEAM_SLUG,
+    apply_default_access,
+    apply_default_access_many,
 )
+from launch.lib.github.audit import audit_repositories
 from launch.lib.github.auth import get_github_instance
+from launch.lib.github.rate_limit import TokenBucket
+from launch.lib.github.repo import select_repositories
 
 logger = logging.getLogger(__name__)
 
@@ -53,22 +59,130 @@ def set_default(organization: str, repository_name: str, dry_run: bool):
 
     repository = organization.get_repo(name=repository_name)
 
-    try:
-        specific_admin_team = select_administrative_team(
-            repository=repository, organization=organization
-        )
-    except NoMatchingTeamException:
+    apply_default_access(
+        repository=repository,
+        organization=organization,
+        platform_team=platform_team,
+        platform_admin_team=platform_admin_team,
+        dry_run=dry_run,
+    )
+
+
+@click.command()
+@click.option(
+    "--organization",
+    default=GITHUB_ORG_NAME,
+    help=f"GitHub organization containing the repositories. Defaults to the {GITHUB_ORG_NAME} organization.",
+)
+@click.option(
+    "--repository",
+    "repositories",
+    multiple=True,
+    help="(Optional) Name of a repository to update. May be supplied multiple times.",
+)
+@click.option(
+    "--repositories-file",
+    type=click.File("r"),
+    help="(Optional) File containing the names of repositories to update, one per line.",
+)
+@click.option(
+    "--prefix",
+    "prefixes",
+    multiple=True,
+    help=f"(Optional) Only update repositories whose name starts with this prefix, e.g. one of {', '.join(REPO_PREFIX_ADMIN_TEAM_SLUG)}. May be supplied multiple times.",
+)
+@click.option(
+    "--topic",
+    help="(Optional) Only update repositories in the organization that carry this topic.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=MAX_WORKERS,
+    help=f"(Optional) Maximum number of repositories updated at once. Defaults to {MAX_WORKERS}.",
+)
+@click.option(
+    "--requests-per-second",
+    type=click.FloatRange(min=0, min_open=True),
+    default=GITHUB_REQUESTS_PER_SECOND,
+    help=f"(Optional) Maximum pace of requests to GitHub, lowered automatically to stay within the rate limit. Defaults to {GITHUB_REQUESTS_PER_SECOND}.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Perform a dry run that reports on what it would do, but does not update access.",
+)
+def set_default_many(
+    organization: str,
+    repositories: tuple[str],
+    repositories_file: IO[Any],
+    prefixes: tuple[str],
+    topic: str,
+    max_workers: int,
+    requests_per_second: float,
+    dry_run: bool,
+):
+    """Sets the default access and branch protections for many repositories concurrently. Repositories are selected
+    by name, by name prefix, or by topic. A table with the result for every repository is printed at the end.
+    """
+    if dry_run:
         click.secho(
-            "Couldn't match a domain-specific administrative team to your repository based on name. Only the Platform Admin team will be granted administrative access, you may need to manually update permissions on this repo!",
+            "[DRYRUN] Performing a dry run, reporting on changes without making them in GitHub.",
             fg="yellow",
         )
-        specific_admin_team = None
 
-    grant_maintain(team=platform_team, repository=repository, dry_run=dry_run)
-    grant_admin(team=platform_admin_team, repository=repository, dry_run=dry_run)
-    if specific_admin_team:
-        grant_admin(team=specific_admin_team, repository=repository, dry_run=dry_run)
-    configure_default_branch_protection(repository=repository, dry_run=dry_run)
+    names = list(repositories)
+    if repositories_file:
+        names.extend(
+            line.strip() for line in repositories_file.readlines() if line.strip()
+        )
+    if not names and not prefixes and not topic:
+        click.secho(
+            "You must select repositories with at least one of --repository, --repositories-file, --prefix or --topic.",
+            fg="red",
+        )
+        sys.exit(1)
+
+    g = get_github_instance()
+    selected = select_repositories(
+        g=g,
+        organization=organization,
+        names=names,
+        patterns=[f"{prefix}*" for prefix in prefixes],
+        topic=topic,
+    )
+    if not selected:
+        click.secho("No repositories matched the supplied filters.", fg="yellow")
+        return
+
+    results = apply_default_access_many(
+        g=g,
+        organization=organization,
+        repositories=selected,
+        platform_team_slug=GITHUB_ORG_PLATFORM_TEAM,
+        platform_admin_team_slug=GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS,
+        bucket=TokenBucket(rate=requests_per_second),
+        max_workers=max_workers,
+        dry_run=dry_run,
+    )
+
+    click.echo(
+        format_table(
+            headers=["REPOSITORY", "RESULT", "DURATION", "DETAIL"],
+            rows=[
+                [
+                    result.name,
+                    "ok" if result.succeeded else "failed",
+                    f"{result.duration:.1f}s",
+                    result.detail,
+                ]
+                for result in results
+            ],
+        )
+    )
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
 
 
 @click.command("check-user")
@@ -144,3 +258,72 @@ def check_pr_organization(repository: str, pr_number: int, organization: str):
     else:
         click.echo(f"{user.login} is not a member of {org.login}")
         exit(1)
+
+
+@click.command()
+@click.option(
+    "--organization",
+    default=GITHUB_ORG_NAME,
+    help=f"GitHub organization containing the repositories. Defaults to the {GITHUB_ORG_NAME} organization.",
+)
+@click.option(
+    "--repository",
+    "repositories",
+    multiple=True,
+    help="(Optional) Name of a repository to audit. May be supplied multiple times.",
+)
+@click.option(
+    "--repositories-file",
+    type=click.File("r"),
+    help="(Optional) File containing the names of repositories to audit, one per line.",
+)
+@click.option(
+    "--pattern",
+    "patterns",
+    multiple=True,
+    help="(Optional) Glob pattern matched against the organization's repository names, e.g. 'tf-*'. May be supplied multiple times.",
+)
+@click.option(
+    "--topic",
+    help="(Optional) Only audit repositories in the organization that carry this topic.",
+)
+def audit(
+    organization: str,
+    repositories: tuple[str],
+    repositories_file: IO[Any],
+    patterns: tuple[str],
+    topic: str,
+):
+    """Reports repositories whose labels, team permissions or default branch protection differ from the defaults
+    applied by set-default and create-labels. Without any filter, every unarchived repository of the organization is
+    audited. Exits with a non-zero code if any drift was found."""
+    names = list(repositories)
+    if repositories_file:
+        names.extend(
+            line.strip() for line in repositories_file.readlines() if line.strip()
+        )
+
+    g = get_github_instance()
+    results = audit_repositories(
+        g=g,
+        organization=organization,
+        names=names,
+        patterns=list(patterns),
+        topic=topic,
+    )
+    if not results:
+        click.secho("No repositories matched the supplied filters.", fg="yellow")
+        return
+
+    click.echo(
+        format_table(
+            headers=["REPOSITORY", "RESULT", "DRIFT"],
+            rows=[
+                [result.name, "ok" if result.compliant else "drift", drift]
+                for result in results
+                for drift in (result.drift or [""])
+            ],
+        )
+    )
+    if not all(result.compliant for result in results):
+        sys.exit(1)
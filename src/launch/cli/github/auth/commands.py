@@ -1,3 +1,6 @@
+from functools import partial
+from pathlib import Path
+
 import click
 
 from launch.config.github import (
@@ -6,7 +9,11 @@ from launch.config.github import (
     GITHUB_SIGNING_CERT_FILE,
     GITHUB_SIGNING_CERT_SECRET_NAME,
 )
-from launch.lib.github.generate_github_token import get_token_with_file, get_token_with_secret_name
+from launch.lib.github.generate_github_token import (
+    get_installation_token,
+    get_secret_value,
+)
+from launch.lib.github.token_cache import CachedToken, get_token_cache
 from launch.lib.automation.common.functions import single_true
 
 
@@ -55,12 +62,19 @@ def validate_max_seconds(ctx, param, value):
     help="Number of seconds the token will be valid for. Default is 600 seconds.",
     callback=validate_max_seconds,
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Always request a new installation token instead of reusing a cached one.",
+)
 def application(
     application_id_parameter_name: str,
     installation_id_parameter_name: str,
     signing_cert_file: str | None,
     signing_cert_secret_name: str | None,
     token_expiration_seconds: int,
+    no_cache: bool = False,
 ):
     if not single_true(
         [
@@ -75,18 +89,27 @@ def application(
         raise RuntimeError(message)
 
     if signing_cert_file:
-        token = get_token_with_file(
+        read_private_key = Path(signing_cert_file).read_text
+    else:
+        read_private_key = partial(get_secret_value, signing_cert_secret_name)
+
+    # The private key is only read when a new token has to be requested.
+    def fetch() -> CachedToken:
+        return get_installation_token(
             application_id=application_id_parameter_name,
             installation_id=installation_id_parameter_name,
-            signing_cert_file=signing_cert_file,
+            private_key=read_private_key(),
             token_expiration_seconds=token_expiration_seconds,
         )
+
+    # Installation tokens stay valid for an hour, so one is only requested when no cached token can be reused.
+    if no_cache:
+        token = fetch().token
     else:
-        token = get_token_with_secret_name(
+        token = get_token_cache().get(
             application_id=application_id_parameter_name,
             installation_id=installation_id_parameter_name,
-            signing_cert_secret_name=signing_cert_secret_name,
-            token_expiration_seconds=token_expiration_seconds,
+            fetch=fetch,
         )
 
     print(token)
@@ -1,12 +1,18 @@
+import sys
+from typing import IO, Any
+
 import click
 
-from launch.config.github import GITHUB_ORG_NAME
+from launch.config.github import GITHUB_MAX_CONNECTIONS, GITHUB_ORG_NAME
+from launch.lib.common.utilities import format_table
 from launch.lib.github.auth import get_github_instance
 from launch.lib.github.commit_status import (
     CommitStatusState,
     CommitStatusUpdatePayload,
     get_commit_status,
+    read_commit_status_entries,
     set_commit_status,
+    set_commit_statuses,
 )
 
 
@@ -98,6 +104,67 @@ def set(
     )
 
 
+@click.command("set-many")
+@click.option(
+    "--organization",
+    default=GITHUB_ORG_NAME,
+    help=f"GitHub organization containing your repositories. Defaults to the {GITHUB_ORG_NAME} organization.",
+)
+@click.option(
+    "--repository-name",
+    help="Repository of the statuses that don't name one.",
+)
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    default="-",
+    help="JSON lines file of statuses, each with the keys commit, state, context, description, target_url and optionally repository. Defaults to stdin.",
+)
+@click.option(
+    "--max-connections",
+    type=click.IntRange(min=1),
+    default=GITHUB_MAX_CONNECTIONS,
+    help=f"Maximum number of requests to GitHub in flight at once. Defaults to {GITHUB_MAX_CONNECTIONS}.",
+)
+def set_many(
+    organization: str,
+    repository_name: str,
+    input_file: IO[Any],
+    max_connections: int,
+):
+    """Sets many commit statuses at once. Statuses of different commits or contexts are posted concurrently, those of
+    the same commit and context in the order given, skipping a status identical to the previous one.
+    """
+    try:
+        entries = list(
+            read_commit_status_entries(lines=input_file, repo_name=repository_name)
+        )
+    except ValueError as e:
+        click.secho(str(e), fg="red")
+        sys.exit(2)
+
+    results = set_commit_statuses(
+        repo_org=organization, entries=entries, max_connections=max_connections
+    )
+
+    click.echo(
+        format_table(
+            headers=["STATUS", "RESULT", "DETAIL"],
+            rows=[
+                [
+                    result.name,
+                    result.value if result.succeeded else "failed",
+                    result.detail,
+                ]
+                for result in results
+            ],
+        )
+    )
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
+
+
 @click.group(name="status")
 def status_group():
     """Command family for dealing with GitHub commit status."""
@@ -105,3 +172,4 @@ def status_group():
 
 status_group.add_command(get)
 status_group.add_command(set)
+status_group.add_command(set_many)
@@ -1,6 +1,12 @@
 import click
 
-from .commands import check_labels, create, create_labels, label_pull_request
+from .commands import (
+    check_labels,
+    create,
+    create_labels,
+    create_labels_many,
+    label_pull_request,
+)
 
 
 @click.group(name="repo")
@@ -11,4 +17,5 @@ def repo_group():
 repo_group.add_command(create)
 repo_group.add_command(check_labels)
 repo_group.add_command(create_labels)
+repo_group.add_command(create_labels_many)
 repo_group.add_command(label_pull_request)
@@ -1,19 +1,25 @@
 import logging
 import sys
+from typing import IO, Any
 
 import click
 import git
 from git.repo import Repo
 from github.GithubException import UnknownObjectException
 
-from launch.config.github import GITHUB_ORG_NAME
+from launch.config.common import MAX_WORKERS
+from launch.config.github import GITHUB_ORG_NAME, GITHUB_REQUESTS_PER_SECOND
+from launch.lib.common.utilities import format_table
+from launch.lib.github.access import REPO_PREFIX_ADMIN_TEAM_SLUG
 from launch.lib.github.auth import get_github_instance
 from launch.lib.github.labels import (
     create_custom_labels,
+    create_custom_labels_many,
     get_label_for_change_type,
     has_custom_labels,
 )
-from launch.lib.github.repo import create_repository
+from launch.lib.github.rate_limit import TokenBucket
+from launch.lib.github.repo import create_repository, select_repositories
 from launch.lib.local_repo.predict import (
     InvalidBranchNameException,
     predict_change_type,
@@ -139,6 +145,106 @@ def create_labels(repository_name: str, organization: str):
     logger.info(f"Created {labels_created} new labels on {repo_full_name}.")
 
 
+@click.command()
+@click.option(
+    "--organization",
+    default=GITHUB_ORG_NAME,
+    help=f"GitHub organization containing the repositories. Defaults to the {GITHUB_ORG_NAME} organization.",
+)
+@click.option(
+    "--repository",
+    "repositories",
+    multiple=True,
+    help="(Optional) Name of a repository to label. May be supplied multiple times.",
+)
+@click.option(
+    "--repositories-file",
+    type=click.File("r"),
+    help="(Optional) File containing the names of repositories to label, one per line.",
+)
+@click.option(
+    "--prefix",
+    "prefixes",
+    multiple=True,
+    help=f"(Optional) Only label repositories whose name starts with this prefix, e.g. one of {', '.join(REPO_PREFIX_ADMIN_TEAM_SLUG)}. May be supplied multiple times.",
+)
+@click.option(
+    "--topic",
+    help="(Optional) Only label repositories in the organization that carry this topic.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=MAX_WORKERS,
+    help=f"(Optional) Maximum number of repositories labelled at once. Defaults to {MAX_WORKERS}.",
+)
+@click.option(
+    "--requests-per-second",
+    type=click.FloatRange(min=0, min_open=True),
+    default=GITHUB_REQUESTS_PER_SECOND,
+    help=f"(Optional) Maximum pace of requests to GitHub, lowered automatically to stay within the rate limit. Defaults to {GITHUB_REQUESTS_PER_SECOND}.",
+)
+def create_labels_many(
+    organization: str,
+    repositories: tuple[str],
+    repositories_file: IO[Any],
+    prefixes: tuple[str],
+    topic: str,
+    max_workers: int,
+    requests_per_second: float,
+):
+    """Creates custom labels for GitHub Actions on many repositories concurrently. Repositories are selected by name,
+    by name prefix, or by topic. Like create-labels, this can be safely rerun against the same repositories.
+    """
+    names = list(repositories)
+    if repositories_file:
+        names.extend(
+            line.strip() for line in repositories_file.readlines() if line.strip()
+        )
+    if not names and not prefixes and not topic:
+        click.secho(
+            "You must select repositories with at least one of --repository, --repositories-file, --prefix or --topic.",
+            fg="red",
+        )
+        sys.exit(1)
+
+    g = get_github_instance()
+    selected = select_repositories(
+        g=g,
+        organization=organization,
+        names=names,
+        patterns=[f"{prefix}*" for prefix in prefixes],
+        topic=topic,
+    )
+    if not selected:
+        click.secho("No repositories matched the supplied filters.", fg="yellow")
+        return
+
+    results = create_custom_labels_many(
+        g=g,
+        repositories=selected,
+        bucket=TokenBucket(rate=requests_per_second),
+        max_workers=max_workers,
+    )
+
+    click.echo(
+        format_table(
+            headers=["REPOSITORY", "RESULT", "LABELS CREATED", "DETAIL"],
+            rows=[
+                [
+                    result.name,
+                    "ok" if result.succeeded else "failed",
+                    result.value if result.succeeded else "",
+                    result.detail,
+                ]
+                for result in results
+            ],
+        )
+    )
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
+
+
 @click.command()
 @click.option("--repository-name", required=True)
 @click.option(
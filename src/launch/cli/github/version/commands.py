@@ -9,8 +9,10 @@ from launch.lib.local_repo.predict import predict_change_type, predict_version
 from launch.lib.local_repo.tags import (
     CommitNotTaggedException,
     CommitTagNotSemanticVersionException,
+    build_tag_index,
     create_version_tag,
     push_version_tag,
+    read_remote_semantic_tags,
     read_semantic_tags,
     read_semantic_version_tag,
 )
@@ -50,22 +52,38 @@ def version_required_options_wrapper(f):
     is_flag=True,
     help="Print the type of predicted change (e.g. 'major', 'minor', 'patch') rather than the version.",
 )
+@click.option(
+    "--remote-url",
+    type=click.STRING,
+    default=None,
+    help="Read the tags of the repository at this URL with git ls-remote, rather than from a local repository. No clone is needed.",
+)
 @version_required_options_wrapper
-def predict(repo_path: pathlib.Path, source_branch: str, change_type: bool):
+def predict(
+    repo_path: pathlib.Path,
+    source_branch: str,
+    change_type: bool,
+    remote_url: str | None,
+):
     """Predicts the next semantic version for a repository."""
 
     try:
         if change_type:
             click.echo(predict_change_type(branch_name=source_branch))
         else:
+            existing_tags = (
+                read_remote_semantic_tags(repository_url=remote_url)
+                if remote_url
+                else read_semantic_tags(repo_path=repo_path)
+            )
             predicted_version = predict_version(
-                existing_tags=read_semantic_tags(repo_path=repo_path),
+                existing_tags=existing_tags,
                 branch_name=source_branch,
             )
             click.echo(predicted_version)
     except Exception as e:
         click.secho(
-            f"Failed to predict next version for repository at {repo_path}: {e}",
+            f"Failed to predict next version for repository at {remote_url or repo_path}: {e}",
             fg="red",
         )
         raise click.Abort()
@@ -95,8 +113,10 @@ def apply(repo_path: pathlib.Path, source_branch: str, pipeline: bool):
             raise click.Abort()
 
     try:
+        # Tags are read once, both to predict the version and to check whether HEAD is already tagged.
+        tag_index = build_tag_index(repo_path=repo_path)
         predicted_version = predict_version(
-            existing_tags=read_semantic_tags(repo_path=repo_path),
+            existing_tags=read_semantic_tags(repo_path=repo_path, index=tag_index),
             branch_name=source_branch,
         )
     except Exception as e:
@@ -107,7 +127,7 @@ def apply(repo_path: pathlib.Path, source_branch: str, pipeline: bool):
         raise click.Abort()
 
     try:
-        existing_tag = read_semantic_version_tag(repo_path=repo_path)
+        existing_tag = read_semantic_version_tag(repo_path=repo_path, index=tag_index)
         click.secho(
             f"Failed to apply next version for repository at {repo_path}: HEAD is already tagged {existing_tag}",
             fg="red",
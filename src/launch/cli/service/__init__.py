@@ -2,11 +2,12 @@ import click
 
 from .build import build
 from .clean import clean
-from .create import create
+from .create import create, create_many
 from .generate import generate
+from .pipeline import pipeline
 from .publish import publish
 from .test import test
-from .update import update
+from .update import update, update_many
 
 
 @click.group(name="service")
@@ -18,6 +19,9 @@ service_group.add_command(build)
 service_group.add_command(test)
 service_group.add_command(clean)
 service_group.add_command(create)
+service_group.add_command(create_many)
 service_group.add_command(generate)
 service_group.add_command(update)
+service_group.add_command(update_many)
 service_group.add_command(publish)
+service_group.add_command(pipeline)
@@ -28,6 +28,7 @@ from launch.lib.automation.environment.functions import (
 from launch.lib.common.utilities import extract_repo_name_from_url
 from launch.lib.local_repo.repo import clone_repository, checkout_branch
 from launch.lib.service.common import load_launchconfig
+from launch.lib.service.build.cache import create_build_checker
 from launch.lib.service.build.functions import execute_build
 from launch.lib.service.template.launchconfig import LaunchConfigTemplate
 
@@ -57,6 +58,12 @@ logger = logging.getLogger(__name__)
     default=False,
     help="(Optional) Skip cloning the application files. Will assume you're in a directory with the application files.",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="(Optional) Build even if the application source is unchanged since it was last built.",
+)
 @click.option(
     "--registry-type",
     default="docker",
@@ -76,6 +83,7 @@ def build(
     tag: str,
     push: bool,
     skip_clone: bool,
+    force: bool,
     dry_run: bool,
 ):
     """
@@ -88,6 +96,7 @@ def build(
         tag: str: The tag of the repository to clone.
         push: bool: Will push the built image to the repository.
         skip_clone: bool: Skip cloning the application files.
+        force: bool: Build even if the application source is unchanged since it was last built.
         dry_run: bool: Perform a dry run that reports on what it would do.
 
     Returns:
@@ -125,6 +134,7 @@ def build(
 
     input_data = None
     service_dir = Path.cwd().joinpath(BUILD_TEMP_DIR_PATH)
+    checker = None if force else create_build_checker()
     
     if Path(f"{Path.cwd()}/{DOCKER_FILE_DIR}/{DOCKER_FILE_NAME}").exists():
         execute_build(
@@ -133,6 +143,7 @@ def build(
             push=push,
             provider=LaunchConfigTemplate(dry_run).get_provider("service", input_data),
             dry_run=dry_run,
+            checker=checker,
         )
         quit()
 
@@ -181,4 +192,5 @@ def build(
         push=push,
         provider=LaunchConfigTemplate(dry_run).get_provider("service", input_data),
         dry_run=dry_run,
+        checker=checker,
     )
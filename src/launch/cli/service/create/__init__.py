@@ -1,17 +1,21 @@
 import json
 import logging
+import sys
 from pathlib import Path
 from typing import IO, Any
 
 import click
 
 from launch.cli.github.access.commands import set_default
-from launch.config.common import PLATFORM_SRC_DIR_PATH
+from launch.config.common import MAX_WORKERS, PLATFORM_SRC_DIR_PATH
 from launch.config.github import GITHUB_ORG_NAME
 from launch.config.launchconfig import SERVICE_MAIN_BRANCH, SERVICE_REMOTE_BRANCH
+from launch.lib.common.utilities import format_table
+from launch.lib.github.auth import get_github_instance
 from launch.lib.github.repo import create_repository, repo_exist
 from launch.lib.local_repo.repo import checkout_branch, clone_repository
 from launch.lib.service.common import input_data_validation, write_text
+from launch.lib.service.create.functions import create_fleet, load_manifest
 from launch.lib.service.functions import common_service_workflow, prepare_service
 from launch.lib.service.template.functions import process_template
 
@@ -221,6 +225,121 @@ def create(
     )
 
 
+@click.command()
+@click.option(
+    "--manifest",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON manifest of the services to be created. Relative paths in the manifest and in the service inputs are resolved against the manifest's directory.",
+)
+@click.option(
+    "--organization",
+    default=GITHUB_ORG_NAME,
+    help=f"(Optional) GitHub organization to create the services in. Defaults to the {GITHUB_ORG_NAME} organization.",
+)
+@click.option(
+    "--git-message",
+    default="bot: launch-cli service create initial commit",
+    help="(Optional) The git commit message to use when creating a commit. Defaults to 'Initial commit'.",
+)
+@click.option(
+    "--skip-commit",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will skip committing the local changes.",
+)
+@click.option(
+    "--skip-git-permissions",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will skip setting the default access permissions on the repositories.",
+)
+@click.option(
+    "--skip-uuid",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will not generate a UUID to be used in skeleton files.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=MAX_WORKERS,
+    help=f"(Optional) Maximum number of services created at once. Defaults to {MAX_WORKERS}.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="(Optional) Perform a dry run that reports on what it would do.",
+)
+def create_many(
+    manifest: Path,
+    organization: str,
+    git_message: str,
+    skip_commit: bool,
+    skip_git_permissions: bool,
+    skip_uuid: bool,
+    max_workers: int,
+    dry_run: bool,
+):
+    """
+    Creates many services concurrently from a manifest of service definitions. Every service is created the same way as
+    launch service create, into the current directory, while sharing one GitHub client, one lookup of the platform
+    teams, and one checkout of each skeleton. A table with the result for every service is printed when all services
+    have been created.
+
+    Args:
+        manifest (Path): JSON manifest of the services to be created.
+        organization (str): GitHub organization to create the services in.
+        git_message (str): The git commit message to use when creating a commit.
+        skip_commit (bool): If set, it will skip commiting the local changes.
+        skip_git_permissions (bool): If set, it will skip setting the default access permissions on the repositories.
+        skip_uuid (bool): If set, it will not generate a UUID to be used in skeleton files.
+        max_workers (int): Maximum number of services created at once.
+        dry_run (bool): If set, it will not make any changes, but will log what it would.
+    """
+    if dry_run:
+        click.secho(
+            "[DRYRUN] Performing a dry run, nothing will be created", fg="yellow"
+        )
+
+    definitions = load_manifest(path=manifest)
+    if not definitions:
+        click.secho(f"No services are defined in {manifest}.", fg="yellow")
+        return
+
+    results = create_fleet(
+        definitions=definitions,
+        g=get_github_instance(),
+        organization=organization,
+        workdir=Path.cwd(),
+        inputs_base=manifest.parent,
+        git_message=git_message,
+        skip_commit=skip_commit,
+        skip_git_permissions=skip_git_permissions,
+        skip_uuid=skip_uuid,
+        max_workers=max_workers,
+        dry_run=dry_run,
+    )
+
+    click.echo(
+        format_table(
+            headers=["SERVICE", "RESULT", "DURATION", "DETAIL"],
+            rows=[
+                [
+                    result.name,
+                    "ok" if result.succeeded else "failed",
+                    f"{result.duration:.1f}s",
+                    result.value if result.succeeded else result.detail,
+                ]
+                for result in results
+            ],
+        )
+    )
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
+
+
 @click.command()
 @click.option("--name", required=True, help="Name of the service to  be created.")
 @click.option(
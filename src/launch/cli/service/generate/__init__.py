@@ -1,7 +1,6 @@
 
 import click
 import logging
-import os
 import shutil
 
 from git import Repo
@@ -95,6 +94,8 @@ def generate(
         )
         return
 
+    # The directory holding the service repository; relative paths from its .launch_config are resolved against it.
+    repo_base = Path.cwd()
     if url:
         service_dir = extract_repo_name_from_url(url)
         output_path = f"{output_path}/{service_dir}"
@@ -121,14 +122,14 @@ def generate(
             target_branch=tag,
             dry_run=dry_run,
         )
-        os.chdir(output_path)
+        repo_base = Path(output_path).absolute()
 
     shutil.copytree(
-        Path.cwd().joinpath(".git"), Path(build_path_service).joinpath(".git")
+        repo_base.joinpath(".git"), Path(build_path_service).joinpath(".git")
     )
 
-    if Path(LAUNCHCONFIG_PATH_LOCAL).exists():
-        input_data=load_launchconfig()
+    if repo_base.joinpath(LAUNCHCONFIG_PATH_LOCAL).exists():
+        input_data = load_launchconfig(repo_base.joinpath(LAUNCHCONFIG_PATH_LOCAL))
     elif Path(f"{build_path_service}/{LAUNCHCONFIG_NAME}").exists():
         input_data=load_launchconfig(f"{build_path_service}/{LAUNCHCONFIG_NAME}")
     else:
@@ -156,7 +157,7 @@ def generate(
     )
 
     input_data[PLATFORM_SRC_DIR_PATH] = process_template(
-        repo_base=Path.cwd(),
+        repo_base=repo_base,
         dest_base=Path(build_path_service),
         config={PLATFORM_SRC_DIR_PATH: input_data[PLATFORM_SRC_DIR_PATH]},
         skip_uuid=True,
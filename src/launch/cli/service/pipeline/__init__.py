@@ -0,0 +1,234 @@
+import logging
+import sys
+from pathlib import Path
+
+import click
+
+from launch.cli.github.auth.commands import application
+from launch.cli.service.clean import clean
+from launch.config.common import DOCKER_FILE_DIR, DOCKER_FILE_NAME
+from launch.config.github import (
+    DEFAULT_TOKEN_EXPIRATION_SECONDS,
+    GITHUB_APPLICATION_ID,
+    GITHUB_INSTALLATION_ID,
+    GITHUB_PACKAGE_PUBLISHER,
+    GITHUB_PACKAGE_REGISTRY,
+    GITHUB_PACKAGE_SCOPE,
+    GITHUB_PUBLISH_TOKEN_SECRET_NAME,
+    GITHUB_REPO_PATH,
+    GITHUB_SIGNING_CERT_SECRET_NAME,
+    GITHUB_SOURCE_BRANCH,
+)
+from launch.config.launchconfig import SERVICE_MAIN_BRANCH
+from launch.lib.automation.environment.functions import set_netrc
+from launch.lib.common.utilities import format_table
+from launch.lib.github.auth import read_github_token
+from launch.lib.service.pipeline.functions import (
+    PIPELINE_STAGES,
+    resolve_application_source,
+    run_pipeline,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option(
+    "--stage",
+    "stages",
+    multiple=True,
+    type=click.Choice(PIPELINE_STAGES),
+    help=f"(Optional) A stage to run. May be supplied multiple times. Stages always run in the order {', '.join(PIPELINE_STAGES)}. Defaults to all stages.",
+)
+@click.option(
+    "--url",
+    default=None,
+    help="(Optional) The URL of the repository to clone.",
+)
+@click.option(
+    "--tag",
+    default=SERVICE_MAIN_BRANCH,
+    help=f"(Optional) The tag of the repository to clone. Defaults to {SERVICE_MAIN_BRANCH}",
+)
+@click.option(
+    "--push",
+    is_flag=True,
+    default=False,
+    help="(Optional) Will push the built image to the repository.",
+)
+@click.option(
+    "--skip-clone",
+    is_flag=True,
+    default=False,
+    help="(Optional) Skip cloning the application files. Will assume you're in a directory with the application files.",
+)
+@click.option(
+    "--registry-type",
+    default="docker",
+    help="Based off of the registry-type value, the sequence of make commands used before build is decided. Defaults to 'docker'.",
+)
+@click.option(
+    "--package-scope",
+    default=GITHUB_PACKAGE_SCOPE,
+    help="(Optional) The scope of the package.",
+)
+@click.option(
+    "--package-publisher",
+    default=GITHUB_PACKAGE_PUBLISHER,
+    help="(Optional) The user who will publish the package.",
+)
+@click.option(
+    "--package-registry",
+    default=GITHUB_PACKAGE_REGISTRY,
+    help="(Optional) The registry url where package will be published.",
+)
+@click.option(
+    "--source-folder-name",
+    default=None,
+    help="(Optional) The name of the source folder.",
+)
+@click.option(
+    "--repo-path",
+    default=GITHUB_REPO_PATH,
+    help="(Optional) The path to the repository to be tagged.",
+)
+@click.option(
+    "--source-branch",
+    default=GITHUB_SOURCE_BRANCH,
+    help="(Optional) The branch to be tagged.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="(Optional) Perform a dry run that reports on what it would do.",
+)
+@click.pass_context
+def pipeline(
+    context: click.Context,
+    stages: tuple[str],
+    url: str,
+    tag: str,
+    push: bool,
+    skip_clone: bool,
+    registry_type: str,
+    package_scope: str,
+    package_publisher: str,
+    package_registry: str,
+    source_folder_name: str,
+    repo_path: str,
+    source_branch: str,
+    dry_run: bool,
+):
+    """
+    Builds, tests and publishes an application defined in a .launch_config file in one run. The workspace is cleaned,
+    the GitHub credentials are written, the application is cloned and `make configure` is run once for all of the
+    selected stages. As with `launch service build`, an application with a Dockerfile in the current directory is used
+    where it is instead of being cloned. A table with the duration of every stage is printed when the pipeline has
+    finished.
+
+    Args:
+        context: click.Context: The context of the click command.
+        stages (tuple[str]): The stages to run. Defaults to all stages.
+        url: str: The URL of the repository to clone.
+        tag: str: The tag of the repository to clone.
+        push: bool: Will push the built image to the repository.
+        skip_clone: bool: Skip cloning the application files.
+        registry_type (str): The registry type to use. Examples include: "docker", "npm", "nuget".
+        package_scope: str: The scope of the package.
+        package_publisher: str: The publisher of the package.
+        package_registry: str: The registry url where package will be published.
+        source_folder_name: str: The name of the source folder.
+        repo_path: str: The path to the repository to be tagged.
+        source_branch: str: The branch to be tagged.
+        dry_run: bool: Perform a dry run that reports on what it would do.
+
+    Returns:
+        None
+    """
+    context.invoke(
+        clean,
+        dry_run=dry_run,
+    )
+
+    if dry_run:
+        click.secho(
+            "[DRYRUN] Performing a dry run, nothing will be built.", fg="yellow"
+        )
+
+    selected_stages = [
+        stage for stage in PIPELINE_STAGES if stage in (stages or PIPELINE_STAGES)
+    ]
+    if "publish" in selected_stages and GITHUB_PUBLISH_TOKEN_SECRET_NAME is None:
+        click.secho(
+            f"No PAT token found for AWS CodeBuild. Please set {GITHUB_PUBLISH_TOKEN_SECRET_NAME} in the environment variables.",
+            fg="red",
+        )
+        sys.exit(1)
+
+    if (
+        GITHUB_APPLICATION_ID
+        and GITHUB_INSTALLATION_ID
+        and GITHUB_SIGNING_CERT_SECRET_NAME
+    ):
+        token = context.invoke(
+            application,
+            application_id_parameter_name=GITHUB_APPLICATION_ID,
+            installation_id_parameter_name=GITHUB_INSTALLATION_ID,
+            signing_cert_secret_name=GITHUB_SIGNING_CERT_SECRET_NAME,
+            token_expiration_seconds=DEFAULT_TOKEN_EXPIRATION_SECONDS,
+        )
+    else:
+        token = read_github_token()
+
+    set_netrc(
+        password=token,
+        dry_run=dry_run,
+    )
+
+    # Like launch service build, an application with a Dockerfile in the current directory is built where it is.
+    if skip_clone or Path.cwd().joinpath(DOCKER_FILE_DIR, DOCKER_FILE_NAME).exists():
+        url = None
+        service_dir = Path.cwd()
+    else:
+        try:
+            url, tag, service_dir = resolve_application_source(url=url, tag=tag)
+        except FileNotFoundError as e:
+            click.secho(str(e), fg="red")
+            sys.exit(1)
+
+    results = run_pipeline(
+        service_dir=service_dir,
+        stages=selected_stages,
+        registry_type=registry_type,
+        push=push,
+        publish_options={
+            "token_secret_name": GITHUB_PUBLISH_TOKEN_SECRET_NAME,
+            "package_scope": package_scope,
+            "package_publisher": package_publisher,
+            "package_registry": package_registry,
+            "source_folder_name": source_folder_name,
+            "repo_path": repo_path,
+            "source_branch": source_branch,
+        },
+        url=url,
+        tag=tag,
+        dry_run=dry_run,
+    )
+
+    click.echo(
+        format_table(
+            headers=["STAGE", "RESULT", "DURATION", "DETAIL"],
+            rows=[
+                [
+                    result.name,
+                    "ok" if result.succeeded else "failed",
+                    f"{result.duration:.1f}s",
+                    result.detail,
+                ]
+                for result in results
+            ],
+        )
+    )
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
@@ -1,18 +1,22 @@
 import logging
+import sys
 from pathlib import Path
 from typing import IO, Any
 
 import click
 from git import Repo
 
-from launch.config.common import PLATFORM_SRC_DIR_PATH
+from launch.config.common import MAX_WORKERS, PLATFORM_SRC_DIR_PATH
 from launch.config.github import GITHUB_ORG_NAME
 from launch.config.launchconfig import SERVICE_MAIN_BRANCH, SERVICE_REMOTE_BRANCH
 from launch.constants.launchconfig import LAUNCHCONFIG_NAME
-from launch.lib.github.repo import repo_exist
+from launch.lib.common.utilities import format_table
+from launch.lib.github.auth import get_github_instance
+from launch.lib.github.repo import repo_exist, select_repositories
 from launch.lib.local_repo.repo import checkout_branch, clone_repository
 from launch.lib.service.common import determine_existing_uuid
 from launch.lib.service.functions import common_service_workflow, prepare_service
+from launch.lib.service.update.functions import update_fleet
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +60,12 @@ logger = logging.getLogger(__name__)
     default=False,
     help="(Optional) If set, it will skip syncing the template files and only update the properties files and directories.",
 )
+@click.option(
+    "--full-sync",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will copy every skeleton file instead of only the files that changed since the skeleton commit recorded in the service.",
+)
 @click.option(
     "--skip-uuid",
     is_flag=True,
@@ -82,6 +92,7 @@ def update(
     skip_git: bool,
     skip_commit: bool,
     skip_sync: bool,
+    full_sync: bool,
     skip_uuid: bool,
     dry_run: bool,
     force: bool,
@@ -97,6 +108,7 @@ def update(
         skip_git (bool): If set, it will ignore cloning and checking out the git repository.
         skip_commit (bool): If set, it will skip commiting the local changes.
         skip_sync (bool): If set, it will skip syncing the template files and only update the properties files and directories.
+        full_sync (bool): If set, it will copy every skeleton file instead of only the files that changed.
         skip_uuid (bool): If set, it will not generate a UUID to be used in skeleton files.
         dry_run (bool): If set, it will not make any changes, but will log what it would.
         force (bool): If set, it will override safeguards.
@@ -161,4 +173,165 @@ def update(
         skip_git=skip_git,
         skip_commit=skip_commit,
         dry_run=dry_run,
+        full_sync=full_sync,
+    )
+
+
+@click.command()
+@click.option(
+    "--organization",
+    default=GITHUB_ORG_NAME,
+    help=f"(Optional) GitHub organization containing the services. Defaults to the {GITHUB_ORG_NAME} organization.",
+)
+@click.option(
+    "--repository",
+    "repositories",
+    multiple=True,
+    help="(Optional) Name of a service repository to update. May be supplied multiple times.",
+)
+@click.option(
+    "--repositories-file",
+    type=click.File("r"),
+    help="(Optional) File containing the names of service repositories to update, one per line.",
+)
+@click.option(
+    "--pattern",
+    "patterns",
+    multiple=True,
+    help="(Optional) Glob pattern matched against the organization's repository names, e.g. 'svc-*'. May be supplied multiple times.",
+)
+@click.option(
+    "--topic",
+    help="(Optional) Only update repositories in the organization that carry this topic.",
+)
+@click.option(
+    "--git-message",
+    default="bot: launch-cli service update commit",
+    help="(Optional) The git commit message to use when creating a commit. Defaults to 'bot: launch service update commit'.",
+)
+@click.option(
+    "--skip-commit",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will skip commiting the local changes.",
+)
+@click.option(
+    "--skip-sync",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will skip syncing the template files and only update the properties files and directories.",
+)
+@click.option(
+    "--skip-uuid",
+    is_flag=True,
+    default=False,
+    help="(Optional) If set, it will not generate a UUID to be used in skeleton files.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=MAX_WORKERS,
+    help=f"(Optional) Maximum number of services updated at once. Defaults to {MAX_WORKERS}.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="(Optional) Perform a dry run that reports on what it would do.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="(Optional) Override safeguards.",
+)
+def update_many(
+    organization: str,
+    repositories: tuple[str],
+    repositories_file: IO[Any],
+    patterns: tuple[str],
+    topic: str,
+    git_message: str,
+    skip_commit: bool,
+    skip_sync: bool,
+    skip_uuid: bool,
+    max_workers: int,
+    dry_run: bool,
+    force: bool,
+):
+    """
+    Updates a fleet of services concurrently. Services are selected by name, by a glob pattern, or by topic, and are
+    cloned into the current directory. Services generated from the same skeleton share one skeleton checkout. A table
+    with the result for every service is printed when all updates have finished.
+
+    Args:
+        organization (str): GitHub organization containing the services.
+        repositories (tuple[str]): Names of service repositories to update.
+        repositories_file (IO[Any]): File containing names of service repositories to update, one per line.
+        patterns (tuple[str]): Glob patterns matched against the organization's repository names.
+        topic (str): Only update repositories that carry this topic.
+        git_message (str): The git commit message to use when creating a commit.
+        skip_commit (bool): If set, it will skip commiting the local changes.
+        skip_sync (bool): If set, it will skip syncing the template files and only update the properties files and directories.
+        skip_uuid (bool): If set, it will not generate a UUID to be used in skeleton files.
+        max_workers (int): Maximum number of services updated at once.
+        dry_run (bool): If set, it will not make any changes, but will log what it would.
+        force (bool): If set, it will override safeguards.
+    """
+    if dry_run:
+        click.secho(
+            "[DRYRUN] Performing a dry run, nothing will be updated", fg="yellow"
+        )
+
+    names = list(repositories)
+    if repositories_file:
+        names.extend(
+            line.strip() for line in repositories_file.readlines() if line.strip()
+        )
+    if not names and not patterns and not topic:
+        click.secho(
+            "You must select services with at least one of --repository, --repositories-file, --pattern or --topic.",
+            fg="red",
+        )
+        sys.exit(1)
+
+    g = get_github_instance()
+    selected = select_repositories(
+        g=g,
+        organization=organization,
+        names=names,
+        patterns=list(patterns),
+        topic=topic,
+    )
+    if not selected:
+        click.secho("No repositories matched the supplied filters.", fg="yellow")
+        return
+
+    results = update_fleet(
+        repositories=selected,
+        workdir=Path.cwd(),
+        git_message=git_message,
+        skip_sync=skip_sync,
+        skip_uuid=skip_uuid,
+        skip_commit=skip_commit,
+        force=force,
+        max_workers=max_workers,
+        dry_run=dry_run,
+    )
+
+    click.echo(
+        format_table(
+            headers=["REPOSITORY", "RESULT", "DURATION", "DETAIL"],
+            rows=[
+                [
+                    result.name,
+                    "ok" if result.succeeded else "failed",
+                    f"{result.duration:.1f}s",
+                    result.value if result.succeeded else result.detail,
+                ]
+                for result in results
+            ],
+        )
     )
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
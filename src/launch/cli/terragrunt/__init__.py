@@ -15,7 +15,11 @@ from launch.cli.common.options.aws import (
 from launch.cli.github.auth.commands import application
 from launch.cli.service.generate import generate
 from launch.config.aws import AWS_LAMBDA_CODEBUILD_ENV_VAR_FILE
-from launch.config.common import BUILD_TEMP_DIR_PATH, PLATFORM_SRC_DIR_PATH
+from launch.config.common import (
+    BUILD_TEMP_DIR_PATH,
+    PLATFORM_SRC_DIR_PATH,
+    TOOL_VERSION_FILE,
+)
 from launch.config.container import (
     CONTAINER_IMAGE_NAME,
     CONTAINER_IMAGE_VERSION,
@@ -30,7 +34,7 @@ from launch.config.github import (
 from launch.config.launchconfig import SERVICE_MAIN_BRANCH
 from launch.config.terragrunt import TARGETENV, TERRAGRUNT_RUN_DIRS
 from launch.config.webhook import WEBHOOK_GIT_REPO_URL
-from launch.constants.launchconfig import LAUNCHCONFIG_NAME
+from launch.constants.launchconfig import LAUNCHCONFIG_NAME, LAUNCHCONFIG_PATH_LOCAL
 from launch.enums.launchconfig import LAUNCHCONFIG_KEYS
 from launch.lib.automation.common.functions import is_platform_git_changes, single_true
 from launch.lib.automation.environment.functions import (
@@ -40,7 +44,7 @@ from launch.lib.automation.environment.functions import (
 )
 from launch.lib.automation.processes.functions import git_config
 from launch.lib.automation.provider.aws.functions import assume_role
-from launch.lib.automation.provider.az.functions import deploy_remote_state
+from launch.lib.automation.provider.az.functions import deploy_remote_states
 from launch.lib.automation.terragrunt.functions import (
     copy_webhook,
     create_tf_auto_file,
@@ -222,21 +226,16 @@ def terragrunt(
                 url = f"{temp_server_url}/{temp_org}/{temp_repo}"
                 tag = readFile("MERGE_COMMIT_ID")
 
+    # The service repository checkout, and the build directory generated from it.
     if url:
-        build_path = (
-            Path()
-            .cwd()
-            .joinpath(
-                f"{extract_repo_name_from_url(url)}/{BUILD_TEMP_DIR_PATH}/{extract_repo_name_from_url(url)}"
-            )
+        repo_path = Path().cwd().joinpath(extract_repo_name_from_url(url))
+        build_path = repo_path.joinpath(
+            f"{BUILD_TEMP_DIR_PATH}/{extract_repo_name_from_url(url)}"
         )
     else:
-        build_path = (
-            Path()
-            .cwd()
-            .joinpath(
-                f"{BUILD_TEMP_DIR_PATH}/{extract_repo_name_from_url(Repo(Path().cwd()).remotes.origin.url)}"
-            )
+        repo_path = Path().cwd()
+        build_path = repo_path.joinpath(
+            f"{BUILD_TEMP_DIR_PATH}/{extract_repo_name_from_url(Repo(repo_path).remotes.origin.url)}"
         )
 
     webhooks_path = (
@@ -248,7 +247,6 @@ def terragrunt(
     )
 
     if check_diff:
-        os.chdir(build_path)
         is_platform_git_changes(
             repository=Repo(build_path),
             commit_id=tag,
@@ -263,9 +261,9 @@ def terragrunt(
             dry_run=dry_run,
         )
     else:
-        input_data=load_launchconfig()
+        input_data = load_launchconfig(repo_path.joinpath(LAUNCHCONFIG_PATH_LOCAL))
 
-    install_tool_versions()
+    install_tool_versions(file=str(repo_path.joinpath(TOOL_VERSION_FILE)))
     if IS_PIPELINE:
         git_config(
             dry_run=dry_run
@@ -325,46 +323,51 @@ def terragrunt(
             message = f"Error: Path {tg_dir} does not exist."
             click.secho(message, fg="red")
             raise FileNotFoundError(message)
-        os.chdir(tg_dir)
-        for instance in os.scandir(tg_dir):
-            if instance.is_dir():
-                # If the Provider is AZURE we need to deploy the remote state
-                if provider == "az" or provider == "ado":
-                    if platform_resource == "service":
-                        uuid_value = input_data["platform"][platform_resource][target_environment][deployment_region][instance.name][LAUNCHCONFIG_KEYS.UUID.value]
-                    else:
-                        uuid_value = input_data["platform"]["pipeline"][f"{platform_resource}-provider"][target_environment][deployment_region][instance.name][LAUNCHCONFIG_KEYS.UUID.value]
-                    deploy_remote_state(
-                        uuid_value = uuid_value,
-                        naming_prefix = input_data["naming_prefix"],
-                        target_environment = target_environment,
-                        region = deployment_region,
-                        instance = instance.name,
-                        build_path = build_path,
-                        dry_run = dry_run,
+        instances = [instance for instance in os.scandir(tg_dir) if instance.is_dir()]
+        # If the Provider is AZURE we need to deploy the remote state
+        if provider == "az" or provider == "ado":
+            if platform_resource == "service":
+                instance_data = input_data["platform"][platform_resource][target_environment][deployment_region]
+            else:
+                instance_data = input_data["platform"]["pipeline"][f"{platform_resource}-provider"][target_environment][deployment_region]
+            deploy_remote_states(
+                instances = {
+                    instance.name: instance_data[instance.name][LAUNCHCONFIG_KEYS.UUID.value]
+                    for instance in instances
+                },
+                naming_prefix = input_data["naming_prefix"],
+                target_environment = target_environment,
+                region = deployment_region,
+                build_path = build_path,
+                dry_run = dry_run,
+            )
+        if render_app_vars:
+            for instance in instances:
+                create_tf_auto_file(
+                    data={
+                        "app_image": f'"{CONTAINER_REGISTRY}/{CONTAINER_IMAGE_NAME}:{app_image_version}"',
+                        "redeploy_on_apply": "true",
+                        "force_new_deployment": "true",
+                    },
+                    out_file=tg_dir.joinpath(instance, "app_image.auto.tfvars"),
+                    dry_run=dry_run,
                     )
-                if render_app_vars:
-                    create_tf_auto_file(
-                        data={
-                            "app_image": f'"{CONTAINER_REGISTRY}/{CONTAINER_IMAGE_NAME}:{app_image_version}"',
-                            "redeploy_on_apply": "true",
-                            "force_new_deployment": "true",
-                        },
-                        out_file=tg_dir.joinpath(instance, "app_image.auto.tfvars"),
-                        dry_run=dry_run,
-                        )
         terragrunt_init(
             dry_run=dry_run,
+            cwd=tg_dir,
         )
         if plan:
             terragrunt_plan(
                 dry_run=dry_run,
+                cwd=tg_dir,
             )
         elif apply:
             terragrunt_apply(
                 dry_run=dry_run,
+                cwd=tg_dir,
             )
         elif destroy:
             terragrunt_destroy(
                 dry_run=dry_run,
+                cwd=tg_dir,
             )
@@ -1,6 +1,6 @@
 import click
 
-from .commands import branch_name
+from .commands import branch_name, refs
 
 
 @click.group(name="validate")
@@ -9,3 +9,4 @@ def validate_group():
 
 
 validate_group.add_command(branch_name)
+validate_group.add_command(refs)
@@ -4,8 +4,12 @@ from pathlib import Path
 
 import click
 
+from launch.config.launchconfig import SERVICE_MAIN_BRANCH
+from launch.lib.local_repo.hooks import RefStatus, validate_ref_updates
 from launch.lib.local_repo.predict import validate_name
-from launch.lib.local_repo.repo import acquire_repo
+
+# Git and GitHub libraries are only imported when a command needs them, so validation can run from server-side hooks
+# without loading them.
 
 
 @click.command()
@@ -23,6 +27,8 @@ def branch_name(branch_name: str):
     if git_path.exists() and git_path.is_dir():
         # We're in a Git repo
         if not branch_name:
+            from launch.lib.local_repo.repo import acquire_repo
+
             this_repo = acquire_repo(cwd)
             try:
                 branch_name = this_repo.active_branch.name
@@ -48,3 +54,24 @@ def branch_name(branch_name: str):
     except Exception as e:
         click.secho(e, fg="red")
         sys.exit(1)
+
+
+@click.command()
+@click.option(
+    "--allow-branch",
+    multiple=True,
+    default=[SERVICE_MAIN_BRANCH],
+    help=f"Name of a branch that is accepted without validation. Can be supplied multiple times. Defaults to {SERVICE_MAIN_BRANCH}.",
+)
+def refs(allow_branch: tuple[str]):
+    """Validates the branch names of the ref updates read from stdin, one per line in the format of a git pre-receive hook: <old-sha> <new-sha> <ref-name>. Prints the outcome for each ref as it is read, and exits with 1 if any branch name isn't valid. Tags and deleted branches are skipped."""
+    invalid = False
+    for result in validate_ref_updates(lines=sys.stdin, allowed_branches=allow_branch):
+        if result.status == RefStatus.INVALID:
+            invalid = True
+            click.secho(f"{result.ref} isn't valid: {result.reason}", fg="red")
+        elif result.status == RefStatus.VALID:
+            click.secho(f"{result.ref} is valid.", fg="green")
+        else:
+            click.echo(f"{result.ref} skipped, {result.reason}.")
+    sys.exit(1 if invalid else 0)
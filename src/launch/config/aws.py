@@ -29,3 +29,30 @@ SM_AWS_REGION = override_default(
     key_name="SM_AWS_REGION",
     default=AWS_REGION,
 )
+
+AWS_ROLE_SESSION_NAME = override_default(
+    key_name="AWS_ROLE_SESSION_NAME",
+    default="caf-build-agent",
+)
+
+AWS_SHARED_CREDENTIALS_FILE = override_default(
+    key_name="AWS_SHARED_CREDENTIALS_FILE",
+    default="~/.aws/credentials",
+)
+
+AWS_CONFIG_FILE = override_default(
+    key_name="AWS_CONFIG_FILE",
+    default="~/.aws/config",
+)
+
+AWS_CREDENTIALS_CACHE_DIR = override_default(
+    key_name="AWS_CREDENTIALS_CACHE_DIR",
+    default="~/.launch/aws",
+)
+
+AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS = int(
+    override_default(
+        key_name="AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS",
+        default=300,
+    )
+)
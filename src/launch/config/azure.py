@@ -0,0 +1,6 @@
+from launch.env import override_default
+
+AZURE_REMOTE_STATE_CONTAINER_NAME = override_default(
+    key_name="AZURE_REMOTE_STATE_CONTAINER_NAME",
+    default="tfstate",
+)
@@ -27,6 +27,13 @@ DOCKER_FILE_NAME = override_default(
 
 IS_PIPELINE = get_bool_env_var(env_var_name="IS_PIPELINE", default_value=False)
 
+MAX_WORKERS = int(
+    override_default(
+        key_name="MAX_WORKERS",
+        default=8,
+    )
+)
+
 PLATFORM_SRC_DIR_PATH = override_default(
     key_name="PLATFORM_SRC_DIR_PATH",
     default="platform",
@@ -42,7 +49,22 @@ TOOL_VERSION_FILE = override_default(
     default=".tool-versions",
 )
 
+ASDF_DATA_DIR = override_default(
+    key_name="ASDF_DATA_DIR",
+    default="~/.asdf",
+)
+
+# When set, the installed toolchain is saved to and restored from a tarball in this directory, keyed by a fingerprint
+# of the tool versions file.
+TOOLCHAIN_CACHE_DIR = override_default(
+    key_name="TOOLCHAIN_CACHE_DIR",
+    default=None,
+)
+
 NON_SECRET_J2_TEMPLATE_NAME = override_default(
     key_name="NON_SECRET_J2_TEMPLATE_NAME",
     default="non_secret.yaml",
 )
+
+# Persist the index of tags by commit in the repository's git directory, so it is only rebuilt when tags change.
+TAG_INDEX_CACHE = get_bool_env_var(env_var_name="TAG_INDEX_CACHE", default_value=True)
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from launch.env import override_default
 
 CONTAINER_IMAGE_NAME = override_default(
@@ -14,3 +17,45 @@ CONTAINER_REGISTRY = override_default(
     key_name="CONTAINER_REGISTRY",
     default=None,
 )
+
+DOCKER_HOST = override_default(
+    key_name="DOCKER_HOST",
+    default="unix:///var/run/docker.sock",
+)
+
+# Like the docker CLI, any non-empty DOCKER_TLS_VERIFY or DOCKER_TLS means the daemon is reached over TLS.
+DOCKER_TLS = bool(
+    override_default(key_name="DOCKER_TLS_VERIFY", default=None)
+    or override_default(key_name="DOCKER_TLS", default=None)
+)
+
+DOCKER_STARTUP_TIMEOUT_SECONDS = float(
+    override_default(
+        key_name="DOCKER_STARTUP_TIMEOUT_SECONDS",
+        default=60,
+    )
+)
+
+DOCKER_DAEMON_LOG = override_default(
+    key_name="DOCKER_DAEMON_LOG",
+    default=os.path.join(tempfile.gettempdir(), "launch-dockerd.log"),
+)
+
+# When set, BuildKit is enabled and builds are pointed at a local layer cache in this directory.
+DOCKER_BUILDKIT_CACHE_DIR = override_default(
+    key_name="DOCKER_BUILDKIT_CACHE_DIR",
+    default=None,
+)
+
+# How launch service build checks whether the application has already been built: "local" keeps a record of
+# previous builds in BUILD_CACHE_DIR and checks their image is still in the docker daemon, or in the registry once
+# pushed, "registry" looks for the image in the registry, "none" always builds.
+BUILD_CACHE_CHECKER = override_default(
+    key_name="BUILD_CACHE_CHECKER",
+    default="local",
+)
+
+BUILD_CACHE_DIR = override_default(
+    key_name="BUILD_CACHE_DIR",
+    default="~/.launch/cache/build",
+)
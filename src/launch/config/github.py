@@ -1,4 +1,10 @@
-from launch.env import override_default
+from launch.constants.launchconfig import LAUNCHCONFIG_HOME_LOCAL
+from launch.env import get_bool_env_var, override_default
+
+GITHUB_API_URL = override_default(
+    key_name="GITHUB_API_URL",
+    default="https://api.github.com",
+)
 
 GITHUB_ORG_NAME = override_default(
     key_name="GITHUB_ORG_NAME",
@@ -53,6 +59,67 @@ DEFAULT_TOKEN_EXPIRATION_SECONDS = override_default(
     default=600,
 )
 
+# Where installation tokens are cached between invocations: "memory", "file" or "keyring".
+GITHUB_TOKEN_CACHE = override_default(
+    key_name="GITHUB_TOKEN_CACHE",
+    default="memory",
+)
+
+GITHUB_TOKEN_CACHE_DIR = override_default(
+    key_name="GITHUB_TOKEN_CACHE_DIR",
+    default=str(LAUNCHCONFIG_HOME_LOCAL.with_name(".launch").joinpath("tokens")),
+)
+
+# Fernet key used to encrypt tokens cached on disk. Tokens are never written to disk unencrypted.
+GITHUB_TOKEN_CACHE_KEY = override_default(
+    key_name="GITHUB_TOKEN_CACHE_KEY",
+    default=None,
+)
+
+GITHUB_TOKEN_REFRESH_MARGIN_SECONDS = int(
+    override_default(
+        key_name="GITHUB_TOKEN_REFRESH_MARGIN_SECONDS",
+        default=300,
+    )
+)
+
+# Whether GitHub API reads are cached on disk and revalidated with conditional requests. A revalidated response that
+# hasn't changed doesn't count against the primary rate limit.
+GITHUB_HTTP_CACHE = get_bool_env_var(
+    env_var_name="GITHUB_HTTP_CACHE", default_value=False
+)
+
+GITHUB_HTTP_CACHE_PATH = override_default(
+    key_name="GITHUB_HTTP_CACHE_PATH",
+    default=str(
+        LAUNCHCONFIG_HOME_LOCAL.with_name(".launch").joinpath("cache", "github.sqlite3")
+    ),
+)
+
+GITHUB_HTTP_CACHE_MAX_BYTES = int(
+    override_default(
+        key_name="GITHUB_HTTP_CACHE_MAX_BYTES",
+        default=100 * 1024 * 1024,
+    )
+)
+
+# Pace of the requests made by commands that operate on many repositories. It is lowered automatically when the rate
+# limit reported by GitHub wouldn't last until it resets.
+GITHUB_REQUESTS_PER_SECOND = float(
+    override_default(
+        key_name="GITHUB_REQUESTS_PER_SECOND",
+        default=10,
+    )
+)
+
+# Requests the asyncio GitHub client keeps in flight at once.
+GITHUB_MAX_CONNECTIONS = int(
+    override_default(
+        key_name="GITHUB_MAX_CONNECTIONS",
+        default=32,
+    )
+)
+
 GITHUB_PUBLISH_TOKEN_SECRET_NAME = override_default(
     key_name="GITHUB_PUBLISH_TOKEN_SECRET_NAME",
     default=None,
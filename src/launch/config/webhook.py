@@ -19,3 +19,8 @@ WEBHOOK_ZIP = override_default(
     key_name="WEBHOOK_ZIP",
     default="lambda.zip",
 )
+
+WEBHOOK_CACHE_DIR = override_default(
+    key_name="WEBHOOK_CACHE_DIR",
+    default="~/.launch/cache/webhook",
+)
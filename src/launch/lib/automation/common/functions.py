@@ -2,9 +2,10 @@ import itertools
 import logging
 import pathlib
 import shutil
+import subprocess
 
 import click
-from git import Repo
+from git import GitCommandError, Repo
 from ruamel.yaml import YAML
 
 from launch.config.launchconfig import SERVICE_MAIN_BRANCH
@@ -14,62 +15,141 @@ logger = logging.getLogger(__name__)
 
 
 ## Other Functions
+def fetch_commits(repository: Repo, main_branch: str, commit_id: str) -> None:
+    """Fetches only the main branch and, when it isn't already present, the commit being compared, instead of every
+    ref of origin. In a shallow clone the fetches stay shallow, deep enough to reach the parent of the main branch.
+
+    Args:
+        repository (Repo): The local repository.
+        main_branch (str): Name of the main branch.
+        commit_id (str): The commit being compared with the main branch.
+    """
+    shallow = repository.git.rev_parse("--is-shallow-repository") == "true"
+    depth = ["--depth=2"] if shallow else []
+    repository.git.fetch(
+        *depth,
+        "origin",
+        f"+refs/heads/{main_branch}:refs/remotes/origin/{main_branch}",
+    )
+    try:
+        repository.git.cat_file("-e", f"{commit_id}^{{commit}}")
+    except GitCommandError:
+        repository.git.fetch(*depth, "origin", commit_id)
+
+
+def _changed_paths(repository: Repo, from_commit: str, to_commit: str):
+    """Yields the paths that differ between two commits as git prints them, so callers can stop reading early."""
+    process = subprocess.Popen(
+        ["git", "diff", "--name-only", "-z", "--no-renames", from_commit, to_commit],
+        cwd=repository.working_tree_dir or repository.git_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        remainder = b""
+        for chunk in iter(lambda: process.stdout.read(65536), b""):
+            *paths, remainder = (remainder + chunk).split(b"\0")
+            for path in paths:
+                yield path.decode(errors="surrogateescape")
+        if remainder:
+            yield remainder.decode(errors="surrogateescape")
+        if process.wait() != 0:
+            raise GitCommandError(
+                ["git", "diff", from_commit, to_commit],
+                process.returncode,
+                process.stderr.read(),
+            )
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        process.stderr.close()
+
+
 def is_platform_git_changes(
     repository: Repo,
     commit_id: str,
     directory: str,
     main_branch: str = SERVICE_MAIN_BRANCH,
 ) -> bool:
+    """Checks whether the changes between a commit and the main branch are confined to a directory. The changed paths
+    come from a single name-only diff, which is read only until changes both inside and outside the directory are
+    found.
+
+    Args:
+        repository (Repo): The local repository.
+        commit_id (str): The commit being deployed.
+        directory (str): The directory, relative to the root of the repository or absolute.
+        main_branch (str, optional): Name of the main branch. Defaults to SERVICE_MAIN_BRANCH.
+
+    Raises:
+        RuntimeError: If there are changes both inside and outside the directory.
+
+    Returns:
+        bool: True if there are changes, all of them inside the directory, False if there are none inside it.
+    """
     click.secho(
         f"Checking if git changes are exclusive to: {directory}",
     )
-    origin = repository.remotes.origin
-    origin.fetch()
+    fetch_commits(repository=repository, main_branch=main_branch, commit_id=commit_id)
 
-    commit_main = repository.commit(f"origin/{main_branch}")
+    commit_main = repository.git.rev_parse(f"origin/{main_branch}")
 
     # Check if the PR commit hash is the same as the commit sha of the main branch
-    if commit_id == repository.rev_parse(f"origin/{main_branch}"):
+    if commit_id == commit_main:
         click.secho(
             f"Commit hash is the same as origin/{main_branch}",
         )
-        commit_compare = repository.commit(f"origin/{main_branch}^")
+        commit_compare = repository.git.rev_parse(f"origin/{main_branch}^")
     # PR commit sha is not the same as the commit sha of the main branch. Thus we want whats been changed since because
     # terragrunt will apply all changes.
     else:
-        commit_compare = repository.commit(commit_id)
-
-    # Get the diff between of the last commit only inside the platform/pipline directory
-    exclusive_dir_diff = commit_compare.diff(
-        commit_main, paths=directory, name_only=True
-    )
-    # Get the diff between of the last commit only outside the platform/pipline directory
-    diff = commit_compare.diff(commit_main, name_only=True)
-    excluding_dir_diff = [
-        item.a_path for item in diff if not item.a_path.startswith(directory)
-    ]
-
-    # If there are no git changes, return false.
-    if not exclusive_dir_diff:
-        click.secho(
-            f"No changes found in {directory}",
-        )
-        return False
-    else:
+        commit_compare = commit_id
+
+    prefix = _repository_relative(repository=repository, directory=directory)
+    inside = outside = False
+    for path in _changed_paths(
+        repository=repository, from_commit=commit_compare, to_commit=commit_main
+    ):
+        if not prefix or path == prefix or path.startswith(f"{prefix}/"):
+            inside = True
+        else:
+            outside = True
         # If both are true, we want to throw to prevent simultaneous infrastructure and service changes.
-        if excluding_dir_diff:
+        if inside and outside:
             message = f"Changes found in both inside and outside dir: {directory}"
             click.secho(
                 message,
                 fg="red",
             )
             raise RuntimeError(message)
-        # If only the infrastructure directory has changes, return true.
-        else:
-            click.secho(
-                f"Git changes only found in folder: {directory}",
-            )
-            return True
+
+    # If there are no git changes, return false.
+    if not inside:
+        click.secho(
+            f"No changes found in {directory}",
+        )
+        return False
+    # If only the infrastructure directory has changes, return true.
+    click.secho(
+        f"Git changes only found in folder: {directory}",
+    )
+    return True
+
+
+def _repository_relative(repository: Repo, directory: str) -> str:
+    """Returns a directory relative to the root of a repository, with forward slashes and without a trailing slash.
+    The root itself is returned as an empty string."""
+    path = pathlib.PurePath(directory)
+    if path.is_absolute() and repository.working_tree_dir:
+        path = (
+            pathlib.Path(directory)
+            .resolve()
+            .relative_to(pathlib.Path(repository.working_tree_dir).resolve())
+        )
+    relative = path.as_posix().strip("/")
+    return "" if relative == "." else relative
 
 
 def discover_files(
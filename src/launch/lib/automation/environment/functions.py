@@ -1,13 +1,25 @@
+import hashlib
+import json
 import logging
 import os
+import platform
 import subprocess
+import tarfile
+from functools import partial
 from pathlib import Path
 
 import click
 
 from launch.config.aws import AWS_LAMBDA_CODEBUILD_ENV_VAR_FILE
-from launch.config.common import IS_PIPELINE, TOOL_VERSION_FILE
+from launch.config.common import (
+    ASDF_DATA_DIR,
+    IS_PIPELINE,
+    TOOL_VERSION_FILE,
+    TOOLCHAIN_CACHE_DIR,
+)
 from launch.config.github import GIT_MACHINE_USER, GIT_SCM_ENDPOINT
+from launch.lib.automation.processes.runner import run_command
+from launch.lib.common.utilities.concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -24,22 +36,169 @@ def parse_plugin_line(line: str) -> tuple[str, str, str | None]:
     return plugin_name, plugin_version, plugin_url
 
 
-def install_tool_versions(file: str = TOOL_VERSION_FILE) -> None:
+def read_tool_versions(
+    file: str = TOOL_VERSION_FILE,
+) -> list[tuple[str, str, str | None]]:
+    with open(file, "r") as fh:
+        lines = fh.readlines()
+    return [parse_plugin_line(line.strip()) for line in lines if line.strip()]
+
+
+def tool_versions_fingerprint(tools: list[tuple[str, str, str | None]]) -> str:
+    """Returns a fingerprint of the tools to install and the platform they are installed on."""
+    return hashlib.sha256(
+        json.dumps(
+            [platform.system(), platform.machine(), sorted(tools, key=str)]
+        ).encode()
+    ).hexdigest()
+
+
+def installed_asdf_plugins() -> set[str]:
+    result = run_command(
+        ["asdf", "plugin", "list"],
+        check=False,
+        capture=True,
+        stream=False,
+        merge_stderr=False,
+    )
+    return {line.strip() for line in result.output.splitlines() if line.strip()}
+
+
+def missing_tool_versions(
+    tools: list[tuple[str, str, str | None]], data_dir: str = ASDF_DATA_DIR
+) -> list[tuple[str, str, str | None]]:
+    installs = Path(data_dir).expanduser().joinpath("installs")
+    # A "system" version is provided by the host rather than installed by asdf.
+    return [
+        tool
+        for tool in tools
+        if tool[1] != "system" and not installs.joinpath(tool[0], tool[1]).is_dir()
+    ]
+
+
+def add_asdf_plugins(tools: list[tuple[str, str, str | None]]) -> None:
+    """Adds the asdf plugins of the tools that aren't added yet, concurrently.
+
+    Args:
+        tools (list[tuple[str, str, str | None]]): Parsed lines of the tool versions file.
+
+    Raises:
+        RuntimeError: If adding any of the plugins failed.
+    """
+    installed = installed_asdf_plugins()
+    tasks = {}
+    for plugin_name, _, plugin_url in tools:
+        if plugin_name in installed or plugin_name in tasks:
+            continue
+        command = ["asdf", "plugin", "add", plugin_name]
+        if plugin_url:
+            command.append(plugin_url)
+        tasks[plugin_name] = partial(run_command, command, prefix=plugin_name)
+
+    failed = [
+        result for result in run_concurrently(tasks=tasks) if not result.succeeded
+    ]
+    if failed:
+        raise RuntimeError(
+            "Failed to add asdf plugins: "
+            + ", ".join(f"{result.name} ({result.detail})" for result in failed)
+        )
+
+
+def restore_toolchain(
+    fingerprint: str,
+    cache_dir: str = TOOLCHAIN_CACHE_DIR,
+    data_dir: str = ASDF_DATA_DIR,
+) -> bool:
+    tarball = Path(cache_dir).expanduser().joinpath(f"{fingerprint}.tar.gz")
+    if not tarball.exists():
+        return False
+    logger.info(f"Restoring asdf toolchain from {tarball}")
+    try:
+        with tarfile.open(tarball, "r:gz") as archive:
+            # Extraction filters were added in a 3.11 patch release.
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(Path(data_dir).expanduser(), filter="data")
+            else:
+                archive.extractall(Path(data_dir).expanduser())
+        run_command(["asdf", "reshim"])
+    except (OSError, tarfile.TarError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Failed to restore asdf toolchain from {tarball}: {e}")
+        return False
+    return True
+
+
+def save_toolchain(
+    fingerprint: str,
+    tools: list[tuple[str, str, str | None]],
+    cache_dir: str = TOOLCHAIN_CACHE_DIR,
+    data_dir: str = ASDF_DATA_DIR,
+) -> None:
+    data_path = Path(data_dir).expanduser()
+    tarball = Path(cache_dir).expanduser().joinpath(f"{fingerprint}.tar.gz")
+    temporary_tarball = tarball.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tarball.parent.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(temporary_tarball, "w:gz") as archive:
+            for plugin_name, plugin_version, _ in tools:
+                for path in (
+                    Path("plugins", plugin_name),
+                    Path("installs", plugin_name, plugin_version),
+                ):
+                    if data_path.joinpath(path).exists():
+                        archive.add(data_path.joinpath(path), arcname=path)
+        temporary_tarball.replace(tarball)
+        logger.info(f"Saved asdf toolchain to {tarball}")
+    except (OSError, tarfile.TarError) as e:
+        temporary_tarball.unlink(missing_ok=True)
+        logger.warning(f"Failed to save asdf toolchain to {tarball}: {e}")
+
+
+def install_tool_versions(
+    file: str = TOOL_VERSION_FILE,
+    cache_dir: str | None = TOOLCHAIN_CACHE_DIR,
+    data_dir: str = ASDF_DATA_DIR,
+) -> None:
+    """Installs the tools listed in a tool versions file with asdf. Tools that are already installed are skipped,
+    missing plugins are added concurrently, and when cache_dir is set the toolchain is restored from and saved to a
+    tarball keyed by a fingerprint of the file.
+
+    Args:
+        file (str, optional): Path of the tool versions file. Defaults to TOOL_VERSION_FILE.
+        cache_dir (str | None, optional): Directory of toolchain tarballs. Defaults to TOOLCHAIN_CACHE_DIR.
+        data_dir (str, optional): The asdf data directory. Defaults to ASDF_DATA_DIR.
+
+    Raises:
+        RuntimeError: If reading the file or installing any of the tools failed.
+    """
     logger.info("Installing all asdf plugins under .tool-versions")
     try:
-        with open(file, "r") as fh:
-            lines = fh.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if line:
-                plugin_name, _, plugin_url = parse_plugin_line(line)
-                if plugin_url:
-                    subprocess.run(["asdf", "plugin", "add", plugin_name, plugin_url])
-                else:
-                    subprocess.run(["asdf", "plugin", "add", plugin_name])
-
-        subprocess.run(["asdf", "install"])
+        tools = read_tool_versions(file=file)
+        if not missing_tool_versions(tools=tools, data_dir=data_dir):
+            logger.info("All asdf tools are already installed")
+            return
+
+        fingerprint = tool_versions_fingerprint(tools=tools)
+        if (
+            cache_dir
+            and restore_toolchain(
+                fingerprint=fingerprint, cache_dir=cache_dir, data_dir=data_dir
+            )
+            and not missing_tool_versions(tools=tools, data_dir=data_dir)
+        ):
+            return
+
+        add_asdf_plugins(tools=tools)
+        # asdf install reads the .tool-versions of its working directory.
+        run_command(["asdf", "install"], cwd=Path(file).parent)
+
+        if cache_dir:
+            save_toolchain(
+                fingerprint=fingerprint,
+                tools=tools,
+                cache_dir=cache_dir,
+                data_dir=data_dir,
+            )
     except Exception as e:
         raise RuntimeError(
             f"An error occurred with asdf install {file}: {str(e)}"
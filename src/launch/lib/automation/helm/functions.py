@@ -1,12 +1,12 @@
 import logging
 import pathlib
-import subprocess
 
 from launch.lib.automation.common.functions import (
     discover_files,
     load_yaml,
     unpack_archive,
 )
+from launch.lib.automation.processes.runner import run_command
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ def resolve_dependencies(
     if not dry_run:
         add_dependency_repositories(dependencies)
 
-        subprocess.call(["helm", "dep", "build", "."], cwd=helm_directory)
+        run_command(["helm", "dep", "build", "."], cwd=helm_directory, check=False)
 
         resolve_next_layer_dependencies(
             dependencies, helm_directory, global_dependencies, dry_run=dry_run
@@ -94,8 +94,9 @@ def add_dependency_repositories(dependencies: list[dict[str, str]]) -> None:
             logger.debug(
                 f"Running: helm repo add {dependency['name']} {dependency['repository']}"
             )
-            subprocess.call(
-                ["helm", "repo", "add", dependency["name"], dependency["repository"]]
+            run_command(
+                ["helm", "repo", "add", dependency["name"], dependency["repository"]],
+                check=False,
             )
 
 
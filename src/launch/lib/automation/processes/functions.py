@@ -1,16 +1,32 @@
+import http.client
+import logging
 import os
+import socket
 import subprocess
 import time
+import urllib.parse
+from pathlib import Path
 
 import click
 
+from launch.config.container import (
+    DOCKER_BUILDKIT_CACHE_DIR,
+    DOCKER_DAEMON_LOG,
+    DOCKER_HOST,
+    DOCKER_STARTUP_TIMEOUT_SECONDS,
+    DOCKER_TLS,
+)
+from launch.lib.automation.processes.runner import run_command
 from launch.lib.github.generate_github_token import get_secret_value
 from launch.lib.local_repo.predict import predict_version
 from launch.lib.local_repo.tags import read_semantic_tags
 
+logger = logging.getLogger(__name__)
+
 
 def make_configure(
     dry_run: bool = True,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make configure")
     try:
@@ -20,13 +36,14 @@ def make_configure(
                 fg="yellow",
             )
         else:
-            subprocess.run(["make", "configure"], check=True)
+            run_command(["make", "configure"], cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
 
 def make_build(
     dry_run: bool = True,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make build")
     try:
@@ -36,14 +53,14 @@ def make_build(
                 fg="yellow",
             )
         else:
-            env = os.environ.copy()
-            subprocess.run(["make", "build"], env=env, check=True)
+            run_command(["make", "build"], cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
 
 def make_install(
     dry_run: bool = True,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make install")
     try:
@@ -53,14 +70,14 @@ def make_install(
                 fg="yellow",
             )
         else:
-            env = os.environ.copy()
-            subprocess.run(["make", "install"], env=env, check=True)
+            run_command(["make", "install"], cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
 
 def make_test(
     dry_run: bool = True,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make test")
     try:
@@ -70,14 +87,14 @@ def make_test(
                 fg="yellow",
             )
         else:
-            env = os.environ.copy()
-            subprocess.run(["make", "test"], env=env, check=True)
+            run_command(["make", "test"], cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
 
 def make_push(
     dry_run: bool = True,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make push")
     try:
@@ -87,8 +104,7 @@ def make_push(
                 fg="yellow",
             )
         else:
-            env = os.environ.copy()
-            subprocess.run(["make", "push"], env=env, check=True)
+            run_command(["make", "push"], cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
@@ -102,6 +118,7 @@ def make_publish(
     source_folder_name: str = None,
     repo_path: str = None,
     source_branch: str = None,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make publish")
     try:
@@ -121,11 +138,9 @@ def make_publish(
                 )
                 click.echo(f"predicted_version is: {predicted_version}")
                 # Update package.json to reflect new version
-                subprocess.run(
-                    f"make version TAG={predicted_version}", shell=True, check=True
-                )
+                run_command(["make", "version", f"TAG={predicted_version}"], cwd=cwd)
                 # NPM login
-                subprocess.run(
+                run_command(
                     [
                         "make",
                         "login",
@@ -134,10 +149,11 @@ def make_publish(
                         f"PACKAGE_SCOPE={package_scope}",
                         f"TOKEN={token}",
                     ],
-                    check=True,
+                    cwd=cwd,
+                    redact=[token],
                 )
                 # Publish to npm registry
-                subprocess.run(["make", "publish"], check=True)
+                run_command(["make", "publish"], cwd=cwd)
             else:
                 click.secho(
                     "Valid PAT token must be provided to publish to npm registry",
@@ -151,6 +167,7 @@ def make_publish(
 # Move to AWS Provider.
 def make_docker_aws_ecr_login(
     dry_run: bool = True,
+    cwd: Path | None = None,
 ) -> None:
     click.secho("Running make docker/aws_ecr_login")
     try:
@@ -160,7 +177,7 @@ def make_docker_aws_ecr_login(
                 fg="yellow",
             )
         else:
-            subprocess.run(["make", "docker/aws_ecr_login"], check=True)
+            run_command(["make", "docker/aws_ecr_login"], cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
@@ -176,53 +193,171 @@ def git_config(
                 fg="yellow",
             )
         else:
-            subprocess.run(
-                ["git", "config", "--global", "user.name", "nobody"], check=True
-            )
-            subprocess.run(
-                ["git", "config", "--global", "user.email", "nobody@nttdata.com"],
-                check=True,
+            run_command(["git", "config", "--global", "user.name", "nobody"])
+            run_command(
+                ["git", "config", "--global", "user.email", "nobody@nttdata.com"]
             )
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
 
 
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+# Seconds to wait for the docker CLI to reach a daemon that can't be pinged directly, e.g. over ssh.
+DOCKER_CLI_PING_TIMEOUT_SECONDS = 10.0
+
+
+def ping_docker(
+    docker_host: str = DOCKER_HOST, timeout: float = 1.0, tls: bool = DOCKER_TLS
+) -> bool:
+    """Checks whether the docker daemon answers its /_ping endpoint. Daemons on a unix socket or plain tcp are pinged
+    directly, any other daemon (TLS, ssh://, npipe://) is asked for its version through the docker CLI, which knows how
+    to reach it.
+
+    Args:
+        docker_host (str, optional): Address of the daemon, e.g. a unix://, tcp:// or ssh:// URL. Defaults to DOCKER_HOST.
+        timeout (float, optional): Seconds to wait for an answer. Defaults to 1.0.
+        tls (bool, optional): The daemon is reached over TLS. Defaults to DOCKER_TLS.
+
+    Returns:
+        bool: True if the daemon is ready to accept requests.
+    """
+    address = urllib.parse.urlparse(docker_host)
+    if address.scheme == "unix":
+        connection = _UnixHTTPConnection(socket_path=address.path, timeout=timeout)
+    elif address.scheme in ("tcp", "http") and not tls and address.port != 2376:
+        connection = http.client.HTTPConnection(
+            host=address.hostname, port=address.port or 2375, timeout=timeout
+        )
+    else:
+        return _docker_cli_ping(
+            docker_host=docker_host,
+            timeout=max(timeout, DOCKER_CLI_PING_TIMEOUT_SECONDS),
+        )
+    try:
+        connection.request("GET", "/_ping")
+        response = connection.getresponse()
+        response.read()
+        return response.status == 200
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        connection.close()
+
+
+def _docker_cli_ping(docker_host: str | None, timeout: float) -> bool:
+    # Without a host, the docker CLI picks the daemon from DOCKER_HOST or the active docker context.
+    host_args = ["--host", docker_host] if docker_host else []
+    try:
+        result = run_command(
+            ["docker", *host_args, "version", "--format", "{{.Server.Version}}"],
+            check=False,
+            stream=False,
+            timeout=timeout,
+            report=None,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Unable to reach docker daemon {docker_host or ''}: {e}")
+        return False
+    return result.returncode == 0
+
+
+def wait_for_docker(
+    process: subprocess.Popen | None = None,
+    timeout: float = DOCKER_STARTUP_TIMEOUT_SECONDS,
+    docker_host: str = DOCKER_HOST,
+) -> None:
+    """Polls the docker daemon until it is ready, backing off from 50ms to 1s between attempts.
+
+    Args:
+        process (subprocess.Popen | None, optional): The daemon process, polling stops early if it exits. Defaults to None.
+        timeout (float, optional): Seconds to wait for the daemon. Defaults to DOCKER_STARTUP_TIMEOUT_SECONDS.
+        docker_host (str, optional): Address of the daemon. Defaults to DOCKER_HOST.
+
+    Raises:
+        RuntimeError: If the daemon exited or wasn't ready within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while not ping_docker(docker_host=docker_host):
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(
+                f"Docker daemon exited with code {process.returncode}:\n{read_daemon_log()}"
+            )
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"Docker daemon was not ready after {timeout} seconds:\n{read_daemon_log()}"
+            )
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+def read_daemon_log(log_path: str = DOCKER_DAEMON_LOG, lines: int = 50) -> str:
+    try:
+        with open(log_path, "r", errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return f"(no daemon log at {log_path})"
+
+
+def configure_buildkit(cache_dir: str | None = DOCKER_BUILDKIT_CACHE_DIR) -> None:
+    """Enables BuildKit for subsequent builds and, when cache_dir is set, exports BUILDX_CACHE_FROM and
+    BUILDX_CACHE_TO for the build to read and write a local layer cache.
+
+    Args:
+        cache_dir (str | None, optional): Directory of the layer cache. Defaults to DOCKER_BUILDKIT_CACHE_DIR.
+    """
+    if not cache_dir:
+        return
+    cache_path = Path(cache_dir).expanduser()
+    os.environ["DOCKER_BUILDKIT"] = "1"
+    os.environ["BUILDX_CACHE_FROM"] = f"type=local,src={cache_path}"
+    os.environ["BUILDX_CACHE_TO"] = f"type=local,dest={cache_path},mode=max"
+    logger.info(f"Using BuildKit layer cache {cache_path}")
+
+
 def start_docker(
     dry_run: bool = True,
 ) -> None:
     click.secho("Starting docker if not running")
-    try:
-        if not is_docker_running():
-            if dry_run:
-                click.secho(
-                    "[DRYRUN] Would have started docker daemon",
-                    fg="yellow",
-                )
-            else:
-                subprocess.Popen(
+    if not is_docker_running():
+        if dry_run:
+            click.secho(
+                "[DRYRUN] Would have started docker daemon",
+                fg="yellow",
+            )
+            return
+        try:
+            with open(DOCKER_DAEMON_LOG, "ab") as log:
+                process = subprocess.Popen(
                     ["dockerd"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
                     close_fds=True,
                 )
-                time.sleep(5)  # Docker daemon takes a few seconds to start
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"An error occurred: {str(e)}") from e
+        except OSError as e:
+            raise RuntimeError(f"An error occurred: {str(e)}") from e
+        wait_for_docker(process=process)
+    configure_buildkit()
 
 
 def is_docker_running() -> bool:
-    try:
-        subprocess.run(
-            ["docker", "ps"],
-            check=True,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+    if ping_docker():
         return True
-    except subprocess.CalledProcessError:
-        click.secho(
-            "Docker found not to be running...",
-            fg="yellow",
-        )
-        return False
+    # The daemon may be behind a docker context (rootless, Colima, Docker Desktop) rather than DOCKER_HOST.
+    if _docker_cli_ping(docker_host=None, timeout=DOCKER_CLI_PING_TIMEOUT_SECONDS):
+        return True
+    click.secho(
+        "Docker found not to be running...",
+        fg="yellow",
+    )
+    return False
@@ -0,0 +1,196 @@
+import logging
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import click
+
+from launch.lib.common.utilities import format_table
+
+logger = logging.getLogger(__name__)
+
+# Serializes writes to the terminal, so lines from concurrently running commands never interleave mid-line.
+_output_lock = threading.Lock()
+
+
+@dataclass
+class CommandResult:
+    args: list[str]
+    cwd: str | None
+    returncode: int
+    duration: float
+    output: str | None = None
+    stderr: str | None = None
+
+
+class RunReport:
+    """Collects the results of the commands run through run_command. Safe to share between threads."""
+
+    def __init__(self):
+        self._results: list[CommandResult] = []
+        self._lock = threading.Lock()
+
+    def add(self, result: CommandResult) -> None:
+        with self._lock:
+            self._results.append(result)
+
+    @property
+    def results(self) -> list[CommandResult]:
+        with self._lock:
+            return list(self._results)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def format(self) -> str:
+        return format_table(
+            headers=["COMMAND", "CWD", "EXIT", "DURATION"],
+            rows=[
+                [
+                    " ".join(str(arg) for arg in result.args),
+                    result.cwd or ".",
+                    result.returncode,
+                    f"{result.duration:.1f}s",
+                ]
+                for result in self.results
+            ],
+        )
+
+
+# Report of every command run by this process.
+RUN_REPORT = RunReport()
+
+
+def run_command(
+    args: list,
+    cwd: Path | str | None = None,
+    env: dict[str, str] | None = None,
+    prefix: str | None = None,
+    check: bool = True,
+    capture: bool = False,
+    stream: bool = True,
+    log_file: Path | None = None,
+    timeout: float | None = None,
+    report: RunReport | None = RUN_REPORT,
+    redact: list[str] | None = None,
+    merge_stderr: bool = True,
+) -> CommandResult:
+    """Runs a command, streaming its combined stdout and stderr line by line as it is produced.
+
+    Args:
+        args (list): The command and its arguments.
+        cwd (Path | str | None, optional): Directory to run the command in. Defaults to None, the current directory.
+        env (dict[str, str] | None, optional): Variables set for the command on top of the current environment. Defaults to None.
+        prefix (str | None, optional): Prefix of every streamed line, to tell concurrent commands apart. Defaults to None.
+        check (bool, optional): Raise if the command exits with a non-zero code. Defaults to True.
+        capture (bool, optional): Keep the output in the result. Defaults to False.
+        stream (bool, optional): Echo the output to the terminal. Defaults to True.
+        log_file (Path | None, optional): Also append the output to this file. Defaults to None.
+        timeout (float | None, optional): Seconds after which the command is killed. Defaults to None.
+        report (RunReport | None, optional): Report the result is added to. Defaults to RUN_REPORT.
+        redact (list[str] | None, optional): Secrets in args that are masked in logs, the report and errors. Defaults to None.
+        merge_stderr (bool, optional): Merge stderr into the output. Set it to False when parsing the output, so that
+            warnings on stderr are streamed and captured separately instead. Defaults to True.
+
+    Raises:
+        subprocess.CalledProcessError: If check is set and the command exits with a non-zero code.
+        subprocess.TimeoutExpired: If the command ran longer than timeout.
+
+    Returns:
+        CommandResult: The exit code and duration of the command, and its output and separate stderr if captured.
+    """
+    display_args = [_redact(str(arg), redact) for arg in args]
+    logger.debug(f"Running {display_args} in {cwd or os.getcwd()}")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        args,
+        cwd=cwd,
+        env={**os.environ, **env} if env else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        process.kill()
+
+    timer = None
+    if timeout is not None:
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+
+    output = []
+    errors = []
+    log = open(log_file, "a") if log_file else None
+    log_lock = threading.Lock()
+
+    def pump(pipe, lines: list[str], err: bool) -> None:
+        for line in pipe:
+            if stream:
+                with _output_lock:
+                    click.echo(
+                        f"[{prefix}] {line}" if prefix else line, nl=False, err=err
+                    )
+            if log:
+                with log_lock:
+                    log.write(line)
+            if capture:
+                lines.append(line)
+
+    stderr_reader = None
+    if not merge_stderr:
+        stderr_reader = threading.Thread(
+            target=pump, args=(process.stderr, errors, True), daemon=True
+        )
+        stderr_reader.start()
+    try:
+        pump(process.stdout, output, False)
+        returncode = process.wait()
+        if stderr_reader is not None:
+            stderr_reader.join()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if log:
+            log.close()
+        process.stdout.close()
+        if process.stderr is not None:
+            process.stderr.close()
+
+    result = CommandResult(
+        args=display_args,
+        cwd=str(cwd) if cwd is not None else None,
+        returncode=returncode,
+        duration=time.perf_counter() - start,
+        output="".join(output) if capture else None,
+        stderr="".join(errors) if capture and not merge_stderr else None,
+    )
+    if report is not None:
+        report.add(result)
+    logger.debug(
+        f"{display_args} exited with {returncode} after {result.duration:.1f}s"
+    )
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(
+            display_args, timeout, output=result.output, stderr=result.stderr
+        )
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode, display_args, output=result.output, stderr=result.stderr
+        )
+    return result
+
+
+def _redact(value: str, secrets: list[str] | None) -> str:
+    for secret in secrets or []:
+        if secret:
+            value = value.replace(secret, "***")
+    return value
@@ -0,0 +1,79 @@
+import logging
+import os
+import threading
+from typing import Any
+
+import boto3
+
+logger = logging.getLogger(__name__)
+
+# boto3 sessions are not thread-safe, clients are. Both are created under this lock and then shared by the whole
+# process, so credentials are resolved once per profile and connections are reused between calls.
+_lock = threading.Lock()
+_sessions: dict[str | None, boto3.session.Session] = {}
+_clients: dict[tuple[str, str | None, str | None], Any] = {}
+
+
+def get_session(profile_name: str | None = None) -> boto3.session.Session:
+    """Returns the process-wide boto3 session for a profile, creating it on first use.
+
+    Args:
+        profile_name (str | None, optional): Name of the AWS profile. Defaults to None, which uses the default credential chain.
+
+    Returns:
+        boto3.session.Session: The shared session.
+    """
+    with _lock:
+        return _get_session(profile_name=profile_name)
+
+
+def _get_session(profile_name: str | None) -> boto3.session.Session:
+    if profile_name not in _sessions:
+        _sessions[profile_name] = boto3.session.Session(profile_name=profile_name)
+    return _sessions[profile_name]
+
+
+def get_client(
+    service_name: str,
+    region_name: str | None = None,
+    profile_name: str | None = None,
+) -> Any:
+    """Returns the process-wide boto3 client for a service, region and profile, creating it on first use.
+
+    Args:
+        service_name (str): Name of the AWS service, e.g. "secretsmanager".
+        region_name (str | None, optional): AWS region. Defaults to None, which uses the profile's region.
+        profile_name (str | None, optional): Name of the AWS profile. Defaults to None, which uses the default credential chain.
+
+    Returns:
+        Any: The shared boto3 client.
+    """
+    key = (service_name, region_name, profile_name)
+    with _lock:
+        if key not in _clients:
+            logger.debug(f"Creating boto3 client: {key=}")
+            _clients[key] = _get_session(profile_name=profile_name).client(
+                service_name=service_name, region_name=region_name
+            )
+        return _clients[key]
+
+
+def clear_clients(profile_name: str | None = None) -> None:
+    """Forgets the shared sessions and clients, e.g. after the credentials of a profile changed. The session of the
+    default credential chain is forgotten along with the profile it reads, AWS_PROFILE or "default".
+
+    Args:
+        profile_name (str | None, optional): Only forget the session and clients of this profile. Defaults to None, which forgets all of them.
+    """
+    with _lock:
+        if profile_name is None:
+            _sessions.clear()
+            _clients.clear()
+            return
+        profile_names = {profile_name}
+        if profile_name == os.environ.get("AWS_PROFILE", "default"):
+            profile_names.add(None)
+        for name in profile_names:
+            _sessions.pop(name, None)
+        for key in [key for key in _clients if key[2] in profile_names]:
+            del _clients[key]
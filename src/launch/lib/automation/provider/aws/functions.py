@@ -1,6 +1,25 @@
+import configparser
+import hashlib
 import json
 import logging
-import subprocess
+import os
+import re
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from launch.config.aws import (
+    AWS_CONFIG_FILE,
+    AWS_CREDENTIALS_CACHE_DIR,
+    AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS,
+    AWS_ROLE_SESSION_NAME,
+    AWS_SHARED_CREDENTIALS_FILE,
+)
+from launch.lib.automation.provider.aws.clients import (
+    clear_clients,
+    get_client,
+    get_session,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -9,70 +28,236 @@ def assume_role(
     aws_deployment_role: str,
     aws_deployment_region: str,
     profile: str,
-) -> None:
+    session_name: str = AWS_ROLE_SESSION_NAME,
+    export_environment: bool = False,
+) -> dict:
+    """Assumes an IAM role and writes its credentials and region to an AWS profile. Credentials are cached per caller,
+    role and session name, so repeated runs on the same machine only call STS once the cached ones are about to expire.
+
+    Args:
+        aws_deployment_role (str): ARN of the role to assume.
+        aws_deployment_region (str): Region to set on the profile.
+        profile (str): Name of the profile to write.
+        session_name (str, optional): Role session name. Defaults to AWS_ROLE_SESSION_NAME.
+        export_environment (bool, optional): Also export the credentials as environment variables, so child processes
+            that don't use the profile pick them up. Defaults to False.
+
+    Raises:
+        RuntimeError: If the role can't be assumed or the profile can't be written.
+
+    Returns:
+        dict: The Credentials of the assumed role, as returned by STS.
+    """
     logger.info("Assuming the IAM deployment role")
 
+    credentials = get_role_credentials(
+        role_arn=aws_deployment_role, session_name=session_name
+    )
+
     try:
-        sts_credentials = json.loads(
-            subprocess.check_output(
-                [
-                    "aws",
-                    "sts",
-                    "assume-role",
-                    "--role-arn",
-                    aws_deployment_role,
-                    "--role-session-name",
-                    "caf-build-agent",
-                ]
+        write_profile(
+            profile=profile, credentials=credentials, region=aws_deployment_region
+        )
+    except (OSError, configparser.Error) as e:
+        raise RuntimeError(f"Failed set aws configure: {str(e)}") from e
+    clear_clients(profile_name=profile)
+
+    if export_environment:
+        os.environ.update(
+            credentials_environment(
+                credentials=credentials, region=aws_deployment_region
             )
         )
+    return credentials
+
+
+def get_role_credentials(
+    role_arn: str,
+    session_name: str = AWS_ROLE_SESSION_NAME,
+    cache_dir: str = AWS_CREDENTIALS_CACHE_DIR,
+    refresh_margin: int = AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS,
+) -> dict:
+    """Returns credentials for a role, from the cache while they are valid for longer than refresh_margin seconds and
+    from STS otherwise. The cache is keyed by the caller's profile and access key as well as the role, so switching
+    users or source profiles never reuses another caller's credentials.
+
+    Args:
+        role_arn (str): ARN of the role to assume.
+        session_name (str, optional): Role session name. Defaults to AWS_ROLE_SESSION_NAME.
+        cache_dir (str, optional): Directory cached credentials are kept in. Defaults to AWS_CREDENTIALS_CACHE_DIR.
+        refresh_margin (int, optional): Seconds before expiry at which cached credentials are replaced. Defaults to
+            AWS_CREDENTIALS_REFRESH_MARGIN_SECONDS.
+
+    Raises:
+        RuntimeError: If the role can't be assumed.
+
+    Returns:
+        dict: The Credentials of the assumed role, as returned by STS.
+    """
+    cache_key = f"{_caller_key()}:{role_arn}:{session_name}"
+    cache_path = (
+        Path(cache_dir)
+        .expanduser()
+        .joinpath(f"{hashlib.sha256(cache_key.encode()).hexdigest()}.json")
+    )
+    credentials = _load_cached_credentials(cache_path)
+    if credentials and _seconds_remaining(credentials) > refresh_margin:
+        logger.debug(f"Using cached credentials for {role_arn}")
+        return credentials
+
+    try:
+        credentials = get_client("sts").assume_role(
+            RoleArn=role_arn, RoleSessionName=session_name
+        )["Credentials"]
     except Exception as e:
         raise RuntimeError(f"Failed aws sts assume-role: {str(e)}") from e
 
-    access_key = sts_credentials["Credentials"]["AccessKeyId"]
-    secret_access_key = sts_credentials["Credentials"]["SecretAccessKey"]
-    session_token = sts_credentials["Credentials"]["SessionToken"]
-
     try:
-        subprocess.run(
-            [
-                "aws",
-                "configure",
-                "set",
-                f"profile.{profile}.aws_access_key_id",
-                access_key,
-            ],
-            check=True,
-        )
-        subprocess.run(
-            [
-                "aws",
-                "configure",
-                "set",
-                f"profile.{profile}.aws_secret_access_key",
-                secret_access_key,
-            ],
-            check=True,
-        )
-        subprocess.run(
-            [
-                "aws",
-                "configure",
-                "set",
-                f"profile.{profile}.aws_session_token",
-                session_token,
-            ],
-            check=True,
+        _atomic_write(
+            path=cache_path, content=json.dumps(credentials, default=_isoformat)
         )
-        subprocess.run(
-            [
-                "aws",
-                "configure",
-                "set",
-                f"profile.{profile}.region",
-                aws_deployment_region,
-            ],
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed set aws configure: {str(e)}")
+    except OSError as e:
+        logger.warning(f"Failed to cache credentials for {role_arn}: {e}")
+    return credentials
+
+
+def write_profile(profile: str, credentials: dict, region: str) -> None:
+    """Writes credentials and a region to an AWS profile, the same keys `aws configure set` would write. Each file is
+    replaced in a single atomic update, so concurrent readers never see a partially written profile.
+
+    Args:
+        profile (str): Name of the profile.
+        credentials (dict): Credentials as returned by STS.
+        region (str): Region of the profile.
+    """
+    _update_ini_file(
+        path=Path(AWS_SHARED_CREDENTIALS_FILE).expanduser(),
+        section=profile,
+        values={
+            "aws_access_key_id": credentials["AccessKeyId"],
+            "aws_secret_access_key": credentials["SecretAccessKey"],
+            "aws_session_token": credentials["SessionToken"],
+        },
+    )
+    _update_ini_file(
+        path=Path(AWS_CONFIG_FILE).expanduser(),
+        section=profile if profile == "default" else f"profile {profile}",
+        values={"region": region},
+    )
+
+
+def credentials_environment(credentials: dict, region: str) -> dict[str, str]:
+    """Returns the environment variables that hand credentials to the AWS CLI and SDKs.
+
+    Args:
+        credentials (dict): Credentials as returned by STS.
+        region (str): AWS region.
+
+    Returns:
+        dict[str, str]: The environment variables.
+    """
+    return {
+        "AWS_ACCESS_KEY_ID": credentials["AccessKeyId"],
+        "AWS_SECRET_ACCESS_KEY": credentials["SecretAccessKey"],
+        "AWS_SESSION_TOKEN": credentials["SessionToken"],
+        "AWS_REGION": region,
+        "AWS_DEFAULT_REGION": region,
+    }
+
+
+def _caller_key() -> str:
+    """Identifies the credentials STS is called with, without making a request."""
+    credentials = get_session().get_credentials()
+    access_key = credentials.access_key if credentials is not None else ""
+    return f"{os.environ.get('AWS_PROFILE', '')}:{access_key}"
+
+
+def _load_cached_credentials(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cached credentials {path}: {e}")
+        return None
+
+
+def _seconds_remaining(credentials: dict) -> float:
+    expiration = credentials.get("Expiration")
+    if expiration is None:
+        return 0
+    if isinstance(expiration, str):
+        expiration = datetime.fromisoformat(expiration)
+    return (expiration - datetime.now(timezone.utc)).total_seconds()
+
+
+def _isoformat(value: datetime) -> str:
+    return value.isoformat()
+
+
+_INI_SECTION = re.compile(r"^\s*\[\s*(?P<name>[^\]]*?)\s*\]")
+_INI_KEY = re.compile(r"^(?P<key>[^\s=#;\[][^=]*?)\s*=")
+
+
+def _update_ini_file(path: Path, section: str, values: dict[str, str]) -> None:
+    """Sets keys of one section of an AWS ini file, adding the section if it is missing. Only the lines of those keys
+    are touched, so comments, formatting and anything configparser would reject are left as they were.
+    """
+    try:
+        lines = path.read_text().splitlines(keepends=True)
+    except FileNotFoundError:
+        lines = []
+
+    updated = []
+    remaining = dict(values)
+    current_section = None
+    # Index in updated after the last non-blank line of the section, where missing keys are inserted.
+    section_end = None
+    skipping_nested = False
+    for line in lines:
+        header = _INI_SECTION.match(line)
+        if header:
+            current_section = header.group("name")
+            skipping_nested = False
+        elif skipping_nested and line[:1].isspace() and line.strip():
+            # Nested values of a replaced key belong to the old value.
+            continue
+        else:
+            skipping_nested = False
+            key = _INI_KEY.match(line) if current_section == section else None
+            if key and key.group("key") in values:
+                name = key.group("key")
+                updated.append(f"{name} = {values[name]}\n")
+                remaining.pop(name, None)
+                skipping_nested = True
+                section_end = len(updated)
+                continue
+        updated.append(line)
+        # Comments after the last key usually introduce the next section.
+        if current_section == section and line.strip() and line.lstrip()[0] not in "#;":
+            section_end = len(updated)
+
+    new_lines = [f"{key} = {value}\n" for key, value in remaining.items()]
+    if new_lines and updated and not updated[-1].endswith("\n"):
+        updated[-1] += "\n"
+    if section_end is not None:
+        updated[section_end:section_end] = new_lines
+    elif new_lines:
+        if updated and updated[-1].strip():
+            updated.append("\n")
+        updated.append(f"[{section}]\n")
+        updated.extend(new_lines)
+    _atomic_write(path=path, content="".join(updated))
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    # mkstemp creates the file readable by its owner only, as the AWS CLI does for these files.
+    descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+    try:
+        with os.fdopen(descriptor, "w") as f:
+            f.write(content)
+        os.replace(temporary_path, path)
+    except BaseException:
+        Path(temporary_path).unlink(missing_ok=True)
+        raise
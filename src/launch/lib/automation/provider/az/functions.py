@@ -2,13 +2,81 @@ import logging
 import re
 import os
 import subprocess
+import threading
 import click
 from pathlib import Path
 
+from launch.config.azure import AZURE_REMOTE_STATE_CONTAINER_NAME
+from launch.config.common import MAX_WORKERS
 from launch.lib.automation.processes.functions import make_configure
+from launch.lib.automation.processes.runner import run_command
+from launch.lib.common.utilities.concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
+# Storage accounts and containers already known to exist, so each one is only probed once per process.
+_existing_remote_state: set[tuple[str, str]] = set()
+_existing_remote_state_lock = threading.Lock()
+
+
+def get_storage_account_name(naming_prefix: str, uuid_value: str) -> str:
+    stripped_name = re.sub(r"[\W_]+", "", naming_prefix)
+    return f"{stripped_name[0:16]}{uuid_value}"
+
+
+def remote_state_exists(
+    storage_account_name: str,
+    container_name: str = AZURE_REMOTE_STATE_CONTAINER_NAME,
+) -> bool:
+    """Checks whether the storage account and container holding an instance's remote state already exist. Only
+    positive results are cached, so a missing account is probed again after it has been bootstrapped.
+
+    Args:
+        storage_account_name (str): Name of the storage account.
+        container_name (str, optional): Name of the blob container. Defaults to AZURE_REMOTE_STATE_CONTAINER_NAME.
+
+    Returns:
+        bool: True if both exist, False if either is missing or the probe failed.
+    """
+    key = (storage_account_name, container_name)
+    with _existing_remote_state_lock:
+        if key in _existing_remote_state:
+            return True
+
+    try:
+        result = run_command(
+            [
+                "az",
+                "storage",
+                "container",
+                "exists",
+                "--account-name",
+                storage_account_name,
+                "--name",
+                container_name,
+                "--auth-mode",
+                "login",
+                "--query",
+                "exists",
+                "--output",
+                "tsv",
+            ],
+            check=False,
+            capture=True,
+            stream=False,
+            merge_stderr=False,
+        )
+    except OSError as e:
+        logger.warning(f"Unable to check remote state {storage_account_name}: {e}")
+        return False
+
+    # The command fails when the storage account itself doesn't exist.
+    exists = result.returncode == 0 and result.output.strip() == "true"
+    if exists:
+        with _existing_remote_state_lock:
+            _existing_remote_state.add(key)
+    return exists
+
 
 def deploy_remote_state(
     uuid_value: str,
@@ -18,13 +86,16 @@ def deploy_remote_state(
     instance: str,
     build_path: Path,
     dry_run: bool = False,
+    configure: bool = True,
 ) -> None:
     run_list = ["make"]
 
-    make_configure(dry_run=dry_run)
- 
-    stripped_name = re.sub("[\W_]+", "", naming_prefix)
-    storage_account_name = f"{stripped_name[0:16]}{uuid_value}"
+    if configure:
+        make_configure(dry_run=dry_run)
+
+    storage_account_name = get_storage_account_name(
+        naming_prefix=naming_prefix, uuid_value=uuid_value
+    )
     if naming_prefix:
         run_list.append(f"NAME_PREFIX={naming_prefix}")
     if region:
@@ -39,6 +110,74 @@ def deploy_remote_state(
 
     logger.info(f"Running {run_list}")
     try:
-        subprocess.run(run_list, check=True, cwd=build_path)
+        run_command(run_list, cwd=build_path, prefix=instance or None)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}") from e
+    with _existing_remote_state_lock:
+        _existing_remote_state.add(
+            (storage_account_name, AZURE_REMOTE_STATE_CONTAINER_NAME)
+        )
+
+
+def deploy_remote_states(
+    instances: dict[str, str],
+    naming_prefix: str,
+    target_environment: str,
+    region: str,
+    build_path: Path,
+    max_workers: int = MAX_WORKERS,
+    dry_run: bool = False,
+) -> None:
+    """Bootstraps the remote state of several instances. make configure runs once for the build path, then the
+    instances whose storage account and container don't exist yet are bootstrapped concurrently.
+
+    Args:
+        instances (dict[str, str]): Mapping of instance name to its uuid.
+        naming_prefix (str): Naming prefix of the service.
+        target_environment (str): The environment being deployed.
+        region (str): The region being deployed.
+        build_path (Path): Path of the build directory containing the Makefile.
+        max_workers (int, optional): Maximum number of instances bootstrapped at once. Defaults to MAX_WORKERS.
+        dry_run (bool, optional): Whether to run in dry run mode. Defaults to False.
+
+    Raises:
+        RuntimeError: If bootstrapping any of the instances failed.
+    """
+    missing = {
+        instance: uuid_value
+        for instance, uuid_value in instances.items()
+        if not remote_state_exists(
+            storage_account_name=get_storage_account_name(
+                naming_prefix=naming_prefix, uuid_value=uuid_value
+            )
+        )
+    }
+    for instance in instances.keys() - missing.keys():
+        click.secho(f"Remote state for instance {instance} already exists, skipping.")
+    if not missing:
+        return
+
+    make_configure(dry_run=dry_run, cwd=build_path)
+
+    results = run_concurrently(
+        tasks={
+            instance: lambda instance=instance, uuid_value=uuid_value: deploy_remote_state(
+                uuid_value=uuid_value,
+                naming_prefix=naming_prefix,
+                target_environment=target_environment,
+                region=region,
+                instance=instance,
+                build_path=build_path,
+                dry_run=dry_run,
+                configure=False,
+            )
+            for instance, uuid_value in missing.items()
+        },
+        max_workers=max_workers,
+    )
+    failed = [result for result in results if not result.succeeded]
+    if failed:
+        raise RuntimeError(
+            "Failed to deploy remote state for instances: "
+            + ", ".join(f"{result.name} ({result.detail})" for result in failed)
+        )
@@ -1,6 +1,9 @@
+import hashlib
+import logging
 import os
 import shutil
 import subprocess
+import tempfile
 from pathlib import Path
 
 import click
@@ -10,22 +13,27 @@ from launch.config.common import NON_SECRET_J2_TEMPLATE_NAME, SECRET_J2_TEMPLATE
 from launch.config.terragrunt import TERRAGRUNT_RUN_DIRS
 from launch.config.webhook import (
     WEBHOOK_BUILD_SCRIPT,
+    WEBHOOK_CACHE_DIR,
     WEBHOOK_GIT_REPO_TAG,
     WEBHOOK_GIT_REPO_URL,
     WEBHOOK_ZIP,
 )
 from launch.enums.launchconfig import LAUNCHCONFIG_KEYS
-from launch.lib.local_repo.repo import clone_repository
+from launch.lib.automation.processes.runner import run_command
+from launch.lib.local_repo.repo import clone_repository, resolve_remote_ref
+
+logger = logging.getLogger(__name__)
 
 
 ## Terragrunt Specific Functions
-def terragrunt_init(run_all=True, dry_run=True) -> None:
+def terragrunt_init(run_all=True, dry_run=True, cwd=None) -> None:
     """
-    Runs terragrunt init subprocess in the current directory.
+    Runs terragrunt init subprocess in cwd, or the current directory if it isn't set.
 
     Args:
         run_all (bool, optional): If set, it will run terragrunt init on all directories. Defaults to True.
         dry_run (bool, optional): If set, it will perform a dry run that reports on what it would do, but does not perform any action. Defaults to True.
+        cwd (Path, optional): The directory to run terragrunt in. Defaults to None.
 
     Raises:
         RuntimeError: If an error occurs during the subprocess.
@@ -52,19 +60,20 @@ def terragrunt_init(run_all=True, dry_run=True) -> None:
                 fg="yellow",
             )
         else:
-            subprocess.run(subprocess_args, check=True)
+            run_command(subprocess_args, cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}")
 
 
-def terragrunt_plan(out_file=None, run_all=True, dry_run=True) -> None:
+def terragrunt_plan(out_file=None, run_all=True, dry_run=True, cwd=None) -> None:
     """
-    Runs terragrunt plan subprocess in the current directory.
+    Runs terragrunt plan subprocess in cwd, or the current directory if it isn't set.
 
     Args:
         out_file (str, optional): The output file from running terragrunt plan. Defaults to None.
         run_all (bool, optional): If set, it will run terragrunt plan on all directories. Defaults to True.
         dry_run (bool, optional): If set, it will perform a dry run that reports on what it would do, but does not perform any action. Defaults to True.
+        cwd (Path, optional): The directory to run terragrunt in. Defaults to None.
 
     Raises:
         RuntimeError: If an error occurs during the subprocess.
@@ -88,19 +97,20 @@ def terragrunt_plan(out_file=None, run_all=True, dry_run=True) -> None:
                 fg="yellow",
             )
         else:
-            subprocess.run(subprocess_args, check=True)
+            run_command(subprocess_args, cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}")
 
 
-def terragrunt_apply(var_file=None, run_all=True, dry_run=True) -> None:
+def terragrunt_apply(var_file=None, run_all=True, dry_run=True, cwd=None) -> None:
     """
-    Runs terragrunt apply subprocess in the current directory.
+    Runs terragrunt apply subprocess in cwd, or the current directory if it isn't set.
 
     Args:
         var_file (str, optional): The var file with inputs to pass to terragrunt. Defaults to None.
         run_all (bool, optional): If set, it will run terragrunt apply on all directories. Defaults to True.
         dry_run (bool, optional): If set, it will perform a dry run that reports on what it would do, but does not perform any action. Defaults to True.
+        cwd (Path, optional): The directory to run terragrunt in. Defaults to None.
 
     Raises:
         RuntimeError: If an error occurs during the subprocess.
@@ -135,19 +145,20 @@ def terragrunt_apply(var_file=None, run_all=True, dry_run=True) -> None:
                 fg="yellow",
             )
         else:
-            subprocess.run(subprocess_args, check=True)
+            run_command(subprocess_args, cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}")
 
 
-def terragrunt_destroy(var_file=None, run_all=True, dry_run=True) -> None:
+def terragrunt_destroy(var_file=None, run_all=True, dry_run=True, cwd=None) -> None:
     """
-    Runs terragrunt destroy subprocess in the current directory.
+    Runs terragrunt destroy subprocess in cwd, or the current directory if it isn't set.
 
     Args:
         var_file (str, optional): The var file with inputs to pass to terragrunt. Defaults to None.
         run_all (bool, optional): If set, it will run terragrunt destroy on all directories. Defaults to True.
         dry_run (bool, optional): If set, it will perform a dry run that reports on what it would do, but does not perform any action. Defaults to True.
+        cwd (Path, optional): The directory to run terragrunt in. Defaults to None.
 
     Raises:
         RuntimeError: If an error occurs during the subprocess.
@@ -179,7 +190,7 @@ def terragrunt_destroy(var_file=None, run_all=True, dry_run=True) -> None:
                 fg="yellow",
             )
         else:
-            subprocess.run(subprocess_args, check=True)
+            run_command(subprocess_args, cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"An error occurred: {str(e)}")
 
@@ -278,37 +289,141 @@ def process_app_templates(
             )
 
 
-def copy_webhook(
-    webhooks_path: str,
-    build_path: str,
-    target_environment: str,
-    dry_run: bool = True,
-) -> None:
+def webhook_cache_key(
+    commit: str,
+    repository_url: str = WEBHOOK_GIT_REPO_URL,
+    build_script: str = WEBHOOK_BUILD_SCRIPT,
+    zip_name: str = WEBHOOK_ZIP,
+) -> str:
+    """
+    Returns the key a built webhook zip is cached under. The commit pins the sources and the build script's contents,
+    the script and zip names are part of the key since they can be overridden independently of the repository.
+
+    Args:
+        commit (str): The commit of the webhook repository the zip is built from.
+        repository_url (str, optional): URL of the webhook repository. Defaults to WEBHOOK_GIT_REPO_URL.
+        build_script (str, optional): Path of the build script in the repository. Defaults to WEBHOOK_BUILD_SCRIPT.
+        zip_name (str, optional): Path of the zip the build script produces. Defaults to WEBHOOK_ZIP.
+
+    Returns:
+        str: The cache key.
+    """
+    return hashlib.sha256(
+        "\n".join([repository_url, commit, build_script, zip_name]).encode()
+    ).hexdigest()
+
+
+def build_webhook(webhooks_path: Path) -> Path:
+    """
+    Clones the webhook repository and runs its build script.
+
+    Args:
+        webhooks_path (Path): Directory to clone the webhook repository into.
+
+    Raises:
+        RuntimeError: If the build script fails.
+
+    Returns:
+        Path: Path of the built zip.
+    """
     clone_repository(
         repository_url=WEBHOOK_GIT_REPO_URL,
         target=webhooks_path,
         branch=WEBHOOK_GIT_REPO_TAG,
-        dry_run=dry_run,
+        dry_run=False,
     )
-    cur_dir = Path.cwd()
-    os.chdir(webhooks_path)
-    os.chmod(webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT), 0o755)
-    subprocess.run([webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT)], check=True)
-    os.chdir(cur_dir)
-    for root, dirs, files in os.walk(
-        build_path.joinpath(TERRAGRUNT_RUN_DIRS["webhook"].joinpath(target_environment))
-    ):
-        relative_depth = len(
-            os.path.relpath(
-                root,
-                build_path.joinpath(
-                    TERRAGRUNT_RUN_DIRS["webhook"].joinpath(target_environment)
-                ),
-            ).split(os.sep)
+    build_script = webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT)
+    os.chmod(build_script, 0o755)
+    try:
+        run_command([build_script], cwd=webhooks_path)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"An error occurred: {str(e)}") from e
+    return webhooks_path.joinpath(WEBHOOK_ZIP)
+
+
+def get_webhook_zip(webhooks_path: Path, cache_dir: str = WEBHOOK_CACHE_DIR) -> Path:
+    """
+    Returns the webhook zip for WEBHOOK_GIT_REPO_TAG, building it only if it isn't cached yet. The cache directory
+    can be shared between agents, entries are written atomically and never modified afterwards.
+
+    Args:
+        webhooks_path (Path): Directory to clone the webhook repository into when the zip has to be built.
+        cache_dir (str, optional): Directory built zips are cached in. Defaults to WEBHOOK_CACHE_DIR.
+
+    Returns:
+        Path: Path of the webhook zip.
+    """
+    commit = resolve_remote_ref(
+        repository_url=WEBHOOK_GIT_REPO_URL, ref=WEBHOOK_GIT_REPO_TAG
+    )
+    if commit is None:
+        logger.warning(
+            f"Unable to resolve {WEBHOOK_GIT_REPO_TAG} in {WEBHOOK_GIT_REPO_URL}, building the webhook without the cache."
+        )
+        return build_webhook(webhooks_path=webhooks_path)
+
+    cached_zip = (
+        Path(cache_dir).expanduser().joinpath(f"{webhook_cache_key(commit=commit)}.zip")
+    )
+    if cached_zip.exists():
+        click.secho(f"Using cached webhook build of {commit}: {cached_zip}")
+        return cached_zip
+
+    built_zip = build_webhook(webhooks_path=webhooks_path)
+    cached_zip.parent.mkdir(parents=True, exist_ok=True)
+    # A unique name, as pids repeat across the containers sharing the cache.
+    descriptor, temporary_zip = tempfile.mkstemp(
+        dir=cached_zip.parent, prefix=cached_zip.name, suffix=".tmp"
+    )
+    os.close(descriptor)
+    try:
+        shutil.copyfile(built_zip, temporary_zip)
+        os.replace(temporary_zip, cached_zip)
+    except BaseException:
+        Path(temporary_zip).unlink(missing_ok=True)
+        raise
+    logger.info(f"Cached webhook build of {commit}: {cached_zip}")
+    return cached_zip
+
+
+def copy_webhook(
+    webhooks_path: Path,
+    build_path: Path,
+    target_environment: str,
+    dry_run: bool = True,
+) -> None:
+    """
+    Places the webhook zip in every region/instance directory of the webhook run directory for the environment.
+
+    Args:
+        webhooks_path (Path): Directory to clone the webhook repository into when the zip has to be built.
+        build_path (Path): Path of the build directory.
+        target_environment (str): The environment being deployed.
+        dry_run (bool, optional): If set, it will perform a dry run that reports on what it would do, but does not perform any action. Defaults to True.
+    """
+    environment_path = build_path.joinpath(
+        TERRAGRUNT_RUN_DIRS["webhook"].joinpath(target_environment)
+    )
+    instance_paths = [
+        instance.path
+        for region in os.scandir(environment_path)
+        if region.is_dir()
+        for instance in os.scandir(region.path)
+        if instance.is_dir()
+    ]
+    if dry_run:
+        click.secho(
+            f"[DRYRUN] Would have built {WEBHOOK_GIT_REPO_URL}@{WEBHOOK_GIT_REPO_TAG} and copied {WEBHOOK_ZIP} to {instance_paths}",
+            fg="yellow",
+        )
+        return
+
+    webhook_zip = get_webhook_zip(webhooks_path=webhooks_path)
+    for instance_path in instance_paths:
+        shutil.copyfile(
+            webhook_zip, Path(instance_path).joinpath(Path(WEBHOOK_ZIP).name)
         )
-        if relative_depth == 2:
-            shutil.copy(webhooks_path.joinpath(WEBHOOK_ZIP), root)
-            print(f"Copied {webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT)} to {root}")
+        click.secho(f"Copied {WEBHOOK_ZIP} to {instance_path}")
 
 
 def create_tf_auto_file(data: dict, out_file: str, dry_run: bool = True) -> None:
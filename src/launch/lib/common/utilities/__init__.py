@@ -58,3 +58,24 @@ def extract_repo_name_from_url(url: str) -> str:
         str: Repository name
     """
     return url.split("/")[-1].replace(".git", "")
+
+
+def format_table(headers: list[str], rows: list[list[str]]) -> str:
+    """
+    Formats rows of values as a plain-text table with left-aligned, padded columns.
+
+    Args:
+        headers (list[str]): Column headers
+        rows (list[list[str]]): Rows of values, each the same length as headers
+
+    Returns:
+        str: Table with a header line, a separator line and one line per row
+    """
+    table = [[str(cell) for cell in row] for row in [headers, *rows]]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in table
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
@@ -0,0 +1,94 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from launch.config.common import MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskResult:
+    name: str
+    succeeded: bool
+    duration: float
+    detail: str = ""
+    value: Any = None
+
+
+def run_task(name: str, task: Callable[[], Any]) -> TaskResult:
+    """Runs a single task, capturing its return value or the exception that it raised.
+
+    Args:
+        name (str): Name used to identify the task in the result.
+        task (Callable[[], Any]): Callable taking no arguments.
+
+    Returns:
+        TaskResult: Outcome of the task, including how long it took.
+    """
+    start = time.perf_counter()
+    try:
+        value = task()
+        return TaskResult(
+            name=name,
+            succeeded=True,
+            duration=time.perf_counter() - start,
+            value=value,
+        )
+    except Exception as e:
+        logger.error(f"Task {name} failed: {e}")
+        logger.debug(f"Task {name} failed", exc_info=True)
+        return TaskResult(
+            name=name,
+            succeeded=False,
+            duration=time.perf_counter() - start,
+            detail=str(e),
+        )
+
+
+def run_concurrently(
+    tasks: dict[str, Callable[[], Any]], max_workers: int = MAX_WORKERS
+) -> list[TaskResult]:
+    """Runs named tasks on a bounded thread pool. A failing task does not prevent the others from running.
+
+    Args:
+        tasks (dict[str, Callable[[], Any]]): Mapping of task name to a callable taking no arguments.
+        max_workers (int, optional): Maximum number of tasks to run at once. Defaults to MAX_WORKERS.
+
+    Returns:
+        list[TaskResult]: One result per task, in the same order as the supplied tasks.
+    """
+    if not tasks:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            executor.submit(run_task, name, task) for name, task in tasks.items()
+        ]
+        return [future.result() for future in futures]
+
+
+def run_in_order(tasks: dict[str, Callable[[], Any]]) -> list[TaskResult]:
+    """Runs named tasks one after another. Once a task fails, the remaining tasks are reported as skipped.
+
+    Args:
+        tasks (dict[str, Callable[[], Any]]): Mapping of task name to a callable taking no arguments.
+
+    Returns:
+        list[TaskResult]: One result per task, in the same order as the supplied tasks.
+    """
+    results = []
+    for name, task in tasks.items():
+        if results and not results[-1].succeeded:
+            results.append(
+                TaskResult(
+                    name=name,
+                    succeeded=False,
+                    duration=0.0,
+                    detail=f"skipped, {results[-1].name} did not succeed",
+                )
+            )
+            continue
+        results.append(run_task(name=name, task=task))
+    return results
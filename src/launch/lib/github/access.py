@@ -1,12 +1,20 @@
 import logging
+import threading
+from functools import partial
 
+import click
 import requests
+from github import Github
 from github.Branch import Branch
 from github.Organization import Organization
 from github.Permissions import Permissions
 from github.Repository import Repository
 from github.Team import Team
 
+from launch.config.common import MAX_WORKERS
+from launch.lib.common.utilities.concurrency import TaskResult, run_concurrently
+from launch.lib.github.rate_limit import TokenBucket, throttled
+
 from .auth import github_headers
 
 logging.getLogger("github.Requester").setLevel(logging.WARNING)
@@ -25,15 +33,43 @@ REPO_PREFIX_ADMIN_TEAM_SLUG: dict[str, str] = {
     "caf-": "caf-administrators",
 }
 
+# Permissions a team holds on a repository once it has been granted maintain or admin.
+MAINTAIN_PERMISSIONS = {
+    "triage": True,
+    "push": True,
+    "pull": True,
+    "maintain": True,
+    "admin": False,
+}
+ADMIN_PERMISSIONS = {
+    "triage": True,
+    "push": True,
+    "pull": True,
+    "maintain": True,
+    "admin": True,
+}
+
+DEFAULT_BRANCH_NAME = "main"
+
+# Approximate number of requests apply_default_access makes for a repository.
+APPLY_DEFAULT_ACCESS_REQUESTS = 12
+
+DEFAULT_BRANCH_PROTECTIONS = {
+    "enforce_admins": False,
+    "dismiss_stale_reviews": False,
+    "require_code_owner_reviews": True,
+    "required_approving_review_count": 2,
+    "required_linear_history": True,
+    "allow_force_pushes": False,
+    "block_creations": True,
+    "required_conversation_resolution": False,
+    "lock_branch": False,
+    "allow_fork_syncing": True,
+}
+
 
 def grant_maintain(team: Team, repository: Repository, dry_run=True) -> None:
-    expected_permissions = {
-        "triage": True,
-        "push": True,
-        "pull": True,
-        "maintain": True,
-        "admin": False,
-    }
+    expected_permissions = MAINTAIN_PERMISSIONS
 
     existing_permissions: Permissions = team.get_repo_permission(repo=repository)
 
@@ -63,13 +99,7 @@ def grant_maintain(team: Team, repository: Repository, dry_run=True) -> None:
 
 
 def grant_admin(team: Team, repository: Repository, dry_run=True) -> None:
-    expected_permissions = {
-        "triage": True,
-        "push": True,
-        "pull": True,
-        "maintain": True,
-        "admin": True,
-    }
+    expected_permissions = ADMIN_PERMISSIONS
 
     existing_permissions: Permissions = team.get_repo_permission(repo=repository)
 
@@ -100,24 +130,11 @@ def grant_admin(team: Team, repository: Repository, dry_run=True) -> None:
 
 def configure_default_branch_protection(repository: Repository, dry_run=True) -> None:
     default_branch: Branch = repository.get_branch(repository.default_branch)
-    if not default_branch.name == "main":
+    if not default_branch.name == DEFAULT_BRANCH_NAME:
         logger.warning(
-            f"Repository at {repository.url} uses default branch {default_branch.name}, should be main!"
+            f"Repository at {repository.url} uses default branch {default_branch.name}, should be {DEFAULT_BRANCH_NAME}!"
         )
 
-    default_protections = {
-        "enforce_admins": False,
-        "dismiss_stale_reviews": False,
-        "require_code_owner_reviews": True,
-        "required_approving_review_count": 2,
-        "required_linear_history": True,
-        "allow_force_pushes": False,
-        "block_creations": True,
-        "required_conversation_resolution": False,
-        "lock_branch": False,
-        "allow_fork_syncing": True,
-    }
-
     if dry_run:
         logger.info(
             f"Would have applied default branch protection to {default_branch.name} for repo {repository.url}"
@@ -126,7 +143,7 @@ def configure_default_branch_protection(repository: Repository, dry_run=True) ->
         logger.info(
             f"Applying default branch protection to {default_branch.name} for repo {repository.url}"
         )
-        default_branch.edit_protection(**default_protections)
+        default_branch.edit_protection(**DEFAULT_BRANCH_PROTECTIONS)
         default_branch.edit_required_pull_request_reviews(
             require_code_owner_reviews=True, required_approving_review_count=2
         )
@@ -166,13 +183,126 @@ def set_require_approval_of_most_recent_reviewable_push(
         ) from e
 
 
+# Team caches are shared by the threads applying access to many repositories, so a team is only looked up once.
+_team_cache_lock = threading.Lock()
+
+
 def select_administrative_team(
-    repository: Repository, organization: Organization
+    repository: Repository,
+    organization: Organization,
+    team_cache: dict[str, Team] | None = None,
 ) -> Team:
     for name_prefix, team_slug in REPO_PREFIX_ADMIN_TEAM_SLUG.items():
         if repository.name.startswith(name_prefix):
-            return organization.get_team_by_slug(team_slug)
+            if team_cache is None:
+                return organization.get_team_by_slug(team_slug)
+            with _team_cache_lock:
+                if team_slug not in team_cache:
+                    team_cache[team_slug] = organization.get_team_by_slug(team_slug)
+                return team_cache[team_slug]
     else:
         raise NoMatchingTeamException(
             f"Repository {repository.name} not matched for any known administrative team."
         )
+
+
+def apply_default_access(
+    repository: Repository,
+    organization: Organization,
+    platform_team: Team,
+    platform_admin_team: Team,
+    team_cache: dict[str, Team] | None = None,
+    dry_run=True,
+) -> None:
+    """Grants the platform teams and the administrative team matching the repository's name their default permissions
+    on a repository, then applies the default branch protection.
+
+    Args:
+        repository (Repository): GitHub Repository
+        organization (Organization): GitHub Organization that owns the repository
+        platform_team (Team): Team granted maintain permissions
+        platform_admin_team (Team): Team granted admin permissions
+        team_cache (dict[str, Team], optional): Administrative teams already looked up, keyed by slug. Pass the same dictionary when applying access to many repositories to avoid looking up the same team repeatedly. Defaults to None.
+        dry_run (bool, optional): Report on what would change without changing it. Defaults to True.
+    """
+    try:
+        specific_admin_team = select_administrative_team(
+            repository=repository, organization=organization, team_cache=team_cache
+        )
+    except NoMatchingTeamException:
+        click.secho(
+            f"Couldn't match a domain-specific administrative team to {repository.name} based on name. Only the Platform Admin team will be granted administrative access, you may need to manually update permissions on this repo!",
+            fg="yellow",
+        )
+        specific_admin_team = None
+
+    grant_maintain(team=platform_team, repository=repository, dry_run=dry_run)
+    grant_admin(team=platform_admin_team, repository=repository, dry_run=dry_run)
+    if specific_admin_team:
+        grant_admin(team=specific_admin_team, repository=repository, dry_run=dry_run)
+    configure_default_branch_protection(repository=repository, dry_run=dry_run)
+
+
+def apply_default_access_many(
+    g: Github,
+    organization: str,
+    repositories: list[Repository],
+    platform_team_slug: str,
+    platform_admin_team_slug: str,
+    bucket: TokenBucket | None = None,
+    max_workers: int = MAX_WORKERS,
+    dry_run=True,
+) -> list[TaskResult]:
+    """Applies the default access and branch protection to many repositories concurrently. The teams are looked up
+    once and shared by every repository, and requests are paced by a token bucket that follows GitHub's rate limit.
+
+    Args:
+        g (Github): GitHub client shared by every repository
+        organization (str): Name of the organization that owns the repositories
+        repositories (list[Repository]): Repositories to update
+        platform_team_slug (str): Slug of the team granted maintain permissions
+        platform_admin_team_slug (str): Slug of the team granted admin permissions
+        bucket (TokenBucket, optional): Bucket pacing the requests. Defaults to None, which creates one.
+        max_workers (int, optional): Maximum number of repositories updated at once. Defaults to MAX_WORKERS.
+        dry_run (bool, optional): Report on what would change without changing it. Defaults to True.
+
+    Returns:
+        list[TaskResult]: One result per repository, in the order supplied.
+    """
+    bucket = bucket or TokenBucket()
+    github_organization = g.get_organization(organization)
+    platform_team = github_organization.get_team_by_slug(platform_team_slug)
+    platform_admin_team = github_organization.get_team_by_slug(platform_admin_team_slug)
+    # Resolved up front, so the threads only ever read the cache.
+    team_cache: dict[str, Team] = {}
+    for repository in repositories:
+        try:
+            select_administrative_team(
+                repository=repository,
+                organization=github_organization,
+                team_cache=team_cache,
+            )
+        except NoMatchingTeamException:
+            pass
+
+    tasks = {
+        repository.name: throttled(
+            task=partial(
+                apply_default_access,
+                repository=repository,
+                organization=github_organization,
+                platform_team=platform_team,
+                platform_admin_team=platform_admin_team,
+                team_cache=team_cache,
+                dry_run=dry_run,
+            ),
+            g=g,
+            bucket=bucket,
+            cost=APPLY_DEFAULT_ACCESS_REQUESTS,
+        )
+        for repository in repositories
+    }
+    logger.info(
+        f"Applying default access to {len(tasks)} repositories with up to {max_workers} workers"
+    )
+    return run_concurrently(tasks=tasks, max_workers=max_workers)
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+import requests
+from github import Consts
+from github.GithubException import GithubException
+from github.GithubRetry import GithubRetry
+from requests.adapters import HTTPAdapter
+
+from launch.config.github import (
+    GITHUB_API_URL,
+    GITHUB_HTTP_CACHE,
+    GITHUB_MAX_CONNECTIONS,
+)
+from launch.lib.github.auth import read_github_token
+from launch.lib.github.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Pages of a paginated listing fetched ahead of the consumer.
+PAGINATION_PREFETCH = 2
+
+GITHUB_API_VERSION = "2022-11-28"
+
+
+class AsyncGithub:
+    """asyncio client for the GitHub REST API, for commands that keep many requests in flight.
+
+    Requests go through one pooled requests.Session and run on a thread pool sized to the pool, so at most
+    max_connections requests are in flight and callers can simply gather as many coroutines as they like. Responses
+    are the decoded JSON, and errors raise the same GithubException as PyGithub.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = GITHUB_API_URL,
+        max_connections: int = GITHUB_MAX_CONNECTIONS,
+        timeout: int = Consts.DEFAULT_TIMEOUT,
+        bucket: TokenBucket | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.bucket = bucket
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"Bearer {token or read_github_token()}",
+                "X-GitHub-Api-Version": GITHUB_API_VERSION,
+            }
+        )
+        self.session.mount(
+            f"{self.base_url.split('://')[0]}://",
+            self._adapter(max_connections=max_connections),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="github"
+        )
+        self._slots = asyncio.Semaphore(max_connections)
+
+    @staticmethod
+    def _adapter(max_connections: int) -> HTTPAdapter:
+        kwargs = {
+            "pool_connections": 1,
+            "pool_maxsize": max_connections,
+            "max_retries": GithubRetry(),
+        }
+        if GITHUB_HTTP_CACHE:
+            from launch.lib.github.http_cache import CachingAdapter, install_http_cache
+
+            return CachingAdapter(cache=install_http_cache(), **kwargs)
+        return HTTPAdapter(**kwargs)
+
+    async def __aenter__(self) -> "AsyncGithub":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def _url(self, path: str) -> str:
+        return path if "://" in path else f"{self.base_url}/{path.lstrip('/')}"
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.bucket is not None:
+            self.bucket.acquire()
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        if self.bucket is not None and "X-RateLimit-Remaining" in response.headers:
+            self.bucket.observe(
+                remaining=int(response.headers["X-RateLimit-Remaining"]),
+                reset_at=float(response.headers.get("X-RateLimit-Reset", 0)),
+            )
+        return response
+
+    async def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        async with self._slots:
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self._send, method, self._url(path), **kwargs)
+            )
+        if response.status_code >= 400:
+            try:
+                data = response.json()
+            except ValueError:
+                data = {"message": response.text}
+            raise GithubException(
+                status=response.status_code,
+                data=data,
+                headers=dict(response.headers),
+            )
+        return response
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> Any:
+        """Makes a request to the API.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path relative to the API url, e.g. "repos/org/repo", or an absolute url.
+            params (dict[str, Any] | None, optional): Query parameters. Defaults to None.
+            json (Any, optional): Body sent as JSON. Defaults to None.
+
+        Raises:
+            GithubException: If GitHub responded with an error.
+
+        Returns:
+            Any: The decoded JSON response, or None if it had no content.
+        """
+        response = await self._request(method, path, params=params, json=json)
+        return response.json() if response.content else None
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return await self.request("GET", path, params=params)
+
+    async def post(self, path: str, json: Any = None) -> Any:
+        return await self.request("POST", path, json=json)
+
+    async def paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        per_page: int = 100,
+        prefetch: int = PAGINATION_PREFETCH,
+    ) -> AsyncIterator[Any]:
+        """Yields the items of a paginated listing as its pages arrive, following the Link headers. At most prefetch
+        pages are fetched ahead of the consumer, and a consumer that stops early stops the fetching.
+
+        Args:
+            path (str): Path of the listing relative to the API url, e.g. "repos/org/repo/tags".
+            params (dict[str, Any] | None, optional): Query parameters of the first page. Defaults to None.
+            per_page (int, optional): Items per page. Defaults to 100, the most GitHub allows.
+            prefetch (int, optional): Pages fetched ahead of the consumer. Defaults to PAGINATION_PREFETCH.
+
+        Yields:
+            Any: Each item of the listing.
+        """
+        pages: asyncio.Queue = asyncio.Queue(maxsize=max(prefetch, 1))
+        done = object()
+
+        async def fetch_pages() -> None:
+            url, page_params = path, {**(params or {}), "per_page": per_page}
+            try:
+                while url:
+                    response = await self._request("GET", url, params=page_params)
+                    await pages.put(response.json())
+                    # The next url already carries the query parameters.
+                    url, page_params = response.links.get("next", {}).get("url"), None
+                await pages.put(done)
+            except Exception as e:
+                await pages.put(e)
+
+        producer = asyncio.create_task(fetch_pages())
+        try:
+            while (page := await pages.get()) is not done:
+                if isinstance(page, Exception):
+                    raise page
+                for item in page:
+                    yield item
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+
+async def gather_limited(
+    func: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    limit: int,
+) -> list[Any]:
+    """Awaits func for every item with at most limit calls running at once, returning the results in the order of
+    items. Exceptions are returned in place of their result, so one failure doesn't cancel the others.
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(item: T) -> Any:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+async def get_repositories(
+    client: AsyncGithub, organization: str, names: Iterable[str]
+) -> dict[str, Any]:
+    """Fetches many repositories of an organization concurrently, keyed by name. Missing repositories are left out."""
+    names = list(names)
+    results = await asyncio.gather(
+        *(client.get(f"repos/{organization}/{name}") for name in names),
+        return_exceptions=True,
+    )
+    repositories = {}
+    for name, result in zip(names, results):
+        if isinstance(result, GithubException) and result.status == 404:
+            logger.info(f"Repository {organization}/{name} does not exist")
+            continue
+        if isinstance(result, Exception):
+            raise result
+        repositories[name] = result
+    return repositories
+
+
+async def iter_repo_tag_names(
+    client: AsyncGithub, full_name: str
+) -> AsyncIterator[str]:
+    """Yields the names of a repository's tags, page by page."""
+    async for tag in client.paginate(f"repos/{full_name}/tags"):
+        yield tag["name"]
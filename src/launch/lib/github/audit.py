@@ -0,0 +1,342 @@
+import fnmatch
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from github import Github
+
+from launch.config.github import (
+    GITHUB_ORG_PLATFORM_TEAM,
+    GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS,
+)
+from launch.lib.github.access import (
+    ADMIN_PERMISSIONS,
+    DEFAULT_BRANCH_NAME,
+    DEFAULT_BRANCH_PROTECTIONS,
+    MAINTAIN_PERMISSIONS,
+    REPO_PREFIX_ADMIN_TEAM_SLUG,
+)
+from launch.lib.github.labels import CUSTOM_LABELS, CustomLabel
+
+logger = logging.getLogger(__name__)
+
+# Repositories fetched per GraphQL request. Each one carries its labels and branch protection, so keep this well under
+# the node limit of a query.
+REPOSITORIES_PAGE_SIZE = 50
+TEAM_REPOSITORIES_PAGE_SIZE = 100
+
+# Fields of a GraphQL BranchProtectionRule holding each protection applied by configure_default_branch_protection.
+BRANCH_PROTECTION_RULE_FIELDS = {
+    "enforce_admins": "isAdminEnforced",
+    "dismiss_stale_reviews": "dismissesStaleReviews",
+    "require_code_owner_reviews": "requiresCodeOwnerReviews",
+    "required_approving_review_count": "requiredApprovingReviewCount",
+    "required_linear_history": "requiresLinearHistory",
+    "allow_force_pushes": "allowsForcePushes",
+    "block_creations": "blocksCreations",
+    "required_conversation_resolution": "requiresConversationResolution",
+    "lock_branch": "lockBranch",
+    "allow_fork_syncing": "lockAllowsFetchAndMerge",
+    "require_last_push_approval": "requireLastPushApproval",
+}
+
+EXPECTED_BRANCH_PROTECTIONS = {
+    **DEFAULT_BRANCH_PROTECTIONS,
+    "require_last_push_approval": True,
+}
+
+# GraphQL permission levels, from the highest to the lowest, with the REST permission each of them implies.
+PERMISSION_LEVELS = {
+    "ADMIN": "admin",
+    "MAINTAIN": "maintain",
+    "WRITE": "push",
+    "TRIAGE": "triage",
+    "READ": "pull",
+}
+
+REPOSITORIES_QUERY = """
+query($organization: String!, $first: Int!, $after: String) {
+  organization(login: $organization) {
+    repositories(first: $first, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        isArchived
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        %(labels)s
+        defaultBranchRef {
+          name
+          branchProtectionRule { %(protections)s }
+        }
+      }
+    }
+  }
+}
+"""
+
+TEAM_REPOSITORIES_QUERY = """
+query($organization: String!, $slug: String!, $first: Int!, $after: String) {
+  organization(login: $organization) {
+    team(slug: $slug) {
+      repositories(first: $first, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        edges { permission node { name } }
+      }
+    }
+  }
+}
+"""
+
+
+@dataclass
+class RepositoryAudit:
+    name: str
+    drift: list[str] = field(default_factory=list)
+
+    @property
+    def compliant(self) -> bool:
+        return not self.drift
+
+
+def permission_level(permissions: dict[str, bool]) -> str:
+    """Returns the GraphQL permission level matching a set of REST permissions, such as MAINTAIN_PERMISSIONS."""
+    for level, permission in PERMISSION_LEVELS.items():
+        if permissions.get(permission):
+            return level
+    return ""
+
+
+def repositories_query(custom_labels: list[CustomLabel]) -> str:
+    # Each label is looked up by name, so repositories with many labels don't need their labels paginated.
+    labels = " ".join(
+        f"label{index}: label(name: {_graphql_string(custom_label.name)}) {{ name }}"
+        for index, custom_label in enumerate(custom_labels)
+    )
+    protections = " ".join(BRANCH_PROTECTION_RULE_FIELDS.values())
+    return REPOSITORIES_QUERY % {"labels": labels, "protections": protections}
+
+
+def _graphql_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _paginate(
+    g: Github, query: str, variables: dict[str, Any], path: list[str]
+) -> Iterator[dict[str, Any]]:
+    """Yields every page of the connection at path, following its cursor."""
+    after = None
+    while True:
+        _, response = g.requester.graphql_query(
+            query=query, variables={**variables, "after": after}
+        )
+        connection = response["data"]
+        for key in path:
+            if connection is None:
+                return
+            connection = connection[key]
+        if connection is None:
+            return
+        yield connection
+        if not connection["pageInfo"]["hasNextPage"]:
+            return
+        after = connection["pageInfo"]["endCursor"]
+
+
+def fetch_team_permissions(
+    g: Github, organization: str, slug: str
+) -> dict[str, str] | None:
+    """Returns the permission level of a team on each repository it has access to, keyed by repository name, or None
+    if the team doesn't exist."""
+    permissions: dict[str, str] | None = None
+    for page in _paginate(
+        g=g,
+        query=TEAM_REPOSITORIES_QUERY,
+        variables={
+            "organization": organization,
+            "slug": slug,
+            "first": TEAM_REPOSITORIES_PAGE_SIZE,
+        },
+        path=["organization", "team", "repositories"],
+    ):
+        permissions = permissions or {}
+        for edge in page["edges"]:
+            permissions[edge["node"]["name"]] = edge["permission"]
+    return permissions
+
+
+def _is_selected(
+    repository: dict[str, Any],
+    names: list[str] | None,
+    patterns: list[str] | None,
+    topic: str | None,
+) -> bool:
+    # Same semantics as launch.lib.github.repo.select_repositories.
+    if names and repository["name"] in names:
+        return True
+    if names and not (patterns or topic):
+        return False
+    if patterns and not any(
+        fnmatch.fnmatch(repository["name"], pattern) for pattern in patterns
+    ):
+        return False
+    topics = [node["topic"]["name"] for node in repository["repositoryTopics"]["nodes"]]
+    if topic and topic not in topics:
+        return False
+    return True
+
+
+def fetch_repositories(
+    g: Github,
+    organization: str,
+    names: list[str] | None = None,
+    patterns: list[str] | None = None,
+    topic: str | None = None,
+    custom_labels: list[CustomLabel] | None = None,
+) -> list[dict[str, Any]]:
+    """Fetches the labels, topics and default branch protection of the organization's unarchived repositories,
+    REPOSITORIES_PAGE_SIZE repositories per request, keeping those selected by name, glob pattern or topic. Without
+    any filter, every repository is kept.
+    """
+    query = repositories_query(custom_labels=custom_labels or CUSTOM_LABELS)
+    selected = []
+    for page in _paginate(
+        g=g,
+        query=query,
+        variables={"organization": organization, "first": REPOSITORIES_PAGE_SIZE},
+        path=["organization", "repositories"],
+    ):
+        selected.extend(
+            repository
+            for repository in page["nodes"]
+            if not repository["isArchived"]
+            and _is_selected(
+                repository=repository, names=names, patterns=patterns, topic=topic
+            )
+        )
+    logger.debug(f"Fetched {len(selected)} repositories from {organization}")
+    return selected
+
+
+def expected_team_permissions(
+    repository_name: str,
+    platform_team: str = GITHUB_ORG_PLATFORM_TEAM,
+    platform_admin_team: str = GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS,
+) -> dict[str, str]:
+    """Returns the permission level apply_default_access grants each team on a repository, keyed by team slug."""
+    expected = {
+        platform_team: permission_level(MAINTAIN_PERMISSIONS),
+        platform_admin_team: permission_level(ADMIN_PERMISSIONS),
+    }
+    for name_prefix, team_slug in REPO_PREFIX_ADMIN_TEAM_SLUG.items():
+        if repository_name.startswith(name_prefix):
+            expected[team_slug] = permission_level(ADMIN_PERMISSIONS)
+            break
+    return expected
+
+
+def audit_repository(
+    repository: dict[str, Any],
+    team_permissions: dict[str, dict[str, str] | None],
+    expected_permissions: dict[str, str],
+    custom_labels: list[CustomLabel] | None = None,
+) -> RepositoryAudit:
+    """Compares a repository fetched by fetch_repositories against the labels, team permissions and default branch
+    protection that launch applies.
+
+    Args:
+        repository (dict[str, Any]): The repository, as fetched by fetch_repositories.
+        team_permissions (dict[str, dict[str, str] | None]): Permissions of each team, as fetched by
+            fetch_team_permissions, keyed by team slug.
+        expected_permissions (dict[str, str]): Expected permission level of each team, keyed by team slug.
+        custom_labels (list[CustomLabel], optional): Labels the repository must have. Defaults to None, which uses
+            CUSTOM_LABELS.
+
+    Returns:
+        RepositoryAudit: The drift found on the repository.
+    """
+    audit = RepositoryAudit(name=repository["name"])
+
+    for index, custom_label in enumerate(custom_labels or CUSTOM_LABELS):
+        if repository.get(f"label{index}") is None:
+            audit.drift.append(f"missing label {custom_label.name}")
+
+    for slug, expected in expected_permissions.items():
+        permissions = team_permissions.get(slug)
+        if permissions is None:
+            audit.drift.append(f"team {slug} not found")
+            continue
+        actual = permissions.get(repository["name"])
+        if actual != expected:
+            audit.drift.append(
+                f"team {slug} has {actual or 'no'} permission, expected {expected}"
+            )
+
+    default_branch = repository["defaultBranchRef"]
+    if default_branch is None:
+        audit.drift.append("no default branch")
+        return audit
+    if default_branch["name"] != DEFAULT_BRANCH_NAME:
+        audit.drift.append(
+            f"default branch is {default_branch['name']}, expected {DEFAULT_BRANCH_NAME}"
+        )
+    rule = default_branch["branchProtectionRule"]
+    if rule is None:
+        audit.drift.append(f"default branch {default_branch['name']} is not protected")
+        return audit
+    for protection, expected in EXPECTED_BRANCH_PROTECTIONS.items():
+        actual = rule.get(BRANCH_PROTECTION_RULE_FIELDS[protection])
+        if actual != expected:
+            audit.drift.append(f"{protection} is {actual}, expected {expected}")
+    return audit
+
+
+def audit_repositories(
+    g: Github,
+    organization: str,
+    names: list[str] | None = None,
+    patterns: list[str] | None = None,
+    topic: str | None = None,
+    platform_team: str = GITHUB_ORG_PLATFORM_TEAM,
+    platform_admin_team: str = GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS,
+) -> list[RepositoryAudit]:
+    """Audits the labels, team permissions and default branch protection of an organization's repositories with
+    batched GraphQL queries: one request per REPOSITORIES_PAGE_SIZE repositories, and one per
+    TEAM_REPOSITORIES_PAGE_SIZE repositories of each team involved, instead of several REST calls per repository.
+
+    Args:
+        g (Github): GitHub client
+        organization (str): Name of the organization that owns the repositories.
+        names (list[str], optional): Exact repository names. Defaults to None.
+        patterns (list[str], optional): Glob patterns matched against repository names, e.g. "tf-*". Defaults to None.
+        topic (str, optional): Topic that a repository must carry. Defaults to None.
+        platform_team (str, optional): Slug of the team granted maintain. Defaults to GITHUB_ORG_PLATFORM_TEAM.
+        platform_admin_team (str, optional): Slug of the team granted admin. Defaults to
+            GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS.
+
+    Returns:
+        list[RepositoryAudit]: The drift found on each selected repository, in the order GitHub lists them.
+    """
+    repositories = fetch_repositories(
+        g=g, organization=organization, names=names, patterns=patterns, topic=topic
+    )
+    expected = {
+        repository["name"]: expected_team_permissions(
+            repository_name=repository["name"],
+            platform_team=platform_team,
+            platform_admin_team=platform_admin_team,
+        )
+        for repository in repositories
+    }
+    slugs = sorted({slug for teams in expected.values() for slug in teams})
+    team_permissions = {
+        slug: fetch_team_permissions(g=g, organization=organization, slug=slug)
+        for slug in slugs
+    }
+    return [
+        audit_repository(
+            repository=repository,
+            team_permissions=team_permissions,
+            expected_permissions=expected[repository["name"]],
+        )
+        for repository in repositories
+    ]
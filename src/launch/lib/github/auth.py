@@ -4,6 +4,8 @@ from functools import cache
 
 from github import Auth, Consts, Github
 
+from launch.config.github import GITHUB_HTTP_CACHE
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,10 +31,19 @@ def get_github_instance(token: str | None = None, timeout: int | None = None) ->
         logger.debug("Token wasn't passed, reading from environment.")
         token = read_github_token()
     auth = Auth.Token(token)
+    _use_http_cache()
     return Github(auth=auth, timeout=timeout)
 
 
 def get_anonymous_github_instance(timeout: int | None = None) -> Github:
     if timeout is None:
         timeout = Consts.DEFAULT_TIMEOUT
+    _use_http_cache()
     return Github(auth=None, timeout=timeout)
+
+
+def _use_http_cache() -> None:
+    if GITHUB_HTTP_CACHE:
+        from launch.lib.github.http_cache import install_http_cache
+
+        install_http_cache()
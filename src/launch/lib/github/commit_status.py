@@ -1,9 +1,20 @@
-from dataclasses import dataclass
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
 from enum import StrEnum
+from typing import Iterable, Iterator
 
 from github import Github
 from github.CommitStatus import CommitStatus
 
+from launch.config.github import GITHUB_MAX_CONNECTIONS
+from launch.lib.common.utilities.concurrency import TaskResult
+from launch.lib.github.async_client import AsyncGithub
+
+logger = logging.getLogger(__name__)
+
 
 class CommitStatusState(StrEnum):
     error = "error"
@@ -50,3 +61,136 @@ def set_commit_status(
         description=payload.description,
         context=payload.context,
     )
+
+
+@dataclass
+class CommitStatusEntry:
+    repo_name: str
+    commit_sha: str
+    payload: CommitStatusUpdatePayload
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        """Statuses sharing a key replace each other on GitHub, so they are posted in order."""
+        return (self.repo_name, self.commit_sha, self.payload.context)
+
+
+def read_commit_status_entries(
+    lines: Iterable[str], repo_name: str | None = None
+) -> Iterator[CommitStatusEntry]:
+    """Parses commit statuses from JSON lines, one object per line with the keys commit, state, context, description,
+    target_url and, optionally, repository. Blank lines are skipped.
+
+    Args:
+        lines (Iterable[str]): The JSON lines.
+        repo_name (str | None, optional): Repository of entries that don't name one. Defaults to None.
+
+    Raises:
+        ValueError: If a line isn't a valid commit status.
+
+    Yields:
+        CommitStatusEntry: Each commit status, in the order given.
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            entry = CommitStatusEntry(
+                repo_name=data.get("repository") or repo_name,
+                commit_sha=data["commit"],
+                payload=CommitStatusUpdatePayload(
+                    state=CommitStatusState(str(data["state"]).lower()),
+                    target_url=data.get("target_url") or "",
+                    description=data.get("description") or "",
+                    context=data.get("context") or "",
+                ),
+            )
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid commit status on line {number}: {e}") from e
+        if not entry.repo_name:
+            raise ValueError(f"Invalid commit status on line {number}: no repository")
+        yield entry
+
+
+def group_commit_status_entries(
+    entries: Iterable[CommitStatusEntry],
+) -> dict[tuple[str, str, str], list[CommitStatusEntry]]:
+    """Groups statuses by repository, commit and context, keeping their order within each group and dropping a status
+    identical to the one before it in its group."""
+    groups: dict[tuple[str, str, str], list[CommitStatusEntry]] = {}
+    for entry in entries:
+        group = groups.setdefault(entry.key, [])
+        if group and group[-1].payload == entry.payload:
+            continue
+        group.append(entry)
+    return groups
+
+
+async def post_commit_statuses(
+    client: AsyncGithub,
+    repo_org: str,
+    entries: Iterable[CommitStatusEntry],
+) -> list[TaskResult]:
+    """Posts commit statuses with an asyncio GitHub client. Statuses of different commits or contexts are posted
+    concurrently, those of the same commit and context one after another in the order given.
+
+    Args:
+        client (AsyncGithub): Client the statuses are posted with.
+        repo_org (str): Organization of the repositories.
+        entries (Iterable[CommitStatusEntry]): The statuses to post.
+
+    Returns:
+        list[TaskResult]: One result per repository, commit and context, in order of first appearance. A failure
+            skips the remaining statuses of its group.
+    """
+
+    async def post_group(key, group: list[CommitStatusEntry]) -> TaskResult:
+        repo_name, commit_sha, context = key
+        name = f"{repo_name}@{commit_sha[:12]} {context}".rstrip()
+        start = time.perf_counter()
+        try:
+            for entry in group:
+                await client.post(
+                    f"repos/{repo_org}/{repo_name}/statuses/{commit_sha}",
+                    json={
+                        **asdict(entry.payload),
+                        "state": str(entry.payload.state),
+                    },
+                )
+        except Exception as e:
+            logger.error(f"Failed to set commit status {name}: {e}")
+            return TaskResult(
+                name=name,
+                succeeded=False,
+                duration=time.perf_counter() - start,
+                detail=str(e),
+            )
+        return TaskResult(
+            name=name,
+            succeeded=True,
+            duration=time.perf_counter() - start,
+            value=str(group[-1].payload.state),
+        )
+
+    groups = group_commit_status_entries(entries)
+    return list(
+        await asyncio.gather(*(post_group(key, group) for key, group in groups.items()))
+    )
+
+
+def set_commit_statuses(
+    repo_org: str,
+    entries: Iterable[CommitStatusEntry],
+    token: str | None = None,
+    max_connections: int = GITHUB_MAX_CONNECTIONS,
+) -> list[TaskResult]:
+    """Posts many commit statuses concurrently over one pooled session. See post_commit_statuses."""
+
+    async def main() -> list[TaskResult]:
+        async with AsyncGithub(token=token, max_connections=max_connections) as client:
+            return await post_commit_statuses(
+                client=client, repo_org=repo_org, entries=entries
+            )
+
+    return asyncio.run(main())
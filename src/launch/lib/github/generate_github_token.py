@@ -1,11 +1,19 @@
+import base64
 import logging
 import time
+from datetime import datetime
 
 import requests
-from boto3.session import Session
 from botocore.exceptions import ClientError
 from jwt import PyJWT
 
+from launch.config.github import GITHUB_API_URL
+from launch.lib.automation.provider.aws.clients import get_client
+from launch.lib.github.token_cache import (
+    INSTALLATION_TOKEN_LIFETIME_SECONDS,
+    CachedToken,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -65,6 +73,24 @@ def get_token(
     private_key: str,
     token_expiration_seconds: int,
 ) -> str:
+    return get_installation_token(
+        application_id=application_id,
+        installation_id=installation_id,
+        private_key=private_key,
+        token_expiration_seconds=token_expiration_seconds,
+    ).token
+
+
+def get_installation_token(
+    application_id: str,
+    installation_id: str,
+    private_key: str,
+    token_expiration_seconds: int,
+) -> CachedToken:
+    """Requests a new installation token, along with the expiry GitHub reported for it. Should GitHub not report one,
+    the token is assumed to last INSTALLATION_TOKEN_LIFETIME_SECONDS from before the request.
+    """
+    issued_at = time.time()
     try:
         signing_jwt = create_jwt(
             application_id=application_id,
@@ -73,10 +99,17 @@ def get_token(
         )
         headers = {"Authorization": f"Bearer {signing_jwt}"}
         response = requests.post(
-            url=f"https://api.github.com/app/installations/{installation_id}/access_tokens",
+            url=f"{GITHUB_API_URL}/app/installations/{installation_id}/access_tokens",
             headers=headers,
         )
-        return response.json()["token"]
+        data = response.json()
+        if data.get("expires_at"):
+            expires_at = datetime.fromisoformat(
+                data["expires_at"].replace("Z", "+00:00")
+            ).timestamp()
+        else:
+            expires_at = issued_at + INSTALLATION_TOKEN_LIFETIME_SECONDS
+        return CachedToken(token=data["token"], expires_at=expires_at)
     except ClientError as e:
         logger.exception(
             f"An error occurred while retrieving the value of token for application id {application_id}"
@@ -94,11 +127,8 @@ def get_secret_value(secret_name: str) -> str:
     Returns:
     - str: The value of the secret.
     """
-    # Create a session with the specified AWS profile
-    session = Session()
-
-    # Create a session using AWS SDK
-    secretsmanager = session.client("secretsmanager")
+    # The client is shared by the whole process
+    secretsmanager = get_client("secretsmanager")
 
     try:
         # Get the secret value
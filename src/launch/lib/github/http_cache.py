@@ -0,0 +1,300 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+)
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from launch.config.github import GITHUB_HTTP_CACHE_MAX_BYTES, GITHUB_HTTP_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Request headers that change the representation GitHub responds with, so they are part of the cache key.
+VARYING_HEADERS = ["Accept", "X-GitHub-Api-Version"]
+
+# Headers of a 304 response that replace the cached ones, so the rate limit PyGithub reports stays current.
+REVALIDATED_HEADERS = [
+    "Date",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+    "X-RateLimit-Used",
+    "X-RateLimit-Resource",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: bytes
+
+
+def cache_key(request: requests.PreparedRequest) -> str:
+    """Returns the key a response is cached under: the URL, the token it was requested with and the headers
+    selecting its representation. Tokens are hashed, so they are never written to the cache.
+    """
+    digest = hashlib.sha256()
+    token = request.headers.get("Authorization", "")
+    for part in [
+        request.method,
+        request.url,
+        hashlib.sha256(token.encode()).hexdigest(),
+        *(request.headers.get(name, "") for name in VARYING_HEADERS),
+    ]:
+        digest.update(f"{part}\0".encode())
+    return digest.hexdigest()
+
+
+class HttpCache:
+    """Keeps responses in a SQLite database, evicting the least recently used ones once the bodies exceed max_bytes.
+    A single cache can be shared by threads and by processes.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Unable to enable write-ahead logging for {self.path}: {e}")
+        self._connection.execute(_SCHEMA)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, etag, last_modified, headers, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        url, etag, last_modified, headers, body = row
+        return CachedResponse(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            headers=json.loads(headers),
+            body=body,
+        )
+
+    def store(self, key: str, response: CachedResponse) -> None:
+        if len(response.body) > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.etag,
+                    response.last_modified,
+                    json.dumps(response.headers),
+                    response.body,
+                    len(response.body),
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} responses from {self.path}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """Revalidates GET requests that have a cached response with If-None-Match and If-Modified-Since. A 304 response
+    is answered from the cache, so unchanged resources don't count against the primary rate limit.
+    """
+
+    def __init__(self, cache: HttpCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs):
+        if request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        key = cache_key(request)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Not modified, answering from the cache: {request.url}")
+            return self._cached_response(request, response, cached)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self.cache.store(
+                key,
+                CachedResponse(
+                    url=request.url,
+                    etag=etag,
+                    last_modified=last_modified,
+                    headers=dict(response.headers),
+                    body=response.content,
+                ),
+            )
+        return response
+
+    def _cached_response(
+        self,
+        request: requests.PreparedRequest,
+        not_modified: requests.Response,
+        cached: CachedResponse,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(cached.headers)
+        for name in REVALIDATED_HEADERS:
+            if name in not_modified.headers:
+                response.headers[name] = not_modified.headers[name]
+        response._content = cached.body
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = not_modified.elapsed
+        response.connection = self
+        return response
+
+
+class _CachingConnectionMixin:
+    # PyGithub creates a connection for every request once connection classes are injected. The sessions are shared
+    # instead, so connections are still pooled across requests.
+    _sessions: dict[tuple, requests.Session] = {}
+    _sessions_lock = threading.Lock()
+    cache: HttpCache | None = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        session_key = (self.protocol, self.host, self.port, self.pool_size)
+        with self._sessions_lock:
+            session = self._sessions.get(session_key)
+            if session is None:
+                session = requests.Session()
+                session.auth = Requester.noopAuth
+                session.mount(
+                    f"{self.protocol}://",
+                    CachingAdapter(
+                        cache=self.cache,
+                        max_retries=self.retry,
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                    ),
+                )
+                self._sessions[session_key] = session
+        self.session = session
+
+    def close(self) -> None:
+        # The shared session outlives each connection.
+        pass
+
+
+class CachingHTTPSConnectionClass(
+    _CachingConnectionMixin, HTTPSRequestsConnectionClass
+):
+    pass
+
+
+class CachingHTTPConnectionClass(_CachingConnectionMixin, HTTPRequestsConnectionClass):
+    pass
+
+
+_install_lock = threading.Lock()
+
+
+def install_http_cache(
+    path: str = GITHUB_HTTP_CACHE_PATH,
+    max_bytes: int = GITHUB_HTTP_CACHE_MAX_BYTES,
+) -> HttpCache:
+    """Makes every Github instance created afterwards answer reads from a persistent cache of conditional requests.
+    Installing it again returns the cache that is already installed.
+
+    Args:
+        path (str, optional): Path of the SQLite database. Defaults to GITHUB_HTTP_CACHE_PATH.
+        max_bytes (int, optional): Size of the cached bodies above which the least recently used are evicted.
+            Defaults to GITHUB_HTTP_CACHE_MAX_BYTES.
+
+    Returns:
+        HttpCache: The installed cache.
+    """
+    with _install_lock:
+        if _CachingConnectionMixin.cache is None:
+            _CachingConnectionMixin.cache = HttpCache(path=path, max_bytes=max_bytes)
+            Requester.injectConnectionClasses(
+                CachingHTTPConnectionClass, CachingHTTPSConnectionClass
+            )
+        return _CachingConnectionMixin.cache
+
+
+def uninstall_http_cache() -> None:
+    """Restores PyGithub's own connections for Github instances created afterwards."""
+    with _install_lock:
+        Requester.resetConnectionClasses()
+        with _CachingConnectionMixin._sessions_lock:
+            for session in _CachingConnectionMixin._sessions.values():
+                session.close()
+            _CachingConnectionMixin._sessions.clear()
+        if _CachingConnectionMixin.cache is not None:
+            _CachingConnectionMixin.cache.close()
+            _CachingConnectionMixin.cache = None
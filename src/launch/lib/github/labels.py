@@ -1,11 +1,19 @@
+import logging
 from dataclasses import dataclass
+from functools import partial
 
+from github import Github
 from github.GithubException import GithubException
 from github.Label import Label
 from github.Repository import Repository
 
+from launch.config.common import MAX_WORKERS
+from launch.lib.common.utilities.concurrency import TaskResult, run_concurrently
+from launch.lib.github.rate_limit import TokenBucket, throttled
 from launch.lib.local_repo.predict import ChangeType
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CustomLabel:
@@ -94,3 +102,45 @@ def create_custom_labels(
             else:
                 raise
     return num_created
+
+
+def create_custom_labels_many(
+    g: Github,
+    repositories: list[Repository],
+    custom_labels: list[CustomLabel] = None,
+    bucket: TokenBucket | None = None,
+    max_workers: int = MAX_WORKERS,
+) -> list[TaskResult]:
+    """Creates custom labels on many repositories concurrently, pacing the requests with a token bucket that follows
+    GitHub's rate limit. The value of each result is the number of labels created on that repository.
+
+    Args:
+        g (Github): GitHub client shared by every repository
+        repositories (list[Repository]): Repositories to create the labels on
+        custom_labels (list[CustomLabel], optional): List of labels to create. Defaults to None, which will pull the standard custom labels from the module.
+        bucket (TokenBucket, optional): Bucket pacing the requests. Defaults to None, which creates one.
+        max_workers (int, optional): Maximum number of repositories updated at once. Defaults to MAX_WORKERS.
+
+    Returns:
+        list[TaskResult]: One result per repository, in the order supplied.
+    """
+    if not custom_labels:
+        custom_labels = CUSTOM_LABELS
+    bucket = bucket or TokenBucket()
+    tasks = {
+        repository.name: throttled(
+            task=partial(
+                create_custom_labels,
+                repository=repository,
+                custom_labels=custom_labels,
+            ),
+            g=g,
+            bucket=bucket,
+            cost=len(custom_labels),
+        )
+        for repository in repositories
+    }
+    logger.info(
+        f"Creating labels on {len(tasks)} repositories with up to {max_workers} workers"
+    )
+    return run_concurrently(tasks=tasks, max_workers=max_workers)
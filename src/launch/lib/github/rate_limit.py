@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from github import Github
+
+from launch.config.github import GITHUB_REQUESTS_PER_SECOND
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Paces requests shared by many threads. Tokens are added at a steady rate up to the capacity, and each request
+    takes tokens out, waiting for them when the bucket runs dry. The rate is lowered whenever GitHub reports that the
+    remaining rate limit wouldn't last until it resets.
+    """
+
+    def __init__(
+        self,
+        rate: float = GITHUB_REQUESTS_PER_SECOND,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Takes tokens out of the bucket, waiting until they have been added back if there weren't enough. The
+        tokens are reserved before waiting, so the bucket can go into debt: a charge larger than the capacity waits
+        for the full amount, and concurrent callers queue up behind each other's debt.
+
+        Args:
+            tokens (float, optional): Number of tokens. Defaults to 1.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            wait = max(-self.tokens, 0) / self.rate
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def observe(
+        self, remaining: int, reset_at: float, now: float | None = None
+    ) -> None:
+        """Adjusts the rate so the remaining rate limit is spread over the time until it resets.
+
+        Args:
+            remaining (int): Requests remaining, from the X-RateLimit-Remaining header.
+            reset_at (float): Unix time the rate limit resets at, from the X-RateLimit-Reset header.
+            now (float | None, optional): Current unix time. Defaults to None, which reads the clock.
+        """
+        seconds_until_reset = max(reset_at - (time.time() if now is None else now), 1)
+        with self._lock:
+            self._refill()
+            # With nothing left, the next request waits for the reset.
+            self.rate = min(
+                self.max_rate,
+                max(remaining, 1) / seconds_until_reset,
+            )
+            self.tokens = min(self.tokens, max(remaining, 0))
+        if self.rate < self.max_rate:
+            logger.debug(
+                f"{remaining} requests remaining for {seconds_until_reset:.0f}s, slowing down to {self.rate:.2f} requests per second"
+            )
+
+
+def observe_rate_limit(bucket: TokenBucket, g: Github) -> None:
+    """Feeds the rate limit headers of the client's latest response to the bucket, without making a request."""
+    remaining, limit = g.requester.rate_limiting
+    if limit < 0:
+        return
+    bucket.observe(remaining=remaining, reset_at=g.requester.rate_limiting_resettime)
+
+
+def throttled(
+    task: Callable[[], Any], g: Github, bucket: TokenBucket, cost: float = 1
+) -> Callable[[], Any]:
+    """Wraps a task making about cost requests with g, so it waits for its tokens before running and updates the
+    bucket from the rate limit headers once it has finished.
+    """
+
+    def run() -> Any:
+        bucket.acquire(tokens=cost)
+        try:
+            return task()
+        finally:
+            observe_rate_limit(bucket=bucket, g=g)
+
+    return run
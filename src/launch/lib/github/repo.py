@@ -1,3 +1,4 @@
+import fnmatch
 import logging
 
 import click
@@ -56,3 +57,48 @@ def repo_exist(name: str, g: Github) -> bool:
     except Exception as e:
         logger.info(f"Repository {name} does not exist")
         return False
+
+
+def select_repositories(
+    g: Github,
+    organization: str,
+    names: list[str] | None = None,
+    patterns: list[str] | None = None,
+    topic: str | None = None,
+) -> list[Repository]:
+    """Selects repositories from an organization by exact name, by glob pattern, or by topic.
+
+    Repositories named explicitly are looked up directly. Patterns and topic filters require listing the organization's
+    repositories once; when both are supplied, a repository must match one of the patterns and carry the topic.
+
+    Args:
+        g (Github): GitHub client
+        organization (str): Name of the organization that owns the repositories.
+        names (list[str], optional): Exact repository names. Defaults to None.
+        patterns (list[str], optional): Glob patterns matched against repository names, e.g. "tf-*". Defaults to None.
+        topic (str, optional): Topic that a repository must carry. Defaults to None.
+
+    Returns:
+        list[Repository]: Matching repositories without duplicates, explicitly named repositories first.
+    """
+    org = g.get_organization(organization)
+    selected: dict[str, Repository] = {}
+
+    for name in names or []:
+        if name not in selected:
+            selected[name] = org.get_repo(name)
+
+    if patterns or topic:
+        for repository in org.get_repos():
+            if repository.name in selected:
+                continue
+            if patterns and not any(
+                fnmatch.fnmatch(repository.name, pattern) for pattern in patterns
+            ):
+                continue
+            if topic and topic not in repository.topics:
+                continue
+            selected[repository.name] = repository
+
+    logger.debug(f"Selected {len(selected)} repositories from {organization}")
+    return list(selected.values())
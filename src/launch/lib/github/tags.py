@@ -1,5 +1,6 @@
-import itertools
+import heapq
 import logging
+from typing import Callable, Iterable, Iterator
 
 from github.Repository import Repository
 from github.Tag import Tag
@@ -8,24 +9,69 @@ from semver import Version
 logger = logging.getLogger(__name__)
 
 
+def iter_repo_tags(repo: Repository) -> Iterator[Tag]:
+    """Yields a repository's tags as their pages are fetched, so a caller that stops early doesn't fetch the rest."""
+    count = 0
+    for tag in repo.get_tags():
+        count += 1
+        yield tag
+    logger.debug(f"Fetched {count} tags from {repo.name}")
+
+
 def get_repo_tags(repo: Repository) -> list[Tag]:
-    tags = [tag for tag in repo.get_tags()]
-    logger.debug(f"Fetched {len(tags)} tags from {repo.name}")
-    return tags
+    return list(iter_repo_tags(repo=repo))
+
+
+def try_parse_version(tag_name: str) -> Version | None:
+    try:
+        return Version.parse(version=tag_name)
+    except Exception as e:
+        logger.debug(f"Failed to parse version from tag {tag_name}: {e}")
+
+
+def iter_repo_semantic_versions(
+    repo: Repository, until: Callable[[Version], bool] | None = None
+) -> Iterator[Version]:
+    """Yields the versions of a repository's semantic version tags while the tags are streamed, skipping other tags.
+
+    Args:
+        repo (Repository): GitHub Repository
+        until (Callable[[Version], bool] | None, optional): Stops fetching tags once a version satisfying it has
+            been yielded, e.g. lambda version: version > threshold. Defaults to None, which yields every version.
+
+    Yields:
+        Version: Each semantic version, in the order GitHub lists the tags.
+    """
+    count = 0
+    for tag in iter_repo_tags(repo=repo):
+        version = try_parse_version(tag.name)
+        if version is None:
+            continue
+        count += 1
+        yield version
+        if until is not None and until(version):
+            logger.debug(f"Stopped reading tags on {repo.name} at {version}")
+            break
+    logger.debug(f"Successfully parsed {count} from tags on {repo.name}")
 
 
 def get_repo_semantic_versions(repo: Repository) -> list[Version]:
-    def try_parse_version(tag_name: str) -> Version | None:
-        try:
-            return Version.parse(version=tag_name)
-        except Exception as e:
-            logger.debug(f"Failed to parse version from tag {tag_name}: {e}")
-
-    tags = get_repo_tags(repo=repo)
-    versions = list(
-        itertools.filterfalse(
-            lambda x: x is None, [try_parse_version(t.name) for t in tags]
-        )
-    )
-    logger.debug(f"Successfully parsed {len(versions)} from tags on {repo.name}")
-    return versions
+    return list(iter_repo_semantic_versions(repo=repo))
+
+
+def top_versions(
+    versions: Iterable[Version], k: int, include_prerelease: bool = True
+) -> list[Version]:
+    """Returns the k newest versions from a stream, holding no more than k of them at a time.
+
+    Args:
+        versions (Iterable[Version]): Versions, e.g. from iter_repo_semantic_versions.
+        k (int): Number of versions to return.
+        include_prerelease (bool, optional): Consider prerelease versions. Defaults to True.
+
+    Returns:
+        list[Version]: Up to k versions, newest first.
+    """
+    if not include_prerelease:
+        versions = (version for version in versions if version.prerelease is None)
+    return heapq.nlargest(k, versions)
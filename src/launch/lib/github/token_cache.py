@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Protocol
+
+from launch.config.github import (
+    GITHUB_TOKEN_CACHE,
+    GITHUB_TOKEN_CACHE_DIR,
+    GITHUB_TOKEN_CACHE_KEY,
+    GITHUB_TOKEN_REFRESH_MARGIN_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# GitHub App installation tokens expire one hour after they are issued, assumed when GitHub doesn't say otherwise.
+INSTALLATION_TOKEN_LIFETIME_SECONDS = 3600
+
+# A token closer than this to its expiry is never handed out, a new one is fetched instead.
+MINIMUM_REMAINING_SECONDS = 60
+
+KEYRING_SERVICE_NAME = "launch-cli"
+
+
+@dataclass
+class CachedToken:
+    token: str
+    expires_at: float
+
+    def remaining(self) -> float:
+        return self.expires_at - time.time()
+
+
+class TokenStore(Protocol):
+    def load(self, key: str) -> CachedToken | None: ...
+
+    def save(self, key: str, cached_token: CachedToken) -> None: ...
+
+
+class FileTokenStore:
+    """Keeps tokens in a directory, one file per key, encrypted with a Fernet key."""
+
+    def __init__(self, directory: Path, encryption_key: str):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise RuntimeError(
+                "The file token cache requires the 'cryptography' package to be installed."
+            ) from e
+        self.directory = Path(directory)
+        self.fernet = Fernet(encryption_key)
+
+    def path(self, key: str) -> Path:
+        return self.directory.joinpath(f"{key}.token")
+
+    def load(self, key: str) -> CachedToken | None:
+        try:
+            data = self.fernet.decrypt(self.path(key).read_bytes())
+            return CachedToken(**json.loads(data))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached token {self.path(key)}: {e}")
+            return None
+
+    def save(self, key: str, cached_token: CachedToken) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+        temporary_path = self.path(key).with_suffix(f".{os.getpid()}.tmp")
+        descriptor = os.open(
+            temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(self.fernet.encrypt(json.dumps(asdict(cached_token)).encode()))
+        temporary_path.replace(self.path(key))
+
+
+class KeyringTokenStore:
+    """Keeps tokens in the operating system's keyring."""
+
+    def __init__(self):
+        try:
+            import keyring
+        except ImportError as e:
+            raise RuntimeError(
+                "The keyring token cache requires the 'keyring' package to be installed."
+            ) from e
+        self.keyring = keyring
+
+    def load(self, key: str) -> CachedToken | None:
+        data = self.keyring.get_password(KEYRING_SERVICE_NAME, key)
+        return CachedToken(**json.loads(data)) if data else None
+
+    def save(self, key: str, cached_token: CachedToken) -> None:
+        self.keyring.set_password(
+            KEYRING_SERVICE_NAME, key, json.dumps(asdict(cached_token))
+        )
+
+
+class TokenCache:
+    """
+    Caches GitHub App installation tokens by application and installation id. A cached token is returned until it is
+    within refresh_margin seconds of expiring, from then on a new one is fetched before returning. A long-lived process
+    can set background_refresh to keep returning the cached token while a new one is fetched in the background, until
+    it is about to expire. That is off by default: a one-shot CLI process would exit before the refresh finished.
+    Tokens are kept in memory, and in the store when one is supplied so they are shared across invocations.
+    """
+
+    def __init__(
+        self,
+        store: TokenStore | None = None,
+        refresh_margin: int = GITHUB_TOKEN_REFRESH_MARGIN_SECONDS,
+        lifetime: int = INSTALLATION_TOKEN_LIFETIME_SECONDS,
+        background_refresh: bool = False,
+    ):
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self.lifetime = lifetime
+        self.background_refresh = background_refresh
+        self._tokens: dict[str, CachedToken] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(application_id: str, installation_id: str) -> str:
+        return f"{application_id}-{installation_id}"
+
+    def get(
+        self,
+        application_id: str,
+        installation_id: str,
+        fetch: Callable[[], str | CachedToken],
+    ) -> str:
+        """Returns a token for the installation, calling fetch for a new one only when required.
+
+        Args:
+            application_id (str): The application id of the GitHub App.
+            installation_id (str): The installation id of the GitHub App.
+            fetch (Callable[[], str | CachedToken]): Requests a new installation token from GitHub, returning it with
+                the expiry GitHub reported, or only the token to assume the default lifetime.
+
+        Returns:
+            str: An installation token.
+        """
+        key = self.key(application_id=application_id, installation_id=installation_id)
+        cached_token = self._lookup(key)
+        if cached_token and cached_token.remaining() > self.refresh_margin:
+            logger.debug(f"Using cached installation token for {key}")
+            return cached_token.token
+        if (
+            self.background_refresh
+            and cached_token
+            and cached_token.remaining() > MINIMUM_REMAINING_SECONDS
+        ):
+            logger.debug(f"Using cached installation token for {key}, refreshing it")
+            self._refresh_in_background(key=key, fetch=fetch)
+            return cached_token.token
+        return self._refresh(key=key, fetch=fetch).token
+
+    def _lookup(self, key: str) -> CachedToken | None:
+        with self._lock:
+            cached_token = self._tokens.get(key)
+        if cached_token is None and self.store is not None:
+            cached_token = self.store.load(key)
+            if cached_token is not None:
+                with self._lock:
+                    self._tokens[key] = cached_token
+        return cached_token
+
+    def _refresh(self, key: str, fetch: Callable[[], str | CachedToken]) -> CachedToken:
+        # Without an expiry from GitHub, it is counted from before the request, so it is never later than GitHub's.
+        issued_at = time.time()
+        cached_token = fetch()
+        if not isinstance(cached_token, CachedToken):
+            cached_token = CachedToken(
+                token=cached_token, expires_at=issued_at + self.lifetime
+            )
+        with self._lock:
+            self._tokens[key] = cached_token
+        if self.store is not None:
+            try:
+                self.store.save(key, cached_token)
+            except Exception as e:
+                logger.warning(f"Failed to store installation token for {key}: {e}")
+        logger.info(f"Fetched a new installation token for {key}")
+        return cached_token
+
+    def _refresh_in_background(
+        self, key: str, fetch: Callable[[], str | CachedToken]
+    ) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._refresh(key=key, fetch=fetch)
+            except Exception as e:
+                logger.warning(
+                    f"Background refresh of installation token {key} failed: {e}"
+                )
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+
+def create_token_store(
+    backend: str = GITHUB_TOKEN_CACHE,
+    directory: str = GITHUB_TOKEN_CACHE_DIR,
+    encryption_key: str | None = GITHUB_TOKEN_CACHE_KEY,
+) -> TokenStore | None:
+    """Creates the store that installation tokens are shared through between invocations.
+
+    Args:
+        backend (str, optional): One of "memory", "file" or "keyring". Defaults to GITHUB_TOKEN_CACHE.
+        directory (str, optional): Directory of the file store. Defaults to GITHUB_TOKEN_CACHE_DIR.
+        encryption_key (str | None, optional): Fernet key for the file store. Defaults to GITHUB_TOKEN_CACHE_KEY.
+
+    Returns:
+        TokenStore | None: The store, or None when tokens are only kept in memory.
+    """
+    if backend == "memory":
+        return None
+    if backend == "keyring":
+        return KeyringTokenStore()
+    if backend == "file":
+        if not encryption_key:
+            logger.warning(
+                "GITHUB_TOKEN_CACHE_KEY is not set, installation tokens will only be cached in memory."
+            )
+            return None
+        return FileTokenStore(directory=Path(directory), encryption_key=encryption_key)
+    raise ValueError(
+        f"Unsupported token cache: {backend}. Must be one of: memory, file, keyring."
+    )
+
+
+_token_cache: TokenCache | None = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """Returns the token cache shared by the whole process, creating it on first use."""
+    global _token_cache
+    with _token_cache_lock:
+        if _token_cache is None:
+            _token_cache = TokenCache(store=create_token_store())
+        return _token_cache
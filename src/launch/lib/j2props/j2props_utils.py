@@ -1,11 +1,11 @@
 import os
 from pathlib import Path
 
-import boto3
 from botocore.exceptions import ClientError
 from jinja2 import Environment, FileSystemLoader
 
 from launch.lib.automation.common.functions import load_yaml
+from launch.lib.automation.provider.aws.clients import get_client
 
 
 class J2PropsTemplate:
@@ -65,15 +65,16 @@ class J2PropsTemplate:
 
     def __get_client(self):
         """
-        Return an AWS boto3 client using lazy initialization.
+        Return an AWS boto3 client using lazy initialization. The client is shared with every other template using
+        the same region and profile.
         :return: boto3 client
         """
         if self._aws_client is None:
-            # Create a Secrets Manager client
-            session = boto3.session.Session(
-                region_name=self.region, profile_name=self.profile
+            self._aws_client = get_client(
+                service_name="secretsmanager",
+                region_name=self.region,
+                profile_name=self.profile,
             )
-            self._aws_client = session.client(service_name="secretsmanager")
         return self._aws_client
 
     def __lookup_aws_secret_filter(self, secret_name):
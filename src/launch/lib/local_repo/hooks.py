@@ -0,0 +1,88 @@
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from launch.lib.local_repo.predict import BranchNameMatcher
+
+# Only the standard library and semver are imported here, so server-side hooks can load this module quickly.
+
+logger = logging.getLogger(__name__)
+
+BRANCH_REF_PREFIX = "refs/heads/"
+
+
+class RefStatus:
+    VALID = "valid"
+    INVALID = "invalid"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class RefValidation:
+    ref: str
+    status: str
+    reason: str = ""
+
+
+def validate_ref_update(
+    line: str,
+    matcher: BranchNameMatcher,
+    allowed_branches: Iterable[str] = (),
+) -> RefValidation | None:
+    """Validates the branch name of one ref update, given in the format of a git pre-receive hook:
+    `<old-sha> <new-sha> <ref-name>`. Only branches that are created or updated are validated.
+
+    Args:
+        line (str): The ref update.
+        matcher (BranchNameMatcher): Matcher the branch name is validated with.
+        allowed_branches (Iterable[str], optional): Branch names accepted without validation. Defaults to ().
+
+    Returns:
+        RefValidation | None: The outcome for the ref, or None if the line is blank.
+    """
+    parts = line.split()
+    if not parts:
+        return None
+    if len(parts) != 3:
+        return RefValidation(
+            ref=line.strip(), status=RefStatus.INVALID, reason="malformed ref update"
+        )
+    _, new_sha, ref = parts
+    if not ref.startswith(BRANCH_REF_PREFIX):
+        return RefValidation(ref=ref, status=RefStatus.SKIPPED, reason="not a branch")
+    if not new_sha.strip("0"):
+        return RefValidation(ref=ref, status=RefStatus.SKIPPED, reason="deleted")
+    branch_name = ref[len(BRANCH_REF_PREFIX) :]
+    if branch_name in allowed_branches or matcher.is_valid(branch_name):
+        return RefValidation(ref=ref, status=RefStatus.VALID)
+    return RefValidation(
+        ref=ref,
+        status=RefStatus.INVALID,
+        reason=f"must case-insensitively start with one of {sorted(matcher.name_parts)} followed by {matcher.delimiter}",
+    )
+
+
+def validate_ref_updates(
+    lines: Iterable[str],
+    matcher: BranchNameMatcher | None = None,
+    allowed_branches: Iterable[str] = (),
+) -> Iterator[RefValidation]:
+    """Validates the branch names of a stream of ref updates, yielding each outcome as soon as its line is read.
+
+    Args:
+        lines (Iterable[str]): Ref updates in the format of a git pre-receive hook, one per line.
+        matcher (BranchNameMatcher | None, optional): Matcher the branch names are validated with. Defaults to None,
+            which uses the revision types configured in launch.lib.local_repo.predict.
+        allowed_branches (Iterable[str], optional): Branch names accepted without validation. Defaults to ().
+
+    Yields:
+        RefValidation: The outcome for each ref.
+    """
+    matcher = matcher or BranchNameMatcher()
+    allowed_branches = frozenset(allowed_branches)
+    for line in lines:
+        result = validate_ref_update(
+            line=line, matcher=matcher, allowed_branches=allowed_branches
+        )
+        if result is not None:
+            yield result
@@ -46,6 +46,45 @@ def latest_tag(tags: list[Version]) -> Version:
     return sorted(tags)[-1]
 
 
+class BranchNameMatcher:
+    """Validates branch names against a set of revision types. The revision types are prepared once, so a single
+    matcher can validate any number of names cheaply."""
+
+    def __init__(
+        self,
+        name_parts: list[str] | None = None,
+        breaking_chars: list[str] | None = None,
+        delimiter: str | None = None,
+    ):
+        self.name_parts = frozenset(
+            part.lower()
+            for part in (ALL_NAME_PARTS if name_parts is None else name_parts)
+        )
+        self.breaking_chars = tuple(
+            BREAKING_CHARS if breaking_chars is None else breaking_chars
+        )
+        self.delimiter = delimiter or BRANCH_DELIMITER
+
+    def is_valid(self, branch_name: str) -> bool:
+        """Checks a branch name against the revision types of this matcher.
+
+        Args:
+            branch_name (str): Name of the branch to validate.
+
+        Returns:
+            bool: True if the branch name conforms to the expected convention, False otherwise.
+        """
+        revision_type, delimiter, _ = branch_name.partition(self.delimiter)
+        if not delimiter:
+            return False
+        for breaking_char in self.breaking_chars:
+            revision_type = revision_type.replace(breaking_char, "")
+        return revision_type.lower().strip() in self.name_parts
+
+
+_default_matcher = BranchNameMatcher()
+
+
 def validate_name(branch_name: str) -> bool:
     """Checks the contents of a branch name against this module's configuration and returns a success/failure boolean with the outcome.
 
@@ -55,18 +94,7 @@ def validate_name(branch_name: str) -> bool:
     Returns:
         bool: Success indicator. A True value indicates that this branch name conforms to the expected convention, a False value indicates otherwise.
     """
-    try:
-        revision_type, _ = split_delimiter(branch_name=branch_name)
-    except InvalidBranchNameException:
-        return False
-
-    for breaking_char in BREAKING_CHARS:
-        if breaking_char in revision_type:
-            revision_type = revision_type.replace(breaking_char, "")
-
-    if revision_type.lower().strip() not in map(str.lower, ALL_NAME_PARTS):
-        return False
-    return True
+    return _default_matcher.is_valid(branch_name)
 
 
 def predict_version(
@@ -1,11 +1,18 @@
 import logging
+import os
 import pathlib
+import re
+import tempfile
+from typing import Iterable
 
 import click
-from git import GitCommandError, Repo
+from git import Git, GitCommandError, Repo
 
 logger = logging.getLogger(__name__)
 
+# Number of paths handed to a single `git add` when staging an explicit set of paths.
+GIT_ADD_BATCH_SIZE = 1000
+
 
 def acquire_repo(repo_path: pathlib.Path) -> Repo:
     try:
@@ -16,6 +23,43 @@ def acquire_repo(repo_path: pathlib.Path) -> Repo:
         ) from e
 
 
+def get_head_commit(repo_path: pathlib.Path) -> str | None:
+    """Returns the sha of the commit checked out in a local repository, or None if repo_path is not a repository."""
+    try:
+        return Repo(path=repo_path).head.commit.hexsha
+    except Exception:
+        logger.debug(f"Could not determine the checked out commit of {repo_path}")
+        return None
+
+
+def resolve_remote_ref(repository_url: str, ref: str) -> str | None:
+    """Returns the sha of a branch or tag in a remote repository without cloning it.
+
+    Args:
+        repository_url (str): URL of the remote repository.
+        ref (str): Name of a branch or tag, or a full commit sha which is returned as is.
+
+    Returns:
+        str | None: The commit sha, or None if the ref couldn't be resolved.
+    """
+    if re.fullmatch(r"[0-9a-f]{40}", ref):
+        return ref
+    try:
+        output = Git().ls_remote(repository_url, ref, f"{ref}^{{}}")
+    except GitCommandError as e:
+        logger.warning(f"Unable to resolve {ref} in {repository_url}: {e}")
+        return None
+    refs = {}
+    for line in output.splitlines():
+        sha, name = line.split("\t", 1)
+        refs[name] = sha
+    # An annotated tag is listed twice, the peeled entry is the commit it points to.
+    for name in (f"refs/tags/{ref}^{{}}", f"refs/heads/{ref}", f"refs/tags/{ref}", ref):
+        if name in refs:
+            return refs[name]
+    return None
+
+
 def checkout_branch(
     repository: Repo,
     target_branch: str,
@@ -67,8 +111,62 @@ def clone_repository(
     return repository
 
 
+def stage_paths(
+    repository: Repo,
+    paths: Iterable[pathlib.Path | str],
+    batch_size: int = GIT_ADD_BATCH_SIZE,
+) -> int:
+    """
+    Stages only the given paths, including their deletion, with batched `git add --pathspec-from-file` calls. Paths
+    outside of the repository's working tree and paths ignored by git are skipped.
+
+    Args:
+        repository (Repo): The local repository.
+        paths (Iterable[pathlib.Path | str]): Absolute paths, or paths relative to the current directory, to stage.
+        batch_size (int, optional): Number of paths staged per git call. Defaults to GIT_ADD_BATCH_SIZE.
+
+    Returns:
+        int: The number of paths staged.
+    """
+    working_tree = pathlib.Path(os.path.realpath(repository.working_tree_dir))
+    relative_paths = set()
+    for path in paths:
+        path = pathlib.Path(path)
+        path = pathlib.Path(os.path.realpath(path.parent)).joinpath(path.name)
+        try:
+            relative_paths.add(path.relative_to(working_tree).as_posix())
+        except ValueError:
+            logger.warning(f"Not staging {path}, it is outside of {working_tree}")
+    relative_paths = sorted(relative_paths)
+
+    staged = 0
+    for start in range(0, len(relative_paths), batch_size):
+        batch = relative_paths[start : start + batch_size]
+        ignored = set(repository.ignored(*batch))
+        batch = [path for path in batch if path not in ignored]
+        if not batch:
+            continue
+        with tempfile.NamedTemporaryFile("w", suffix=".pathspec") as pathspec_file:
+            pathspec_file.write("\0".join(f":(literal){path}" for path in batch))
+            pathspec_file.flush()
+            repository.git.add(
+                [
+                    "--all",
+                    f"--pathspec-from-file={pathspec_file.name}",
+                    "--pathspec-file-nul",
+                ]
+            )
+        staged += len(batch)
+    logger.info(f"Staged {staged} paths in {working_tree}")
+    return staged
+
+
 def push_branch(
-    repository: Repo, branch: str, commit_msg="Initial commit", dry_run: bool = True
+    repository: Repo,
+    branch: str,
+    commit_msg="Initial commit",
+    dry_run: bool = True,
+    paths: Iterable[pathlib.Path | str] | None = None,
 ) -> None:
     if dry_run:
         click.secho(
@@ -77,7 +175,11 @@ def push_branch(
         )
         return
 
-    repository.git.add(["."])
+    # When the paths written by the generation step are known only those are staged, otherwise the whole working tree.
+    if paths is None:
+        repository.git.add(["."])
+    else:
+        stage_paths(repository=repository, paths=paths)
     repository.git.commit(["-m", commit_msg])
     repository.git.push(["--set-upstream", "origin", branch])
     logger.info(f"Pushed the following branch: {repository=} {branch=} {commit_msg=}")
@@ -1,14 +1,20 @@
+import json
 import logging
+import os
 import pathlib
+from dataclasses import dataclass, field
 
-from git import TagReference
+from git import Git, GitCommandError, Repo, TagReference
 from git.objects.commit import Commit
 from semver import Version
 
+from launch.config.common import TAG_INDEX_CACHE
 from launch.lib.local_repo.repo import acquire_repo
 
 logger = logging.getLogger(__name__)
 
+TAG_INDEX_FILE = "launch-tag-index.json"
+
 
 class CommitNotTaggedException(Exception):
     pass
@@ -18,6 +24,109 @@ class CommitTagNotSemanticVersionException(Exception):
     pass
 
 
+@dataclass
+class TagIndex:
+    """The tags of a repository by the commit they point to, with the semantic versions among them parsed."""
+
+    commits: dict[str, list[str]] = field(default_factory=dict)
+    versions: dict[str, Version] = field(default_factory=dict)
+
+    def tags_for(self, commit_sha: str) -> list[str]:
+        """Returns the names of the tags pointing at a commit, sorted by name."""
+        return sorted(self.commits.get(commit_sha, []))
+
+    def semantic_tags(self) -> list[Version]:
+        return list(self.versions.values())
+
+
+def _parse_semantic_version(tag: str) -> Version | None:
+    try:
+        return Version.parse(tag)
+    except ValueError:
+        return None
+
+
+def _tag_refs_signature(repo: Repo) -> list:
+    """Returns the modification times of packed-refs and of the directories of loose tags. Creating, moving or
+    deleting a tag changes at least one of them."""
+    common_dir = pathlib.Path(repo.common_dir)
+    signature = []
+    packed_refs = common_dir.joinpath("packed-refs")
+    if packed_refs.exists():
+        stat = packed_refs.stat()
+        signature.append(["packed-refs", stat.st_mtime_ns, stat.st_size])
+    for root, _, _ in os.walk(common_dir.joinpath("refs", "tags")):
+        signature.append([root, os.stat(root).st_mtime_ns])
+    return signature
+
+
+def build_tag_index(
+    repo_path: pathlib.Path, persist: bool = TAG_INDEX_CACHE
+) -> TagIndex:
+    """Indexes the tags of a repository from a single `git for-each-ref` call, instead of looking up the commit of
+    every tag separately. Annotated tags are indexed by the commit they point to.
+
+    Args:
+        repo_path (pathlib.Path): Path to the repository.
+        persist (bool, optional): Keep the index in the repository's git directory, and reuse it until the tags
+            change. Defaults to TAG_INDEX_CACHE.
+
+    Returns:
+        TagIndex: The index of the repository's tags.
+    """
+    repo_instance = acquire_repo(repo_path=repo_path)
+    index_path = pathlib.Path(repo_instance.common_dir).joinpath(TAG_INDEX_FILE)
+    signature = _tag_refs_signature(repo_instance) if persist else None
+    if persist:
+        try:
+            cached = json.loads(index_path.read_text())
+            if cached["signature"] == signature:
+                logger.debug(f"Using the persisted tag index of {repo_path}")
+                return TagIndex(
+                    commits=cached["commits"],
+                    versions={
+                        tag: Version.parse(tag) for tag in cached["semantic_tags"]
+                    },
+                )
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable tag index {index_path}: {e}")
+
+    index = TagIndex()
+    output = repo_instance.git.for_each_ref(
+        "--format=%(refname:strip=2) %(objectname) %(*objectname)", "refs/tags"
+    )
+    for line in output.splitlines():
+        name, object_sha, *peeled = line.split(" ")
+        # Annotated tags point at a tag object, which in turn points at the commit.
+        commit_sha = peeled[0] if peeled and peeled[0] else object_sha
+        index.commits.setdefault(commit_sha, []).append(name)
+        version = _parse_semantic_version(name)
+        if version is not None:
+            index.versions[name] = version
+    logger.debug(
+        f"Indexed {len(index.versions)} semantic of {len(output.splitlines())} tags"
+    )
+
+    if persist:
+        try:
+            temporary_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary_path.write_text(
+                json.dumps(
+                    {
+                        "signature": signature,
+                        "commits": index.commits,
+                        "semantic_tags": list(index.versions),
+                    }
+                )
+            )
+            temporary_path.replace(index_path)
+        except OSError as e:
+            logger.debug(f"Failed to persist the tag index of {repo_path}: {e}")
+    return index
+
+
 def read_tags(repo_path: pathlib.Path) -> list[str]:
     repo_instance = acquire_repo(repo_path=repo_path)
     all_tags = [tag.name for tag in repo_instance.tags]
@@ -25,7 +134,11 @@ def read_tags(repo_path: pathlib.Path) -> list[str]:
     return all_tags
 
 
-def read_semantic_tags(repo_path: pathlib.Path) -> list[Version]:
+def read_semantic_tags(
+    repo_path: pathlib.Path, index: TagIndex | None = None
+) -> list[Version]:
+    if index is not None:
+        return index.semantic_tags()
     all_tags = read_tags(repo_path=repo_path)
     semver_tags: list[Version] = []
     for tag in all_tags:
@@ -39,17 +152,48 @@ def read_semantic_tags(repo_path: pathlib.Path) -> list[Version]:
 
 
 def read_version_tag(
-    repo_path: pathlib.Path, commit: Commit | None = None
+    repo_path: pathlib.Path, commit: Commit | None = None, index: TagIndex | None = None
 ) -> TagReference:
     repo_instance = acquire_repo(repo_path=repo_path)
     if not commit:
         commit = repo_instance.head.object
-    for discovered_tag in reversed(sorted(repo_instance.tags, key=lambda x: x.name)):
-        if discovered_tag.commit == commit:
-            return discovered_tag
+    if index is None:
+        index = build_tag_index(repo_path=repo_path)
+    tag_names = index.tags_for(commit.hexsha)
+    if tag_names:
+        return TagReference(repo_instance, f"refs/tags/{tag_names[-1]}")
     raise CommitNotTaggedException(f"{commit.hexsha if commit else 'HEAD'} is untagged")
 
 
+def read_remote_semantic_tags(repository_url: str) -> list[Version]:
+    """Lists the semantic version tags of a remote repository with a single `git ls-remote`, without cloning it.
+
+    Args:
+        repository_url (str): URL of the remote repository.
+
+    Raises:
+        RuntimeError: If the tags of the remote repository can't be listed.
+
+    Returns:
+        list[Version]: The semantic versions among the repository's tags.
+    """
+    try:
+        # --refs leaves out the peeled entries of annotated tags, so each tag is listed once.
+        output = Git().ls_remote("--tags", "--refs", repository_url)
+    except GitCommandError as e:
+        raise RuntimeError(f"Failed to list the tags of {repository_url}: {e}") from e
+    semver_tags: list[Version] = []
+    for line in output.splitlines():
+        tag = line.split("\t", 1)[-1].removeprefix("refs/tags/")
+        version = _parse_semantic_version(tag)
+        if version is None:
+            logger.debug(f"Dropping {tag=}, does not conform to semantic version")
+        else:
+            semver_tags.append(version)
+    logger.debug(f"Discovered {len(semver_tags)} semantic tags in {repository_url}")
+    return semver_tags
+
+
 def tag_is_semantic(tag: TagReference) -> bool:
     try:
         Version.parse(tag.name)
@@ -59,18 +203,20 @@ def tag_is_semantic(tag: TagReference) -> bool:
 
 
 def read_semantic_version_tag(
-    repo_path: pathlib.Path, commit: Commit | None = None
+    repo_path: pathlib.Path, commit: Commit | None = None, index: TagIndex | None = None
 ) -> Version:
     repo_instance = acquire_repo(repo_path=repo_path)
     if not commit:
         commit = repo_instance.head.object
-    applicable_tags = list(filter(lambda x: x.commit == commit, repo_instance.tags))
+    if index is None:
+        index = build_tag_index(repo_path=repo_path)
+    applicable_tags = index.tags_for(commit.hexsha)
     if not len(applicable_tags):
         raise CommitNotTaggedException()
-    semantic_tags = list(filter(lambda x: tag_is_semantic(x), applicable_tags))
+    semantic_tags = [tag for tag in applicable_tags if tag in index.versions]
     if not len(semantic_tags):
         raise CommitTagNotSemanticVersionException()
-    return Version.parse(sorted(semantic_tags, key=lambda x: x.name)[-1].name)
+    return index.versions[semantic_tags[-1]]
 
 
 def create_version_tag(repo_path: pathlib.Path, version: Version) -> TagReference:
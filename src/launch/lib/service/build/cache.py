@@ -0,0 +1,254 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import time
+from pathlib import Path
+from typing import Protocol
+
+from launch.config.common import BUILD_TEMP_DIR_PATH
+from launch.config.container import (
+    BUILD_CACHE_CHECKER,
+    BUILD_CACHE_DIR,
+    CONTAINER_IMAGE_NAME,
+    CONTAINER_IMAGE_VERSION,
+    CONTAINER_REGISTRY,
+)
+from launch.lib.automation.processes.runner import run_command
+
+logger = logging.getLogger(__name__)
+
+DOCKER_IGNORE_FILE = ".dockerignore"
+
+# Never part of the built image: the git metadata, and the checkouts launch clones into the working directory. The
+# rest of BUILD_DEPENDENCIES_PATH holds build inputs, so it is hashed.
+ALWAYS_IGNORED = [".git", BUILD_TEMP_DIR_PATH]
+
+
+def read_ignore_patterns(path: Path) -> list[str]:
+    """Returns the patterns of a .dockerignore file, or an empty list if it doesn't exist."""
+    try:
+        lines = Path(path).read_text().splitlines()
+    except FileNotFoundError:
+        return []
+    return [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    expression = ""
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**", index):
+            expression += ".*"
+            index += 2
+            # "**/" also matches no directory at all.
+            if pattern.startswith("/", index):
+                expression = expression[:-2] + "(?:.*/)?"
+                index += 1
+        elif pattern[index] == "*":
+            expression += "[^/]*"
+            index += 1
+        elif pattern[index] == "?":
+            expression += "[^/]"
+            index += 1
+        else:
+            expression += re.escape(pattern[index])
+            index += 1
+    # A pattern matching a directory also matches everything below it.
+    return re.compile(f"{expression}(?:/.*)?")
+
+
+def compile_ignore_patterns(patterns: list[str]) -> list[tuple[re.Pattern, bool]]:
+    """Compiles .dockerignore patterns into (expression, negated) pairs, in the order they are applied."""
+    compiled = []
+    for pattern in patterns:
+        negated = pattern.startswith("!")
+        pattern = os.path.normpath(pattern.lstrip("!").strip()).lstrip("/")
+        compiled.append((_compile_pattern(pattern), negated))
+    return compiled
+
+
+def is_ignored(path: str, patterns: list[tuple[re.Pattern, bool]]) -> bool:
+    """Returns whether a path relative to the build context is excluded by .dockerignore patterns. As with docker,
+    the last pattern matching the path decides, and a pattern starting with ! includes the path again.
+
+    Args:
+        path (str): Path relative to the build context, with forward slashes.
+        patterns (list[tuple[re.Pattern, bool]]): Patterns compiled by compile_ignore_patterns.
+
+    Returns:
+        bool: True if the path is excluded.
+    """
+    ignored = False
+    for expression, negated in patterns:
+        if expression.fullmatch(path):
+            ignored = not negated
+    return ignored
+
+
+def source_tree_hash(service_dir: Path) -> str:
+    """Hashes the paths, executable bits and contents of the files in an application checkout, leaving out the
+    files its .dockerignore excludes, so the hash only changes when the build context does.
+
+    Args:
+        service_dir (Path): The application checkout.
+
+    Returns:
+        str: The sha256 hex digest of the source tree.
+    """
+    service_dir = Path(service_dir)
+    patterns = compile_ignore_patterns(
+        ALWAYS_IGNORED + read_ignore_patterns(service_dir.joinpath(DOCKER_IGNORE_FILE))
+    )
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(service_dir):
+        relative_root = Path(root).relative_to(service_dir).as_posix()
+        prefix = "" if relative_root == "." else f"{relative_root}/"
+        # Excluded directories are still walked when a later pattern may include something below them again.
+        if not any(negated for _, negated in patterns):
+            dirs[:] = [name for name in dirs if not is_ignored(prefix + name, patterns)]
+        dirs.sort()
+        for name in sorted(files):
+            relative_path = prefix + name
+            if is_ignored(relative_path, patterns):
+                continue
+            path = Path(root, name)
+            digest.update(relative_path.encode())
+            digest.update(b"\0")
+            if path.is_symlink():
+                digest.update(f"link:{os.readlink(path)}".encode())
+            else:
+                digest.update(b"x" if os.access(path, os.X_OK) else b"-")
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(chunk)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_cache_key(service_dir: Path, registry_type: str) -> str:
+    """Returns the key builds of an application checkout are recorded under."""
+    return hashlib.sha256(
+        f"{registry_type}:{source_tree_hash(service_dir)}".encode()
+    ).hexdigest()
+
+
+def container_image() -> str | None:
+    """Returns the image reference make push publishes to, or None if it isn't configured. CONTAINER_IMAGE_VERSION is
+    read from the environment, as launch service build sets it from the commit being built.
+    """
+    registry = os.environ.get("CONTAINER_REGISTRY", CONTAINER_REGISTRY)
+    name = os.environ.get("CONTAINER_IMAGE_NAME", CONTAINER_IMAGE_NAME)
+    version = os.environ.get("CONTAINER_IMAGE_VERSION", CONTAINER_IMAGE_VERSION)
+    if not (registry and name and version):
+        return None
+    return f"{registry}/{name}:{version}"
+
+
+class BuildChecker(Protocol):
+    def is_built(self, key: str, image: str | None, push: bool) -> bool: ...
+
+    def record(self, key: str, image: str | None, push: bool) -> None: ...
+
+
+class LocalBuildChecker:
+    """Keeps a record of each build in a directory, one file per build cache key."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory).expanduser()
+
+    def path(self, key: str) -> Path:
+        return self.directory.joinpath(f"{key}.json")
+
+    def is_built(self, key: str, image: str | None, push: bool) -> bool:
+        # Without an image to look for, a record can't show the build is still there.
+        if image is None:
+            return False
+        try:
+            record = json.loads(self.path(key).read_text())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable build record {self.path(key)}: {e}")
+            return False
+        if record.get("image") != image:
+            return False
+        if push:
+            # A build that wasn't pushed doesn't satisfy a build that has to be.
+            return bool(record.get("pushed"))
+        # The image may have been pruned, or the record may come from another daemon.
+        return local_image_exists(image)
+
+    def record(self, key: str, image: str | None, push: bool) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path(key).with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(
+            json.dumps({"image": image, "pushed": push, "built_at": time.time()})
+        )
+        temporary_path.replace(self.path(key))
+
+
+def local_image_exists(image: str) -> bool:
+    """Returns whether the docker daemon has the image."""
+    try:
+        result = run_command(
+            ["docker", "image", "inspect", image],
+            check=False,
+            stream=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Unable to look up {image} in the docker daemon: {e}")
+        return False
+    return result.returncode == 0
+
+
+class RegistryBuildChecker:
+    """Looks the image up in its registry, so builds are skipped on any machine once the image has been pushed."""
+
+    def is_built(self, key: str, image: str | None, push: bool) -> bool:
+        # An image in the registry only stands in for a build that would have been pushed.
+        if image is None or not push:
+            return False
+        try:
+            result = run_command(
+                ["docker", "manifest", "inspect", image],
+                check=False,
+                stream=False,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Unable to look up {image} in its registry: {e}")
+            return False
+        return result.returncode == 0
+
+    def record(self, key: str, image: str | None, push: bool) -> None:
+        pass
+
+
+def create_build_checker(
+    backend: str = BUILD_CACHE_CHECKER,
+    directory: str = BUILD_CACHE_DIR,
+) -> BuildChecker | None:
+    """Creates the checker that decides whether an application has already been built.
+
+    Args:
+        backend (str, optional): One of "none", "local" or "registry". Defaults to BUILD_CACHE_CHECKER.
+        directory (str, optional): Directory of the local build records. Defaults to BUILD_CACHE_DIR.
+
+    Returns:
+        BuildChecker | None: The checker, or None when every build runs.
+    """
+    if backend == "none":
+        return None
+    if backend == "local":
+        return LocalBuildChecker(directory=Path(directory))
+    if backend == "registry":
+        return RegistryBuildChecker()
+    raise ValueError(
+        f"Unsupported build cache checker: {backend}. Must be one of: none, local, registry."
+    )
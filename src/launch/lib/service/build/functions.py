@@ -1,8 +1,12 @@
-import os
 import click
 from pathlib import Path
 
 from launch.lib.automation.processes import functions
+from launch.lib.service.build.cache import (
+    BuildChecker,
+    build_cache_key,
+    container_image,
+)
 
 
 def execute_build(
@@ -11,21 +15,37 @@ def execute_build(
     provider: str,
     push: bool = False,
     dry_run: bool = True,
+    configure: bool = True,
+    checker: BuildChecker | None = None,
 ) -> None:
-    os.chdir(service_dir)
+    # The build is skipped when the checker has already seen one of the same source tree.
+    key = None
+    if checker is not None and not dry_run:
+        key = build_cache_key(service_dir=service_dir, registry_type=registry_type)
+        image = container_image()
+        if checker.is_built(key=key, image=image, push=push):
+            click.secho(
+                f"{image or service_dir} is unchanged since it was last built, skipping the build."
+            )
+            return
+
     if registry_type == "docker":
         functions.start_docker(dry_run=dry_run)
 
-    functions.git_config(dry_run=dry_run)
-    functions.make_configure(dry_run=dry_run)
+    if configure:
+        functions.git_config(dry_run=dry_run)
+        functions.make_configure(dry_run=dry_run, cwd=service_dir)
 
     if registry_type == "npm":
-        functions.make_install(dry_run=dry_run)
+        functions.make_install(dry_run=dry_run, cwd=service_dir)
 
-    functions.make_build(dry_run=dry_run)
+    functions.make_build(dry_run=dry_run, cwd=service_dir)
 
     if push:
         if registry_type == "docker":
             if provider == "aws":
-                functions.make_docker_aws_ecr_login(dry_run=dry_run)
-            functions.make_push(dry_run=dry_run)
+                functions.make_docker_aws_ecr_login(dry_run=dry_run, cwd=service_dir)
+            functions.make_push(dry_run=dry_run, cwd=service_dir)
+
+    if key is not None:
+        checker.record(key=key, image=image, push=push)
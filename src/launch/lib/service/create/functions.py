@@ -0,0 +1,282 @@
+import copy
+import json
+import logging
+import shutil
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+import click
+from github import Github
+
+from launch.config.common import BUILD_TEMP_DIR_PATH, MAX_WORKERS
+from launch.config.github import (
+    GITHUB_ORG_PLATFORM_TEAM,
+    GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS,
+)
+from launch.config.launchconfig import SERVICE_MAIN_BRANCH, SERVICE_REMOTE_BRANCH
+from launch.lib.common.utilities.concurrency import TaskResult, run_concurrently
+from launch.lib.github.access import apply_default_access
+from launch.lib.github.repo import create_repository, repo_exist
+from launch.lib.local_repo.repo import checkout_branch, clone_repository, push_branch
+from launch.lib.service.common import input_data_validation
+from launch.lib.service.functions import (
+    SkeletonCheckouts,
+    common_service_workflow,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def load_manifest(path: Path) -> list[dict]:
+    """
+    Reads a manifest of service definitions. The manifest is a JSON list of definitions, or an object with the list
+    under the "services" key. Every definition needs a "name" and either an "in_file", relative to the manifest's
+    directory, or the inputs themselves under "inputs". The optional "description", "public" and "visibility" keys
+    match the options of launch service create.
+
+    Args:
+        path (Path): Path to the manifest.
+
+    Returns:
+        list[dict]: Definitions with their inputs loaded under the "inputs" key.
+    """
+    path = Path(path)
+    manifest = json.loads(path.read_text())
+    if isinstance(manifest, dict):
+        manifest = manifest.get("services", [])
+
+    definitions = []
+    names = set()
+    for entry in manifest:
+        if "name" not in entry:
+            raise ValueError(f"Service definition without a name in {path}: {entry}")
+        if entry["name"] in names:
+            raise ValueError(
+                f"Service {entry['name']} is defined more than once in {path}"
+            )
+        names.add(entry["name"])
+
+        if "inputs" in entry:
+            inputs = entry["inputs"]
+        elif "in_file" in entry:
+            inputs = json.loads(path.parent.joinpath(entry["in_file"]).read_text())
+        else:
+            raise ValueError(
+                f"Service {entry['name']} needs either an in_file or inputs in {path}"
+            )
+        definitions.append(
+            {
+                "name": entry["name"],
+                "description": entry.get(
+                    "description", "Service created with launch-cli."
+                ),
+                "public": entry.get("public", False),
+                "visibility": entry.get("visibility", "private"),
+                "inputs": inputs,
+            }
+        )
+    return definitions
+
+
+def create_service(
+    definition: dict,
+    g: Github,
+    organization: str,
+    service_path: Path,
+    inputs_base: Path,
+    checkouts: SkeletonCheckouts,
+    grant_access: Callable | None,
+    git_message: str,
+    skip_commit: bool,
+    skip_uuid: bool,
+    dry_run: bool = True,
+) -> str:
+    """
+    Creates a single service: the remote repository, its default access, and the generated files. Every step,
+    including generation, may run concurrently with other services: generation resolves paths against repo_base
+    rather than the working directory, so it neither changes directory nor takes a lock.
+
+    Args:
+        definition (dict): Service definition as returned by load_manifest.
+        g (Github): GitHub client shared by all services.
+        organization (str): GitHub organization the repository is created in.
+        service_path (Path): Absolute path of the local service checkout.
+        inputs_base (Path): Directory that relative paths in the service inputs are resolved against.
+        checkouts (SkeletonCheckouts): Shared skeleton and application checkouts.
+        grant_access (Callable | None): Applies the default access to a repository, or None to skip it.
+        git_message (str): The git commit message to use when creating a commit.
+        skip_commit (bool): If set, it will skip commiting the local changes.
+        skip_uuid (bool): If set, it will not generate a UUID to be used in skeleton files.
+        dry_run (bool): If set, it will not make any changes, but will log what it would.
+
+    Returns:
+        str: Short description of the outcome.
+    """
+    name = definition["name"]
+    input_data = input_data_validation(copy.deepcopy(definition["inputs"]))
+
+    if repo_exist(name=f"{organization}/{name}", g=g):
+        raise RuntimeError(
+            f"Repository {organization}/{name} already exists. Please use launch service update-many to update it."
+        )
+    if service_path.exists():
+        raise FileExistsError(
+            f"Directory {service_path} already exists. Please remove this directory or use a different name."
+        )
+
+    service_repo = create_repository(
+        g=g,
+        organization=organization,
+        name=name,
+        description=definition["description"],
+        public=definition["public"],
+        visibility=definition["visibility"],
+        dry_run=dry_run,
+    )
+    if dry_run:
+        return "would have created"
+
+    if grant_access:
+        grant_access(repository=service_repo)
+
+    local_repository = clone_repository(
+        repository_url=service_repo.clone_url,
+        target=service_path,
+        branch=SERVICE_MAIN_BRANCH,
+        dry_run=dry_run,
+    )
+    checkout_branch(
+        repository=local_repository,
+        target_branch=SERVICE_REMOTE_BRANCH,
+        new_branch=True,
+        dry_run=dry_run,
+    )
+
+    skeleton_path = checkouts.get(
+        url=input_data["skeleton"]["url"],
+        tag=input_data["skeleton"]["tag"],
+    )
+    application_path = None
+    if "application" in input_data["sources"]:
+        application_path = checkouts.get(
+            url=input_data["sources"]["application"]["url"],
+            tag=input_data["sources"]["application"]["tag"],
+        )
+
+    generated_paths = common_service_workflow(
+        service_path=str(service_path),
+        repository=local_repository,
+        input_data=input_data,
+        git_message=git_message,
+        skip_uuid=skip_uuid,
+        skip_sync=False,
+        skip_git=False,
+        skip_commit=True,
+        dry_run=dry_run,
+        skeleton_path=skeleton_path,
+        application_path=application_path,
+        repo_base=Path(inputs_base),
+    )
+
+    if skip_commit:
+        return "created, not committed"
+
+    push_branch(
+        repository=local_repository,
+        branch=SERVICE_REMOTE_BRANCH,
+        commit_msg=git_message,
+        dry_run=dry_run,
+        paths=generated_paths,
+    )
+    return "created and pushed"
+
+
+def create_fleet(
+    definitions: list[dict],
+    g: Github,
+    organization: str,
+    workdir: Path,
+    inputs_base: Path,
+    git_message: str,
+    skip_commit: bool = False,
+    skip_git_permissions: bool = False,
+    skip_uuid: bool = False,
+    max_workers: int = MAX_WORKERS,
+    dry_run: bool = True,
+) -> list[TaskResult]:
+    """
+    Creates many services concurrently. The platform teams are looked up once and shared by every service, and
+    services generated from the same skeleton share a single skeleton checkout. The number of services in flight is
+    bounded by max_workers so the GitHub API is not flooded; requests that are still rate limited are retried by the
+    GitHub client.
+
+    Args:
+        definitions (list[dict]): Service definitions as returned by load_manifest.
+        g (Github): GitHub client shared by all services.
+        organization (str): GitHub organization the repositories are created in.
+        workdir (Path): Directory that the services are cloned into.
+        inputs_base (Path): Directory that relative paths in the service inputs are resolved against.
+        git_message (str): The git commit message to use when creating a commit.
+        skip_commit (bool, optional): If set, it will skip commiting the local changes. Defaults to False.
+        skip_git_permissions (bool, optional): If set, it will skip setting the default access permissions. Defaults to False.
+        skip_uuid (bool, optional): If set, it will not generate a UUID to be used in skeleton files. Defaults to False.
+        max_workers (int, optional): Maximum number of services created at once. Defaults to MAX_WORKERS.
+        dry_run (bool, optional): If set, it will not make any changes, but will log what it would. Defaults to True.
+
+    Returns:
+        list[TaskResult]: One result per service definition, in the order supplied.
+    """
+    workdir = Path(workdir).resolve()
+    inputs_base = Path(inputs_base).resolve()
+
+    checkouts_path = workdir.joinpath(BUILD_TEMP_DIR_PATH)
+    if dry_run:
+        click.secho(
+            f"[DRYRUN] Would have removed the following directory: {checkouts_path=}",
+            fg="yellow",
+        )
+    else:
+        shutil.rmtree(checkouts_path, ignore_errors=True)
+
+    grant_access = None
+    if dry_run and not skip_git_permissions:
+        click.secho(
+            "[DRYRUN] Would have applied the default access to every created repository.",
+            fg="yellow",
+        )
+    elif not skip_git_permissions:
+        github_organization = g.get_organization(login=organization)
+        grant_access = partial(
+            apply_default_access,
+            organization=github_organization,
+            platform_team=github_organization.get_team_by_slug(
+                GITHUB_ORG_PLATFORM_TEAM
+            ),
+            platform_admin_team=github_organization.get_team_by_slug(
+                GITHUB_ORG_PLATFORM_TEAM_ADMINISTRATORS
+            ),
+            team_cache={},
+            dry_run=dry_run,
+        )
+
+    checkouts = SkeletonCheckouts(build_path=checkouts_path, dry_run=dry_run)
+    tasks = {
+        definition["name"]: partial(
+            create_service,
+            definition=definition,
+            g=g,
+            organization=organization,
+            service_path=workdir.joinpath(definition["name"]),
+            inputs_base=inputs_base,
+            checkouts=checkouts,
+            grant_access=grant_access,
+            git_message=git_message,
+            skip_commit=skip_commit,
+            skip_uuid=skip_uuid,
+            dry_run=dry_run,
+        )
+        for definition in definitions
+    }
+    logger.info(f"Creating {len(tasks)} services with up to {max_workers} workers")
+    return run_concurrently(tasks=tasks, max_workers=max_workers)
@@ -1,6 +1,8 @@
 import json
 import logging
+import re
 import shutil
+import threading
 from pathlib import Path
 from typing import IO, Any
 
@@ -12,9 +14,17 @@ from launch.config.launchconfig import SERVICE_REMOTE_BRANCH
 from launch.constants.launchconfig import LAUNCHCONFIG_NAME
 from launch.lib.common.utilities import extract_repo_name_from_url
 from launch.lib.github.auth import get_github_instance
-from launch.lib.local_repo.repo import clone_repository, push_branch
+from launch.lib.local_repo.repo import (
+    clone_repository,
+    get_head_commit,
+    push_branch,
+)
 from launch.lib.service.common import input_data_validation, write_text
-from launch.lib.service.template.functions import copy_template_files, process_template
+from launch.lib.service.template.functions import (
+    copy_template_files,
+    process_template,
+    sync_template_changes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +73,55 @@ def prepare_service(
     return input_data, service_path, repository, g
 
 
+def previous_skeleton_source(service_path: Path) -> dict:
+    """Returns the skeleton section of the .launch_config already present in a service, or an empty dictionary."""
+    launch_config_path = Path(service_path).joinpath(LAUNCHCONFIG_NAME)
+    try:
+        return json.loads(launch_config_path.read_text()).get("skeleton", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+class SkeletonCheckouts:
+    """Clones each skeleton repository at a given tag at most once, so that many services can be generated from a
+    single shared checkout. Safe to use from multiple threads."""
+
+    def __init__(self, build_path: Path, dry_run: bool = True):
+        self.build_path = Path(build_path)
+        self.dry_run = dry_run
+        self._paths: dict[tuple[str, str], Path] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, tag: str) -> Path:
+        """Returns the path of the checkout for a skeleton url and tag, cloning it on first use.
+
+        Args:
+            url (str): URL of the skeleton repository.
+            tag (str): Tag or branch of the skeleton repository.
+
+        Returns:
+            Path: Path to the skeleton checkout.
+        """
+        key = (url, tag)
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._paths:
+                path = self.build_path.joinpath(
+                    f"{extract_repo_name_from_url(url)}-{re.sub(r'[^A-Za-z0-9._-]', '_', tag)}"
+                )
+                if not path.exists():
+                    clone_repository(
+                        repository_url=url,
+                        target=path,
+                        branch=tag,
+                        dry_run=self.dry_run,
+                    )
+                self._paths[key] = path
+            return self._paths[key]
+
+
 def common_service_workflow(
     service_path: str,
     repository: Repo,
@@ -73,18 +132,32 @@ def common_service_workflow(
     skip_git: bool,
     skip_commit: bool,
     dry_run: bool,
-) -> None:
-    skeleton_path = Path(
-        f"{BUILD_TEMP_DIR_PATH}/{extract_repo_name_from_url(input_data['skeleton']['url'])}"
-    )
-    if "application" in input_data["sources"]:
-        application_path = Path(
-            f"{BUILD_TEMP_DIR_PATH}/{extract_repo_name_from_url(input_data['sources']['application']['url'])}"
+    skeleton_path: Path | None = None,
+    application_path: Path | None = None,
+    full_sync: bool = False,
+    repo_base: Path | None = None,
+) -> set[Path]:
+    # The relative paths inside a .launch_config, and the build directory, are resolved against repo_base rather than
+    # the working directory, so several services can be generated concurrently.
+    repo_base = Path(repo_base) if repo_base is not None else Path.cwd()
+    # A skeleton_path or application_path is supplied when that repository was already checked out, e.g. shared
+    # between many services.
+    clone_skeleton = skeleton_path is None
+    clone_application = application_path is None
+    if clone_skeleton:
+        skeleton_path = repo_base.joinpath(
+            BUILD_TEMP_DIR_PATH,
+            extract_repo_name_from_url(input_data["skeleton"]["url"]),
+        )
+    if "application" in input_data["sources"] and clone_application:
+        application_path = repo_base.joinpath(
+            BUILD_TEMP_DIR_PATH,
+            extract_repo_name_from_url(input_data["sources"]["application"]["url"]),
         )
 
     # Clone the skeleton repository. We need this to copy dir structure and any global repo files.
     # This is a temporary directory that will be deleted after the service is created.
-    if dry_run and not skip_git:
+    if dry_run and not skip_git and clone_skeleton:
         url = input_data["skeleton"]["url"]
         tag = input_data["skeleton"]["tag"]
         click.secho(
@@ -92,13 +165,14 @@ def common_service_workflow(
             fg="yellow",
         )
     elif not skip_git:
-        clone_repository(
-            repository_url=input_data["skeleton"]["url"],
-            target=skeleton_path,
-            branch=input_data["skeleton"]["tag"],
-            dry_run=dry_run,
-        )
-        if "application" in input_data["sources"]:
+        if clone_skeleton:
+            clone_repository(
+                repository_url=input_data["skeleton"]["url"],
+                target=skeleton_path,
+                branch=input_data["skeleton"]["tag"],
+                dry_run=dry_run,
+            )
+        if "application" in input_data["sources"] and clone_application:
             clone_repository(
                 repository_url=input_data["sources"]["application"]["url"],
                 target=application_path,
@@ -106,37 +180,68 @@ def common_service_workflow(
                 dry_run=dry_run,
             )
 
+    # The skeleton commit the service was last synced from is recorded in its .launch_config, so an update only has
+    # to apply the skeleton files that changed since then.
+    previous_skeleton = previous_skeleton_source(service_path=Path(service_path))
+    skeleton_commit = None if dry_run else get_head_commit(repo_path=skeleton_path)
+
+    # Every file written or removed by the generation step, so that only those paths have to be staged.
+    generated_paths: set[Path] = set()
+
     # Copy all the files from the skeleton repo to the service directory unless flag is set.
     if not skip_sync:
-        copy_template_files(
-            src_dir=skeleton_path,
-            target_dir=Path(service_path),
-            dry_run=dry_run,
+        synced_changes = (
+            not full_sync
+            and skeleton_commit
+            and previous_skeleton.get("commit")
+            and previous_skeleton.get("url") == input_data["skeleton"]["url"]
+            and sync_template_changes(
+                src_dir=skeleton_path,
+                target_dir=Path(service_path),
+                previous_commit=previous_skeleton["commit"],
+                dry_run=dry_run,
+                generated_paths=generated_paths,
+            )
         )
+        if not synced_changes:
+            copy_template_files(
+                src_dir=skeleton_path,
+                target_dir=Path(service_path),
+                dry_run=dry_run,
+                generated_paths=generated_paths,
+            )
+        if skeleton_commit:
+            input_data["skeleton"]["commit"] = skeleton_commit
         if "application" in input_data["sources"]:
             copy_template_files(
                 src_dir=application_path,
                 target_dir=Path(service_path),
                 not_platform=True,
                 dry_run=dry_run,
+                generated_paths=generated_paths,
             )
+    elif previous_skeleton.get("commit"):
+        input_data["skeleton"]["commit"] = previous_skeleton["commit"]
 
     # Process the template files. This is the main logic that loops over the template and
     # creates the directories and files in the service directory.
     input_data[PLATFORM_SRC_DIR_PATH] = process_template(
-        repo_base=Path.cwd(),
+        repo_base=repo_base,
         dest_base=Path(service_path),
         config={PLATFORM_SRC_DIR_PATH: input_data[PLATFORM_SRC_DIR_PATH]},
         skip_uuid=skip_uuid,
         dry_run=dry_run,
+        generated_paths=generated_paths,
     )[PLATFORM_SRC_DIR_PATH]
 
     # Write the .launch_config file
+    launch_config_path = Path(f"{service_path}/{LAUNCHCONFIG_NAME}")
     write_text(
         data=input_data,
-        path=Path(f"{service_path}/{LAUNCHCONFIG_NAME}"),
+        path=launch_config_path,
         dry_run=dry_run,
     )
+    generated_paths.add(launch_config_path.absolute())
 
     # Push the branch to the remote repository unless the flag is set.
     if not skip_git and not skip_commit:
@@ -145,6 +250,7 @@ def common_service_workflow(
             branch=SERVICE_REMOTE_BRANCH,
             commit_msg=git_message,
             dry_run=dry_run,
+            paths=generated_paths,
         )
 
     if dry_run:
@@ -152,3 +258,4 @@ def common_service_workflow(
             f"[DRYRUN] {LAUNCHCONFIG_NAME}: {input_data}",
             fg="yellow",
         )
+    return generated_paths
@@ -0,0 +1,171 @@
+import logging
+import os
+from functools import partial
+from pathlib import Path
+
+from git import Repo
+
+from launch.config.aws import AWS_LAMBDA_CODEBUILD_ENV_VAR_FILE
+from launch.config.common import BUILD_TEMP_DIR_PATH
+from launch.config.launchconfig import SERVICE_MAIN_BRANCH
+from launch.constants.launchconfig import LAUNCHCONFIG_NAME, LAUNCHCONFIG_PATH_LOCAL
+from launch.lib.automation.environment.functions import readFile
+from launch.lib.automation.processes import functions
+from launch.lib.common.utilities import extract_repo_name_from_url
+from launch.lib.common.utilities.concurrency import TaskResult, run_in_order
+from launch.lib.local_repo.repo import checkout_branch, clone_repository
+from launch.lib.service.build.functions import execute_build
+from launch.lib.service.common import load_launchconfig
+from launch.lib.service.publish.functions import execute_publish
+from launch.lib.service.template.launchconfig import LaunchConfigTemplate
+from launch.lib.service.test.functions import execute_test
+
+logger = logging.getLogger(__name__)
+
+# Stages are always run in this order, whatever order they were selected in.
+PIPELINE_STAGES = ["build", "test", "publish"]
+
+
+def resolve_application_source(url: str | None, tag: str) -> tuple[str, str, Path]:
+    """
+    Works out which application repository and tag to check out, and where to check it out, the same way that
+    launch service build, test and publish do: an explicit url, else the .launch_config in the current directory, else
+    the CodeBuild environment file. Sets CONTAINER_IMAGE_VERSION when it can be determined.
+
+    Args:
+        url (str | None): The URL of the repository to clone, if supplied.
+        tag (str): The tag of the repository to clone, used with an explicit url.
+
+    Returns:
+        tuple[str, str, Path]: The repository url, the tag and the directory to check it out into.
+    """
+    service_dir = Path.cwd().joinpath(BUILD_TEMP_DIR_PATH)
+    if url:
+        return url, tag, service_dir
+
+    if Path(LAUNCHCONFIG_NAME).exists():
+        input_data = load_launchconfig()
+        os.environ["CONTAINER_IMAGE_VERSION"] = Repo(Path.cwd()).head.object.hexsha
+        url = input_data["sources"]["application"]["url"]
+        tag = input_data["sources"]["application"]["tag"]
+    elif Path(AWS_LAMBDA_CODEBUILD_ENV_VAR_FILE).exists():
+        url = (
+            f"{readFile('GIT_SERVER_URL')}/{readFile('GIT_ORG')}/{readFile('GIT_REPO')}"
+        )
+        tag = readFile("MERGE_COMMIT_ID")
+        os.environ["CONTAINER_IMAGE_VERSION"] = readFile("CONTAINER_IMAGE_VERSION")
+    else:
+        raise FileNotFoundError(
+            f"No {LAUNCHCONFIG_NAME} found or a {AWS_LAMBDA_CODEBUILD_ENV_VAR_FILE}. Please rerun command with appropriate {LAUNCHCONFIG_NAME},{AWS_LAMBDA_CODEBUILD_ENV_VAR_FILE}, or --url"
+        )
+    return url, tag, service_dir.joinpath(extract_repo_name_from_url(url))
+
+
+def clone_application(
+    url: str, tag: str, service_dir: Path, dry_run: bool = True
+) -> None:
+    repository = clone_repository(
+        repository_url=url,
+        target=service_dir,
+        branch=SERVICE_MAIN_BRANCH,
+        dry_run=dry_run,
+    )
+    checkout_branch(
+        repository=repository,
+        target_branch=tag,
+        dry_run=dry_run,
+    )
+
+
+def service_provider(service_dir: Path, dry_run: bool = True) -> str:
+    """Returns the provider of the service from the .launch_config of an application checkout, if it has one."""
+    launchconfig_path = Path(service_dir).joinpath(LAUNCHCONFIG_PATH_LOCAL)
+    input_data = (
+        load_launchconfig(path=launchconfig_path)
+        if launchconfig_path.exists()
+        else None
+    )
+    return LaunchConfigTemplate(dry_run).get_provider("service", input_data)
+
+
+def configure_workspace(
+    service_dir: Path, start_docker: bool = False, dry_run: bool = True
+) -> None:
+    # In the same order as execute_build, so docker is running before `make configure`.
+    if start_docker:
+        functions.start_docker(dry_run=dry_run)
+    functions.git_config(dry_run=dry_run)
+    functions.make_configure(dry_run=dry_run, cwd=service_dir)
+
+
+def run_pipeline(
+    service_dir: Path,
+    stages: list[str],
+    registry_type: str,
+    push: bool = False,
+    publish_options: dict | None = None,
+    url: str | None = None,
+    tag: str | None = None,
+    dry_run: bool = True,
+) -> list[TaskResult]:
+    """
+    Runs the selected stages over a single application checkout. The application is cloned once when a url is
+    supplied and the workspace is configured once with `make configure`, after starting docker when a docker build is
+    selected, then build, test and publish run in that order without configuring again. Once a stage fails the
+    remaining stages are skipped.
+
+    Args:
+        service_dir (Path): The application checkout.
+        stages (list[str]): The stages to run, any of PIPELINE_STAGES.
+        registry_type (str): The registry type to use. Examples include: "docker", "npm", "nuget".
+        push (bool, optional): Will push the built image to the repository. Defaults to False.
+        publish_options (dict, optional): Keyword arguments passed on to execute_publish. Defaults to None.
+        url (str, optional): The URL of the application repository to clone into service_dir. Defaults to None, which uses the existing service_dir.
+        tag (str, optional): The tag of the application repository to check out. Defaults to None.
+        dry_run (bool, optional): Perform a dry run that reports on what it would do. Defaults to True.
+
+    Returns:
+        list[TaskResult]: One result for cloning and configuring the workspace, then one per stage, with its duration.
+    """
+    tasks = {}
+    if url:
+        tasks["clone"] = partial(
+            clone_application,
+            url=url,
+            tag=tag,
+            service_dir=service_dir,
+            dry_run=dry_run,
+        )
+    tasks["configure"] = partial(
+        configure_workspace,
+        service_dir=service_dir,
+        start_docker="build" in stages and registry_type == "docker",
+        dry_run=dry_run,
+    )
+    if "build" in stages:
+        tasks["build"] = lambda: execute_build(
+            service_dir=service_dir,
+            registry_type=registry_type,
+            provider=service_provider(service_dir=service_dir, dry_run=dry_run),
+            push=push,
+            dry_run=dry_run,
+            configure=False,
+        )
+    if "test" in stages:
+        tasks["test"] = partial(
+            execute_test,
+            service_dir=service_dir,
+            dry_run=dry_run,
+            configure=False,
+        )
+    if "publish" in stages:
+        tasks["publish"] = partial(
+            execute_publish,
+            service_dir=service_dir,
+            registry_type=registry_type,
+            dry_run=dry_run,
+            configure=False,
+            **(publish_options or {}),
+        )
+    logger.info(f"Running pipeline stages {list(tasks)} in {service_dir}")
+    return run_in_order(tasks=tasks)
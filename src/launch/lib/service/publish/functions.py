@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 
 import click
@@ -17,15 +16,17 @@ def execute_publish(
     source_folder_name: str = None,
     repo_path: str = None,
     source_branch: str = None,
+    configure: bool = True,
 ) -> None:
-    os.chdir(service_dir)
-    functions.git_config(dry_run=dry_run)
-    functions.make_configure(dry_run=dry_run)
+    if configure:
+        functions.git_config(dry_run=dry_run)
+        functions.make_configure(dry_run=dry_run, cwd=service_dir)
     if registry_type == "npm":
-        functions.make_install(dry_run=dry_run)
-        functions.make_build(dry_run=dry_run)
+        functions.make_install(dry_run=dry_run, cwd=service_dir)
+        functions.make_build(dry_run=dry_run, cwd=service_dir)
         functions.make_publish(
             dry_run=dry_run,
+            cwd=service_dir,
             token_secret_name=token_secret_name,
             package_scope=package_scope,
             package_publisher=package_publisher,
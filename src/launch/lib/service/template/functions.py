@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import List
 
 import click
+from git import GitCommandError, Repo
 from jinja2 import Environment, FileSystemLoader
 
 from launch.config.common import PLATFORM_SRC_DIR_PATH
@@ -23,6 +24,7 @@ def process_template(
     parent_keys=[],
     skip_uuid=True,
     dry_run=True,
+    generated_paths: set | None = None,
 ) -> None:
     """
     Recursively creates a directory structure and copies files based on a provided template.
@@ -32,10 +34,12 @@ def process_template(
     based on specific keys defined in the structure.
 
     Args:
+        repo_base (Path): The directory relative paths in the template are resolved against.
         dest_base (Path): The base path of the destination directory where the new structure will be created.
         structure (dict): A nested dictionary structure defining the directory structure and files to copy.
         parent_keys (list, optional): The keys represent directory names, and the values can be nested dictionaries or strings.
         update_paths (bool, optional): A flag to indicate whether to update paths to be relative to the destination base directory.
+        generated_paths (set, optional): If supplied, every file written is added to it.
 
     Returns:
         dict: A dictionary representing the updated configuration structure.
@@ -57,25 +61,33 @@ def process_template(
                     current_path.mkdir(parents=True, exist_ok=True)
 
             if LAUNCHCONFIG_KEYS.ADDITIONAL_FILES.value in value:
-                LaunchConfigTemplate(dry_run).copy_additional_files(
+                LaunchConfigTemplate(
+                    dry_run, generated_paths, repo_base
+                ).copy_additional_files(
                     value=value,
                     current_path=current_path,
                     dest_base=dest_base,
                 )
             if LAUNCHCONFIG_KEYS.PROPERTIES_FILE.value in value:
-                LaunchConfigTemplate(dry_run).properties_file(
+                LaunchConfigTemplate(
+                    dry_run, generated_paths, repo_base
+                ).properties_file(
                     value=value,
                     current_path=current_path,
                     dest_base=dest_base,
                 )
                 if not skip_uuid:
-                    LaunchConfigTemplate(dry_run).uuid(value=value)
+                    LaunchConfigTemplate(dry_run, generated_paths, repo_base).uuid(
+                        value=value
+                    )
             if LAUNCHCONFIG_KEYS.TEMPLATES.value in value:
-                LaunchConfigTemplate(dry_run).templates(
+                LaunchConfigTemplate(dry_run, generated_paths, repo_base).templates(
                     value=value, current_path=current_path, dest_base=dest_base
                 )
             if LAUNCHCONFIG_KEYS.TEMPLATE_PROPERTIES.value in value:
-                LaunchConfigTemplate(dry_run).template_properties(
+                LaunchConfigTemplate(
+                    dry_run, generated_paths, repo_base
+                ).template_properties(
                     value=value,
                     current_path=current_path,
                     dest_base=dest_base,
@@ -87,6 +99,7 @@ def process_template(
                 parent_keys=current_keys,
                 skip_uuid=skip_uuid,
                 dry_run=dry_run,
+                generated_paths=generated_paths,
             )
         else:
             updated_config[key] = value
@@ -95,7 +108,11 @@ def process_template(
 
 
 def copy_template_files(
-    src_dir: Path, target_dir: Path, not_platform: bool = False, dry_run: bool = True
+    src_dir: Path,
+    target_dir: Path,
+    not_platform: bool = False,
+    dry_run: bool = True,
+    generated_paths: set | None = None,
 ) -> None:
     """
     Copies files from a source directory to a target directory, excluding a specific directory.
@@ -105,6 +122,7 @@ def copy_template_files(
         target_dir (Path): The target directory where the files will be copied.
         not_platform (bool, optional): A flag to indicate whether to copy only platform files.
         dry_run (bool, optional): A flag to indicate whether to perform a dry run.
+        generated_paths (set, optional): If supplied, every file written is added to it.
 
     Returns:
         None
@@ -117,6 +135,11 @@ def copy_template_files(
         return
     os.makedirs(target_dir, exist_ok=True)
 
+    def copy_file(src_item: str, target_item: str) -> str:
+        if generated_paths is not None:
+            generated_paths.add(Path(os.path.abspath(target_item)))
+        return shutil.copy2(src_item, target_item)
+
     for item in os.listdir(src_dir):
         src_item = os.path.join(src_dir, item)
         target_item = os.path.join(target_dir, item)
@@ -124,9 +147,77 @@ def copy_template_files(
             if (
                 item != PLATFORM_SRC_DIR_PATH or not_platform
             ) and item not in DISCOVERY_FORBIDDEN_DIRECTORIES:
-                shutil.copytree(src_item, target_item, dirs_exist_ok=True)
+                shutil.copytree(
+                    src_item, target_item, dirs_exist_ok=True, copy_function=copy_file
+                )
+        else:
+            copy_file(src_item, target_item)
+
+
+def sync_template_changes(
+    src_dir: Path,
+    target_dir: Path,
+    previous_commit: str,
+    not_platform: bool = False,
+    dry_run: bool = True,
+    generated_paths: set | None = None,
+) -> bool:
+    """
+    Applies only the files that changed in a template repository between previous_commit and the commit checked out in
+    src_dir, using the same exclusions as copy_template_files. Added and modified files are copied, deleted files are
+    removed from the target directory.
+
+    Args:
+        src_dir (Path): The checkout of the template repository.
+        target_dir (Path): The target directory where the files will be copied.
+        previous_commit (str): The commit of the template repository that the target directory was last synced from.
+        not_platform (bool, optional): A flag to indicate whether to copy only platform files.
+        dry_run (bool, optional): A flag to indicate whether to perform a dry run.
+        generated_paths (set, optional): If supplied, every file written or removed is added to it.
+
+    Returns:
+        bool: False if the changes could not be determined, in which case the caller should copy every file.
+    """
+    try:
+        output = Repo(path=src_dir).git.diff(
+            ["--name-status", "--no-renames", "-z", previous_commit, "HEAD"]
+        )
+    except (GitCommandError, OSError) as e:
+        logger.info(
+            f"Could not diff {src_dir} against {previous_commit}, every file will be copied: {e}"
+        )
+        return False
+
+    fields = [field for field in output.split("\0") if field]
+    changes = list(zip(fields[0::2], fields[1::2]))
+    for status, path in changes:
+        parts = Path(path).parts
+        if len(parts) > 1 and (
+            (parts[0] == PLATFORM_SRC_DIR_PATH and not not_platform)
+            or parts[0] in DISCOVERY_FORBIDDEN_DIRECTORIES
+        ):
+            continue
+        src_item = Path(src_dir).joinpath(path)
+        target_item = Path(target_dir).joinpath(path)
+        if dry_run:
+            click.secho(
+                f"[DRYRUN] Processing template, would have applied change: {status=} {target_item=}",
+                fg="yellow",
+            )
+            continue
+        if status == "D":
+            if not target_item.exists():
+                continue
+            target_item.unlink()
         else:
+            target_item.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src_item, target_item)
+        if generated_paths is not None:
+            generated_paths.add(Path(os.path.abspath(target_item)))
+    logger.info(
+        f"Found {len(changes)} changed paths in {src_dir} since {previous_commit}"
+    )
+    return True
 
 
 def list_jinja_templates(base_dir: str) -> tuple:
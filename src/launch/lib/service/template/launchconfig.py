@@ -14,11 +14,29 @@ logger = logging.getLogger(__name__)
 
 
 class LaunchConfigTemplate:
-    def __init__(self, dry_run: bool = False):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        generated_paths: set | None = None,
+        repo_base: Path | None = None,
+    ):
         self.dry_run = dry_run
+        self.generated_paths = generated_paths
+        self.repo_base = repo_base
+
+    def source(self, path: str) -> Path:
+        """Resolves a path from a .launch_config against repo_base, or the working directory if it isn't set."""
+        if self.repo_base is None:
+            return Path(path).resolve()
+        return Path(self.repo_base).joinpath(path).resolve()
+
+    def record(self, path: Path) -> None:
+        """Adds a written file to the generated paths, if they are being collected."""
+        if self.generated_paths is not None:
+            self.generated_paths.add(Path(os.path.abspath(path)))
 
     def properties_file(self, value: dict, current_path: Path, dest_base: Path) -> None:
-        file_path = Path(value[LAUNCHCONFIG_KEYS.PROPERTIES_FILE.value]).resolve()
+        file_path = self.source(value[LAUNCHCONFIG_KEYS.PROPERTIES_FILE.value])
         relative_path = current_path.joinpath(file_path.name)
         value[LAUNCHCONFIG_KEYS.PROPERTIES_FILE.value] = str(
             f"./{relative_path.relative_to(dest_base).with_name(TERRAFORM_VAR_FILE)}"
@@ -31,6 +49,7 @@ class LaunchConfigTemplate:
         else:
             with suppress(shutil.SameFileError):
                 shutil.copy(file_path, relative_path.with_name(TERRAFORM_VAR_FILE))
+            self.record(relative_path.with_name(TERRAFORM_VAR_FILE))
 
     def copy_additional_files(
         self, value: dict, current_path: Path, dest_base: Path
@@ -38,7 +57,7 @@ class LaunchConfigTemplate:
         for target_file, source_file in value[
             LAUNCHCONFIG_KEYS.ADDITIONAL_FILES.value
         ].items():
-            file_path = Path(source_file).resolve()
+            file_path = self.source(source_file)
             target_path = current_path.joinpath(target_file)
             value[LAUNCHCONFIG_KEYS.ADDITIONAL_FILES.value][target_file] = str(
                 f"./{target_path.relative_to(dest_base)}"
@@ -55,12 +74,13 @@ class LaunchConfigTemplate:
                     shutil.copy(file_path, target_path)
                 except shutil.SameFileError:
                     pass
+                self.record(target_path)
 
     def templates(self, value: dict, current_path: Path, dest_base: Path) -> None:
         for name, templates in value[LAUNCHCONFIG_KEYS.TEMPLATES.value].items():
             logger.info(f"{templates=}")
             for type, file in templates.items():
-                file_path = Path(file).resolve()
+                file_path = self.source(file)
                 relative_path = current_path.joinpath(
                     f"{LAUNCHCONFIG_KEYS.TEMPLATES.value}/{name}/{type}.yaml"
                 )
@@ -83,6 +103,7 @@ class LaunchConfigTemplate:
                         shutil.copy(file_path, relative_path)
                     except shutil.SameFileError:
                         pass
+                    self.record(relative_path)
 
     def template_properties(
         self,
@@ -91,7 +112,7 @@ class LaunchConfigTemplate:
         dest_base: Path,
     ) -> None:
         for name, file in value[LAUNCHCONFIG_KEYS.TEMPLATE_PROPERTIES.value].items():
-            file_path = Path(file).resolve()
+            file_path = self.source(file)
             relative_path = current_path.joinpath(
                 f"{LAUNCHCONFIG_KEYS.TEMPLATE_PROPERTIES.value}/{name}.yaml"
             )
@@ -114,6 +135,7 @@ class LaunchConfigTemplate:
                     shutil.copy(file_path, relative_path)
                 except shutil.SameFileError:
                     pass
+                self.record(relative_path)
 
     def uuid(
         self,
@@ -0,0 +1,173 @@
+import json
+import logging
+import shutil
+from functools import partial
+from pathlib import Path
+
+import click
+from git import Repo
+from github.Repository import Repository
+
+from launch.config.common import BUILD_TEMP_DIR_PATH, MAX_WORKERS, PLATFORM_SRC_DIR_PATH
+from launch.config.launchconfig import SERVICE_MAIN_BRANCH, SERVICE_REMOTE_BRANCH
+from launch.constants.launchconfig import LAUNCHCONFIG_NAME
+from launch.lib.common.utilities.concurrency import TaskResult, run_concurrently
+from launch.lib.local_repo.repo import checkout_branch, clone_repository, push_branch
+from launch.lib.service.common import determine_existing_uuid, input_data_validation
+from launch.lib.service.functions import (
+    SkeletonCheckouts,
+    common_service_workflow,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def update_service(
+    repository: Repository,
+    service_path: Path,
+    skeletons: SkeletonCheckouts,
+    git_message: str,
+    skip_sync: bool,
+    skip_uuid: bool,
+    skip_commit: bool,
+    force: bool,
+    dry_run: bool = True,
+) -> str:
+    """
+    Updates a single service repository from its own .launch_config, cloning it first if it is not present locally.
+    Every step, including generation, may run concurrently with other services: generation resolves paths against
+    repo_base rather than the working directory, so it neither changes directory nor takes a lock.
+
+    Args:
+        repository (Repository): The remote service repository.
+        service_path (Path): Absolute path of the local service checkout.
+        skeletons (SkeletonCheckouts): Shared skeleton checkouts.
+        git_message (str): The git commit message to use when creating a commit.
+        skip_sync (bool): If set, it will skip syncing the template files and only update the properties files and directories.
+        skip_uuid (bool): If set, it will not generate a UUID to be used in skeleton files.
+        skip_commit (bool): If set, it will skip commiting the local changes.
+        force (bool): If set, it will override safeguards.
+        dry_run (bool): If set, it will not make any changes, but will log what it would.
+
+    Returns:
+        str: Short description of the outcome.
+    """
+    if service_path.exists():
+        local_repository = Repo(service_path)
+    else:
+        local_repository = clone_repository(
+            repository_url=repository.clone_url,
+            target=service_path,
+            branch=SERVICE_MAIN_BRANCH,
+            dry_run=dry_run,
+        )
+        checkout_branch(
+            repository=local_repository,
+            target_branch=SERVICE_REMOTE_BRANCH,
+            dry_run=dry_run,
+        )
+        if dry_run:
+            return "would have cloned and updated"
+
+    launch_config_path = service_path.joinpath(LAUNCHCONFIG_NAME)
+    if not launch_config_path.exists():
+        raise FileNotFoundError(f"No {LAUNCHCONFIG_NAME} found in {service_path}")
+    input_data = input_data_validation(json.loads(launch_config_path.read_text()))
+    input_data[PLATFORM_SRC_DIR_PATH] = determine_existing_uuid(
+        input_data=input_data[PLATFORM_SRC_DIR_PATH],
+        path=service_path,
+        force=force,
+    )
+
+    skeleton_path = skeletons.get(
+        url=input_data["skeleton"]["url"],
+        tag=input_data["skeleton"]["tag"],
+    )
+
+    if not dry_run:
+        shutil.rmtree(service_path.joinpath(BUILD_TEMP_DIR_PATH), ignore_errors=True)
+
+    generated_paths = common_service_workflow(
+        service_path=str(service_path),
+        repository=local_repository,
+        input_data=input_data,
+        git_message=git_message,
+        skip_uuid=skip_uuid,
+        skip_sync=skip_sync,
+        skip_git=False,
+        skip_commit=True,
+        dry_run=dry_run,
+        skeleton_path=skeleton_path,
+        repo_base=Path(service_path),
+    )
+
+    if skip_commit:
+        return "updated, not committed"
+
+    push_branch(
+        repository=local_repository,
+        branch=SERVICE_REMOTE_BRANCH,
+        commit_msg=git_message,
+        dry_run=dry_run,
+        paths=generated_paths,
+    )
+    return "updated and pushed"
+
+
+def update_fleet(
+    repositories: list[Repository],
+    workdir: Path,
+    git_message: str,
+    skip_sync: bool = False,
+    skip_uuid: bool = False,
+    skip_commit: bool = False,
+    force: bool = False,
+    max_workers: int = MAX_WORKERS,
+    dry_run: bool = True,
+) -> list[TaskResult]:
+    """
+    Updates many service repositories concurrently. Every service is cloned into its own directory under workdir, and
+    services that use the same skeleton url and tag share a single skeleton checkout.
+
+    Args:
+        repositories (list[Repository]): The remote service repositories to update.
+        workdir (Path): Directory that the services are cloned into.
+        git_message (str): The git commit message to use when creating a commit.
+        skip_sync (bool, optional): If set, it will skip syncing the template files. Defaults to False.
+        skip_uuid (bool, optional): If set, it will not generate a UUID to be used in skeleton files. Defaults to False.
+        skip_commit (bool, optional): If set, it will skip commiting the local changes. Defaults to False.
+        force (bool, optional): If set, it will override safeguards. Defaults to False.
+        max_workers (int, optional): Maximum number of services updated at once. Defaults to MAX_WORKERS.
+        dry_run (bool, optional): If set, it will not make any changes, but will log what it would. Defaults to True.
+
+    Returns:
+        list[TaskResult]: One result per repository, in the order supplied.
+    """
+    workdir = Path(workdir).resolve()
+    skeleton_build_path = workdir.joinpath(BUILD_TEMP_DIR_PATH)
+    if dry_run:
+        click.secho(
+            f"[DRYRUN] Would have removed the following directory: {skeleton_build_path=}",
+            fg="yellow",
+        )
+    else:
+        shutil.rmtree(skeleton_build_path, ignore_errors=True)
+
+    skeletons = SkeletonCheckouts(build_path=skeleton_build_path, dry_run=dry_run)
+    tasks = {
+        repository.name: partial(
+            update_service,
+            repository=repository,
+            service_path=workdir.joinpath(repository.name),
+            skeletons=skeletons,
+            git_message=git_message,
+            skip_sync=skip_sync,
+            skip_uuid=skip_uuid,
+            skip_commit=skip_commit,
+            force=force,
+            dry_run=dry_run,
+        )
+        for repository in repositories
+    }
+    logger.info(f"Updating {len(tasks)} services with up to {max_workers} workers")
+    return run_concurrently(tasks=tasks, max_workers=max_workers)
@@ -1,35 +1,37 @@
 import logging
+from typing import Iterable
 
 from semver import Version
 
 from launch.config.github import GITHUB_ORG_NAME, GITHUB_REPO_NAME
 from launch.constants.version import SEMANTIC_VERSION
 from launch.lib.github.auth import get_anonymous_github_instance
-from launch.lib.github.tags import get_repo_semantic_versions
+from launch.lib.github.tags import iter_repo_semantic_versions, top_versions
 
 logger = logging.getLogger(__name__)
 
 
 def latest_version(
-    versions: list[Version], include_prerelease: bool = False
+    versions: Iterable[Version], include_prerelease: bool = False
 ) -> Version | None:
     """Narrow a list of versions down to a version that is newer than our current version, if possible. If the current version
     is supplied in the versions list, it will be treated as if it's an older version (not returned), so that we don't prompt a
     user to update to the version they're currently running. Prerelease versions are considered only if include_prerelease is set.
 
     Args:
-        versions (list[Version]): List of versions that are available.
+        versions (Iterable[Version]): Versions that are available, read in a single pass.
         include_prerelease (bool, optional): Allow prerelease versions to be returned. Defaults to False.
 
     Returns:
         Version | None: The latest Version object, or None if no newer versions exist.
     """
     current_version = SEMANTIC_VERSION
-    if not include_prerelease:
-        versions = [v for v in versions if v.prerelease is None]
-    greater_versions = [v for v in versions if v > current_version]
-    if greater_versions:
-        return max(greater_versions)
+    greater_versions = (v for v in versions if v > current_version)
+    newest = top_versions(
+        versions=greater_versions, k=1, include_prerelease=include_prerelease
+    )
+    if newest:
+        return newest[0]
 
 
 def check_for_updates(include_prerelease: bool = False) -> Version | None:
@@ -45,7 +47,8 @@ def check_for_updates(include_prerelease: bool = False) -> Version | None:
         # Very short timeout to limit the amount of time we spend on this if there's problems on the GitHub side.
         g = get_anonymous_github_instance(timeout=1)
         repo = g.get_repo(full_name_or_id=f"{GITHUB_ORG_NAME}/{GITHUB_REPO_NAME}")
-        available_versions = get_repo_semantic_versions(repo=repo)
+        # Streamed, so the tags are never all held in memory at once.
+        available_versions = iter_repo_semantic_versions(repo=repo)
         return latest_version(
             versions=available_versions, include_prerelease=include_prerelease
         )
@@ -0,0 +1,53 @@
+from launch.cli.github.access.commands import audit
+from launch.lib.github.audit import RepositoryAudit
+
+
+def test_audit_compliant(cli_runner, mocker):
+    mocker.patch("launch.cli.github.access.commands.get_github_instance")
+    audit_repositories = mocker.patch(
+        "launch.cli.github.access.commands.audit_repositories",
+        return_value=[RepositoryAudit(name="svc")],
+    )
+
+    result = cli_runner.invoke(audit, ["--pattern", "svc-*", "--topic", "service"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines()[2].split() == ["svc", "ok"]
+    assert audit_repositories.call_args.kwargs["patterns"] == ["svc-*"]
+    assert audit_repositories.call_args.kwargs["topic"] == "service"
+
+
+def test_audit_drift(cli_runner, mocker, tmp_path):
+    mocker.patch("launch.cli.github.access.commands.get_github_instance")
+    audit_repositories = mocker.patch(
+        "launch.cli.github.access.commands.audit_repositories",
+        return_value=[
+            RepositoryAudit(name="a"),
+            RepositoryAudit(
+                name="b", drift=["missing label breaking", "no default branch"]
+            ),
+        ],
+    )
+    repositories_file = tmp_path.joinpath("repositories.txt")
+    repositories_file.write_text("b\n\n")
+
+    result = cli_runner.invoke(
+        audit, ["--repository", "a", "--repositories-file", str(repositories_file)]
+    )
+
+    assert result.exit_code == 1
+    assert "missing label breaking" in result.output
+    assert "no default branch" in result.output
+    assert audit_repositories.call_args.kwargs["names"] == ["a", "b"]
+
+
+def test_audit_no_repositories(cli_runner, mocker):
+    mocker.patch("launch.cli.github.access.commands.get_github_instance")
+    mocker.patch(
+        "launch.cli.github.access.commands.audit_repositories", return_value=[]
+    )
+
+    result = cli_runner.invoke(audit, ["--repository", "missing"])
+
+    assert result.exit_code == 0
+    assert "No repositories matched" in result.output
@@ -0,0 +1,63 @@
+import json
+
+from launch.cli.github.commit.status import set_many
+from launch.lib.common.utilities.concurrency import TaskResult
+
+
+def test_set_many_reads_stdin(cli_runner, mocker):
+    set_commit_statuses = mocker.patch(
+        "launch.cli.github.commit.status.set_commit_statuses",
+        return_value=[
+            TaskResult(
+                name="repo@abc unit", succeeded=True, duration=0.1, value="success"
+            )
+        ],
+    )
+    lines = "\n".join(
+        json.dumps({"commit": "abc", "context": "unit", "state": state})
+        for state in ["pending", "success"]
+    )
+
+    result = cli_runner.invoke(
+        set_many,
+        ["--repository-name", "repo", "--max-connections", "8"],
+        input=lines,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "repo@abc unit" in result.output
+    entries = set_commit_statuses.call_args.kwargs["entries"]
+    assert [str(entry.payload.state) for entry in entries] == ["pending", "success"]
+    assert set_commit_statuses.call_args.kwargs["max_connections"] == 8
+
+
+def test_set_many_invalid_input(cli_runner, mocker):
+    set_commit_statuses = mocker.patch(
+        "launch.cli.github.commit.status.set_commit_statuses"
+    )
+
+    result = cli_runner.invoke(set_many, ["--repository-name", "repo"], input="{}")
+
+    assert result.exit_code == 2
+    assert "line 1" in result.output
+    set_commit_statuses.assert_not_called()
+
+
+def test_set_many_failure(cli_runner, mocker):
+    mocker.patch(
+        "launch.cli.github.commit.status.set_commit_statuses",
+        return_value=[
+            TaskResult(
+                name="repo@abc unit", succeeded=False, duration=0.1, detail="422"
+            )
+        ],
+    )
+
+    result = cli_runner.invoke(
+        set_many,
+        ["--repository-name", "repo"],
+        input=json.dumps({"commit": "abc", "state": "error"}),
+    )
+
+    assert result.exit_code == 1
+    assert "422" in result.output
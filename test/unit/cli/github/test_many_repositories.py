@@ -0,0 +1,93 @@
+import pytest
+
+from launch.cli.github.access.commands import set_default_many
+from launch.cli.github.repo.commands import create_labels_many
+from launch.lib.common.utilities.concurrency import TaskResult
+
+
+@pytest.fixture
+def selected(mocker):
+    repository = mocker.MagicMock()
+    repository.name = "tf-one"
+    return [repository]
+
+
+@pytest.mark.parametrize(
+    "command, module, function",
+    [
+        (set_default_many, "access", "apply_default_access_many"),
+        (create_labels_many, "repo", "create_custom_labels_many"),
+    ],
+)
+class TestManyRepositories:
+    def test_requires_a_filter(self, command, module, function, cli_runner, mocker):
+        get_github_instance = mocker.patch(
+            f"launch.cli.github.{module}.commands.get_github_instance"
+        )
+
+        result = cli_runner.invoke(command, [])
+
+        assert result.exit_code == 1
+        get_github_instance.assert_not_called()
+
+    def test_selects_by_prefix_and_topic(
+        self, command, module, function, cli_runner, mocker, selected
+    ):
+        mocker.patch(f"launch.cli.github.{module}.commands.get_github_instance")
+        select_repositories = mocker.patch(
+            f"launch.cli.github.{module}.commands.select_repositories",
+            return_value=selected,
+        )
+        run = mocker.patch(
+            f"launch.cli.github.{module}.commands.{function}",
+            return_value=[
+                TaskResult(name="tf-one", succeeded=True, duration=0.1, value=2)
+            ],
+        )
+
+        result = cli_runner.invoke(
+            command,
+            [
+                "--prefix",
+                "tf-",
+                "--topic",
+                "terraform",
+                "--max-workers",
+                "4",
+                "--requests-per-second",
+                "2.5",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "tf-one" in result.output
+        assert select_repositories.call_args.kwargs["patterns"] == ["tf-*"]
+        assert select_repositories.call_args.kwargs["topic"] == "terraform"
+        assert run.call_args.kwargs["repositories"] == selected
+        assert run.call_args.kwargs["max_workers"] == 4
+        assert run.call_args.kwargs["bucket"].max_rate == 2.5
+
+    def test_failure_exits_non_zero(
+        self, command, module, function, cli_runner, mocker, selected, tmp_path
+    ):
+        mocker.patch(f"launch.cli.github.{module}.commands.get_github_instance")
+        select_repositories = mocker.patch(
+            f"launch.cli.github.{module}.commands.select_repositories",
+            return_value=selected,
+        )
+        mocker.patch(
+            f"launch.cli.github.{module}.commands.{function}",
+            return_value=[
+                TaskResult(name="tf-one", succeeded=False, duration=0.1, detail="boom")
+            ],
+        )
+        repositories_file = tmp_path.joinpath("repositories.txt")
+        repositories_file.write_text("tf-one\n")
+
+        result = cli_runner.invoke(
+            command, ["--repositories-file", str(repositories_file)]
+        )
+
+        assert result.exit_code == 1
+        assert "boom" in result.output
+        assert select_repositories.call_args.kwargs["names"] == ["tf-one"]
@@ -72,3 +72,22 @@ class TestVersionPredictionCLI:
         assert not result.exception
         assert result.exit_code == 0
         assert result.output.strip() == expected_type
+
+    def test_predict_version_number_from_remote(
+        self, cli_runner, example_github_repo, tmp_path_factory
+    ):
+        example_github_repo.create_tag("0.2.0")
+        result = cli_runner.invoke(
+            commands.predict,
+            [
+                "--source-branch",
+                "fix/foo",
+                "--repo-path",
+                str(tmp_path_factory.mktemp("empty")),
+                "--remote-url",
+                str(example_github_repo.working_dir),
+            ],
+        )
+        assert not result.exception
+        assert result.exit_code == 0
+        assert result.output.strip() == "0.2.1"
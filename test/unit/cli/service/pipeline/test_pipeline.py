@@ -0,0 +1,36 @@
+import importlib
+
+import pytest
+
+from launch.cli.service.pipeline import pipeline
+
+# The command shadows its module as an attribute of launch.cli.service.
+pipeline_command = importlib.import_module("launch.cli.service.pipeline")
+
+
+@pytest.fixture
+def mocked_pipeline(mocker):
+    mocker.patch.object(pipeline_command, "clean")
+    mocker.patch.object(pipeline_command, "set_netrc")
+    mocker.patch.object(pipeline_command, "read_github_token", return_value="token")
+    mocker.patch.object(pipeline_command, "GITHUB_APPLICATION_ID", None)
+    return mocker.patch.object(pipeline_command, "run_pipeline", return_value=[])
+
+
+def test_pipeline_builds_dockerfile_in_place(cli_runner, service_path, mocked_pipeline):
+    service_path.joinpath("source").mkdir()
+    service_path.joinpath("source", "Dockerfile").write_text("FROM scratch\n")
+
+    result = cli_runner.invoke(pipeline, ["--stage", "build", "--dry-run"])
+
+    assert result.exit_code == 0, result.output
+    assert mocked_pipeline.call_args.kwargs["url"] is None
+    assert mocked_pipeline.call_args.kwargs["service_dir"] == service_path
+    assert mocked_pipeline.call_args.kwargs["stages"] == ["build"]
+
+
+def test_pipeline_without_application_source(cli_runner, service_path, mocked_pipeline):
+    result = cli_runner.invoke(pipeline, ["--dry-run"])
+
+    assert result.exit_code == 1
+    mocked_pipeline.assert_not_called()
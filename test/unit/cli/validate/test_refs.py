@@ -0,0 +1,31 @@
+from launch.cli.validate.commands import refs
+
+OLD_SHA = "0" * 40
+NEW_SHA = "a" * 40
+
+
+class TestRefs:
+    def test_refs_valid(self, cli_runner):
+        result = cli_runner.invoke(
+            refs,
+            [],
+            input=f"{OLD_SHA} {NEW_SHA} refs/heads/fix/ok\n{OLD_SHA} {NEW_SHA} refs/heads/main\n",
+        )
+        assert result.exit_code == 0
+        assert "refs/heads/fix/ok is valid." in result.output
+        assert "refs/heads/main is valid." in result.output
+
+    def test_refs_invalid(self, cli_runner):
+        result = cli_runner.invoke(
+            refs,
+            ["--allow-branch", "develop"],
+            input=(
+                f"{OLD_SHA} {NEW_SHA} refs/heads/develop\n"
+                f"{OLD_SHA} {NEW_SHA} refs/heads/main\n"
+                f"{OLD_SHA} {NEW_SHA} refs/tags/1.0.0\n"
+            ),
+        )
+        assert result.exit_code == 1
+        assert "refs/heads/develop is valid." in result.output
+        assert "refs/heads/main isn't valid" in result.output
+        assert "refs/tags/1.0.0 skipped, not a branch." in result.output
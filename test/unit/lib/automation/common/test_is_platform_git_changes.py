@@ -1,74 +1,138 @@
-from unittest.mock import MagicMock, patch
+from pathlib import Path
 
 import pytest
+from git import Repo
 
+from launch.lib.automation.common import functions
 from launch.lib.automation.common.functions import is_platform_git_changes
 
 
-# Test when the commit hash is the same as the main branch
-def test_commit_hash_same_as_main_branch():
-    mock_repo = MagicMock()
-    mock_repo.remote.return_value.fetch.return_value = None
-    mock_repo.commit.return_value = MagicMock()
-    mock_repo.rev_parse.return_value = "same_commit_hash"
+def commit_files(repo: Repo, files: dict[str, str], message: str) -> str:
+    for name, content in files.items():
+        path = Path(repo.working_tree_dir, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    repo.index.add(list(files))
+    return repo.index.commit(message).hexsha
 
-    result = is_platform_git_changes(
-        mock_repo, "same_commit_hash", "main", "infrastructure"
-    )
 
-    assert result
+@pytest.fixture
+def origin(tmp_path):
+    repo = Repo.init(tmp_path.joinpath("origin"), initial_branch="main")
+    repo.config_writer().set_value("uploadpack", "allowAnySHA1InWant", "true").release()
+    commit_files(repo, {"README.md": "readme", "infrastructure/main.tf": ""}, "base")
+    return repo
 
 
-# Test when the commit hash is different from the main branch
-def test_commit_hash_different_from_main_branch():
-    mock_repo = MagicMock()
-    commit_main = MagicMock()
-    commit_compare = MagicMock()
-    mock_repo.remote.return_value.fetch.return_value = None
-    mock_repo.commit.side_effect = [commit_compare, commit_main]
-    mock_repo.rev_parse.return_value = "different_commit_hash"
+@pytest.fixture
+def clone(origin, tmp_path):
+    return Repo.clone_from(origin.git_dir, tmp_path.joinpath("clone"))
 
-    # Setup diffs to simulate changes
-    commit_compare.diff.return_value = MagicMock()
 
-    result = is_platform_git_changes(
-        mock_repo, "different_commit_hash", "infrastructure"
-    )
+def push_main(origin: Repo, files: dict[str, str]) -> str:
+    return commit_files(origin, files, "change")
+
+
+def test_commit_hash_same_as_main_branch(origin, clone):
+    commit_id = push_main(origin, {"infrastructure/main.tf": "changed"})
+
+    assert is_platform_git_changes(clone, commit_id, "infrastructure")
 
-    assert result
 
+def test_commit_hash_different_from_main_branch(origin, clone):
+    commit_id = push_main(origin, {"infrastructure/main.tf": "changed"})
+    push_main(origin, {"infrastructure/variables.tf": "changed"})
 
-# Test when there are no git changes in the specified directory
-def test_no_git_changes_in_directory():
-    mock_repo = MagicMock()
-    mock_repo.commit().diff.return_value = []
+    assert is_platform_git_changes(clone, commit_id, "infrastructure")
 
-    result = is_platform_git_changes(mock_repo, "commit_hash", "infrastructure")
-    assert not result
 
+def test_no_git_changes_in_directory(origin, clone):
+    commit_id = push_main(origin, {"README.md": "changed"})
 
-# Test when there are changes both inside and outside the specified directory
-def test_changes_in_both_inside_and_outside_directory():
-    mock_repo = MagicMock()
-    diff_mock = MagicMock()
-    diff_mock.diff.return_value = [
-        MagicMock(a_path="infrastructure/file1"),
-        MagicMock(a_path="other/file2"),
-    ]
-    mock_repo.commit.side_effect = [MagicMock(), diff_mock]
+    assert not is_platform_git_changes(clone, commit_id, "infrastructure")
+
+
+def test_changes_in_both_inside_and_outside_directory(origin, clone):
+    commit_id = push_main(
+        origin, {"infrastructure/main.tf": "changed", "other/file": "changed"}
+    )
 
     with pytest.raises(
         RuntimeError,
         match="Changes found in both inside and outside dir: infrastructure",
     ):
-        is_platform_git_changes(mock_repo, "commit_hash", "infrastructure")
+        is_platform_git_changes(clone, commit_id, "infrastructure")
+
+
+def test_changes_only_inside_directory(origin, clone):
+    commit_id = push_main(
+        origin, {"infrastructure/main.tf": "changed", "infrastructure/a/b.tf": ""}
+    )
+
+    assert is_platform_git_changes(clone, commit_id, "infrastructure/")
+
+
+def test_directory_is_matched_by_path_component(origin, clone):
+    commit_id = push_main(origin, {"infrastructure2/main.tf": "changed"})
+
+    assert not is_platform_git_changes(clone, commit_id, "infrastructure")
+
+
+def test_absolute_directory(origin, clone):
+    commit_id = push_main(origin, {"infrastructure/main.tf": "changed"})
+
+    assert is_platform_git_changes(
+        clone, commit_id, str(Path(clone.working_tree_dir, "infrastructure"))
+    )
+    assert is_platform_git_changes(clone, commit_id, clone.working_tree_dir)
+
+
+def test_fetches_commit_not_on_main_branch(origin, clone):
+    origin.git.checkout("-b", "feature")
+    commit_id = commit_files(
+        origin, {"infrastructure/main.tf": "changed"}, "feature change"
+    )
+    origin.git.checkout("main")
+
+    assert is_platform_git_changes(clone, commit_id, "infrastructure")
+
+
+def test_fetches_only_main_branch(origin, clone):
+    origin.git.branch("feature")
+    commit_id = push_main(origin, {"infrastructure/main.tf": "changed"})
+
+    is_platform_git_changes(clone, commit_id, "infrastructure")
+
+    assert "origin/feature" not in [ref.name for ref in clone.remote().refs]
+    assert clone.commit("origin/main").hexsha == commit_id
+
+
+def test_shallow_clone_stays_shallow(origin, tmp_path):
+    push_main(origin, {"README.md": "changed"})
+    clone = Repo.clone_from(
+        f"file://{origin.git_dir}", tmp_path.joinpath("shallow"), depth=1
+    )
+    commit_id = push_main(origin, {"infrastructure/main.tf": "changed"})
+
+    assert is_platform_git_changes(clone, commit_id, "infrastructure")
+    assert clone.git.rev_parse("--is-shallow-repository") == "true"
+
+
+def test_stops_reading_once_both_sets_are_found(origin, clone, mocker):
+    commit_id = push_main(
+        origin,
+        {"infrastructure/main.tf": "changed", **{f"other/{i}": "" for i in range(5)}},
+    )
+    read = []
+    changed_paths = functions._changed_paths
 
+    def tracked(**kwargs):
+        for path in changed_paths(**kwargs):
+            read.append(path)
+            yield path
 
-# Test when there are changes only inside the specified directory
-def test_changes_only_inside_directory():
-    mock_repo = MagicMock()
-    exclusive_dir_diff = [MagicMock(a_path="infrastructure/file1")]
-    mock_repo.commit().diff.return_value = exclusive_dir_diff
+    mocker.patch.object(functions, "_changed_paths", side_effect=tracked)
 
-    result = is_platform_git_changes(mock_repo, "commit_hash", "infrastructure")
-    assert result
+    with pytest.raises(RuntimeError):
+        is_platform_git_changes(clone, commit_id, "infrastructure")
+    assert read == ["infrastructure/main.tf", "other/0"]
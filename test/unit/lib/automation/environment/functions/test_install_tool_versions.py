@@ -1,12 +1,17 @@
 import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import mock_open
 
 import pytest
 
+from launch.lib.automation.environment import functions
 from launch.lib.automation.environment.functions import (
     install_tool_versions,
     parse_plugin_line,
 )
+from launch.lib.automation.processes import runner
+from launch.lib.automation.processes.runner import CommandResult
 
 EXAMPLE_TOOL_VERSIONS = """
 tool1 1.0.0
@@ -16,25 +21,28 @@ tool4 4.0.0-beta # https://github.com/org/tool4
 """
 
 
-def test_install_tool_versions_success(mocker):
+def test_install_tool_versions_success(mocker, tmp_path):
     mocker.patch("builtins.open", mock_open(read_data=EXAMPLE_TOOL_VERSIONS))
-    mock_run = mocker.patch("subprocess.run")
+    mock_run = mocker.patch.object(functions, "run_command")
 
-    install_tool_versions("fake_file")
+    install_tool_versions("repo/.tool-versions", cache_dir=None, data_dir=str(tmp_path))
 
     mock_run.assert_has_calls(
         [
-            mocker.call(["asdf", "plugin", "add", "tool1"]),
-            mocker.call(["asdf", "plugin", "add", "tool2"]),
+            mocker.call(["asdf", "plugin", "add", "tool1"], prefix="tool1"),
+            mocker.call(["asdf", "plugin", "add", "tool2"], prefix="tool2"),
             mocker.call(
-                ["asdf", "plugin", "add", "tool3", "https://github.com/org/tool3"]
+                ["asdf", "plugin", "add", "tool3", "https://github.com/org/tool3"],
+                prefix="tool3",
             ),
             mocker.call(
-                ["asdf", "plugin", "add", "tool4", "https://github.com/org/tool4"]
+                ["asdf", "plugin", "add", "tool4", "https://github.com/org/tool4"],
+                prefix="tool4",
             ),
-            mocker.call(["asdf", "install"]),
-        ]
+        ],
+        any_order=True,
     )
+    assert mock_run.call_args == mocker.call(["asdf", "install"], cwd=Path("repo"))
 
 
 def test_install_tool_versions_file_read_exception(mocker):
@@ -44,14 +52,96 @@ def test_install_tool_versions_file_read_exception(mocker):
         install_tool_versions("fake_file")
 
 
-def test_install_tool_versions_subprocess_exception(mocker):
+def test_install_tool_versions_subprocess_exception(mocker, tmp_path):
     mocker.patch("builtins.open", mock_open(read_data=EXAMPLE_TOOL_VERSIONS))
-    mocker.patch(
-        "subprocess.run", side_effect=subprocess.CalledProcessError(1, ["asdf"])
+    mocker.patch.object(
+        functions,
+        "run_command",
+        side_effect=subprocess.CalledProcessError(1, ["asdf"]),
     )
 
     with pytest.raises(RuntimeError, match="An error occurred with asdf install"):
-        install_tool_versions("fake_file")
+        install_tool_versions("fake_file", cache_dir=None, data_dir=str(tmp_path))
+
+
+def installed(data_dir, *tools):
+    for tool in tools:
+        data_dir.joinpath("plugins", tool[0]).mkdir(parents=True, exist_ok=True)
+        data_dir.joinpath("installs", *tool).mkdir(parents=True)
+        data_dir.joinpath("installs", *tool, "bin").write_text(tool[0])
+
+
+def test_install_tool_versions_already_installed(mocker, tmp_path):
+    mocker.patch("builtins.open", mock_open(read_data="tool1 1.0.0\ntool2 system\n"))
+    mock_run = mocker.patch.object(functions, "run_command")
+    installed(tmp_path, ("tool1", "1.0.0"))
+
+    install_tool_versions("fake_file", cache_dir=None, data_dir=str(tmp_path))
+
+    mock_run.assert_not_called()
+
+
+def test_install_tool_versions_skips_added_plugins(mocker, tmp_path):
+    mocker.patch("builtins.open", mock_open(read_data=EXAMPLE_TOOL_VERSIONS))
+    mock_run = mocker.patch.object(
+        functions,
+        "run_command",
+        return_value=CommandResult([], None, 0, 0.1, output="tool1\ntool3\n"),
+    )
+
+    install_tool_versions("fake_file", cache_dir=None, data_dir=str(tmp_path))
+
+    added = sorted(
+        call.args[0][3]
+        for call in mock_run.call_args_list
+        if call.args[0][1] == "plugin" and call.args[0][2] == "add"
+    )
+    assert added == ["tool2", "tool4"]
+
+
+def test_installed_asdf_plugins_ignores_warnings(mocker):
+    asdf = (
+        "import sys; print('warning: asdf is outdated', file=sys.stderr); "
+        "print('tool1'); print('tool3')"
+    )
+    mocker.patch.object(
+        functions,
+        "run_command",
+        side_effect=lambda args, **kwargs: runner.run_command(
+            [sys.executable, "-c", asdf], report=None, **kwargs
+        ),
+    )
+
+    assert functions.installed_asdf_plugins() == {"tool1", "tool3"}
+
+
+def test_install_tool_versions_saves_and_restores_toolchain(mocker, tmp_path):
+    tool_versions = tmp_path.joinpath(".tool-versions")
+    tool_versions.write_text("tool1 1.0.0\n")
+    cache_dir = tmp_path.joinpath("cache")
+    cold_agent = tmp_path.joinpath("cold")
+    warm_agent = tmp_path.joinpath("warm")
+
+    def asdf(command, **kwargs):
+        if command == ["asdf", "install"]:
+            installed(cold_agent, ("tool1", "1.0.0"))
+        return CommandResult(command, None, 0, 0.1, output="")
+
+    mocker.patch.object(functions, "run_command", side_effect=asdf)
+    install_tool_versions(
+        str(tool_versions), cache_dir=str(cache_dir), data_dir=str(cold_agent)
+    )
+    assert len(list(cache_dir.glob("*.tar.gz"))) == 1
+
+    mock_run = mocker.patch.object(functions, "run_command")
+    install_tool_versions(
+        str(tool_versions), cache_dir=str(cache_dir), data_dir=str(warm_agent)
+    )
+
+    assert (
+        warm_agent.joinpath("installs", "tool1", "1.0.0", "bin").read_text() == "tool1"
+    )
+    mock_run.assert_called_once_with(["asdf", "reshim"])
 
 
 @pytest.mark.parametrize(
@@ -1,5 +1,4 @@
 import logging
-import subprocess
 from test.unit.lib.automation.helm.fixtures import (
     chartfile_local_deps,
     chartfile_mixed_deps,
@@ -34,7 +33,7 @@ def helm_add_repo_call(dependencies: list[dict[str, str]]):
         if not dep["repository"].startswith("file://"):
             this_call = mock.Mock()
             this_call.call_args = mock.call(
-                ["helm", "repo", "add", dep["name"], dep["repository"]]
+                ["helm", "repo", "add", dep["name"], dep["repository"]], check=False
             )
             helm_add_repo_calls.append(this_call.call_args)
     return helm_add_repo_calls
@@ -70,26 +69,26 @@ def test_resolve_dependencies_raises_error_if_no_chart_yaml(tmp_path):
 
 
 def test_add_remote_dependency_repositories(mocker, remote_dependencies):
-    mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     dependencies = remote_dependencies
     helm_call = helm_add_repo_call(dependencies)
     add_dependency_repositories(dependencies)
-    assert subprocess.call.mock_calls == helm_call
+    assert mock_run_command.mock_calls == helm_call
 
 
 def test_add_mixed_dependency_repositories(mocker, mixed_dependencies):
-    mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     dependencies = mixed_dependencies
     helm_call = helm_add_repo_call(dependencies)
     add_dependency_repositories(dependencies)
-    assert subprocess.call.mock_calls == helm_call
+    assert mock_run_command.mock_calls == helm_call
 
 
 def test_add_dependency_repositories_local_dependency(mocker, local_dependencies):
-    mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     dependencies = local_dependencies
     add_dependency_repositories(dependencies)
-    subprocess.call.assert_not_called()
+    mock_run_command.assert_not_called()
 
 
 def test_resolve_next_layer_dependencies_empty_dependencies(
@@ -152,7 +151,7 @@ def test_resolve_dependencies_empty_global_empty_deps(
     global_dependencies = empty_global_dependencies
 
     mock_chart_exists = mocker.patch("pathlib.Path.exists")
-    mock_subprocess_call = mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     mock_extract_dependencies_from_chart = mocker.patch(
         "launch.lib.automation.helm.functions.extract_dependencies_from_chart"
     )
@@ -166,7 +165,7 @@ def test_resolve_dependencies_empty_global_empty_deps(
 
     mock_chart_exists.return_value = True
     mock_extract_dependencies_from_chart.return_value = dependencies
-    mock_subprocess_call.return_value = True
+    mock_run_command.return_value = True
     mock_resolve_next_layer_dependencies.return_value = None
     mock_add_dependency_repositories.return_value = None
     with caplog.at_level(logging.DEBUG):
@@ -185,7 +184,7 @@ def test_resolve_dependencies_empty_global_mixed_deps(
     global_dependencies = empty_global_dependencies
 
     mock_chart_exists = mocker.patch("pathlib.Path.exists")
-    mock_subprocess_call = mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     mock_extract_dependencies_from_chart = mocker.patch(
         "launch.lib.automation.helm.functions.extract_dependencies_from_chart"
     )
@@ -199,7 +198,7 @@ def test_resolve_dependencies_empty_global_mixed_deps(
 
     mock_extract_dependencies_from_chart.return_value = dependencies
     mock_chart_exists.return_value = True
-    mock_subprocess_call.return_value = True
+    mock_run_command.return_value = True
     mock_resolve_next_layer_dependencies.return_value = None
     mock_add_dependency_repositories.return_value = None
     with caplog.at_level(logging.DEBUG):
@@ -219,7 +218,7 @@ def test_resolve_dependencies_eq_global_mixed_deps(
     global_dependencies = eq_global_dependencies
 
     mock_chart_exists = mocker.patch("pathlib.Path.exists")
-    mock_subprocess_call = mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     mock_extract_dependencies_from_chart = mocker.patch(
         "launch.lib.automation.helm.functions.extract_dependencies_from_chart"
     )
@@ -233,7 +232,7 @@ def test_resolve_dependencies_eq_global_mixed_deps(
 
     mock_extract_dependencies_from_chart.return_value = dependencies
     mock_chart_exists.return_value = True
-    mock_subprocess_call.return_value = True
+    mock_run_command.return_value = True
     mock_resolve_next_layer_dependencies.return_value = None
     mock_add_dependency_repositories.return_value = None
     with caplog.at_level(logging.DEBUG):
@@ -253,7 +252,7 @@ def test_resolve_dependencies_conflict_global_mixed_deps(
     global_dependencies = conflict_global_dependencies
 
     mock_chart_exists = mocker.patch("pathlib.Path.exists")
-    mock_subprocess_call = mocker.patch("subprocess.call")
+    mock_run_command = mocker.patch("launch.lib.automation.helm.functions.run_command")
     mock_extract_dependencies_from_chart = mocker.patch(
         "launch.lib.automation.helm.functions.extract_dependencies_from_chart"
     )
@@ -267,7 +266,7 @@ def test_resolve_dependencies_conflict_global_mixed_deps(
 
     mock_extract_dependencies_from_chart.return_value = dependencies
     mock_chart_exists.return_value = True
-    mock_subprocess_call.return_value = True
+    mock_run_command.return_value = True
     mock_resolve_next_layer_dependencies.return_value = None
     mock_add_dependency_repositories.return_value = None
 
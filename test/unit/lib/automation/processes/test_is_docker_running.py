@@ -1,37 +1,129 @@
+import http.server
+import socketserver
 import subprocess
-import unittest
-from unittest.mock import MagicMock, patch
-
-from launch.lib.automation.processes.functions import is_docker_running
-
-
-class TestIsDockerRunning(unittest.TestCase):
-    def test_is_docker_running_success(self):
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-
-            result = is_docker_running()
-
-            mock_run.assert_called_once_with(
-                ["docker", "ps"],
-                check=True,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            self.assertTrue(result)
-
-    def test_is_docker_running_failure(self):
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.CalledProcessError(1, ["docker", "ps"])
-
-            result = is_docker_running()
-
-            mock_run.assert_called_once_with(
-                ["docker", "ps"],
-                check=True,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            self.assertFalse(result)
+import threading
+
+import pytest
+
+from launch.lib.automation.processes import functions
+from launch.lib.automation.processes.functions import is_docker_running, ping_docker
+from launch.lib.automation.processes.runner import CommandResult
+
+
+class PingHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 200 if self.path == "/_ping" else 404
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"OK")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def docker_socket(tmp_path):
+    socket_path = tmp_path.joinpath("docker.sock")
+
+    class Handler(PingHandler):
+        # Unix socket peers have no address, which BaseHTTPRequestHandler expects.
+        def address_string(self):
+            return "unix"
+
+    server = UnixHTTPServer(str(socket_path), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"unix://{socket_path}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_ping_docker_unix_socket(docker_socket):
+    assert ping_docker(docker_host=docker_socket)
+
+
+def test_ping_docker_missing_socket(tmp_path):
+    assert not ping_docker(docker_host=f"unix://{tmp_path.joinpath('docker.sock')}")
+
+
+def test_ping_docker_tcp():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert ping_docker(docker_host=f"tcp://127.0.0.1:{server.server_port}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize(
+    "docker_host, tls",
+    [
+        ("tcp://docker.example.com:2376", False),
+        ("tcp://docker.example.com:2375", True),
+        ("ssh://user@docker.example.com", False),
+        ("npipe:////./pipe/docker_engine", False),
+    ],
+)
+def test_ping_docker_uses_cli(mocker, docker_host, tls):
+    mock_connection = mocker.patch("http.client.HTTPConnection")
+    mock_run = mocker.patch.object(
+        functions,
+        "run_command",
+        return_value=CommandResult([], None, 0, 0.1),
+    )
+
+    assert ping_docker(docker_host=docker_host, tls=tls)
+    mock_connection.assert_not_called()
+    assert mock_run.call_args.args[0][:4] == [
+        "docker",
+        "--host",
+        docker_host,
+        "version",
+    ]
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        CommandResult([], None, 1, 0.1),
+        FileNotFoundError("docker"),
+        subprocess.TimeoutExpired("docker", 10),
+    ],
+)
+def test_ping_docker_cli_failure(mocker, result):
+    mocker.patch.object(functions, "run_command", side_effect=[result])
+
+    assert not ping_docker(docker_host="ssh://user@docker.example.com")
+
+
+def test_is_docker_running_success(mocker):
+    mock_ping = mocker.patch.object(functions, "ping_docker", return_value=True)
+
+    assert is_docker_running()
+    mock_ping.assert_called_once_with()
+
+
+def test_is_docker_running_docker_context(mocker):
+    mocker.patch.object(functions, "ping_docker", return_value=False)
+    mock_run = mocker.patch.object(
+        functions, "run_command", return_value=CommandResult([], None, 0, 0.1)
+    )
+
+    assert is_docker_running()
+    assert mock_run.call_args.args[0][:2] == ["docker", "version"]
+
+
+def test_is_docker_running_failure(mocker):
+    mocker.patch.object(functions, "ping_docker", return_value=False)
+    mocker.patch.object(
+        functions, "run_command", return_value=CommandResult([], None, 1, 0.1)
+    )
+
+    assert not is_docker_running()
@@ -8,15 +8,16 @@ from launch.lib.automation.processes.functions import make_build
 
 
 def test_make_build_success():
-    with patch("subprocess.run") as mock_run:
+    with patch("launch.lib.automation.processes.functions.run_command") as mock_run:
         make_build(dry_run=False)
-        mock_run.assert_called_once_with(
-            ["make", "build"], env=os.environ.copy(), check=True
-        )
+        mock_run.assert_called_once_with(["make", "build"], cwd=None)
 
 
 def test_make_build_failure():
-    with patch("subprocess.run") as mock_run, pytest.raises(RuntimeError) as exc_info:
+    with (
+        patch("launch.lib.automation.processes.functions.run_command") as mock_run,
+        pytest.raises(RuntimeError) as exc_info,
+    ):
         mock_run.side_effect = subprocess.CalledProcessError(1, "make build")
         make_build(dry_run=False)
         assert "An error occurred:" in str(exc_info.value)
@@ -1,4 +1,5 @@
 import subprocess
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -7,13 +8,22 @@ from launch.lib.automation.processes.functions import make_configure
 
 
 def test_make_configure_success():
-    with patch("subprocess.run") as mock_run:
+    with patch("launch.lib.automation.processes.functions.run_command") as mock_run:
         make_configure(dry_run=False)
-        mock_run.assert_called_once_with(["make", "configure"], check=True)
+        mock_run.assert_called_once_with(["make", "configure"], cwd=None)
+
+
+def test_make_configure_cwd():
+    with patch("launch.lib.automation.processes.functions.run_command") as mock_run:
+        make_configure(dry_run=False, cwd=Path("build"))
+        mock_run.assert_called_once_with(["make", "configure"], cwd=Path("build"))
 
 
 def test_make_configure_failure():
-    with patch("subprocess.run") as mock_run, pytest.raises(RuntimeError) as exc_info:
+    with (
+        patch("launch.lib.automation.processes.functions.run_command") as mock_run,
+        pytest.raises(RuntimeError) as exc_info,
+    ):
         mock_run.side_effect = subprocess.CalledProcessError(1, "make configure")
         make_configure(dry_run=False)
         assert "An error occurred:" in str(exc_info.value)
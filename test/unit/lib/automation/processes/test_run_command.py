@@ -0,0 +1,148 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from launch.lib.automation.processes.runner import RunReport, run_command
+
+
+def python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_streams_with_prefix(capsys):
+    run_command(python("print('one'); print('two')"), prefix="svc", report=None)
+
+    assert capsys.readouterr().out == "[svc] one\n[svc] two\n"
+
+
+def test_run_command_captures_stdout_and_stderr(capsys):
+    result = run_command(
+        python("import sys; print('out'); print('err', file=sys.stderr)"),
+        capture=True,
+        stream=False,
+        report=None,
+    )
+
+    assert result.returncode == 0
+    assert sorted(result.output.splitlines()) == ["err", "out"]
+    assert capsys.readouterr().out == ""
+
+
+def test_run_command_keeps_stderr_separate(capsys):
+    result = run_command(
+        python(
+            "import sys; print('warning', file=sys.stderr); sys.stderr.flush(); print('true')"
+        ),
+        capture=True,
+        merge_stderr=False,
+        report=None,
+    )
+
+    assert result.output == "true\n"
+    assert result.stderr == "warning\n"
+    streamed = capsys.readouterr()
+    assert streamed.out == "true\n"
+    assert streamed.err == "warning\n"
+
+
+def test_run_command_check_raises_with_stderr():
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        run_command(
+            python("import sys; print('boom', file=sys.stderr); raise SystemExit(2)"),
+            capture=True,
+            stream=False,
+            merge_stderr=False,
+            report=None,
+        )
+
+    assert excinfo.value.output == ""
+    assert excinfo.value.stderr == "boom\n"
+
+
+def test_run_command_cwd_and_env(tmp_path):
+    result = run_command(
+        python("import os; print(os.getcwd()); print(os.environ['LAUNCH_TEST'])"),
+        cwd=tmp_path,
+        env={"LAUNCH_TEST": "overlay"},
+        capture=True,
+        stream=False,
+        report=None,
+    )
+
+    assert result.output.splitlines() == [str(tmp_path.resolve()), "overlay"]
+
+
+def test_run_command_tees_to_log_file(tmp_path):
+    log_file = tmp_path.joinpath("run.log")
+
+    run_command(python("print('logged')"), log_file=log_file, stream=False, report=None)
+
+    assert log_file.read_text() == "logged\n"
+
+
+def test_run_command_records_report():
+    report = RunReport()
+
+    run_command(python("pass"), stream=False, report=report)
+    run_command(python("raise SystemExit(3)"), check=False, stream=False, report=report)
+
+    assert [result.returncode for result in report.results] == [0, 3]
+    assert all(result.duration > 0 for result in report.results)
+    assert "EXIT" in report.format()
+
+
+def test_run_command_check_raises():
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        run_command(
+            python("print('boom'); raise SystemExit(2)"),
+            capture=True,
+            stream=False,
+            report=None,
+        )
+
+    assert excinfo.value.returncode == 2
+    assert excinfo.value.output == "boom\n"
+
+
+def test_run_command_redacts_secrets():
+    report = RunReport()
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        run_command(
+            python("raise SystemExit(1)") + ["TOKEN=s3cr3t"],
+            stream=False,
+            report=report,
+            redact=["s3cr3t"],
+        )
+
+    assert "s3cr3t" not in str(excinfo.value)
+    assert report.results[0].args[-1] == "TOKEN=***"
+
+
+def test_run_command_timeout():
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_command(
+            python("import time; time.sleep(10)"),
+            timeout=0.2,
+            stream=False,
+            report=None,
+        )
+
+
+def test_run_command_concurrently_keeps_lines_whole(capsys):
+    code = "for i in range(200): print('x' * 200)"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda name: run_command(python(code), prefix=name, report=None),
+                ["a", "b", "c", "d"],
+            )
+        )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 800
+    assert {line[:4] for line in lines} == {"[a] ", "[b] ", "[c] ", "[d] "}
+    assert all(line[4:] == "x" * 200 for line in lines)
@@ -1,41 +1,110 @@
+import os
 import subprocess
 
 import pytest
 
-from launch.lib.automation.processes.functions import start_docker
+from launch.lib.automation.processes import functions
+from launch.lib.automation.processes.functions import (
+    configure_buildkit,
+    start_docker,
+    wait_for_docker,
+)
+
+
+@pytest.fixture
+def daemon_log(mocker, tmp_path):
+    log_path = tmp_path.joinpath("dockerd.log")
+    mocker.patch.object(functions, "DOCKER_DAEMON_LOG", str(log_path))
+    mocker.patch.object(functions.read_daemon_log, "__defaults__", (str(log_path), 50))
+    return log_path
 
 
 def test_start_docker_dry_run(mocker):
+    mocker.patch.object(functions, "is_docker_running", return_value=False)
+    mock_popen = mocker.patch("subprocess.Popen")
     mock_click_secho = mocker.patch("launch.lib.service.functions.click.secho")
-    start_docker(dry_run=True)
-    mock_click_secho.assert_called_once_with(f"Starting docker if not running")
 
+    start_docker(dry_run=True)
 
-def test_start_docker_non_dry_run(mocker):
-    mocker.patch(
-        "launch.lib.automation.processes.functions.is_docker_running",
-        return_value=False,
+    mock_click_secho.assert_any_call("Starting docker if not running")
+    mock_click_secho.assert_any_call(
+        "[DRYRUN] Would have started docker daemon", fg="yellow"
     )
+    mock_popen.assert_not_called()
+
+
+def test_start_docker_non_dry_run(mocker, daemon_log):
+    mocker.patch.object(functions, "is_docker_running", return_value=False)
     mock_popen = mocker.patch("subprocess.Popen")
-    mock_click_secho = mocker.patch("launch.lib.service.functions.click.secho")
+    mock_wait = mocker.patch.object(functions, "wait_for_docker")
     mock_sleep = mocker.patch("time.sleep")
 
-    mock_popen_instance = mocker.MagicMock()
-    mock_popen.return_value = mock_popen_instance
-
     start_docker(dry_run=False)
 
-    mock_click_secho.assert_called_once_with(f"Starting docker if not running")
     mock_popen.assert_called_once_with(
         ["dockerd"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stdout=mocker.ANY,
+        stderr=subprocess.STDOUT,
         close_fds=True,
     )
-    mock_sleep.assert_called_once_with(5)
+    assert mock_popen.call_args.kwargs["stdout"].name == str(daemon_log)
+    mock_wait.assert_called_once_with(process=mock_popen.return_value)
+    mock_sleep.assert_not_called()
 
 
 def test_start_docker_already_running(mocker):
-    mock_click_secho = mocker.patch("launch.lib.service.functions.click.secho")
+    mocker.patch.object(functions, "is_docker_running", return_value=True)
+    mock_popen = mocker.patch("subprocess.Popen")
+
     start_docker(dry_run=False)
-    mock_click_secho.assert_called_once_with(f"Starting docker if not running")
+
+    mock_popen.assert_not_called()
+
+
+def test_wait_for_docker_ready_after_retries(mocker):
+    mock_ping = mocker.patch.object(
+        functions, "ping_docker", side_effect=[False, False, True]
+    )
+    mock_sleep = mocker.patch("time.sleep")
+
+    wait_for_docker(timeout=10)
+
+    assert mock_ping.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.05, 0.1]
+
+
+def test_wait_for_docker_daemon_exited(mocker, daemon_log):
+    daemon_log.write_text("failed to start daemon: permission denied\n")
+    mocker.patch.object(functions, "ping_docker", return_value=False)
+    process = mocker.MagicMock(returncode=1)
+    process.poll.return_value = 1
+
+    with pytest.raises(RuntimeError, match="permission denied"):
+        wait_for_docker(process=process, timeout=10)
+
+
+def test_wait_for_docker_timeout(mocker, daemon_log):
+    mocker.patch.object(functions, "ping_docker", return_value=False)
+    mocker.patch("time.sleep")
+    mocker.patch("time.monotonic", side_effect=[0, 1, 2, 3])
+
+    with pytest.raises(RuntimeError, match="not ready after 2 seconds"):
+        wait_for_docker(timeout=2)
+
+
+def test_configure_buildkit(mocker, tmp_path):
+    mocker.patch.dict(os.environ, {}, clear=True)
+
+    configure_buildkit(cache_dir=str(tmp_path))
+
+    assert os.environ["DOCKER_BUILDKIT"] == "1"
+    assert os.environ["BUILDX_CACHE_FROM"] == f"type=local,src={tmp_path}"
+    assert os.environ["BUILDX_CACHE_TO"] == f"type=local,dest={tmp_path},mode=max"
+
+
+def test_configure_buildkit_without_cache(mocker):
+    mocker.patch.dict(os.environ, {}, clear=True)
+
+    configure_buildkit(cache_dir=None)
+
+    assert "DOCKER_BUILDKIT" not in os.environ
@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+
+from launch.lib.automation.provider.aws import clients
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(mocker):
+    clients.clear_clients()
+    session = mocker.patch.object(clients.boto3.session, "Session")
+
+    def create_session(profile_name=None):
+        session = mocker.MagicMock(name=f"session-{profile_name}")
+        session.client.side_effect = lambda **kwargs: mocker.MagicMock(**kwargs)
+        return session
+
+    session.side_effect = create_session
+    yield session
+    clients.clear_clients()
+
+
+def test_get_client_reuses_client(fresh_clients):
+    first = clients.get_client("secretsmanager", region_name="us-east-2")
+    second = clients.get_client("secretsmanager", region_name="us-east-2")
+
+    assert first is second
+    fresh_clients.assert_called_once_with(profile_name=None)
+
+
+def test_get_client_keys_by_service_region_and_profile(fresh_clients):
+    default = clients.get_client("secretsmanager", region_name="us-east-2")
+
+    assert clients.get_client("sts", region_name="us-east-2") is not default
+    assert clients.get_client("secretsmanager", region_name="us-west-2") is not default
+    assert (
+        clients.get_client(
+            "secretsmanager", region_name="us-east-2", profile_name="dev"
+        )
+        is not default
+    )
+    assert fresh_clients.call_count == 2
+
+
+def test_get_client_from_many_threads(fresh_clients):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(clients.get_client("sts")))
+        for _ in range(16)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in results}) == 1
+
+
+def test_clear_clients_for_profile(fresh_clients):
+    dev = clients.get_client("sts", profile_name="dev")
+    default = clients.get_client("sts")
+
+    clients.clear_clients(profile_name="dev")
+
+    assert clients.get_client("sts") is default
+    assert clients.get_client("sts", profile_name="dev") is not dev
+
+
+def test_clear_clients_for_default_profile(fresh_clients, mocker):
+    mocker.patch.dict(clients.os.environ, {}, clear=True)
+    default = clients.get_client("sts")
+    named_default = clients.get_client("sts", profile_name="default")
+    dev = clients.get_client("sts", profile_name="dev")
+
+    clients.clear_clients(profile_name="default")
+
+    assert clients.get_client("sts") is not default
+    assert clients.get_client("sts", profile_name="default") is not named_default
+    assert clients.get_client("sts", profile_name="dev") is dev
+
+
+def test_clear_clients_for_aws_profile(fresh_clients, mocker):
+    mocker.patch.dict(clients.os.environ, {"AWS_PROFILE": "dev"})
+    default = clients.get_client("sts")
+
+    clients.clear_clients(profile_name="dev")
+
+    assert clients.get_client("sts") is not default
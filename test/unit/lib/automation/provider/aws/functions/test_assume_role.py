@@ -1,70 +1,209 @@
-import unittest
-from unittest.mock import patch
-import subprocess
-import json
+import configparser
+import os
+from datetime import datetime, timedelta, timezone
+from functools import partial
 
+import pytest
+
+from launch.lib.automation.provider.aws import functions
 from launch.lib.automation.provider.aws.functions import assume_role
 
-class TestAssumeRole(unittest.TestCase):
-
-    def aws_setup(self):
-        aws_deployment_role = "arn:aws:iam::123456789012:role/test-role"
-        aws_deployment_region = "us-west-2"
-        profile = "test-profile"
-        sts_response = {
-                "Credentials": {
-                    "AccessKeyId": "test-access-key-id",
-                    "SecretAccessKey": "test-secret-access-key",
-                    "SessionToken": "test-session-token"
-                }
-         }
-        return aws_deployment_role, aws_deployment_region, profile,sts_response
-
-    def test_assume_role_success(self):
-        with patch("subprocess.check_output") as mock_check_output, patch("subprocess.run") as mock_run:
-            aws_deployment_role, aws_deployment_region, profile, sts_response = self.aws_setup()
-            mock_check_output.return_value = json.dumps(sts_response).encode('utf-8')
-            
-            assume_role(aws_deployment_role, aws_deployment_region, profile)
-            
-            mock_check_output.assert_called_once_with([
-                "aws",
-                "sts",
-                "assume-role",
-                "--role-arn",
-                aws_deployment_role,
-                "--role-session-name",
-                "caf-build-agent",
-            ])
-
-            mock_run.assert_called_with(
-            [
-                "aws",
-                "configure",
-                "set",
-                f"profile.{profile}.region",
-                "us-west-2",
-            ],
-            check=True,
-            )   
-
-    def test_assume_role_assume_role_failure(self):
-        with patch("subprocess.check_output") as mock_check_output:
-            aws_deployment_role, aws_deployment_region, profile,_ = self.aws_setup()
-            mock_check_output.side_effect = subprocess.CalledProcessError(1, "aws sts assume-role")
-            
-            with self.assertRaises(RuntimeError) as context:
-                assume_role(aws_deployment_role, aws_deployment_region, profile)
-            
-            self.assertIn("Failed aws sts assume-role", str(context.exception))
-
-    def test_assume_role_configure_failure(self):
-        with patch("subprocess.check_output") as mock_check_output, patch("subprocess.run") as mock_run:
-            aws_deployment_role, aws_deployment_region, profile, sts_response = self.aws_setup()
-            mock_check_output.return_value = json.dumps(sts_response).encode('utf-8')
-            mock_run.side_effect = subprocess.CalledProcessError(1, "aws configure set")
-            
-            with self.assertRaises(RuntimeError) as context:
-                assume_role(aws_deployment_role, aws_deployment_region, profile)
-            
-            self.assertIn("Failed set aws configure", str(context.exception))
+ROLE = "arn:aws:iam::123456789012:role/test-role"
+
+
+def sts_credentials(expires_in: int = 3600) -> dict:
+    return {
+        "AccessKeyId": "test-access-key-id",
+        "SecretAccessKey": "test-secret-access-key",  # pragma: allowlist secret
+        "SessionToken": "test-session-token",
+        "Expiration": datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+    }
+
+
+@pytest.fixture
+def aws_files(mocker, tmp_path):
+    credentials_file = tmp_path.joinpath("aws", "credentials")
+    config_file = tmp_path.joinpath("aws", "config")
+    mocker.patch.object(functions, "AWS_SHARED_CREDENTIALS_FILE", str(credentials_file))
+    mocker.patch.object(functions, "AWS_CONFIG_FILE", str(config_file))
+    mocker.patch.object(
+        functions,
+        "get_role_credentials",
+        partial(functions.get_role_credentials, cache_dir=str(tmp_path / "cache")),
+    )
+    mocker.patch.object(functions, "clear_clients")
+    mocker.patch.object(
+        functions, "get_session"
+    ).return_value.get_credentials.return_value.access_key = "caller-key"
+    return credentials_file, config_file
+
+
+@pytest.fixture
+def mock_sts(mocker):
+    sts = mocker.MagicMock()
+    sts.assume_role.return_value = {"Credentials": sts_credentials()}
+    mocker.patch.object(functions, "get_client", return_value=sts)
+    return sts
+
+
+def read_ini(path):
+    config = configparser.RawConfigParser()
+    config.read(path)
+    return config
+
+
+def test_assume_role_success(aws_files, mock_sts):
+    credentials_file, config_file = aws_files
+
+    assume_role(ROLE, "us-west-2", "test-profile")
+
+    mock_sts.assume_role.assert_called_once_with(
+        RoleArn=ROLE, RoleSessionName="caf-build-agent"
+    )
+    credentials = read_ini(credentials_file)
+    assert credentials["test-profile"]["aws_access_key_id"] == "test-access-key-id"
+    assert credentials["test-profile"]["aws_session_token"] == "test-session-token"
+    assert read_ini(config_file)["profile test-profile"]["region"] == "us-west-2"
+    assert oct(credentials_file.stat().st_mode & 0o777) == oct(0o600)
+    functions.clear_clients.assert_called_once_with(profile_name="test-profile")
+
+
+def test_assume_role_keeps_other_profiles(aws_files, mock_sts):
+    credentials_file, config_file = aws_files
+    credentials_file.parent.mkdir()
+    credentials_file.write_text("[other]\naws_access_key_id = other-key\n")
+    config_file.write_text("[default]\nregion = us-east-1\n")
+
+    assume_role(ROLE, "us-west-2", "default")
+
+    assert read_ini(credentials_file)["other"]["aws_access_key_id"] == "other-key"
+    assert read_ini(config_file)["default"]["region"] == "us-west-2"
+
+
+def test_assume_role_keeps_comments(aws_files, mock_sts):
+    credentials_file, config_file = aws_files
+    credentials_file.parent.mkdir()
+    credentials_file.write_text(
+        "# Managed by hand\n"
+        "[test-profile]\n"
+        "aws_access_key_id=old-key ; rotated weekly\n"
+        "\n"
+        "; Personal account\n"
+        "[other]\n"
+        "aws_access_key_id = other-key\n"
+    )
+    config = (
+        "[default]\n"
+        "# Where most of our stacks live\n"
+        "region = us-east-1\n"
+        "s3 =\n"
+        "  max_concurrent_requests = 20\n"
+        "[default]\n"
+        "output = json"
+    )
+    config_file.write_text(config)
+
+    assume_role(ROLE, "us-west-2", "test-profile")
+
+    assert credentials_file.read_text() == (
+        "# Managed by hand\n"
+        "[test-profile]\n"
+        "aws_access_key_id = test-access-key-id\n"
+        "aws_secret_access_key = test-secret-access-key\n"  # pragma: allowlist secret
+        "aws_session_token = test-session-token\n"
+        "\n"
+        "; Personal account\n"
+        "[other]\n"
+        "aws_access_key_id = other-key\n"
+    )
+    assert config_file.read_text() == (
+        config + "\n\n[profile test-profile]\nregion = us-west-2\n"
+    )
+
+
+def test_assume_role_updates_duplicate_sections_in_place(aws_files, mock_sts):
+    _, config_file = aws_files
+    config_file.parent.mkdir()
+    config_file.write_text(
+        "[default]\n"
+        "region = us-east-1\n"
+        "s3 =\n"
+        "  max_concurrent_requests = 20\n"
+        "[default]\n"
+        "output = json\n"
+    )
+
+    assume_role(ROLE, "us-west-2", "default")
+
+    assert config_file.read_text() == (
+        "[default]\n"
+        "region = us-west-2\n"
+        "s3 =\n"
+        "  max_concurrent_requests = 20\n"
+        "[default]\n"
+        "output = json\n"
+    )
+
+
+def test_assume_role_uses_cached_credentials(aws_files, mock_sts):
+    assume_role(ROLE, "us-west-2", "test-profile")
+    assume_role(ROLE, "us-west-2", "another-profile")
+
+    mock_sts.assume_role.assert_called_once()
+    assert (
+        read_ini(aws_files[0])["another-profile"]["aws_secret_access_key"]
+        == "test-secret-access-key"  # pragma: allowlist secret
+    )
+
+
+def test_assume_role_caches_per_caller(aws_files, mock_sts, mocker):
+    assume_role(ROLE, "us-west-2", "test-profile")
+    functions.get_session.return_value.get_credentials.return_value.access_key = (
+        "other-caller-key"
+    )
+    assume_role(ROLE, "us-west-2", "test-profile")
+    mocker.patch.dict(os.environ, {"AWS_PROFILE": "other-source"})
+    assume_role(ROLE, "us-west-2", "test-profile")
+
+    assert mock_sts.assume_role.call_count == 3
+
+
+def test_assume_role_refreshes_expiring_credentials(aws_files, mock_sts):
+    mock_sts.assume_role.return_value = {"Credentials": sts_credentials(expires_in=60)}
+    assume_role(ROLE, "us-west-2", "test-profile")
+    assume_role(ROLE, "us-west-2", "test-profile")
+
+    assert mock_sts.assume_role.call_count == 2
+
+
+def test_assume_role_caches_per_session_name(aws_files, mock_sts):
+    assume_role(ROLE, "us-west-2", "test-profile")
+    assume_role(ROLE, "us-west-2", "test-profile", session_name="another-session")
+
+    assert mock_sts.assume_role.call_count == 2
+
+
+def test_assume_role_export_environment(aws_files, mock_sts, mocker):
+    mocker.patch.dict(os.environ, {}, clear=True)
+
+    assume_role(ROLE, "us-west-2", "test-profile", export_environment=True)
+
+    assert os.environ["AWS_ACCESS_KEY_ID"] == "test-access-key-id"
+    assert os.environ["AWS_SESSION_TOKEN"] == "test-session-token"
+    assert os.environ["AWS_DEFAULT_REGION"] == "us-west-2"
+
+
+def test_assume_role_assume_role_failure(aws_files, mock_sts):
+    mock_sts.assume_role.side_effect = Exception("AccessDenied")
+
+    with pytest.raises(RuntimeError, match="Failed aws sts assume-role"):
+        assume_role(ROLE, "us-west-2", "test-profile")
+
+
+def test_assume_role_configure_failure(aws_files, mock_sts, mocker):
+    mocker.patch.object(
+        functions, "_atomic_write", side_effect=PermissionError("read-only")
+    )
+
+    with pytest.raises(RuntimeError, match="Failed set aws configure"):
+        assume_role(ROLE, "us-west-2", "test-profile")
@@ -4,7 +4,13 @@ from pathlib import Path
 
 import pytest
 
-from launch.lib.automation.provider.az.functions import deploy_remote_state
+from launch.lib.automation.processes.runner import CommandResult
+from launch.lib.automation.provider.az import functions as az_functions
+from launch.lib.automation.provider.az.functions import (
+    deploy_remote_state,
+    deploy_remote_states,
+    remote_state_exists,
+)
 
 
 @pytest.fixture
@@ -20,7 +26,7 @@ def test_deploy_remote_state_all_parameters(mocker, fakedata):
     target_environment = "prod"
     region = "us-west-2"
     instance = "instance1"
-    build_path='./'
+    build_path = "./"
     expected_run_list = [
         "make",
         "NAME_PREFIX=test-prefix",
@@ -31,9 +37,8 @@ def test_deploy_remote_state_all_parameters(mocker, fakedata):
         "terragrunt/remote_state/azure",
     ]
 
-    mock_run = mocker.patch(
-        "launch.lib.automation.provider.az.functions.subprocess.run"
-    )
+    mock_run = mocker.patch("launch.lib.automation.provider.az.functions.run_command")
+    mocker.patch("launch.lib.automation.provider.az.functions.make_configure")
     mock_logger = mocker.patch(
         "launch.lib.automation.provider.az.functions.logger.info"
     )
@@ -47,7 +52,7 @@ def test_deploy_remote_state_all_parameters(mocker, fakedata):
         build_path,
     )
 
-    mock_run.assert_called_with(expected_run_list, check=True, cwd=build_path)
+    mock_run.assert_called_with(expected_run_list, cwd=build_path, prefix="instance1")
     mock_logger.assert_called()
 
 
@@ -57,16 +62,15 @@ def test_deploy_remote_state_minimal_parameters(mocker, fakedata):
     target_environment = ""
     region = ""
     instance = ""
-    build_path='./'
+    build_path = "./"
     expected_run_list = [
         "make",
         "STORAGE_ACCOUNT_NAME=uuid-test",
         "terragrunt/remote_state/azure",
     ]
 
-    mock_run = mocker.patch(
-        "launch.lib.automation.provider.az.functions.subprocess.run"
-    )
+    mock_run = mocker.patch("launch.lib.automation.provider.az.functions.run_command")
+    mocker.patch("launch.lib.automation.provider.az.functions.make_configure")
     mock_logger = mocker.patch(
         "launch.lib.automation.provider.az.functions.logger.info"
     )
@@ -80,15 +84,16 @@ def test_deploy_remote_state_minimal_parameters(mocker, fakedata):
         build_path,
     )
 
-    mock_run.assert_called_with(expected_run_list, check=True, cwd=build_path)
+    mock_run.assert_called_with(expected_run_list, cwd=build_path, prefix=None)
     mock_logger.assert_called()
 
 
 def test_deploy_remote_state_error_handling(mocker, fakedata):
     mocker.patch(
-        "launch.lib.automation.provider.az.functions.subprocess.run",
+        "launch.lib.automation.provider.az.functions.run_command",
         side_effect=subprocess.CalledProcessError(1, "make"),
     )
+    mocker.patch("launch.lib.automation.provider.az.functions.make_configure")
 
     with pytest.raises(RuntimeError) as excinfo:
         deploy_remote_state(
@@ -103,3 +108,101 @@ def test_deploy_remote_state_error_handling(mocker, fakedata):
     assert "An error occurred:" in str(
         excinfo.value
     ), "Expected RuntimeError to be raised on subprocess.CalledProcessError"
+
+
+@pytest.fixture
+def no_known_remote_state(mocker):
+    mocker.patch.object(az_functions, "_existing_remote_state", set())
+
+
+def test_remote_state_exists_caches_positive_probe(mocker, no_known_remote_state):
+    mock_run = mocker.patch.object(
+        az_functions,
+        "run_command",
+        return_value=CommandResult([], None, 0, 0.1, output="true\n"),
+    )
+
+    assert remote_state_exists("account1")
+    assert remote_state_exists("account1")
+    mock_run.assert_called_once()
+    assert mock_run.call_args.kwargs["merge_stderr"] is False
+
+
+def test_remote_state_exists_missing_account(mocker, no_known_remote_state):
+    mock_run = mocker.patch.object(
+        az_functions,
+        "run_command",
+        return_value=CommandResult([], None, 3, 0.1, output=""),
+    )
+
+    assert not remote_state_exists("account1")
+    assert not remote_state_exists("account1")
+    assert mock_run.call_count == 2
+
+
+def test_deploy_remote_states_skips_existing(mocker, no_known_remote_state):
+    mocker.patch.object(
+        az_functions,
+        "remote_state_exists",
+        side_effect=lambda storage_account_name: storage_account_name
+        == "testprefixuuid-000",
+    )
+    mock_configure = mocker.patch.object(az_functions, "make_configure")
+    mock_run = mocker.patch.object(az_functions, "run_command")
+
+    deploy_remote_states(
+        instances={"000": "uuid-000", "001": "uuid-001", "002": "uuid-002"},
+        naming_prefix="test-prefix",
+        target_environment="prod",
+        region="eastus",
+        build_path=Path("build"),
+    )
+
+    mock_configure.assert_called_once_with(dry_run=False, cwd=Path("build"))
+    deployed = sorted(call.args[0][-2] for call in mock_run.call_args_list)
+    assert deployed == [
+        "STORAGE_ACCOUNT_NAME=testprefixuuid-001",
+        "STORAGE_ACCOUNT_NAME=testprefixuuid-002",
+    ]
+    assert az_functions._existing_remote_state == {
+        ("testprefixuuid-001", "tfstate"),
+        ("testprefixuuid-002", "tfstate"),
+    }
+
+
+def test_deploy_remote_states_all_existing(mocker, no_known_remote_state):
+    mocker.patch.object(az_functions, "remote_state_exists", return_value=True)
+    mock_configure = mocker.patch.object(az_functions, "make_configure")
+    mock_run = mocker.patch.object(az_functions, "run_command")
+
+    deploy_remote_states(
+        instances={"000": "uuid-000"},
+        naming_prefix="test-prefix",
+        target_environment="prod",
+        region="eastus",
+        build_path=Path("build"),
+    )
+
+    mock_configure.assert_not_called()
+    mock_run.assert_not_called()
+
+
+def test_deploy_remote_states_reports_failures(mocker, no_known_remote_state):
+    mocker.patch.object(az_functions, "remote_state_exists", return_value=False)
+    mocker.patch.object(az_functions, "make_configure")
+
+    def run(run_list, **kwargs):
+        if "ENV_INSTANCE=001" in run_list:
+            raise subprocess.CalledProcessError(2, "make")
+
+    mocker.patch.object(az_functions, "run_command", side_effect=run)
+
+    with pytest.raises(RuntimeError, match="001") as excinfo:
+        deploy_remote_states(
+            instances={"000": "uuid-000", "001": "uuid-001"},
+            naming_prefix="test-prefix",
+            target_environment="prod",
+            region="eastus",
+            build_path=Path("build"),
+        )
+    assert "000" not in str(excinfo.value)
@@ -1,132 +1,144 @@
-import os
-import shutil
-import subprocess
-import tempfile
 from pathlib import Path
-from unittest import mock
 
 import pytest
-from git import Repo
 
 from launch.config.terragrunt import TERRAGRUNT_RUN_DIRS
-
-# Constants for testing
-from launch.config.webhook import (
-    WEBHOOK_BUILD_SCRIPT,
-    WEBHOOK_GIT_REPO_TAG,
-    WEBHOOK_GIT_REPO_URL,
-    WEBHOOK_ZIP,
+from launch.config.webhook import WEBHOOK_BUILD_SCRIPT, WEBHOOK_ZIP
+from launch.lib.automation.terragrunt import functions
+from launch.lib.automation.terragrunt.functions import (
+    build_webhook,
+    copy_webhook,
+    get_webhook_zip,
+    webhook_cache_key,
 )
-from launch.lib.automation.terragrunt.functions import copy_webhook
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
 
 
 @pytest.fixture
-def temp_directory():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def build_path(tmp_path):
+    build_path = tmp_path.joinpath("build")
+    environment_path = build_path.joinpath(TERRAGRUNT_RUN_DIRS["webhook"], "dev")
+    for instance in ["us-east-2/000", "us-east-2/001", "us-west-2/000"]:
+        environment_path.joinpath(instance).mkdir(parents=True)
+    environment_path.joinpath("us-east-2", "terragrunt.hcl").touch()
+    return build_path
 
 
 @pytest.fixture
-def mock_clone_repository(mocker):
-    return mocker.patch(
-        "launch.lib.local_repo.repo.clone_repository", return_value=None
-    )
+def mock_build_webhook(mocker, tmp_path):
+    def build(webhooks_path):
+        webhooks_path.mkdir(parents=True, exist_ok=True)
+        built_zip = webhooks_path.joinpath(WEBHOOK_ZIP)
+        built_zip.write_bytes(b"zip")
+        return built_zip
+
+    return mocker.patch.object(functions, "build_webhook", side_effect=build)
 
 
 @pytest.fixture
-def mock_os_chdir(mocker):
-    return mocker.patch("os.chdir")
+def mock_resolve_remote_ref(mocker):
+    return mocker.patch.object(functions, "resolve_remote_ref", return_value=COMMIT)
 
 
-@pytest.fixture
-def mock_os_chmod(mocker):
-    return mocker.patch("os.chmod")
+def test_copy_webhook_dry_run(build_path, mock_build_webhook, tmp_path):
+    copy_webhook(tmp_path.joinpath("webhooks"), build_path, "dev", dry_run=True)
 
+    mock_build_webhook.assert_not_called()
+    assert not list(build_path.rglob(WEBHOOK_ZIP))
 
-@pytest.fixture
-def mock_subprocess_run(mocker):
-    return mocker.patch("subprocess.run")
 
+def test_copy_webhook_copies_to_instances(
+    mocker, build_path, mock_build_webhook, mock_resolve_remote_ref, tmp_path
+):
+    mocker.patch.object(
+        functions,
+        "get_webhook_zip",
+        side_effect=lambda webhooks_path: get_webhook_zip(
+            webhooks_path=webhooks_path, cache_dir=str(tmp_path.joinpath("cache"))
+        ),
+    )
 
-@pytest.fixture
-def mock_os_walk(mocker):
-    return mocker.patch("os.walk")
+    copy_webhook(tmp_path.joinpath("webhooks"), build_path, "dev", dry_run=False)
 
+    environment_path = build_path.joinpath(TERRAGRUNT_RUN_DIRS["webhook"], "dev")
+    assert sorted(
+        path.parent.relative_to(environment_path).as_posix()
+        for path in build_path.rglob(WEBHOOK_ZIP)
+    ) == ["us-east-2/000", "us-east-2/001", "us-west-2/000"]
 
-@pytest.fixture
-def mock_shutil_copy(mocker):
-    return mocker.patch("shutil.copy")
 
+def test_copy_webhook_uses_zip_name(
+    mocker, build_path, mock_resolve_remote_ref, tmp_path
+):
+    webhook_zip = tmp_path.joinpath("cached.zip")
+    webhook_zip.write_bytes(b"zip")
+    mocker.patch.object(functions, "WEBHOOK_ZIP", "dist/lambda.zip")
+    mocker.patch.object(functions, "get_webhook_zip", return_value=webhook_zip)
+
+    copy_webhook(tmp_path.joinpath("webhooks"), build_path, "dev", dry_run=False)
 
-def test_copy_webhook_dry_run(
-    mock_clone_repository,
-    mock_os_chdir,
-    mock_os_chmod,
-    mock_subprocess_run,
-    mock_os_walk,
+    copies = list(build_path.rglob("*.zip"))
+    assert len(copies) == 3
+    assert all(path.name == "lambda.zip" for path in copies)
+
+
+def test_get_webhook_zip_caches_build(
+    mock_build_webhook, mock_resolve_remote_ref, tmp_path
 ):
-    webhooks_path = Path("/fake/webhooks_path")
-    build_path = Path("/fake/build_path")
-    target_environment = "dev"
-    dry_run = True
-
-    mock_os_walk.return_value = [
-        (
-            str(
-                build_path.joinpath(
-                    TERRAGRUNT_RUN_DIRS["webhook"].joinpath(target_environment)
-                )
-            ),
-            [],
-            [],
-        )
-    ]
-
-    copy_webhook(webhooks_path, build_path, target_environment, dry_run)
-
-    mock_os_chdir.assert_any_call(webhooks_path)
-    mock_subprocess_run.assert_called_once_with(
-        [webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT)], check=True
-    )
-    mock_os_chdir.assert_any_call(Path.cwd())
+    cache_dir = str(tmp_path.joinpath("cache"))
 
+    first = get_webhook_zip(tmp_path.joinpath("webhooks"), cache_dir=cache_dir)
+    second = get_webhook_zip(tmp_path.joinpath("other"), cache_dir=cache_dir)
 
-def test_copy_webhook_non_dry_run(
-    mock_clone_repository,
-    mock_os_chdir,
-    mock_os_chmod,
-    mock_subprocess_run,
-    mock_os_walk,
-    mock_shutil_copy,
-    temp_directory,
+    assert first == second
+    assert first.name == f"{webhook_cache_key(commit=COMMIT)}.zip"
+    assert first.read_bytes() == b"zip"
+    assert [path.name for path in first.parent.iterdir()] == [first.name]
+    mock_build_webhook.assert_called_once()
+
+
+def test_get_webhook_zip_new_commit(
+    mock_build_webhook, mock_resolve_remote_ref, tmp_path
+):
+    cache_dir = str(tmp_path.joinpath("cache"))
+
+    first = get_webhook_zip(tmp_path.joinpath("webhooks"), cache_dir=cache_dir)
+    mock_resolve_remote_ref.return_value = "f" * 40
+    second = get_webhook_zip(tmp_path.joinpath("other"), cache_dir=cache_dir)
+
+    assert first != second
+    assert mock_build_webhook.call_count == 2
+
+
+def test_get_webhook_zip_unresolved_ref(
+    mock_build_webhook, mock_resolve_remote_ref, tmp_path
 ):
-    # Setup
-    webhooks_path = temp_directory
-    build_path = Path("/fake/build_path")
-    target_environment = "dev"
-    dry_run = False
-
-    mock_os_walk.return_value = [
-        (
-            str(
-                build_path.joinpath(
-                    TERRAGRUNT_RUN_DIRS["webhook"].joinpath(target_environment)
-                )
-            ),
-            [],
-            [],
-        )
-    ]
-
-    # Call the function
-    copy_webhook(webhooks_path, build_path, target_environment, dry_run)
-
-    # Assertions
-    mock_os_chdir.assert_any_call(webhooks_path)
-    mock_os_chmod.assert_called_once_with(
-        webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT), 0o755
+    mock_resolve_remote_ref.return_value = None
+    cache_dir = tmp_path.joinpath("cache")
+
+    webhook_zip = get_webhook_zip(tmp_path.joinpath("webhooks"), cache_dir=cache_dir)
+
+    assert webhook_zip == tmp_path.joinpath("webhooks", WEBHOOK_ZIP)
+    assert not cache_dir.exists()
+
+
+def test_webhook_cache_key_depends_on_build_script():
+    assert webhook_cache_key(commit=COMMIT) != webhook_cache_key(
+        commit=COMMIT, build_script="build.sh"
     )
-    mock_subprocess_run.assert_called_once_with(
-        [webhooks_path.joinpath(WEBHOOK_BUILD_SCRIPT)], check=True
+
+
+def test_build_webhook(mocker, tmp_path):
+    mock_clone = mocker.patch.object(functions, "clone_repository")
+    mock_chmod = mocker.patch.object(functions.os, "chmod")
+    mock_run = mocker.patch.object(functions, "run_command")
+
+    webhook_zip = build_webhook(tmp_path)
+
+    mock_clone.assert_called_once()
+    mock_chmod.assert_called_once_with(tmp_path.joinpath(WEBHOOK_BUILD_SCRIPT), 0o755)
+    mock_run.assert_called_once_with(
+        [tmp_path.joinpath(WEBHOOK_BUILD_SCRIPT)], cwd=tmp_path
     )
-    mock_os_chdir.assert_any_call(Path.cwd())
+    assert webhook_zip == tmp_path.joinpath(WEBHOOK_ZIP)
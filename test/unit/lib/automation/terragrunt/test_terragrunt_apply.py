@@ -7,7 +7,7 @@ from launch.lib.automation.terragrunt.functions import terragrunt_apply
 
 
 @pytest.fixture(scope="function")
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_apply_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_apply(
@@ -23,11 +23,11 @@ def test_terragrunt_apply_run_all(mock_run):
             "-auto-approve",
             "--terragrunt-non-interactive",
         ],
-        check=True,
+        cwd=None,
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_apply_no_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_apply(
@@ -37,11 +37,11 @@ def test_terragrunt_apply_no_run_all(mock_run):
     )
     mock_run.assert_called_once_with(
         ["terragrunt", "apply", "-auto-approve", "--terragrunt-non-interactive"],
-        check=True,
+        cwd=None,
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_apply_with_file(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_apply(
@@ -58,11 +58,11 @@ def test_terragrunt_apply_with_file(mock_run):
             "-var-file",
             "vars.tfvars",
         ],
-        check=True,
+        cwd=None,
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_apply_exception(mock_run):
     mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
     with pytest.raises(RuntimeError):
@@ -7,7 +7,7 @@ from launch.lib.automation.terragrunt.functions import terragrunt_destroy
 
 
 @pytest.fixture(scope="function")
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_destroy_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_destroy(
@@ -23,11 +23,11 @@ def test_terragrunt_destroy_run_all(mock_run):
             "-auto-approve",
             "--terragrunt-non-interactive",
         ],
-        check=True,
+        cwd=None,
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_destroy_no_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_destroy(
@@ -37,11 +37,11 @@ def test_terragrunt_destroy_no_run_all(mock_run):
     )
     mock_run.assert_called_once_with(
         ["terragrunt", "destroy", "-auto-approve", "--terragrunt-non-interactive"],
-        check=True,
+        cwd=None,
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_destroy_with_file(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_destroy(
@@ -58,11 +58,11 @@ def test_terragrunt_destroy_with_file(mock_run):
             "-var-file",
             "vars.tfvars",
         ],
-        check=True,
+        cwd=None,
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_destroy_exception(mock_run):
     mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
     with pytest.raises(RuntimeError):
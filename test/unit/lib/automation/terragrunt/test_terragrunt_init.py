@@ -7,25 +7,25 @@ from launch.lib.automation.terragrunt.functions import terragrunt_init
 
 
 @pytest.fixture(scope="function")
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_init_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_init(run_all=True, dry_run=False)
     mock_run.assert_called_once_with(
-        ["terragrunt", "run_all", "init", "--terragrunt-non-interactive"], check=True
+        ["terragrunt", "run_all", "init", "--terragrunt-non-interactive"], cwd=None
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_init_no_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_init(run_all=False, dry_run=False)
     mock_run.assert_called_once_with(
-        ["terragrunt", "init", "--terragrunt-non-interactive"], check=True
+        ["terragrunt", "init", "--terragrunt-non-interactive"], cwd=None
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_init_exception(mock_run):
     mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
     with pytest.raises(RuntimeError):
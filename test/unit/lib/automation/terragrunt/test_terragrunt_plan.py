@@ -7,7 +7,7 @@ from launch.lib.automation.terragrunt.functions import terragrunt_plan
 
 
 @pytest.fixture(scope="function")
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_plan_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_plan(
@@ -15,10 +15,10 @@ def test_terragrunt_plan_run_all(mock_run):
         run_all=False,
         dry_run=False,
     )
-    mock_run.assert_called_once_with(["terragrunt", "run_all", "plan"], check=True)
+    mock_run.assert_called_once_with(["terragrunt", "run_all", "plan"], cwd=None)
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_plan_no_run_all(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_plan(
@@ -26,10 +26,10 @@ def test_terragrunt_plan_no_run_all(mock_run):
         run_all=False,
         dry_run=False,
     )
-    mock_run.assert_called_once_with(["terragrunt", "plan"], check=True)
+    mock_run.assert_called_once_with(["terragrunt", "plan"], cwd=None)
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_plan_with_file(mock_run):
     mock_run.return_value = MagicMock()
     terragrunt_plan(
@@ -38,11 +38,11 @@ def test_terragrunt_plan_with_file(mock_run):
         dry_run=False,
     )
     mock_run.assert_called_once_with(
-        ["terragrunt", "plan", "-out", "plan.out"], check=True
+        ["terragrunt", "plan", "-out", "plan.out"], cwd=None
     )
 
 
-@patch("subprocess.run")
+@patch("launch.lib.automation.terragrunt.functions.run_command")
 def test_terragrunt_plan_exception(mock_run):
     mock_run.side_effect = subprocess.CalledProcessError(1, "cmd")
     with pytest.raises(RuntimeError):
@@ -0,0 +1,18 @@
+from launch.lib.common.utilities import format_table
+
+
+def test_format_table_pads_columns():
+    table = format_table(
+        headers=["NAME", "RESULT"],
+        rows=[["service-a", "ok"], ["b", "failed"]],
+    )
+    assert table.splitlines() == [
+        "NAME       RESULT",
+        "---------  ------",
+        "service-a  ok",
+        "b          failed",
+    ]
+
+
+def test_format_table_no_rows():
+    assert format_table(headers=["A", "B"], rows=[]).splitlines() == ["A  B", "-  -"]
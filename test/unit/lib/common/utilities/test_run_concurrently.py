@@ -0,0 +1,68 @@
+import threading
+
+from launch.lib.common.utilities.concurrency import run_concurrently, run_in_order
+
+
+def test_run_concurrently_preserves_order():
+    results = run_concurrently(
+        tasks={str(i): (lambda i=i: i * 2) for i in range(10)}, max_workers=4
+    )
+    assert [result.name for result in results] == [str(i) for i in range(10)]
+    assert [result.value for result in results] == [i * 2 for i in range(10)]
+    assert all(result.succeeded for result in results)
+
+
+def test_run_concurrently_captures_failures():
+    def failing_task():
+        raise RuntimeError("boom")
+
+    results = run_concurrently(
+        tasks={"good": lambda: "ok", "bad": failing_task}, max_workers=2
+    )
+    assert results[0].succeeded
+    assert results[0].value == "ok"
+    assert not results[1].succeeded
+    assert results[1].detail == "boom"
+
+
+def test_run_concurrently_bounds_workers():
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    barrier = threading.Event()
+
+    def task():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        barrier.wait(timeout=0.05)
+        with lock:
+            running -= 1
+
+    run_concurrently(tasks={str(i): task for i in range(8)}, max_workers=3)
+    assert peak <= 3
+
+
+def test_run_concurrently_no_tasks():
+    assert run_concurrently(tasks={}) == []
+
+
+def test_run_in_order_skips_after_failure():
+    calls = []
+
+    def fail():
+        calls.append("fail")
+        raise RuntimeError("boom")
+
+    results = run_in_order(
+        {
+            "first": lambda: calls.append("first"),
+            "second": fail,
+            "third": lambda: calls.append("third"),
+        }
+    )
+
+    assert calls == ["first", "fail"]
+    assert [r.succeeded for r in results] == [True, False, False]
+    assert results[2].detail == "skipped, second did not succeed"
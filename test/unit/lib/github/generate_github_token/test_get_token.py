@@ -1,9 +1,10 @@
+import base64
 from unittest.mock import MagicMock, patch, mock_open
 
 import pytest
 from botocore.exceptions import ClientError
 
-from launch.lib.github.generate_github_token import get_secret_value, get_token, get_token_with_file, get_token_with_secret_name
+from launch.lib.github.generate_github_token import get_installation_token, get_secret_value, get_token, get_token_with_file, get_token_with_secret_name
 
 
 @pytest.fixture
@@ -40,6 +41,35 @@ def test_get_token_success(mock_dependencies):
     mock_dependencies["post"].assert_called_once()
 
 
+def test_get_installation_token_reported_expiry(mock_dependencies):
+    mock_dependencies["post"].return_value.json.return_value = {
+        "token": "test_token",
+        "expires_at": "2099-01-01T00:00:00Z",
+    }
+
+    token = get_installation_token(
+        application_id="application_id",
+        installation_id="installation_id",
+        private_key="private_key", # pragma: allowlist secret
+        token_expiration_seconds=60,
+    )
+
+    assert token.token == "test_token"
+    assert token.expires_at == 4070908800
+
+
+def test_get_installation_token_default_expiry(mock_dependencies):
+    with patch("launch.lib.github.generate_github_token.time.time", return_value=1000):
+        token = get_installation_token(
+            application_id="application_id",
+            installation_id="installation_id",
+            private_key="private_key", # pragma: allowlist secret
+            token_expiration_seconds=60,
+        )
+
+    assert token.expires_at == 1000 + 3600
+
+
 def test_get_token_failure(mock_dependencies):
     with pytest.raises(ClientError):
         mock_dependencies["create_jwt"].side_effect = ClientError(
@@ -56,20 +86,14 @@ def test_get_token_failure(mock_dependencies):
 
 @pytest.fixture
 def mock_secret_value():
-    # Mock the Session object itself
-    with patch("launch.lib.github.generate_github_token.Session") as mock_session:
-        mock_session_instance = MagicMock()
-        mock_session.return_value = mock_session_instance
-
-        with patch(
-            "launch.lib.github.generate_github_token.Session.client"
-        ) as mock_client:
-            mock_client.return_value.get_secret_value.return_value = {
-                "SecretString": "secret_value"  # pragma: allowlist secret
-            }
-            mock_session_instance.client = mock_client
+    with patch(
+        "launch.lib.github.generate_github_token.get_client"
+    ) as mock_client:
+        mock_client.return_value.get_secret_value.return_value = {
+            "SecretString": "secret_value"  # pragma: allowlist secret
+        }
 
-            yield mock_client
+        yield mock_client
 
 
 def test_get_secret_value_success(mock_secret_value):
@@ -82,6 +106,14 @@ def test_get_secret_value_success(mock_secret_value):
     mock_secret_value.assert_called_once_with("secretsmanager")
 
 
+def test_get_secret_value_binary(mock_secret_value):
+    mock_secret_value.return_value.get_secret_value.return_value = {
+        "SecretBinary": base64.b64encode(b"secret_value")  # pragma: allowlist secret
+    }
+
+    assert get_secret_value("secret_name") == "secret_value"  # pragma: allowlist secret
+
+
 def test_get_secret_value_exception(mock_secret_value):
     mock_secret_value.return_value.get_secret_value.side_effect = ClientError(
         {"Error": {"Code": "TestException"}}, "test_operation"
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from launch.lib.github.repo import select_repositories
+
+
+def make_repo(name: str, topics: list[str] = None) -> MagicMock:
+    repo = MagicMock()
+    repo.name = name
+    repo.topics = topics or []
+    return repo
+
+
+@pytest.fixture
+def github_with_org():
+    g = MagicMock()
+    org = MagicMock()
+    g.get_organization.return_value = org
+    org.get_repos.return_value = [
+        make_repo("svc-alpha", ["service"]),
+        make_repo("svc-beta"),
+        make_repo("tf-module", ["service"]),
+    ]
+    org.get_repo.side_effect = lambda name: make_repo(name)
+    return g, org
+
+
+def test_select_repositories_by_name_does_not_list(github_with_org):
+    g, org = github_with_org
+    selected = select_repositories(g, "org", names=["one", "two", "one"])
+    assert [r.name for r in selected] == ["one", "two"]
+    org.get_repos.assert_not_called()
+
+
+def test_select_repositories_by_pattern(github_with_org):
+    g, _ = github_with_org
+    selected = select_repositories(g, "org", patterns=["svc-*"])
+    assert [r.name for r in selected] == ["svc-alpha", "svc-beta"]
+
+
+def test_select_repositories_by_topic(github_with_org):
+    g, _ = github_with_org
+    selected = select_repositories(g, "org", topic="service")
+    assert [r.name for r in selected] == ["svc-alpha", "tf-module"]
+
+
+def test_select_repositories_pattern_and_topic(github_with_org):
+    g, _ = github_with_org
+    selected = select_repositories(g, "org", patterns=["svc-*"], topic="service")
+    assert [r.name for r in selected] == ["svc-alpha"]
+
+
+def test_select_repositories_names_and_pattern_deduplicate(github_with_org):
+    g, _ = github_with_org
+    selected = select_repositories(g, "org", names=["svc-beta"], patterns=["svc-*"])
+    assert [r.name for r in selected] == ["svc-beta", "svc-alpha"]
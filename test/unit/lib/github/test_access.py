@@ -1,5 +1,7 @@
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack as does_not_raise
 
 import pytest
@@ -167,3 +169,136 @@ def test_select_administrative_team(repo_name, expected_slug, raises, mocker):
         )
         organization.get_team_by_slug.assert_called_with(expected_slug)
         assert result is not None
+
+
+def test_select_administrative_team_uses_cache(mocker):
+    organization = mocker.MagicMock()
+    team_cache = {}
+    for name in ["tf-aws-module-one", "tf-aws-module-two"]:
+        repository = mocker.MagicMock()
+        repository.name = name
+        access.select_administrative_team(
+            repository=repository, organization=organization, team_cache=team_cache
+        )
+    organization.get_team_by_slug.assert_called_once()
+    assert len(team_cache) == 1
+
+
+def test_select_administrative_team_cache_shared_by_threads(mocker):
+    organization = mocker.MagicMock()
+
+    def slow_lookup(team_slug):
+        time.sleep(0.05)
+        return mocker.MagicMock(name=team_slug)
+
+    organization.get_team_by_slug.side_effect = slow_lookup
+    team_cache = {}
+    repositories = []
+    for index in range(8):
+        repository = mocker.MagicMock()
+        repository.name = f"tf-aws-module-{index}"
+        repositories.append(repository)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        teams = list(
+            executor.map(
+                lambda repository: access.select_administrative_team(
+                    repository=repository,
+                    organization=organization,
+                    team_cache=team_cache,
+                ),
+                repositories,
+            )
+        )
+
+    organization.get_team_by_slug.assert_called_once()
+    assert len({id(team) for team in teams}) == 1
+
+
+def test_apply_default_access(mocker):
+    grant_maintain = mocker.patch.object(access, "grant_maintain")
+    grant_admin = mocker.patch.object(access, "grant_admin")
+    protect = mocker.patch.object(access, "configure_default_branch_protection")
+    organization = mocker.MagicMock()
+    repository = mocker.MagicMock()
+    repository.name = "tf-aws-module-one"
+
+    access.apply_default_access(
+        repository=repository,
+        organization=organization,
+        platform_team=mocker.MagicMock(),
+        platform_admin_team=mocker.MagicMock(),
+        dry_run=False,
+    )
+    grant_maintain.assert_called_once()
+    assert grant_admin.call_count == 2
+    protect.assert_called_once_with(repository=repository, dry_run=False)
+
+
+def test_apply_default_access_without_matching_team(mocker, capsys):
+    mocker.patch.object(access, "grant_maintain")
+    grant_admin = mocker.patch.object(access, "grant_admin")
+    mocker.patch.object(access, "configure_default_branch_protection")
+    repository = mocker.MagicMock()
+    repository.name = "unmatched-repository"
+
+    access.apply_default_access(
+        repository=repository,
+        organization=mocker.MagicMock(),
+        platform_team=mocker.MagicMock(),
+        platform_admin_team=mocker.MagicMock(),
+        dry_run=False,
+    )
+    grant_admin.assert_called_once()
+    assert (
+        "Couldn't match a domain-specific administrative team to unmatched-repository"
+        in capsys.readouterr().out
+    )
+
+
+def test_apply_default_access_many(mocker):
+    apply_default_access = mocker.patch.object(access, "apply_default_access")
+    g = mocker.MagicMock()
+    g.requester.rate_limiting = (5000, 5000)
+    g.requester.rate_limiting_resettime = 0
+    organization = g.get_organization.return_value
+    repositories = []
+    for name in ["tf-one", "tf-two", "caf-one", "unmatched", "broken"]:
+        repository = mocker.MagicMock()
+        repository.name = name
+        repositories.append(repository)
+
+    def apply(repository, **kwargs):
+        if repository.name == "broken":
+            raise RuntimeError("failed")
+
+    apply_default_access.side_effect = apply
+    bucket = mocker.MagicMock()
+
+    results = access.apply_default_access_many(
+        g=g,
+        organization="org",
+        repositories=repositories,
+        platform_team_slug="platform",
+        platform_admin_team_slug="admins",
+        bucket=bucket,
+        max_workers=3,
+        dry_run=False,
+    )
+
+    assert [result.name for result in results] == [
+        "tf-one",
+        "tf-two",
+        "caf-one",
+        "unmatched",
+        "broken",
+    ]
+    assert [result.succeeded for result in results] == [True] * 4 + [False]
+    assert sorted(
+        call.args[0] for call in organization.get_team_by_slug.call_args_list
+    ) == ["admins", "caf-administrators", "platform", "terraform-administrators"]
+    assert apply_default_access.call_count == 5
+    team_cache = apply_default_access.call_args.kwargs["team_cache"]
+    assert set(team_cache) == {"terraform-administrators", "caf-administrators"}
+    assert bucket.acquire.call_count == 5
+    assert bucket.observe.call_count == 5
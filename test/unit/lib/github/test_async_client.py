@@ -0,0 +1,157 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from github.GithubException import GithubException
+
+from launch.lib.github.async_client import (
+    AsyncGithub,
+    gather_limited,
+    get_repositories,
+    iter_repo_tag_names,
+)
+
+TAG_PAGES = 3
+
+
+class GitHubStandIn(BaseHTTPRequestHandler):
+    """Serves just enough of the GitHub REST API for the client: repositories and paginated tags."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    paths: list[str] = []
+    delay = 0.0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.paths.append(self.path)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(cls.delay)
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            parts = url.path.strip("/").split("/")
+            if parts[-1] == "tags":
+                page = int(query.get("page", ["1"])[0])
+                per_page = int(query["per_page"][0])
+                headers = {}
+                if page < TAG_PAGES:
+                    headers["Link"] = (
+                        f'<http://{self.headers["Host"]}{url.path}?per_page={per_page}&page={page + 1}>; rel="next"'
+                    )
+                tags = [{"name": f"{page}.{index}.0"} for index in range(per_page)]
+                self.respond(200, tags, headers)
+            elif parts[-1] == "missing":
+                self.respond(404, {"message": "Not Found"})
+            else:
+                self.respond(200, {"name": parts[-1]})
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def respond(self, status, data, headers=None):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    GitHubStandIn.paths = []
+    GitHubStandIn.max_in_flight = 0
+    GitHubStandIn.delay = 0.0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), GitHubStandIn)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_requests_are_bounded_by_max_connections(base_url):
+    GitHubStandIn.delay = 0.1
+
+    async def main():
+        async with AsyncGithub(base_url=base_url, max_connections=4) as client:
+            return await get_repositories(
+                client, "org", [f"repo-{index}" for index in range(12)] + ["missing"]
+            )
+
+    repositories = asyncio.run(main())
+
+    assert list(repositories) == [f"repo-{index}" for index in range(12)]
+    assert GitHubStandIn.max_in_flight == 4
+
+
+def test_paginate_streams_every_page(base_url):
+    async def main():
+        async with AsyncGithub(base_url=base_url) as client:
+            return [name async for name in iter_repo_tag_names(client, "org/repo")]
+
+    names = asyncio.run(main())
+
+    assert len(names) == TAG_PAGES * 100
+    assert names[0] == "1.0.0"
+    assert names[-1] == f"{TAG_PAGES}.99.0"
+
+
+def test_paginate_stops_with_the_consumer(base_url):
+    GitHubStandIn.delay = 0.05
+
+    async def main():
+        async with AsyncGithub(base_url=base_url) as client:
+            async for tag in client.paginate(
+                "repos/org/repo/tags", per_page=2, prefetch=1
+            ):
+                return tag
+
+    assert asyncio.run(main()) == {"name": "1.0.0"}
+    time.sleep(0.2)
+    assert len(GitHubStandIn.paths) < TAG_PAGES
+
+
+def test_error_raises_github_exception(base_url):
+    async def main():
+        async with AsyncGithub(base_url=base_url) as client:
+            await client.get("repos/org/missing")
+
+    with pytest.raises(GithubException) as e:
+        asyncio.run(main())
+    assert e.value.status == 404
+
+
+def test_gather_limited():
+    running = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if item == 3:
+            raise ValueError(item)
+        return item * 2
+
+    results = asyncio.run(gather_limited(work, range(6), limit=2))
+
+    assert results[:3] == [0, 2, 4]
+    assert isinstance(results[3], ValueError)
+    assert results[4:] == [8, 10]
+    assert peak == 2
@@ -0,0 +1,185 @@
+import pytest
+
+from launch.lib.github import audit
+from launch.lib.github.access import ADMIN_PERMISSIONS, MAINTAIN_PERMISSIONS
+from launch.lib.github.audit import (
+    BRANCH_PROTECTION_RULE_FIELDS,
+    EXPECTED_BRANCH_PROTECTIONS,
+    audit_repositories,
+    audit_repository,
+    expected_team_permissions,
+    permission_level,
+)
+
+COMPLIANT_RULE = {
+    BRANCH_PROTECTION_RULE_FIELDS[protection]: value
+    for protection, value in EXPECTED_BRANCH_PROTECTIONS.items()
+}
+
+
+def repository(name, topics=(), labels=True, rule=COMPLIANT_RULE, branch="main"):
+    return {
+        "name": name,
+        "isArchived": False,
+        "repositoryTopics": {"nodes": [{"topic": {"name": topic}} for topic in topics]},
+        "label0": {"name": "dependencies"} if labels else None,
+        "label1": {"name": "breaking"},
+        "defaultBranchRef": {"name": branch, "branchProtectionRule": rule},
+    }
+
+
+def page(connection, nodes, has_next_page=False, key="nodes"):
+    return (
+        {},
+        {
+            "data": {
+                "organization": {
+                    connection: {
+                        "pageInfo": {
+                            "hasNextPage": has_next_page,
+                            "endCursor": "cursor" if has_next_page else None,
+                        },
+                        key: nodes,
+                    }
+                }
+            }
+        },
+    )
+
+
+def team_page(edges):
+    _, response = page("repositories", edges, key="edges")
+    return {}, {"data": {"organization": {"team": response["data"]["organization"]}}}
+
+
+@pytest.fixture
+def g(mocker):
+    return mocker.MagicMock()
+
+
+def test_permission_level():
+    assert permission_level(MAINTAIN_PERMISSIONS) == "MAINTAIN"
+    assert permission_level(ADMIN_PERMISSIONS) == "ADMIN"
+    assert permission_level({}) == ""
+
+
+def test_expected_team_permissions():
+    assert expected_team_permissions("tf-module", "platform", "admins") == {
+        "platform": "MAINTAIN",
+        "admins": "ADMIN",
+        "terraform-administrators": "ADMIN",
+    }
+    assert expected_team_permissions("svc", "platform", "admins") == {
+        "platform": "MAINTAIN",
+        "admins": "ADMIN",
+    }
+
+
+def test_audit_repository_compliant():
+    result = audit_repository(
+        repository=repository("svc"),
+        team_permissions={"platform": {"svc": "MAINTAIN"}},
+        expected_permissions={"platform": "MAINTAIN"},
+    )
+
+    assert result.compliant
+
+
+def test_audit_repository_drift():
+    result = audit_repository(
+        repository=repository(
+            "svc",
+            labels=False,
+            rule={**COMPLIANT_RULE, "requiredApprovingReviewCount": 1},
+            branch="master",
+        ),
+        team_permissions={"platform": {"svc": "WRITE"}, "admins": {}, "missing": None},
+        expected_permissions={
+            "platform": "MAINTAIN",
+            "admins": "ADMIN",
+            "missing": "ADMIN",
+        },
+    )
+
+    assert result.drift == [
+        "missing label dependencies",
+        "team platform has WRITE permission, expected MAINTAIN",
+        "team admins has no permission, expected ADMIN",
+        "team missing not found",
+        "default branch is master, expected main",
+        "required_approving_review_count is 1, expected 2",
+    ]
+
+
+def test_audit_repository_unprotected():
+    result = audit_repository(
+        repository=repository("svc", rule=None),
+        team_permissions={},
+        expected_permissions={},
+    )
+
+    assert result.drift == ["default branch main is not protected"]
+
+
+def test_audit_repositories_batches_requests(g):
+    g.requester.graphql_query.side_effect = [
+        page("repositories", [repository("tf-a"), repository("svc-b")], True),
+        page("repositories", [repository("other", topics=["service"])]),
+        team_page([{"permission": "ADMIN", "node": {"name": "svc-b"}}]),
+        team_page([{"permission": "MAINTAIN", "node": {"name": "svc-b"}}]),
+        ({}, {"data": {"organization": {"team": None}}}),
+    ]
+
+    results = audit_repositories(
+        g=g,
+        organization="org",
+        patterns=["svc-*", "tf-*"],
+        platform_team="platform",
+        platform_admin_team="admins",
+    )
+
+    assert [result.name for result in results] == ["tf-a", "svc-b"]
+    assert results[1].compliant
+    assert "team terraform-administrators not found" in results[0].drift
+    assert g.requester.graphql_query.call_count == 5
+    second_page = g.requester.graphql_query.call_args_list[1].kwargs
+    assert second_page["variables"]["after"] == "cursor"
+    assert [
+        call.kwargs["variables"]["slug"]
+        for call in g.requester.graphql_query.call_args_list[2:]
+    ] == ["admins", "platform", "terraform-administrators"]
+
+
+@pytest.mark.parametrize(
+    "filters, selected",
+    [
+        ({}, ["a", "svc-b", "svc-c"]),
+        ({"names": ["a"]}, ["a"]),
+        ({"names": ["a"], "topic": "service"}, ["a", "svc-c"]),
+        ({"patterns": ["svc-*"], "topic": "service"}, ["svc-c"]),
+    ],
+)
+def test_fetch_repositories_filters(g, filters, selected):
+    archived = {**repository("svc-archived"), "isArchived": True}
+    g.requester.graphql_query.return_value = page(
+        "repositories",
+        [
+            repository("a"),
+            repository("svc-b"),
+            repository("svc-c", topics=["service"]),
+            archived,
+        ],
+    )
+
+    assert [
+        repository["name"]
+        for repository in audit.fetch_repositories(g=g, organization="org", **filters)
+    ] == selected
+
+
+def test_repositories_query_looks_up_labels_by_name():
+    query = audit.repositories_query(
+        [audit.CustomLabel(name='say "hi"', color="", description="")]
+    )
+
+    assert 'label0: label(name: "say \\"hi\\"") { name }' in query
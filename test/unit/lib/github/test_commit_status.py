@@ -1,11 +1,18 @@
+import asyncio
+import json
+
 import pytest
 from faker import Faker
 from github.CommitStatus import CommitStatus
 
 from launch.lib.github.commit_status import (
+    CommitStatusEntry,
     CommitStatusState,
     CommitStatusUpdatePayload,
     get_commit_status,
+    group_commit_status_entries,
+    post_commit_statuses,
+    read_commit_status_entries,
     set_commit_status,
 )
 
@@ -140,3 +147,122 @@ def test_set_commit_status(mocker, mocked_github, repo_and_commit_attributes):
         description=payload.description,
         context=payload.context,
     )
+
+
+def status_line(commit="a" * 40, context="unit", state="success", **extra):
+    return json.dumps({"commit": commit, "context": context, "state": state, **extra})
+
+
+def entry(commit="a" * 40, context="unit", state="success", repo_name="repo"):
+    return CommitStatusEntry(
+        repo_name=repo_name,
+        commit_sha=commit,
+        payload=CommitStatusUpdatePayload(
+            state=CommitStatusState(state),
+            target_url="",
+            description="",
+            context=context,
+        ),
+    )
+
+
+def test_read_commit_status_entries():
+    entries = list(
+        read_commit_status_entries(
+            [
+                status_line(state="PENDING", target_url="https://ci/1"),
+                "\n",
+                status_line(repository="other", description="done"),
+            ],
+            repo_name="repo",
+        )
+    )
+
+    assert entries[0] == CommitStatusEntry(
+        repo_name="repo",
+        commit_sha="a" * 40,
+        payload=CommitStatusUpdatePayload(
+            state=CommitStatusState.pending,
+            target_url="https://ci/1",
+            description="",
+            context="unit",
+        ),
+    )
+    assert entries[1].repo_name == "other"
+    assert entries[1].payload.description == "done"
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ("not json", "line 1"),
+        (status_line(state="unknown"), "line 1"),
+        (json.dumps({"state": "success"}), "line 1"),
+    ],
+)
+def test_read_commit_status_entries_invalid(line, message):
+    with pytest.raises(ValueError, match=message):
+        list(read_commit_status_entries([line], repo_name="repo"))
+
+
+def test_read_commit_status_entries_without_repository():
+    with pytest.raises(ValueError, match="no repository"):
+        list(read_commit_status_entries([status_line()]))
+
+
+def test_group_commit_status_entries_drops_consecutive_duplicates():
+    groups = group_commit_status_entries(
+        [
+            entry(state="pending"),
+            entry(context="lint", state="pending"),
+            entry(state="pending"),
+            entry(state="success"),
+            entry(state="pending"),
+        ]
+    )
+
+    assert [[str(e.payload.state) for e in group] for group in groups.values()] == [
+        ["pending", "success", "pending"],
+        ["pending"],
+    ]
+
+
+class FakeAsyncGithub:
+    def __init__(self, fail_context=None):
+        self.posts = []
+        self.fail_context = fail_context
+
+    async def post(self, path, json=None):
+        await asyncio.sleep(0)
+        if json["context"] == self.fail_context:
+            raise RuntimeError("rejected")
+        self.posts.append((path, json))
+
+
+def test_post_commit_statuses_orders_each_context():
+    client = FakeAsyncGithub(fail_context="lint")
+
+    results = asyncio.run(
+        post_commit_statuses(
+            client=client,
+            repo_org="org",
+            entries=[
+                entry(state="pending"),
+                entry(context="lint", state="pending"),
+                entry(commit="b" * 40, state="success"),
+                entry(state="success"),
+            ],
+        )
+    )
+
+    assert [(result.name, result.succeeded, result.value) for result in results] == [
+        (f"repo@{'a' * 12} unit", True, "success"),
+        (f"repo@{'a' * 12} lint", False, None),
+        (f"repo@{'b' * 12} unit", True, "success"),
+    ]
+    unit_posts = [
+        json["state"]
+        for path, json in client.posts
+        if path == f"repos/org/repo/statuses/{'a' * 40}"
+    ]
+    assert unit_posts == ["pending", "success"]
@@ -0,0 +1,137 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from github import Auth, Github
+
+from launch.lib.github import auth
+from launch.lib.github.http_cache import (
+    CachedResponse,
+    HttpCache,
+    install_http_cache,
+    uninstall_http_cache,
+)
+
+REPOSITORY = {
+    "id": 1,
+    "name": "repo",
+    "full_name": "org/repo",
+    "url": "/repos/org/repo",
+}
+
+
+class GitHubHandler(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    requests: list[dict] = []
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("X-RateLimit-Limit", "5000")
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.end_headers()
+            return
+        body = json.dumps(REPOSITORY).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", "4998")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    GitHubHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), GitHubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    yield install_http_cache(path=tmp_path.joinpath("github.sqlite3"), max_bytes=1024)
+    uninstall_http_cache()
+
+
+def github(base_url: str, token: str = "ghp_test_value") -> Github:
+    return Github(base_url=base_url, auth=Auth.Token(token))
+
+
+def test_unchanged_response_is_revalidated(server, http_cache):
+    g = github(server)
+
+    assert g.get_repo("org/repo").full_name == "org/repo"
+    assert g.get_repo("org/repo").full_name == "org/repo"
+
+    assert "If-None-Match" not in GitHubHandler.requests[0]
+    assert GitHubHandler.requests[1]["If-None-Match"] == '"v1"'
+    assert g.rate_limiting[0] == 4999
+
+
+def test_cache_is_shared_by_instances(server, http_cache):
+    github(server).get_repo("org/repo")
+    github(server).get_repo("org/repo")
+
+    assert GitHubHandler.requests[1]["If-None-Match"] == '"v1"'
+
+
+def test_cache_is_keyed_by_token(server, http_cache):
+    github(server).get_repo("org/repo")
+    github(server, token="ghp_other_value").get_repo("org/repo")
+
+    assert "If-None-Match" not in GitHubHandler.requests[1]
+
+
+def test_install_is_idempotent(http_cache, tmp_path):
+    assert install_http_cache(path=tmp_path.joinpath("other.sqlite3")) is http_cache
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    cache = HttpCache(path=tmp_path.joinpath("github.sqlite3"), max_bytes=10)
+
+    def response(url, body=b"12345"):
+        return CachedResponse(
+            url=url, etag='"v1"', last_modified=None, headers={}, body=body
+        )
+
+    cache.store("a", response("a"))
+    cache.store("b", response("b"))
+    cache.lookup("a")
+    cache.store("c", response("c"))
+    cache.store("too-large", response("too-large", body=b"x" * 11))
+
+    assert cache.lookup("a") is not None
+    assert cache.lookup("b") is None
+    assert cache.lookup("c") is not None
+    assert cache.lookup("too-large") is None
+    cache.close()
+
+
+def test_get_github_instance_installs_cache(mocker):
+    mocker.patch.object(auth, "GITHUB_HTTP_CACHE", True)
+    install_http_cache = mocker.patch("launch.lib.github.http_cache.install_http_cache")
+
+    auth.get_github_instance()
+
+    install_http_cache.assert_called_once_with()
+
+
+def test_get_github_instance_without_cache(mocker):
+    mocker.patch.object(auth, "GITHUB_HTTP_CACHE", False)
+    install_http_cache = mocker.patch("launch.lib.github.http_cache.install_http_cache")
+
+    auth.get_anonymous_github_instance()
+
+    install_http_cache.assert_not_called()
@@ -9,6 +9,7 @@ from launch.lib.github.labels import (
     CUSTOM_LABELS,
     ChangeType,
     create_custom_labels,
+    create_custom_labels_many,
     get_label_for_change_type,
     has_custom_labels,
 )
@@ -95,3 +96,26 @@ class TestGetLabelForChangeType:
     ):
         get_label_for_change_type(repository=mocked_repository, change_type=change_type)
         mocked_repository.get_label.assert_has_calls([mocker.call(name=label_name)])
+
+
+def test_create_custom_labels_many(mocker):
+    g = mocker.MagicMock()
+    g.requester.rate_limiting = (-1, -1)
+    repositories = []
+    for name in ["one", "two"]:
+        repository = mocker.MagicMock()
+        repository.name = name
+        repositories.append(repository)
+    bucket = mocker.MagicMock()
+
+    results = create_custom_labels_many(
+        g=g, repositories=repositories, bucket=bucket, max_workers=2
+    )
+
+    assert [(result.name, result.value) for result in results] == [
+        ("one", len(CUSTOM_LABELS)),
+        ("two", len(CUSTOM_LABELS)),
+    ]
+    bucket.acquire.assert_called_with(tokens=len(CUSTOM_LABELS))
+    for repository in repositories:
+        assert repository.create_label.call_count == len(CUSTOM_LABELS)
@@ -0,0 +1,96 @@
+import pytest
+
+from launch.lib.github.rate_limit import TokenBucket, observe_rate_limit, throttled
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_acquire_within_capacity(clock):
+    bucket = TokenBucket(rate=2, capacity=4, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(4) == 0
+    assert clock.now == 0
+
+
+def test_acquire_waits_for_tokens(clock):
+    bucket = TokenBucket(rate=2, capacity=4, clock=clock, sleep=clock.sleep)
+    bucket.acquire(4)
+
+    assert bucket.acquire(3) == pytest.approx(1.5)
+    assert clock.now == pytest.approx(1.5)
+
+
+def test_acquire_more_than_capacity_is_paced_at_rate(clock):
+    bucket = TokenBucket(rate=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(10):
+        bucket.acquire(12)
+
+    # Only the first 2 of the 120 tokens were in the bucket.
+    assert clock.now == pytest.approx(59)
+
+
+def test_acquire_queues_behind_debt(clock):
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=lambda seconds: None)
+
+    assert bucket.acquire(5) == pytest.approx(3)
+    assert bucket.acquire(1) == pytest.approx(4)
+
+
+def test_observe_spreads_remaining_until_reset(clock):
+    bucket = TokenBucket(rate=10, clock=clock, sleep=clock.sleep)
+
+    bucket.observe(remaining=100, reset_at=1100, now=1000)
+    assert bucket.rate == pytest.approx(1)
+
+    bucket.observe(remaining=5000, reset_at=1100, now=1000)
+    assert bucket.rate == 10
+
+
+def test_observe_exhausted_waits_for_reset(clock):
+    bucket = TokenBucket(rate=10, clock=clock, sleep=clock.sleep)
+
+    bucket.observe(remaining=0, reset_at=1060, now=1000)
+
+    assert bucket.acquire() == pytest.approx(60)
+
+
+def test_observe_rate_limit(mocker):
+    bucket = mocker.MagicMock()
+    g = mocker.MagicMock()
+    g.requester.rate_limiting = (-1, -1)
+
+    observe_rate_limit(bucket=bucket, g=g)
+    bucket.observe.assert_not_called()
+
+    g.requester.rate_limiting = (10, 5000)
+    g.requester.rate_limiting_resettime = 1234
+    observe_rate_limit(bucket=bucket, g=g)
+    bucket.observe.assert_called_once_with(remaining=10, reset_at=1234)
+
+
+def test_throttled(mocker):
+    bucket = mocker.MagicMock()
+    g = mocker.MagicMock()
+    g.requester.rate_limiting = (10, 5000)
+    task = mocker.MagicMock(side_effect=RuntimeError("failed"))
+
+    with pytest.raises(RuntimeError):
+        throttled(task=task, g=g, bucket=bucket, cost=3)()
+
+    bucket.acquire.assert_called_once_with(tokens=3)
+    bucket.observe.assert_called_once()
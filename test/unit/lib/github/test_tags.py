@@ -57,3 +57,51 @@ def test_get_repo_semantic_versions_drops_non_semantic(mocked_tags, caplog, mock
             in caplog.text
         )
         assert all([r in expected_tags for r in returned_tags])
+
+
+def test_iter_repo_semantic_versions_stops_reading_tags(mocked_tags, mocker):
+    remaining_tags = iter(mocked_tags)
+
+    mocked_repo = mocker.MagicMock()
+    mocked_repo.name = "mocked_repo"
+    mocked_repo.get_tags.return_value = remaining_tags
+
+    returned_versions = list(
+        tags.iter_repo_semantic_versions(
+            repo=mocked_repo, until=lambda version: version.prerelease is None
+        )
+    )
+
+    assert returned_versions == [Version(1, 2, 3)]
+    assert [tag.name for tag in remaining_tags] == [
+        "1.2.3-alpha",
+        "foo",
+        "tag/with/slashes",
+        "hello-world",
+    ]
+
+
+def test_iter_repo_semantic_versions_is_lazy(mocker):
+    mocked_repo = mocker.MagicMock()
+    mocked_repo.get_tags.side_effect = AssertionError("tags fetched eagerly")
+
+    tags.iter_repo_semantic_versions(repo=mocked_repo)
+
+
+@pytest.mark.parametrize(
+    "include_prerelease, expected",
+    [
+        (True, [Version(2, 0, 0, "rc1"), Version(1, 10, 0)]),
+        (False, [Version(1, 10, 0), Version(1, 9, 0)]),
+    ],
+)
+def test_top_versions(include_prerelease, expected):
+    versions = (
+        Version.parse(version)
+        for version in ["1.2.3", "2.0.0-rc1", "1.10.0", "1.9.0", "0.1.0"]
+    )
+
+    assert (
+        tags.top_versions(versions=versions, k=2, include_prerelease=include_prerelease)
+        == expected
+    )
@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from launch.cli.github.auth import commands
+from launch.lib.github import generate_github_token, token_cache
+from launch.lib.github.token_cache import (
+    CachedToken,
+    FileTokenStore,
+    TokenCache,
+    create_token_store,
+)
+
+
+class CountingFetch:
+    def __init__(self):
+        self.calls = 0
+        self.fetched = threading.Event()
+
+    def __call__(self) -> str:
+        self.calls += 1
+        self.fetched.set()
+        return f"token-{self.calls}"
+
+
+@pytest.fixture
+def github_stand_in():
+    """A local stand-in for the GitHub installation token endpoint."""
+    requests_received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            requests_received.append(self.path)
+            body = json.dumps(
+                {
+                    "token": f"ghs_stand_in_{len(requests_received)}",
+                    "expires_at": "2099-01-01T00:00:00Z",
+                }
+            ).encode()
+            self.send_response(201)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requests_received
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def signing_cert_file(tmp_path):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path = tmp_path.joinpath("signing-cert.pem")
+    path.write_bytes(
+        private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.TraditionalOpenSSL,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    return str(path)
+
+
+def test_token_cache_reuses_token():
+    cache = TokenCache()
+    fetch = CountingFetch()
+
+    assert cache.get("app", "installation", fetch) == "token-1"
+    assert cache.get("app", "installation", fetch) == "token-1"
+    assert cache.get("app", "other-installation", fetch) == "token-2"
+    assert fetch.calls == 2
+
+
+def test_token_cache_refreshes_within_margin(mocker):
+    cache = TokenCache(refresh_margin=300)
+    fetch = CountingFetch()
+    cache.get("app", "installation", fetch)
+
+    now = time.time()
+    mocker.patch.object(token_cache.time, "time", return_value=now + 3600 - 120)
+    assert cache.get("app", "installation", fetch) == "token-2"
+    assert fetch.calls == 2
+
+
+def test_token_cache_uses_reported_expiry(mocker):
+    cache = TokenCache(refresh_margin=300)
+    now = time.time()
+    fetch = mocker.MagicMock(
+        side_effect=[
+            CachedToken(token="short-lived", expires_at=now + 600),
+            CachedToken(token="renewed", expires_at=now + 4200),
+        ]
+    )
+
+    assert cache.get("app", "installation", fetch) == "short-lived"
+    mocker.patch.object(token_cache.time, "time", return_value=now + 400)
+    assert cache.get("app", "installation", fetch) == "renewed"
+    assert cache.get("app", "installation", fetch) == "renewed"
+    assert fetch.call_count == 2
+
+
+def test_token_cache_refreshes_in_background(mocker):
+    cache = TokenCache(refresh_margin=300, background_refresh=True)
+    fetch = CountingFetch()
+    cache.get("app", "installation", fetch)
+    fetch.fetched.clear()
+
+    now = time.time()
+    mocker.patch.object(token_cache.time, "time", return_value=now + 3600 - 120)
+    assert cache.get("app", "installation", fetch) == "token-1"
+    assert fetch.fetched.wait(timeout=5)
+
+    for _ in range(50):
+        if cache._tokens["app-installation"].token == "token-2":
+            break
+        time.sleep(0.01)
+    assert cache.get("app", "installation", fetch) == "token-2"
+
+
+def test_token_cache_fetches_expired_token(mocker):
+    cache = TokenCache()
+    fetch = CountingFetch()
+    cache.get("app", "installation", fetch)
+
+    mocker.patch.object(token_cache.time, "time", return_value=time.time() + 3600)
+    assert cache.get("app", "installation", fetch) == "token-2"
+    assert fetch.calls == 2
+
+
+def test_file_token_store_shares_tokens(tmp_path):
+    key = Fernet.generate_key().decode()
+    TokenCache(store=FileTokenStore(tmp_path, key)).get(
+        "app", "installation", CountingFetch()
+    )
+
+    fetch = CountingFetch()
+    token = TokenCache(store=FileTokenStore(tmp_path, key)).get(
+        "app", "installation", fetch
+    )
+    assert token == "token-1"
+    assert fetch.calls == 0
+    assert b"token-1" not in tmp_path.joinpath("app-installation.token").read_bytes()
+    assert tmp_path.joinpath("app-installation.token").stat().st_mode & 0o077 == 0
+
+
+def test_file_token_store_ignores_other_key(tmp_path):
+    store = FileTokenStore(tmp_path, Fernet.generate_key().decode())
+    store.save("app-installation", CachedToken(token="token", expires_at=0))
+
+    other_store = FileTokenStore(tmp_path, Fernet.generate_key().decode())
+    assert other_store.load("app-installation") is None
+
+
+def test_create_token_store():
+    assert create_token_store(backend="memory") is None
+    assert create_token_store(backend="file", encryption_key=None) is None
+    with pytest.raises(ValueError):
+        create_token_store(backend="unknown")
+
+
+def test_application_reuses_cached_token(
+    cli_runner, mocker, github_stand_in, signing_cert_file
+):
+    url, requests_received = github_stand_in
+    mocker.patch.object(generate_github_token, "GITHUB_API_URL", url)
+    cache = TokenCache()
+    mocker.patch.object(commands, "get_token_cache", return_value=cache)
+    arguments = [
+        "--application-id-parameter-name",
+        "1234",
+        "--installation-id-parameter-name",
+        "5678",
+        "--signing-cert-file",
+        signing_cert_file,
+    ]
+
+    first = cli_runner.invoke(commands.application, arguments)
+    second = cli_runner.invoke(commands.application, arguments)
+    uncached = cli_runner.invoke(commands.application, arguments + ["--no-cache"])
+
+    assert first.exit_code == 0, first.output
+    assert first.output.strip() == "ghs_stand_in_1"
+    assert second.output.strip() == "ghs_stand_in_1"
+    assert uncached.output.strip() == "ghs_stand_in_2"
+    assert requests_received == ["/app/installations/5678/access_tokens"] * 2
+    assert cache._tokens["1234-5678"].expires_at == 4070908800
@@ -36,3 +36,11 @@ def test_push_branch_default_commit_msg(repository):
         repository.git.push.assert_called_once_with(
             ["--set-upstream", "origin", branch]
         )
+
+
+def test_push_branch_stages_only_given_paths(repository):
+    with patch("launch.lib.local_repo.repo.stage_paths") as mock_stage_paths:
+        push_branch(repository, "feature-branch", dry_run=False, paths={"a.txt"})
+        mock_stage_paths.assert_called_once_with(repository=repository, paths={"a.txt"})
+        repository.git.add.assert_not_called()
+        repository.git.commit.assert_called_once()
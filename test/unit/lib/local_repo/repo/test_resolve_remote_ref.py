@@ -0,0 +1,53 @@
+import pytest
+from git import GitCommandError, Repo
+
+from launch.lib.local_repo.repo import resolve_remote_ref
+
+
+@pytest.fixture
+def remote_repository(tmp_path):
+    repository = Repo.init(tmp_path.joinpath("remote"), initial_branch="main")
+    with repository.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@example.com")
+    repository.index.commit("initial commit")
+    repository.create_tag("lightweight")
+    repository.index.commit("second commit")
+    repository.create_tag("annotated", message="annotated tag")
+    return repository
+
+
+def test_resolve_remote_ref_branch(remote_repository):
+    assert (
+        resolve_remote_ref(remote_repository.working_dir, "main")
+        == remote_repository.head.commit.hexsha
+    )
+
+
+def test_resolve_remote_ref_tags(remote_repository):
+    url = remote_repository.working_dir
+
+    assert (
+        resolve_remote_ref(url, "lightweight")
+        == remote_repository.tags["lightweight"].commit.hexsha
+    )
+    assert resolve_remote_ref(url, "annotated") == remote_repository.head.commit.hexsha
+
+
+def test_resolve_remote_ref_commit_sha(mocker):
+    mock_git = mocker.patch("launch.lib.local_repo.repo.Git")
+
+    assert resolve_remote_ref("url", "a" * 40) == "a" * 40
+    mock_git.assert_not_called()
+
+
+def test_resolve_remote_ref_unknown(remote_repository):
+    assert resolve_remote_ref(remote_repository.working_dir, "missing") is None
+
+
+def test_resolve_remote_ref_error(mocker):
+    mocker.patch(
+        "launch.lib.local_repo.repo.Git"
+    ).return_value.ls_remote.side_effect = GitCommandError("ls-remote", 128)
+
+    assert resolve_remote_ref("https://example.com/repo.git", "main") is None
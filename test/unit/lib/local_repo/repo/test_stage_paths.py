@@ -0,0 +1,32 @@
+from git import Repo
+
+from launch.lib.local_repo.repo import stage_paths
+
+
+def test_stage_paths(example_github_repo, tmp_path):
+    tmp_path.joinpath("generated.txt").write_text("generated")
+    tmp_path.joinpath("nested").mkdir()
+    tmp_path.joinpath("nested", "also generated [1].txt").write_text("generated")
+    tmp_path.joinpath("unrelated.txt").write_text("unrelated")
+    tmp_path.joinpath(".gitignore").write_text("ignored.txt\n")
+    tmp_path.joinpath("ignored.txt").write_text("ignored")
+    tmp_path.joinpath("test.txt").unlink()
+
+    staged = stage_paths(
+        repository=example_github_repo,
+        paths=[
+            tmp_path.joinpath("generated.txt"),
+            tmp_path.joinpath("nested", "also generated [1].txt"),
+            tmp_path.joinpath("ignored.txt"),
+            tmp_path.joinpath("test.txt"),
+            tmp_path.parent.joinpath("outside.txt"),
+        ],
+        batch_size=2,
+    )
+
+    assert staged == 3
+    status = example_github_repo.git.status(["--porcelain"]).splitlines()
+    assert "A  generated.txt" in status
+    assert 'A  "nested/also generated [1].txt"' in status
+    assert "D  test.txt" in status
+    assert "?? unrelated.txt" in status
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+from launch.lib.local_repo.hooks import RefStatus, validate_ref_updates
+
+OLD_SHA = "0" * 40
+NEW_SHA = "a" * 40
+
+
+@pytest.mark.parametrize(
+    "line, expected_status",
+    [
+        (f"{OLD_SHA} {NEW_SHA} refs/heads/fix/ok", RefStatus.VALID),
+        (f"{OLD_SHA} {NEW_SHA} refs/heads/Feature!/ok", RefStatus.VALID),
+        (f"{OLD_SHA} {NEW_SHA} refs/heads/foo/bar", RefStatus.INVALID),
+        (f"{OLD_SHA} {NEW_SHA} refs/heads/main", RefStatus.INVALID),
+        (f"{OLD_SHA} {NEW_SHA} refs/tags/1.0.0", RefStatus.SKIPPED),
+        (f"{NEW_SHA} {OLD_SHA} refs/heads/foo/bar", RefStatus.SKIPPED),
+        ("refs/heads/fix/ok", RefStatus.INVALID),
+    ],
+)
+def test_validate_ref_updates(line, expected_status):
+    (result,) = validate_ref_updates(lines=[line])
+    assert result.status == expected_status
+
+
+def test_validate_ref_updates_allowed_branches():
+    results = list(
+        validate_ref_updates(
+            lines=[
+                f"{OLD_SHA} {NEW_SHA} refs/heads/main\n",
+                "\n",
+                f"{OLD_SHA} {NEW_SHA} refs/heads/develop\n",
+            ],
+            allowed_branches=["main"],
+        )
+    )
+
+    assert [(r.ref, r.status) for r in results] == [
+        ("refs/heads/main", RefStatus.VALID),
+        ("refs/heads/develop", RefStatus.INVALID),
+    ]
+
+
+def test_validate_ref_updates_is_lazy():
+    def lines():
+        yield f"{OLD_SHA} {NEW_SHA} refs/heads/fix/ok"
+        raise AssertionError("read past the first result")
+
+    assert next(validate_ref_updates(lines=lines())).status == RefStatus.VALID
+
+
+def test_validate_commands_import_without_git():
+    # Hooks run on every push, so the validate commands must not load git or GitHub libraries.
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, launch.cli.validate.commands; "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & {'git', 'github'}))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.strip() == "[]"
@@ -4,12 +4,14 @@ import pytest
 from semver import Version
 
 from launch.lib.local_repo.predict import (
+    BranchNameMatcher,
     ChangeType,
     InvalidBranchNameException,
     latest_tag,
     predict_change_type,
     predict_version,
     split_delimiter,
+    validate_name,
 )
 
 
@@ -111,3 +113,26 @@ def test_predict_default_version(branch_name: str):
     expected_version = Version(1, 0, 0)
     new_version = predict_version(existing_tags=existing_tags, branch_name=branch_name)
     assert new_version == expected_version
+
+
+@pytest.mark.parametrize(
+    "branch_name, expected_outcome",
+    [
+        ("fix/ok", True),
+        ("!Feature/ok", True),
+        ("BUG!/ok", True),
+        ("main", False),
+        ("foo/bar", False),
+        ("", False),
+    ],
+)
+def test_validate_name(branch_name: str, expected_outcome: bool):
+    assert validate_name(branch_name=branch_name) is expected_outcome
+
+
+def test_branch_name_matcher_custom_parts():
+    matcher = BranchNameMatcher(name_parts=["Release"], delimiter="-")
+
+    assert matcher.is_valid("release-1.2")
+    assert not matcher.is_valid("fix-1.2")
+    assert not matcher.is_valid("release/1.2")
@@ -8,11 +8,14 @@ from launch.lib.local_repo.repo import acquire_repo
 from launch.lib.local_repo.tags import (
     CommitNotTaggedException,
     CommitTagNotSemanticVersionException,
+    build_tag_index,
     create_version_tag,
     push_version_tag,
+    read_remote_semantic_tags,
     read_semantic_tags,
     read_semantic_version_tag,
     read_tags,
+    read_version_tag,
     tag_is_semantic,
 )
 
@@ -120,3 +123,86 @@ def test_read_semantic_version_tag_not_semver(example_github_repo):
     example_github_repo.create_tag("not_semantic_versioned")
     with pytest.raises(CommitTagNotSemanticVersionException):
         read_semantic_version_tag(repo_path=example_github_repo.working_dir)
+
+
+def test_build_tag_index(example_github_repo):
+    with example_github_repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@example.com")
+    example_github_repo.create_tag("1.0.0", message="annotated")
+    example_github_repo.create_tag("not-semantic!")
+    head_sha = example_github_repo.head.commit.hexsha
+
+    index = build_tag_index(repo_path=example_github_repo.working_dir, persist=False)
+
+    assert index.tags_for(head_sha) == ["0.1.0", "1.0.0", "not-semantic!"]
+    assert sorted(index.semantic_tags()) == [Version.parse("0.1.0"), Version(1, 0, 0)]
+
+
+def test_build_tag_index_persisted(example_github_repo, mocker):
+    repo_path = example_github_repo.working_dir
+    build_tag_index(repo_path=repo_path, persist=True)
+    for_each_ref = mocker.patch("git.cmd.Git.for_each_ref", create=True)
+
+    index = build_tag_index(repo_path=repo_path, persist=True)
+
+    assert index.semantic_tags() == [Version.parse("0.1.0")]
+    for_each_ref.assert_not_called()
+
+
+def test_build_tag_index_persisted_refreshes_on_new_tag(example_github_repo):
+    repo_path = example_github_repo.working_dir
+    build_tag_index(repo_path=repo_path, persist=True)
+    example_github_repo.create_tag("0.2.0")
+
+    index = build_tag_index(repo_path=repo_path, persist=True)
+
+    assert Version.parse("0.2.0") in index.semantic_tags()
+
+
+def test_build_tag_index_persisted_refreshes_after_pack_refs(example_github_repo):
+    repo_path = example_github_repo.working_dir
+    build_tag_index(repo_path=repo_path, persist=True)
+    example_github_repo.create_tag("0.2.0")
+    example_github_repo.git.pack_refs("--all")
+
+    index = build_tag_index(repo_path=repo_path, persist=True)
+
+    assert Version.parse("0.2.0") in index.semantic_tags()
+
+
+def test_read_version_tag(example_github_repo):
+    example_github_repo.create_tag("0.1.1")
+
+    tag = read_version_tag(repo_path=example_github_repo.working_dir)
+
+    assert tag.name == "0.1.1"
+    assert tag.commit == example_github_repo.head.commit
+
+
+def test_read_version_tag_untagged(example_github_repo):
+    pathlib.Path(example_github_repo.working_dir).joinpath("new.txt").write_text(
+        "hello world"
+    )
+    example_github_repo.index.add("new.txt")
+    example_github_repo.index.commit("Added new.txt")
+
+    with pytest.raises(CommitNotTaggedException):
+        read_version_tag(repo_path=example_github_repo.working_dir)
+
+
+def test_read_remote_semantic_tags(example_github_repo):
+    with example_github_repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@example.com")
+    example_github_repo.create_tag("1.0.0", message="annotated")
+    example_github_repo.create_tag("not-semantic!")
+
+    tags = read_remote_semantic_tags(repository_url=example_github_repo.working_dir)
+
+    assert sorted(tags) == [Version.parse("0.1.0"), Version(1, 0, 0)]
+
+
+def test_read_remote_semantic_tags_failure(tmp_path):
+    with pytest.raises(RuntimeError, match="Failed to list the tags"):
+        read_remote_semantic_tags(repository_url=str(tmp_path.joinpath("missing")))
@@ -0,0 +1,190 @@
+import pytest
+
+from launch.lib.automation.processes.runner import CommandResult
+from launch.lib.service.build import cache
+from launch.lib.service.build.cache import (
+    LocalBuildChecker,
+    RegistryBuildChecker,
+    build_cache_key,
+    compile_ignore_patterns,
+    create_build_checker,
+    is_ignored,
+    source_tree_hash,
+)
+
+
+@pytest.fixture
+def source(tmp_path):
+    tmp_path.joinpath("src").mkdir()
+    tmp_path.joinpath("src", "app.py").write_text("print('hello')\n")
+    tmp_path.joinpath("Dockerfile").write_text("FROM python\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern, path, ignored",
+    [
+        ("*.md", "README.md", True),
+        ("*.md", "docs/README.md", False),
+        ("**/*.md", "docs/README.md", True),
+        ("**/*.md", "README.md", True),
+        ("docs", "docs/index.html", True),
+        ("/docs/", "docs/index.html", True),
+        ("build/?", "build/a", True),
+        ("build/?", "build/ab", False),
+    ],
+)
+def test_is_ignored(pattern, path, ignored):
+    assert is_ignored(path, compile_ignore_patterns([pattern])) is ignored
+
+
+def test_is_ignored_last_match_wins():
+    patterns = compile_ignore_patterns(["*.md", "!README.md"])
+
+    assert is_ignored("CHANGELOG.md", patterns)
+    assert not is_ignored("README.md", patterns)
+
+
+def test_source_tree_hash_changes_with_content(source):
+    before = source_tree_hash(source)
+    source.joinpath("src", "app.py").write_text("print('bye')\n")
+
+    assert source_tree_hash(source) != before
+
+
+def test_source_tree_hash_changes_with_executable_bit(source):
+    before = source_tree_hash(source)
+    source.joinpath("src", "app.py").chmod(0o755)
+
+    assert source_tree_hash(source) != before
+
+
+def test_source_tree_hash_respects_dockerignore(source):
+    source.joinpath(".dockerignore").write_text("# comment\nnode_modules\n*.log\n")
+    before = source_tree_hash(source)
+    source.joinpath("node_modules").mkdir()
+    source.joinpath("node_modules", "dependency.js").write_text("")
+    source.joinpath("debug.log").write_text("noise")
+    source.joinpath(".git").mkdir()
+    source.joinpath(".git", "HEAD").write_text("ref: refs/heads/main")
+
+    assert source_tree_hash(source) == before
+
+
+def test_source_tree_hash_negated_pattern(source):
+    source.joinpath(".dockerignore").write_text("config\n!config/keep.yaml\n")
+    source.joinpath("config").mkdir()
+    before = source_tree_hash(source)
+    source.joinpath("config", "drop.yaml").write_text("a")
+    assert source_tree_hash(source) == before
+
+    source.joinpath("config", "keep.yaml").write_text("a")
+    assert source_tree_hash(source) != before
+
+
+def test_source_tree_hash_includes_build_dependencies(source):
+    before = source_tree_hash(source)
+    source.joinpath(".launch").mkdir()
+    source.joinpath(".launch", "settings.json").write_text("{}")
+    changed = source_tree_hash(source)
+    source.joinpath(".launch", "build", "app").mkdir(parents=True)
+    source.joinpath(".launch", "build", "app", "clone.py").write_text("pass\n")
+
+    assert changed != before
+    assert source_tree_hash(source) == changed
+
+
+def test_build_cache_key_includes_registry_type(source):
+    assert build_cache_key(source, "docker") != build_cache_key(source, "npm")
+
+
+def test_local_build_checker(mocker, tmp_path):
+    local_image_exists = mocker.patch.object(
+        cache, "local_image_exists", return_value=True
+    )
+    checker = LocalBuildChecker(directory=tmp_path)
+    assert not checker.is_built(key="key", image="registry/app:1", push=False)
+
+    checker.record(key="key", image="registry/app:1", push=False)
+
+    assert checker.is_built(key="key", image="registry/app:1", push=False)
+    local_image_exists.assert_called_once_with("registry/app:1")
+    assert not checker.is_built(key="key", image="registry/app:2", push=False)
+    assert not checker.is_built(key="key", image="registry/app:1", push=True)
+
+    checker.record(key="key", image="registry/app:1", push=True)
+
+    assert checker.is_built(key="key", image="registry/app:1", push=True)
+    assert not checker.is_built(key="key", image="registry/app:2", push=True)
+
+
+def test_local_build_checker_image_removed(mocker, tmp_path):
+    run_command = mocker.patch.object(
+        cache,
+        "run_command",
+        return_value=CommandResult(args=[], cwd=None, returncode=1, duration=0.1),
+    )
+    checker = LocalBuildChecker(directory=tmp_path)
+    checker.record(key="key", image="registry/app:1", push=False)
+
+    assert not checker.is_built(key="key", image="registry/app:1", push=False)
+    run_command.assert_called_once_with(
+        ["docker", "image", "inspect", "registry/app:1"],
+        check=False,
+        stream=False,
+    )
+
+
+def test_local_build_checker_without_image(tmp_path):
+    checker = LocalBuildChecker(directory=tmp_path)
+    checker.record(key="key", image=None, push=False)
+
+    assert not checker.is_built(key="key", image=None, push=False)
+
+
+def test_local_build_checker_unreadable_record(tmp_path):
+    tmp_path.joinpath("key.json").write_text("not json")
+
+    assert not LocalBuildChecker(directory=tmp_path).is_built(
+        key="key", image=None, push=False
+    )
+
+
+@pytest.mark.parametrize("returncode, built", [(0, True), (1, False)])
+def test_registry_build_checker(mocker, returncode, built):
+    run_command = mocker.patch.object(
+        cache,
+        "run_command",
+        return_value=CommandResult(
+            args=[], cwd=None, returncode=returncode, duration=0.1
+        ),
+    )
+
+    assert (
+        RegistryBuildChecker().is_built(key="key", image="registry/app:1", push=True)
+        is built
+    )
+    run_command.assert_called_once_with(
+        ["docker", "manifest", "inspect", "registry/app:1"],
+        check=False,
+        stream=False,
+    )
+
+
+def test_registry_build_checker_without_push(mocker):
+    run_command = mocker.patch.object(cache, "run_command")
+
+    assert not RegistryBuildChecker().is_built(
+        key="key", image="registry/app:1", push=False
+    )
+    run_command.assert_not_called()
+
+
+def test_create_build_checker(tmp_path):
+    assert create_build_checker(backend="none") is None
+    assert isinstance(
+        create_build_checker(backend="local", directory=tmp_path), LocalBuildChecker
+    )
+    assert isinstance(create_build_checker(backend="registry"), RegistryBuildChecker)
+    with pytest.raises(ValueError):
+        create_build_checker(backend="s3")
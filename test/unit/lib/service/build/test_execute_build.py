@@ -9,7 +9,6 @@ from launch.lib.service.build import functions as build_functions
 def test_execute_build_push(mocker, capsys, registry_type, push):
     service_dir = Path("/fake/dir")
 
-    mock_os = mocker.patch.object(build_functions, "os")
     mock_start_docker = mocker.patch.object(build_functions.functions, "start_docker")
     mock_git_config = mocker.patch.object(build_functions.functions, "git_config")
     mock_make_configure = mocker.patch.object(
@@ -24,23 +23,73 @@ def test_execute_build_push(mocker, capsys, registry_type, push):
     mock_make_install = mocker.patch.object(build_functions.functions, "make_install")
 
     build_functions.execute_build(
-        service_dir=service_dir, registry_type=registry_type, push=True, dry_run=True
+        service_dir=service_dir,
+        registry_type=registry_type,
+        provider="aws",
+        push=True,
+        dry_run=True,
     )
 
     if registry_type == "docker":
         mock_start_docker.assert_called_once_with(dry_run=True)
         mock_make_install.assert_not_called()
         if push:
-            mock_make_docker_aws_ecr_login.assert_called_once_with(dry_run=True)
-            mock_make_push.assert_called_once_with(dry_run=True)
+            mock_make_docker_aws_ecr_login.assert_called_once_with(
+                dry_run=True, cwd=service_dir
+            )
+            mock_make_push.assert_called_once_with(dry_run=True, cwd=service_dir)
     elif registry_type == "npm":
         mock_start_docker.assert_not_called()
         mock_make_docker_aws_ecr_login.assert_not_called()
         mock_make_push.assert_not_called()
-        mock_make_install.assert_called_once_with(dry_run=True)
+        mock_make_install.assert_called_once_with(dry_run=True, cwd=service_dir)
 
     mock_subprocess.assert_not_called()
-    mock_os.chdir.assert_called_once_with(service_dir)
     mock_git_config.assert_called_once_with(dry_run=True)
-    mock_make_configure.assert_called_once_with(dry_run=True)
-    mock_make_build.assert_called_once_with(dry_run=True)
+    mock_make_configure.assert_called_once_with(dry_run=True, cwd=service_dir)
+    mock_make_build.assert_called_once_with(dry_run=True, cwd=service_dir)
+
+
+def test_execute_build_skips_unchanged_source(mocker, tmp_path):
+    mock_make_build = mocker.patch.object(build_functions.functions, "make_build")
+    mock_start_docker = mocker.patch.object(build_functions.functions, "start_docker")
+    checker = mocker.MagicMock()
+    checker.is_built.return_value = True
+
+    build_functions.execute_build(
+        service_dir=tmp_path,
+        registry_type="docker",
+        provider="aws",
+        push=True,
+        dry_run=False,
+        checker=checker,
+    )
+
+    mock_start_docker.assert_not_called()
+    mock_make_build.assert_not_called()
+    checker.record.assert_not_called()
+
+
+def test_execute_build_records_build(mocker, tmp_path):
+    for name in ["start_docker", "git_config", "make_configure", "make_push"]:
+        mocker.patch.object(build_functions.functions, name)
+    mock_make_build = mocker.patch.object(build_functions.functions, "make_build")
+    mocker.patch.object(
+        build_functions, "container_image", return_value="registry/app:1"
+    )
+    checker = mocker.MagicMock()
+    checker.is_built.return_value = False
+
+    build_functions.execute_build(
+        service_dir=tmp_path,
+        registry_type="docker",
+        provider="azure",
+        push=True,
+        dry_run=False,
+        checker=checker,
+    )
+
+    mock_make_build.assert_called_once_with(dry_run=False, cwd=tmp_path)
+    key = build_functions.build_cache_key(service_dir=tmp_path, registry_type="docker")
+    checker.is_built.assert_called_once_with(key=key, image="registry/app:1", push=True)
+    checker.record.assert_called_once_with(key=key, image="registry/app:1", push=True)
@@ -0,0 +1,146 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from launch.lib.service.create import functions as create_functions
+from launch.lib.service.create.functions import create_fleet, load_manifest
+
+SKELETON_INPUTS = {
+    "skeleton": {"url": "https://github.com/org/skel.git", "tag": "1.0.0"},
+    "sources": {},
+    "platform": {},
+}
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    tmp_path.joinpath("svc-a.json").write_text(json.dumps(SKELETON_INPUTS))
+    path = tmp_path.joinpath("manifest.json")
+    path.write_text(
+        json.dumps(
+            {
+                "services": [
+                    {"name": "svc-a", "in_file": "svc-a.json"},
+                    {
+                        "name": "svc-b",
+                        "description": "Service B",
+                        "visibility": "internal",
+                        "inputs": SKELETON_INPUTS,
+                    },
+                ]
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def mocked_github(mocker):
+    mocks = {
+        "exists": mocker.patch.object(
+            create_functions, "repo_exist", return_value=False
+        ),
+        "create": mocker.patch.object(create_functions, "create_repository"),
+        "access": mocker.patch.object(create_functions, "apply_default_access"),
+        "clone": mocker.patch.object(create_functions, "clone_repository"),
+        "checkout": mocker.patch.object(create_functions, "checkout_branch"),
+        "push": mocker.patch.object(create_functions, "push_branch"),
+        "workflow": mocker.patch.object(create_functions, "common_service_workflow"),
+        "skeleton_clone": mocker.patch("launch.lib.service.functions.clone_repository"),
+    }
+    return mocks
+
+
+def test_load_manifest(manifest):
+    definitions = load_manifest(path=manifest)
+
+    assert [d["name"] for d in definitions] == ["svc-a", "svc-b"]
+    assert definitions[0]["inputs"] == SKELETON_INPUTS
+    assert definitions[0]["visibility"] == "private"
+    assert definitions[1]["description"] == "Service B"
+    assert definitions[1]["visibility"] == "internal"
+
+
+def test_load_manifest_rejects_duplicates(tmp_path):
+    path = tmp_path.joinpath("manifest.json")
+    path.write_text(
+        json.dumps([{"name": "svc", "inputs": {}}, {"name": "svc", "inputs": {}}])
+    )
+    with pytest.raises(ValueError):
+        load_manifest(path=path)
+
+
+def test_load_manifest_requires_inputs(tmp_path):
+    path = tmp_path.joinpath("manifest.json")
+    path.write_text(json.dumps([{"name": "svc"}]))
+    with pytest.raises(ValueError):
+        load_manifest(path=path)
+
+
+def test_create_fleet_shares_teams_and_skeleton(manifest, mocked_github, tmp_path):
+    g = MagicMock()
+    results = create_fleet(
+        definitions=load_manifest(path=manifest),
+        g=g,
+        organization="org",
+        workdir=tmp_path,
+        inputs_base=manifest.parent,
+        git_message="create",
+        max_workers=2,
+        dry_run=False,
+    )
+
+    assert [r.name for r in results] == ["svc-a", "svc-b"]
+    assert all(r.succeeded for r in results)
+    assert all(r.value == "created and pushed" for r in results)
+    g.get_organization.assert_called_once_with(login="org")
+    assert g.get_organization.return_value.get_team_by_slug.call_count == 2
+    assert mocked_github["access"].call_count == 2
+    mocked_github["skeleton_clone"].assert_called_once()
+    assert mocked_github["push"].call_count == 2
+    skeleton_paths = {
+        call.kwargs["skeleton_path"]
+        for call in mocked_github["workflow"].call_args_list
+    }
+    assert len(skeleton_paths) == 1
+
+
+def test_create_fleet_reports_existing_repository(manifest, mocked_github, tmp_path):
+    mocked_github["exists"].side_effect = lambda name, g: name == "org/svc-b"
+    results = create_fleet(
+        definitions=load_manifest(path=manifest),
+        g=MagicMock(),
+        organization="org",
+        workdir=tmp_path,
+        inputs_base=manifest.parent,
+        git_message="create",
+        skip_git_permissions=True,
+        skip_commit=True,
+        dry_run=False,
+    )
+
+    assert results[0].succeeded
+    assert results[0].value == "created, not committed"
+    assert not results[1].succeeded
+    assert "already exists" in results[1].detail
+    mocked_github["access"].assert_not_called()
+    mocked_github["push"].assert_not_called()
+
+
+def test_create_fleet_dry_run(manifest, mocked_github, tmp_path):
+    g = MagicMock()
+    results = create_fleet(
+        definitions=load_manifest(path=manifest),
+        g=g,
+        organization="org",
+        workdir=tmp_path,
+        inputs_base=manifest.parent,
+        git_message="create",
+        dry_run=True,
+    )
+
+    assert all(r.value == "would have created" for r in results)
+    g.get_organization.assert_not_called()
+    mocked_github["clone"].assert_not_called()
+    mocked_github["workflow"].assert_not_called()
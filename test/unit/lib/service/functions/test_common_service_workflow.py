@@ -1,5 +1,5 @@
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -69,26 +69,28 @@ def test_common_service_workflow(mocker, fakedata):
     patches["extract_repo_name_from_url"].assert_called()
     patches["clone_repository"].assert_any_call(
         repository_url="skeleton_url",
-        target=Path(f"{BUILD_TEMP_DIR_PATH}/repo_name"),
+        target=Path.cwd().joinpath(BUILD_TEMP_DIR_PATH, "repo_name"),
         branch="skeleton_tag",
         dry_run=data["dry_run"],
     )
     patches["clone_repository"].assert_any_call(
         repository_url="app_url",
-        target=Path(f"{BUILD_TEMP_DIR_PATH}/repo_name"),
+        target=Path.cwd().joinpath(BUILD_TEMP_DIR_PATH, "repo_name"),
         branch="app_tag",
         dry_run=data["dry_run"],
     )
     patches["copy_template_files"].assert_any_call(
-        src_dir=Path(f"{BUILD_TEMP_DIR_PATH}/repo_name"),
+        src_dir=Path.cwd().joinpath(BUILD_TEMP_DIR_PATH, "repo_name"),
         target_dir=Path(data["service_path"]),
         dry_run=data["dry_run"],
+        generated_paths=ANY,
     )
     patches["copy_template_files"].assert_any_call(
-        src_dir=Path(f"{BUILD_TEMP_DIR_PATH}/repo_name"),
+        src_dir=Path.cwd().joinpath(BUILD_TEMP_DIR_PATH, "repo_name"),
         target_dir=Path(data["service_path"]),
         not_platform=True,
         dry_run=data["dry_run"],
+        generated_paths=ANY,
     )
     patches["process_template"].assert_called_with(
         repo_base=Path.cwd(),
@@ -96,6 +98,7 @@ def test_common_service_workflow(mocker, fakedata):
         config={PLATFORM_SRC_DIR_PATH: "platform_src_path"},
         skip_uuid=data["skip_uuid"],
         dry_run=data["dry_run"],
+        generated_paths=ANY,
     )
     patches["write_text"].assert_called_with(
         data=data["input_data"],
@@ -107,4 +110,62 @@ def test_common_service_workflow(mocker, fakedata):
         branch=SERVICE_REMOTE_BRANCH,
         commit_msg=data["git_message"],
         dry_run=data["dry_run"],
+        paths={Path(f"{data['service_path']}/{LAUNCHCONFIG_NAME}").absolute()},
     )
+
+
+def test_common_service_workflow_syncs_skeleton_changes(mocker, fakedata, tmp_path):
+    patches = setup_patches(mocker)
+    mocker.patch(
+        "launch.lib.service.functions.get_head_commit", return_value="new-commit"
+    )
+    sync = mocker.patch(
+        "launch.lib.service.functions.sync_template_changes", return_value=True
+    )
+    data = setup_data(fakedata)
+    data["service_path"] = str(tmp_path)
+    tmp_path.joinpath(LAUNCHCONFIG_NAME).write_text(
+        '{"skeleton": {"url": "skeleton_url", "tag": "skeleton_tag", "commit": "old-commit"}}'
+    )
+
+    try:
+        common_service_workflow(**data)
+    except KeyError as e:
+        assert str(e) == "'platform'"
+
+    sync.assert_called_once_with(
+        src_dir=Path.cwd().joinpath(BUILD_TEMP_DIR_PATH, "repo_name"),
+        target_dir=tmp_path,
+        previous_commit="old-commit",
+        dry_run=False,
+        generated_paths=ANY,
+    )
+    patches["copy_template_files"].assert_called_once_with(
+        src_dir=Path.cwd().joinpath(BUILD_TEMP_DIR_PATH, "repo_name"),
+        target_dir=tmp_path,
+        not_platform=True,
+        dry_run=False,
+        generated_paths=ANY,
+    )
+    assert data["input_data"]["skeleton"]["commit"] == "new-commit"
+
+
+def test_common_service_workflow_full_sync(mocker, fakedata, tmp_path):
+    patches = setup_patches(mocker)
+    mocker.patch(
+        "launch.lib.service.functions.get_head_commit", return_value="new-commit"
+    )
+    sync = mocker.patch("launch.lib.service.functions.sync_template_changes")
+    data = setup_data(fakedata)
+    data["service_path"] = str(tmp_path)
+    tmp_path.joinpath(LAUNCHCONFIG_NAME).write_text(
+        '{"skeleton": {"url": "skeleton_url", "tag": "skeleton_tag", "commit": "old-commit"}}'
+    )
+
+    try:
+        common_service_workflow(**data, full_sync=True)
+    except KeyError as e:
+        assert str(e) == "'platform'"
+
+    sync.assert_not_called()
+    assert patches["copy_template_files"].call_count == 2
@@ -0,0 +1,69 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from launch.config.common import PLATFORM_SRC_DIR_PATH
+from launch.config.terraform import TERRAFORM_VAR_FILE
+from launch.lib.service.functions import common_service_workflow
+
+
+def generate(tmp_path: Path, name: str) -> Path:
+    """Lays out a service and its skeleton under tmp_path/name, then generates the service from them."""
+    repo_base = tmp_path.joinpath(name)
+    repo_base.joinpath("properties").mkdir(parents=True)
+    repo_base.joinpath("properties", "sandbox.tfvars").write_text(f"name = {name}\n")
+    skeleton_path = repo_base.joinpath("skeleton")
+    skeleton_path.mkdir()
+    skeleton_path.joinpath(f"{name}.txt").write_text(name)
+    service_path = repo_base.joinpath("service")
+
+    common_service_workflow(
+        service_path=str(service_path),
+        repository=None,
+        input_data={
+            "skeleton": {"url": "https://github.com/org/skeleton.git", "tag": "main"},
+            "sources": {},
+            PLATFORM_SRC_DIR_PATH: {
+                "service": {
+                    "sandbox": {
+                        "us-east-2": {
+                            "000": {"properties_file": "properties/sandbox.tfvars"}
+                        }
+                    }
+                }
+            },
+        },
+        git_message="",
+        skip_uuid=True,
+        skip_sync=False,
+        skip_git=True,
+        skip_commit=True,
+        dry_run=False,
+        skeleton_path=skeleton_path,
+        repo_base=repo_base,
+    )
+    return service_path
+
+
+def test_parallel_generations_are_isolated(tmp_path):
+    cwd = os.getcwd()
+    names = [f"service-{index}" for index in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        service_paths = dict(
+            zip(names, executor.map(lambda name: generate(tmp_path, name), names))
+        )
+
+    assert os.getcwd() == cwd
+    for name, service_path in service_paths.items():
+        assert sorted(path.name for path in service_path.glob("*.txt")) == [
+            f"{name}.txt"
+        ]
+        assert (
+            service_path.joinpath(
+                PLATFORM_SRC_DIR_PATH, "service", "sandbox", "us-east-2", "000"
+            )
+            .joinpath(TERRAFORM_VAR_FILE)
+            .read_text()
+            == f"name = {name}\n"
+        )
@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from launch.lib.service import functions as service_functions
+from launch.lib.service.functions import SkeletonCheckouts
+
+
+def test_skeleton_checkouts_clone_once(mocker, tmp_path):
+    mock_clone = mocker.patch.object(service_functions, "clone_repository")
+    checkouts = SkeletonCheckouts(build_path=tmp_path, dry_run=False)
+    url = "https://github.com/org/skeleton.git"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = list(executor.map(lambda _: checkouts.get(url, "1.0.0"), range(8)))
+
+    assert len(set(paths)) == 1
+    assert paths[0] == tmp_path.joinpath("skeleton-1.0.0")
+    mock_clone.assert_called_once_with(
+        repository_url=url, target=paths[0], branch="1.0.0", dry_run=False
+    )
+
+
+def test_skeleton_checkouts_separate_tags(mocker, tmp_path):
+    mock_clone = mocker.patch.object(service_functions, "clone_repository")
+    checkouts = SkeletonCheckouts(build_path=tmp_path, dry_run=False)
+    url = "https://github.com/org/skeleton.git"
+
+    assert checkouts.get(url, "feature/a") == tmp_path.joinpath("skeleton-feature_a")
+    assert checkouts.get(url, "main") == tmp_path.joinpath("skeleton-main")
+    assert mock_clone.call_count == 2
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from launch.lib.service.pipeline import functions as pipeline_functions
+from launch.lib.service.pipeline.functions import run_pipeline
+
+
+@pytest.fixture
+def mocked_stages(mocker):
+    return {
+        "clone": mocker.patch.object(pipeline_functions, "clone_application"),
+        "start_docker": mocker.patch.object(
+            pipeline_functions.functions, "start_docker"
+        ),
+        "git_config": mocker.patch.object(pipeline_functions.functions, "git_config"),
+        "make_configure": mocker.patch.object(
+            pipeline_functions.functions, "make_configure"
+        ),
+        "build": mocker.patch.object(pipeline_functions, "execute_build"),
+        "test": mocker.patch.object(pipeline_functions, "execute_test"),
+        "publish": mocker.patch.object(pipeline_functions, "execute_publish"),
+    }
+
+
+def test_run_pipeline_configures_once(mocked_stages):
+    service_dir = Path("/fake/dir")
+
+    results = run_pipeline(
+        service_dir=service_dir,
+        stages=["publish", "build", "test"],
+        registry_type="npm",
+        publish_options={"package_scope": "scope"},
+        url="https://github.com/org/app.git",
+        tag="main",
+        dry_run=True,
+    )
+
+    assert [r.name for r in results] == [
+        "clone",
+        "configure",
+        "build",
+        "test",
+        "publish",
+    ]
+    assert all(r.succeeded for r in results)
+    mocked_stages["clone"].assert_called_once()
+    mocked_stages["make_configure"].assert_called_once_with(
+        dry_run=True, cwd=service_dir
+    )
+    for stage in ["build", "test", "publish"]:
+        assert mocked_stages[stage].call_args.kwargs["configure"] is False
+    assert mocked_stages["publish"].call_args.kwargs["package_scope"] == "scope"
+    mocked_stages["start_docker"].assert_not_called()
+
+
+def test_run_pipeline_starts_docker_before_configuring(mocker, mocked_stages):
+    order = mocker.MagicMock()
+    for name in ["start_docker", "git_config", "make_configure", "build"]:
+        order.attach_mock(mocked_stages[name], name)
+
+    results = run_pipeline(
+        service_dir=Path("/fake/dir"),
+        stages=["build"],
+        registry_type="docker",
+        dry_run=True,
+    )
+
+    assert all(r.succeeded for r in results)
+    assert [call[0] for call in order.mock_calls] == [
+        "start_docker",
+        "git_config",
+        "make_configure",
+        "build",
+    ]
+
+
+def test_run_pipeline_skips_stages_after_failure(mocked_stages):
+    mocked_stages["build"].side_effect = RuntimeError("build failed")
+
+    results = run_pipeline(
+        service_dir=Path("/fake/dir"),
+        stages=["build", "test"],
+        registry_type="docker",
+        dry_run=True,
+    )
+
+    assert [r.name for r in results] == ["configure", "build", "test"]
+    assert results[0].succeeded
+    assert not results[1].succeeded
+    assert results[1].detail == "build failed"
+    assert not results[2].succeeded
+    assert "skipped" in results[2].detail
+    mocked_stages["clone"].assert_not_called()
+    mocked_stages["test"].assert_not_called()
@@ -9,7 +9,6 @@ from launch.lib.service.publish import functions as publish_functions
 def test_execute_publish(mocker, registry_type):
     service_dir = Path("/fake/dir")
 
-    mock_os = mocker.patch.object(publish_functions, "os")
     mock_git_config = mocker.patch.object(publish_functions.functions, "git_config")
     mock_make_configure = mocker.patch.object(
         publish_functions.functions, "make_configure"
@@ -25,10 +24,11 @@ def test_execute_publish(mocker, registry_type):
     )
 
     if registry_type == "npm":
-        mock_make_install.assert_called_once_with(dry_run=True)
-        mock_make_build.assert_called_once_with(dry_run=True)
+        mock_make_install.assert_called_once_with(dry_run=True, cwd=service_dir)
+        mock_make_build.assert_called_once_with(dry_run=True, cwd=service_dir)
         mock_make_publish.assert_called_once_with(
             dry_run=True,
+            cwd=service_dir,
             token_secret_name=None,
             package_scope=None,
             package_publisher=None,
@@ -38,6 +38,5 @@ def test_execute_publish(mocker, registry_type):
             source_branch=None,
         )
 
-    mock_os.chdir.assert_called_once_with(service_dir)
     mock_git_config.assert_called_once_with(dry_run=True)
-    mock_make_configure.assert_called_once_with(dry_run=True)
+    mock_make_configure.assert_called_once_with(dry_run=True, cwd=service_dir)
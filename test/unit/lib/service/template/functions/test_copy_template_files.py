@@ -73,4 +73,13 @@ def test_copy_template_files_exclude_forbidden_directories(setup_directories):
         assert not (target_dir / ".examples").exists()
         assert (target_dir / "file1.txt").exists()
         assert (target_dir / "file2.txt").exists()
-        assert (target_dir / "subdir" / "file3.txt").exists()
\ No newline at end of file
+        assert (target_dir / "subdir" / "file3.txt").exists()
+def test_copy_template_files_records_generated_paths(setup_directories):
+    src_dir, target_dir = setup_directories
+    generated_paths = set()
+    copy_template_files(src_dir, target_dir, dry_run=False, generated_paths=generated_paths)
+    assert generated_paths == {
+        target_dir / "file1.txt",
+        target_dir / "file2.txt",
+        target_dir / "subdir" / "file3.txt",
+    }
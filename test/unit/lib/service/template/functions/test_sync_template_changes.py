@@ -0,0 +1,77 @@
+from unittest import mock
+
+import pytest
+from git import Repo
+
+from launch.config.common import PLATFORM_SRC_DIR_PATH
+from launch.lib.service.template.functions import sync_template_changes
+
+
+@pytest.fixture
+def skeleton(tmp_path):
+    src_dir = tmp_path / "skeleton"
+    src_dir.mkdir()
+    repo = Repo.init(path=src_dir, initial_branch="main")
+    (src_dir / "unchanged.txt").write_text("unchanged")
+    (src_dir / "modified.txt").write_text("before")
+    (src_dir / "deleted.txt").write_text("deleted")
+    repo.index.add(["unchanged.txt", "modified.txt", "deleted.txt"])
+    previous = repo.index.commit("first").hexsha
+
+    (src_dir / "modified.txt").write_text("after")
+    (src_dir / "subdir").mkdir()
+    (src_dir / "subdir" / "added.txt").write_text("added")
+    (src_dir / PLATFORM_SRC_DIR_PATH).mkdir()
+    (src_dir / PLATFORM_SRC_DIR_PATH / "ignored.txt").write_text("ignored")
+    repo.index.add(
+        ["modified.txt", "subdir/added.txt", f"{PLATFORM_SRC_DIR_PATH}/ignored.txt"]
+    )
+    repo.index.remove(["deleted.txt"], working_tree=True)
+    repo.index.commit("second")
+
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    for name, content in [
+        ("unchanged.txt", "local edit"),
+        ("modified.txt", "before"),
+        ("deleted.txt", "deleted"),
+    ]:
+        (target_dir / name).write_text(content)
+    return src_dir, target_dir, previous
+
+
+def test_sync_template_changes(skeleton):
+    src_dir, target_dir, previous = skeleton
+
+    assert sync_template_changes(src_dir, target_dir, previous, dry_run=False)
+    assert (target_dir / "unchanged.txt").read_text() == "local edit"
+    assert (target_dir / "modified.txt").read_text() == "after"
+    assert (target_dir / "subdir" / "added.txt").read_text() == "added"
+    assert not (target_dir / "deleted.txt").exists()
+    assert not (target_dir / PLATFORM_SRC_DIR_PATH).exists()
+
+
+def test_sync_template_changes_not_platform(skeleton):
+    src_dir, target_dir, previous = skeleton
+
+    assert sync_template_changes(
+        src_dir, target_dir, previous, not_platform=True, dry_run=False
+    )
+    assert (target_dir / PLATFORM_SRC_DIR_PATH / "ignored.txt").exists()
+
+
+def test_sync_template_changes_dry_run(skeleton):
+    src_dir, target_dir, previous = skeleton
+
+    with mock.patch("click.secho") as mock_secho:
+        assert sync_template_changes(src_dir, target_dir, previous, dry_run=True)
+    assert mock_secho.call_count == 3
+    assert (target_dir / "modified.txt").read_text() == "before"
+    assert (target_dir / "deleted.txt").exists()
+
+
+def test_sync_template_changes_unknown_commit(skeleton):
+    src_dir, target_dir, _ = skeleton
+
+    assert not sync_template_changes(src_dir, target_dir, "0" * 40, dry_run=False)
+    assert (target_dir / "modified.txt").read_text() == "before"
@@ -8,7 +8,6 @@ from launch.lib.service.test import functions as test_functions
 def test_execute_test(mocker):
     service_dir = Path("/fake/dir")
 
-    mock_os = mocker.patch.object(test_functions, "os")
     mock_git_config = mocker.patch.object(test_functions.functions, "git_config")
     mock_make_configure = mocker.patch.object(
         test_functions.functions, "make_configure"
@@ -20,8 +19,24 @@ def test_execute_test(mocker):
     test_functions.execute_test(service_dir, dry_run=True)
 
     mock_subprocess.assert_not_called()
-    mock_os.chdir.assert_called_once_with(service_dir)
     mock_git_config.assert_called_once_with(dry_run=True)
-    mock_make_configure.assert_called_once_with(dry_run=True)
-    mock_make_install.assert_called_once_with(dry_run=True)
-    mock_make_test.assert_called_once_with(dry_run=True)
+    mock_make_configure.assert_called_once_with(dry_run=True, cwd=service_dir)
+    mock_make_install.assert_called_once_with(dry_run=True, cwd=service_dir)
+    mock_make_test.assert_called_once_with(dry_run=True, cwd=service_dir)
+
+
+def test_execute_test_without_configure(mocker):
+    mock_git_config = mocker.patch.object(test_functions.functions, "git_config")
+    mock_make_configure = mocker.patch.object(
+        test_functions.functions, "make_configure"
+    )
+    mocker.patch.object(test_functions.functions, "make_install")
+    mock_make_test = mocker.patch.object(test_functions.functions, "make_test")
+
+    service_dir = Path("/fake/dir")
+
+    test_functions.execute_test(service_dir, dry_run=True, configure=False)
+
+    mock_git_config.assert_not_called()
+    mock_make_configure.assert_not_called()
+    mock_make_test.assert_called_once_with(dry_run=True, cwd=service_dir)
@@ -0,0 +1,84 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from launch.lib.service.update import functions as update_functions
+from launch.lib.service.update.functions import update_fleet
+
+
+def make_repo(name: str) -> MagicMock:
+    repo = MagicMock()
+    repo.name = name
+    repo.clone_url = f"https://github.com/org/{name}.git"
+    return repo
+
+
+@pytest.fixture
+def services(tmp_path):
+    for name in ["svc-a", "svc-b"]:
+        tmp_path.joinpath(name).mkdir()
+        tmp_path.joinpath(name, ".launch_config").write_text(
+            json.dumps(
+                {
+                    "skeleton": {
+                        "url": "https://github.com/org/skel.git",
+                        "tag": "1.0.0",
+                    },
+                    "sources": {},
+                    "platform": {},
+                }
+            )
+        )
+    return tmp_path
+
+
+@pytest.fixture
+def mocked_git(mocker):
+    return {
+        "repo": mocker.patch.object(update_functions, "Repo"),
+        "clone": mocker.patch.object(update_functions, "clone_repository"),
+        "push": mocker.patch.object(update_functions, "push_branch"),
+        "workflow": mocker.patch.object(update_functions, "common_service_workflow"),
+        "skeleton_clone": mocker.patch("launch.lib.service.functions.clone_repository"),
+    }
+
+
+def test_update_fleet_shares_skeleton(services, mocked_git):
+    results = update_fleet(
+        repositories=[make_repo("svc-a"), make_repo("svc-b")],
+        workdir=services,
+        git_message="update",
+        max_workers=2,
+        dry_run=False,
+    )
+
+    assert [r.name for r in results] == ["svc-a", "svc-b"]
+    assert all(r.succeeded for r in results)
+    assert all(r.value == "updated and pushed" for r in results)
+    mocked_git["skeleton_clone"].assert_called_once()
+    mocked_git["clone"].assert_not_called()
+    assert mocked_git["push"].call_count == 2
+    skeleton_paths = {
+        call.kwargs["skeleton_path"] for call in mocked_git["workflow"].call_args_list
+    }
+    assert len(skeleton_paths) == 1
+    assert all(
+        call.kwargs["skip_commit"] for call in mocked_git["workflow"].call_args_list
+    )
+
+
+def test_update_fleet_reports_failures(services, mocked_git):
+    results = update_fleet(
+        repositories=[make_repo("svc-a"), make_repo("svc-missing")],
+        workdir=services,
+        git_message="update",
+        skip_commit=True,
+        dry_run=False,
+    )
+    mocked_git["clone"].assert_called_once()
+    assert results[0].succeeded
+    assert results[0].value == "updated, not committed"
+    assert not results[1].succeeded
+    assert ".launch_config" in results[1].detail
+    mocked_git["push"].assert_not_called()
@@ -9,13 +9,13 @@ def test_check_updates_instance_failure(mocker):
         "get_anonymous_github_instance",
         side_effect=Exception("Failed to connect to GitHub"),
     )
-    mocked_get_repo_semantic_versions = mocker.patch.object(
-        update, "get_repo_semantic_versions"
+    mocked_iter_repo_semantic_versions = mocker.patch.object(
+        update, "iter_repo_semantic_versions"
     )
     assert update.check_for_updates() is None
     mocked_get_anonymous_github_instance.assert_called_once()
     # If we encounter a failure in retrieving data from GitHub before the stage where we ask for versions, we shouldn't try to get the available versions
-    mocked_get_repo_semantic_versions.assert_not_called()
+    mocked_iter_repo_semantic_versions.assert_not_called()
 
 
 def test_check_for_updates_repo_failure(mocker):
@@ -26,22 +26,22 @@ def test_check_for_updates_repo_failure(mocker):
     mocked_get_anonymous_github_instance = mocker.patch.object(
         update, "get_anonymous_github_instance", return_value=FakeInstance()
     )
-    mocked_get_repo_semantic_versions = mocker.patch.object(
-        update, "get_repo_semantic_versions"
+    mocked_iter_repo_semantic_versions = mocker.patch.object(
+        update, "iter_repo_semantic_versions"
     )
     assert update.check_for_updates() is None
     mocked_get_anonymous_github_instance.assert_called_once()
     # If we encounter a failure in retrieving data from GitHub before the stage where we ask for versions, we shouldn't try to get the available versions
-    mocked_get_repo_semantic_versions.assert_not_called()
+    mocked_iter_repo_semantic_versions.assert_not_called()
 
 
 def test_check_for_updates_versions_failure(mocker):
     mocked_get_anonymous_github_instance = mocker.patch.object(
         update, "get_anonymous_github_instance"
     )
-    mocked_get_repo_semantic_versions = mocker.patch.object(
+    mocked_iter_repo_semantic_versions = mocker.patch.object(
         update,
-        "get_repo_semantic_versions",
+        "iter_repo_semantic_versions",
         side_effect=Exception(
             "Something went horribly wrong, this code shouldn't raise"
         ),
@@ -49,7 +49,7 @@ def test_check_for_updates_versions_failure(mocker):
     assert update.check_for_updates() is None
     # Successful calls to retrieve the instance, and then to call the get_repo on the instance
     assert len(mocked_get_anonymous_github_instance.mock_calls) == 2
-    mocked_get_repo_semantic_versions.assert_called_once()
+    mocked_iter_repo_semantic_versions.assert_called_once()
 
 
 def test_check_for_updates_passes_prerelease_var(mocker):
@@ -59,7 +59,7 @@ def test_check_for_updates_passes_prerelease_var(mocker):
     mocker.patch.object(update, "SEMANTIC_VERSION", new=current_version)
     mocker.patch.object(
         update,
-        "get_repo_semantic_versions",
+        "iter_repo_semantic_versions",
         return_value=[older_version, current_version, prerelease_version],
     )
     mocker.patch.object(update, "get_anonymous_github_instance")
@@ -74,7 +74,7 @@ def test_check_for_updates_no_newer_version(mocker):
     mocker.patch.object(update, "SEMANTIC_VERSION", new=current_version)
     mocker.patch.object(
         update,
-        "get_repo_semantic_versions",
+        "iter_repo_semantic_versions",
         return_value=[older_version, current_version],
     )
     mocker.patch.object(update, "get_anonymous_github_instance")
@@ -89,7 +89,7 @@ def test_check_for_updates_one_newer_version(mocker):
     mocker.patch.object(update, "SEMANTIC_VERSION", new=current_version)
     mocker.patch.object(
         update,
-        "get_repo_semantic_versions",
+        "iter_repo_semantic_versions",
         return_value=[older_version, current_version, latest_version],
     )
     mocker.patch.object(update, "get_anonymous_github_instance")
@@ -103,7 +103,7 @@ def test_check_for_updates_newest_version(mocker):
     mocker.patch.object(update, "SEMANTIC_VERSION", new=older_version)
     mocker.patch.object(
         update,
-        "get_repo_semantic_versions",
+        "iter_repo_semantic_versions",
         return_value=[older_version, current_version, latest_version],
     )
     mocker.patch.object(update, "get_anonymous_github_instance")